@@ -2,8 +2,13 @@ class ConfItem(object):
     """
     A data model to store information about a configuration item.
 
+    Items are slotted to keep seeds with hundreds of items compact, and hashable by
+    (name, type, value) so they can be used in sets and dicts. Do not change an
+    item while it is stored in a set or used as a dict key.
     """
 
+    __slots__ = ('name', 'type', 'value', 'isMutated')
+
     def __init__(self, name: str = "", type: str = "", value: str = "") -> None:
         self.name: str = name
         self.type: str = type
@@ -16,5 +21,15 @@ class ConfItem(object):
             return self.name == t.name and self.type == t.type and self.value == t.value
         return False
 
+    def __hash__(self) -> int:
+        # the fields are mutable: a changed item is lost in the sets and dicts holding it
+        return hash((self.name, self.type, self.value))
+
     def __str__(self) -> str:
         return 'Configuration Item(name:{0}, type:{1}, value:{2:10})'.format(self.name, self.type, self.value)
+
+    def copy(self) -> 'ConfItem':
+        """
+        A new, not yet mutated item with the same name, type and value.
+        """
+        return ConfItem(self.name, self.type, self.value)
@@ -1,9 +1,107 @@
-from typing import List
+import hashlib
+from typing import Dict, List
 
 from dataModel.ConfItem import ConfItem
 from dataModel.CounterWriteToFileInterface import CounterWriteToFileInterface
 
 
+class ConfItemList(list):
+    """
+    A list of configuration items that keeps a name -> indices map, so looking up or
+    testing for an item is O(1). The map is updated on `append` and `remove` and
+    rebuilt lazily after any other change to the list. `remove` is still O(n) like
+    `list.remove`: it finds the item through the map, but deleting it shifts the
+    items after it. Renaming an item in place is not tracked.
+    """
+
+    def __init__(self, confItems=()) -> None:
+        super().__init__(confItems)
+        self._index: Dict[str, List[int]] = None
+
+    def _nameIndex(self) -> Dict[str, List[int]]:
+        if self._index is None:
+            index = {}
+            for i, confItem in enumerate(self):
+                index.setdefault(confItem.name, []).append(i)
+            self._index = index
+        return self._index
+
+    def _invalidate(self) -> None:
+        self._index = None
+
+    def indexOf(self, confName: str) -> int:
+        """
+        Index of the first item named `confName`, or -1.
+        """
+        indices = self._nameIndex().get(confName)
+        return indices[0] if indices else -1
+
+    def __contains__(self, confItem: object) -> bool:
+        if confItem.__class__ != ConfItem:
+            return False
+        return any(self[i] == confItem for i in self._nameIndex().get(confItem.name, ()))
+
+    def append(self, confItem: ConfItem) -> None:
+        super().append(confItem)
+        if self._index is not None:
+            self._index.setdefault(confItem.name, []).append(len(self) - 1)
+
+    def remove(self, confItem: ConfItem) -> None:
+        index = self._nameIndex()
+        for i in index.get(confItem.name, ()):
+            if self[i] == confItem:
+                super().__delitem__(i)
+                for indices in index.values():
+                    indices[:] = [j - 1 if j > i else j for j in indices if j != i]
+                if not index[confItem.name]:
+                    del index[confItem.name]
+                return
+        raise ValueError("ConfItemList.remove(x): x not in list")
+
+    def __setitem__(self, idx, value) -> None:
+        super().__setitem__(idx, value)
+        self._invalidate()
+
+    def __delitem__(self, idx) -> None:
+        super().__delitem__(idx)
+        self._invalidate()
+
+    def __iadd__(self, confItems):
+        result = super().__iadd__(confItems)
+        self._invalidate()
+        return result
+
+    def __imul__(self, n):
+        result = super().__imul__(n)
+        self._invalidate()
+        return result
+
+    def extend(self, confItems) -> None:
+        super().extend(confItems)
+        self._invalidate()
+
+    def insert(self, idx, confItem: ConfItem) -> None:
+        super().insert(idx, confItem)
+        self._invalidate()
+
+    def pop(self, idx=-1) -> ConfItem:
+        confItem = super().pop(idx)
+        self._invalidate()
+        return confItem
+
+    def clear(self) -> None:
+        super().clear()
+        self._invalidate()
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self._invalidate()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._invalidate()
+
+
 class Seed(CounterWriteToFileInterface):
     """
     This is a data model for seed in configuration fuzzing.
@@ -14,9 +112,17 @@ class Seed(CounterWriteToFileInterface):
         if confItems is None:
             confItems = []
         super().__init__()
-        self.confItemList: List[ConfItem] = confItems
+        self.confItemList = confItems
         self._noneConfItem = ConfItem()
 
+    @property
+    def confItemList(self) -> ConfItemList:
+        return self._confItemList
+
+    @confItemList.setter
+    def confItemList(self, confItems: List[ConfItem]) -> None:
+        self._confItemList = confItems if isinstance(confItems, ConfItemList) else ConfItemList(confItems)
+
     def __getitem__(self, idx: int) -> ConfItem:
         if idx >= self.confItemList.__len__():
             return self._noneConfItem
@@ -32,6 +138,28 @@ class Seed(CounterWriteToFileInterface):
     def __str__(self) -> str:
         return "Seed:\n" + "".join(conf.__str__() + "\n" for conf in self.confItemList)
 
+    def findConfItem(self, confName: str):
+        """
+        Find the first configuration item named `confName`.
+
+        Args:
+            confName (str): name of a configuration item
+
+        Returns:
+            A tuple of the item's index and a copy of the item, or (-1, None) if the seed has no such item.
+        """
+        index = self.confItemList.indexOf(confName)
+        if index == -1:
+            return index, None
+        return index, self.confItemList[index].copy()
+
+    def fingerprint(self) -> str:
+        """
+        A content hash of the (name, value) pairs of this seed, independent of their order.
+        """
+        content = "\n".join(sorted(f"{conf.name}={conf.value}" for conf in self.confItemList))
+        return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
     def addConfItem(self, confItem: ConfItem) -> None:
         """
         The addConfItem function adds a ConfItem to the list of confItems.
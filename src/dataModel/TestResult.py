@@ -15,6 +15,14 @@ class TestResult(CounterWriteToFileInterface):
         self.failed_tests_count = 0
         self.unitTestcasePath = ''
         self.trimmedTestcasePath = ''
+        # set by SystemTester when the failure raised an exception never seen before
+        self.newException = False
+        # probes this run covered for the first time, -1 if coverage was not measured
+        self.newCoverage = -1
+        # signature of the exception the system test failed with, '' if none
+        self.exception = ''
+        # seconds the stage producing this result took
+        self.duration = 0.0
 
     def __str__(self) -> str:
         return "TestResult(status:{0}, failed_tests_count:{1}, sysFailType:{2}, description:{3:10})".format(
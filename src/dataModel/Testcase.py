@@ -20,6 +20,9 @@ class Testcase(Seed):
         if confItems is None:
             confItems = []
         super().__init__(confItems)
+        # the mutation operator and the items it mutated, if the mutator records them
+        self.mutationOperator: str = ""
+        self.mutatedConfNames: List[str] = []
         # self.fileDir = Configuration.fuzzerConf['unit_testcase_dir']
 
     def __str__(self) -> str:
@@ -43,8 +46,26 @@ class Testcase(Seed):
             filePath = os.path.join(fileDir, self.fileName)
 
         self.filePath = filePath
+        rendered = self.render()
+        if rendered is None:
+            self.logger.info("it doesn't support the given project : ".format(Configuration.fuzzerConf['project']))
+            return self.filePath
+        content, extension = rendered
+        self.filePath = f'{self.filePath}{extension}'
+        with open(self.filePath, 'wb') as file:
+            file.write(content)
+
+        return self.filePath
+
+    def render(self):
+        """
+        The configuration file of this testcase for the project under test.
+
+        Returns:
+            (content, extension): the file content as bytes and its extension,
+            or None if the project is not supported.
+        """
         if Configuration.fuzzerConf['project'] in ["hadoop-common", "hadoop-hdfs", "hbase"]:
-            self.filePath = f'{self.filePath}.xml'
             conf = ET.Element("configuration")
             for confItem in self.confItemList:
                 p, v = confItem.name, confItem.value
@@ -53,23 +74,14 @@ class Testcase(Seed):
                 value = ET.SubElement(prop, "value")
                 name.text = p
                 value.text = v
-            with open(self.filePath, 'wb') as file:
-                file.write(str.encode(
-                    "<?xml version=\"1.0\"?>\n<?xml-stylesheet type=\"text/xsl\" href=\"configuration.xsl\"?>\n"))
-                file.write(ET.tostring(conf))
+            return str.encode(
+                "<?xml version=\"1.0\"?>\n<?xml-stylesheet type=\"text/xsl\" href=\"configuration.xsl\"?>\n") \
+                + ET.tostring(conf), '.xml'
         elif Configuration.fuzzerConf['project'] in ["zookeeper"]:
-            self.filePath = f'{self.filePath}.cfg'
-            with open(self.filePath, "w") as file:
-                for confItem in self.confItemList:
-                    p, v = confItem.name, confItem.value
-                    file.write(f"{p}={v}" + "\n")
+            return self.renderProperties(), '.cfg'
         elif Configuration.fuzzerConf['project'] in ["alluxio"]:
-            self.filePath = f'{self.filePath}.properties'
-            with open(self.filePath, "w") as file:
-                for confItem in self.confItemList:
-                    p, v = confItem.name, confItem.value
-                    file.write(f"{p}={v}" + "\n")
-        else:
-            self.logger.info("it doesn't support the given project : ".format(Configuration.fuzzerConf['project']))
+            return self.renderProperties(), '.properties'
+        return None
 
-        return self.filePath
+    def renderProperties(self) -> bytes:
+        return "".join(f"{confItem.name}={confItem.value}\n" for confItem in self.confItemList).encode()
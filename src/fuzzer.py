@@ -10,14 +10,22 @@ import gc
 from seedGenerator.SeedGenerator import SeedGenerator
 from testValidator.TestValidator import TestValidator
 from testcaseGenerator.TestcaseGenerator import TestcaseGenerator
+from utils.Checkpoint import Checkpoint
 from utils.ConfAnalyzer import ConfAnalyzer
 from utils.Configuration import Configuration
+from utils.Coordinator import Coordinator, CoordinatorServer
+from utils.EventLoop import EventLoop
+from utils.FuzzContext import FuzzContext
 
 from utils.InstanceCreator import InstanceCreator
 from utils.Logger import Logger
+from utils.Pipeline import Pipeline
+from utils.ResultsDb import ResultsDb
 from utils.ShowStats import ShowStats
+from utils.TimeSeries import binaryPath
+from utils.UnitConstant import FUZZER_DIR
 
-import time, signal, threading
+import time, signal
 
 from queue import Queue
 
@@ -43,6 +51,7 @@ class Fuzzer(object):
         self.logger.info("Parse configurations...")
         self.commandConf: Dict[str, str] = self.getOpt()
         Configuration.parseConfiguration(self.commandConf)
+        Logger.configure(Configuration.fuzzerConf)
         self.fuzzerConf: Dict[str, str] = Configuration.fuzzerConf
         self.putConf: Dict[str, str] = Configuration.putConf
 
@@ -155,26 +164,98 @@ class Fuzzer(object):
             self.logger.error(f">>>>[LLM Integration] Error: {e}")
         # ================= [LLM & RAG 集成代码结束] =================
 
+        # the process-wide state; FuzzContext.fork gives further workers their own
+        self.context: FuzzContext = FuzzContext.default()
+
         self.logger.info("Creating a TestcaseGenerator...")
         mutatorClassPath = self.fuzzerConf['mutator']
-        self.testcaseGenerator: TestcaseGenerator = TestcaseGenerator(InstanceCreator.getInstance(mutatorClassPath))
+        self.testcaseGenerator: TestcaseGenerator = TestcaseGenerator(InstanceCreator.getInstance(mutatorClassPath),
+                                                                      int(self.fuzzerConf.get('dedup_retry', 5)),
+                                                                      self.context)
 
         self.logger.info("Creating a TestValidator...")
-        self.testValidator: TestValidator = TestValidator()
-        if os.path.exists(self.fuzzerConf['plot_data_path']):
-            os.remove(self.fuzzerConf['plot_data_path'])
+        self.testValidator: TestValidator = TestValidator(self.context)
+
+        # overlap mutation, unit tests and system tests of consecutive testcases
+        self.pipeline: Pipeline = None
+        self.pipelineDepth: int = int(self.fuzzerConf.get('pipeline_depth', 2))
+        self.lastCommitTime: float = 0.0
+        # seed being mutated for remote workers, see nextRemoteTestcase
+        self.remoteSeed: Seed = None
+        self.remoteSeedUses: int = 0
+        self.coordinator: Coordinator = None
+        if self.fuzzerConf.get('pipeline', 'False') == 'True':
+            self.logger.info(f"Pipelined fuzz loop with depth {self.pipelineDepth}...")
+            self.pipeline = Pipeline([("unit", self.unitStage), ("system", self.systemStage)], self.pipelineDepth)
+            self.pipeline.recordBusy("mutate", 0.0)
+
+        self.resumePath = self.commandConf.get('resume')
+        if self.resumePath:
+            self.logger.info(f"Resume campaign from checkpoint {self.resumePath}...")
+            self.restoreState(Checkpoint.load(self.resumePath))
+        else:
+            for path in (self.fuzzerConf['plot_data_path'], binaryPath(self.fuzzerConf['plot_data_path'])):
+                if os.path.exists(path):
+                    os.remove(path)
+        self.checkpoint = Checkpoint(self.fuzzerConf.get('checkpoint_path', os.path.join(FUZZER_DIR, "checkpoint.ckpt")),
+                                     float(self.fuzzerConf.get('checkpoint_interval', 600)))
+        # every tested testcase with its outcomes, queryable with `python -m utils.ResultsDb`
+        self.resultsDb: ResultsDb = None
+        if self.fuzzerConf.get('results_db', 'False') == 'True':
+            self.resultsDb = ResultsDb(self.fuzzerConf.get('results_db_path', os.path.join(FUZZER_DIR, "results.db")),
+                                       float(self.fuzzerConf.get('results_db_flush_interval', 10)),
+                                       int(self.fuzzerConf.get('results_db_flush_rows', 64)))
 
         if self.fuzzerConf['data_viewer'] == 'True':
             from utils.DataViewer import DataViewer
             self.dataViewer = DataViewer(self.fuzzerConf['data_viewer_env'])
 
     def sigintHandler(self, signum, frame):
+        # only ask the loop to stop: run() drains the pipeline and saves the last
+        # checkpoint on its way out, the handler may interrupt any of that state.
+        # A second Ctrl-C raises KeyboardInterrupt if the shutdown is stuck.
+        signal.signal(signal.SIGINT, signal.default_int_handler)
         stopSoon.put(True)
-        self.logger.info(f">>>>[fuzzer] excludeConf : {ConfAnalyzer.excludeConf}; confMutationInfo : {ConfAnalyzer.confMutationInfo}")
-        self.logger.info(f">>>>[fuzzer] receive SIGINT")
-        time.sleep(1)
-        exit(0)
-        # process.kill()
+
+    def captureState(self) -> dict:
+        """
+        Collect everything a resumed campaign needs to continue where this one stopped.
+        """
+        sysTester = self.testValidator.sysTester
+        return {
+            'showStats': ShowStats.snapshot(),
+            'excludeConf': ConfAnalyzer.excludeConf,
+            'confMutationInfo': ConfAnalyzer.confMutationInfo,
+            'seedPool': self.seedGenerator.seedPool,
+            'executedFilter': self.testcaseGenerator.executedFilter,
+            'sequentialGeneratorIndex': self.seedGenerator.sequentialGeneratorIndex,
+            'unitTestTimeMap': self.testValidator.unitTester.unitTestTimeMap,
+            'exceptionMap': getattr(sysTester, 'exceptionMap', {}),
+            'exceptionMapReason': getattr(sysTester, 'exceptionMapReason', {}),
+            'banditScheduler': getattr(self.testcaseGenerator.mutator, 'scheduler', None),
+            'coverageTracker': getattr(sysTester, 'coverage', None),
+        }
+
+    def restoreState(self, state: dict) -> None:
+        ShowStats.restore(state['showStats'])
+        ConfAnalyzer.excludeConf = set(state['excludeConf'])
+        ConfAnalyzer.excludeVersion += 1
+        ConfAnalyzer.confMutationInfo.update(state['confMutationInfo'])
+        self.seedGenerator.seedPool = state['seedPool']
+        self.seedGenerator.sequentialGeneratorIndex = state['sequentialGeneratorIndex']
+        self.seedGenerator.updateConfMutable()
+        self.testcaseGenerator.executedFilter = state['executedFilter']
+        self.testValidator.unitTester.unitTestTimeMap = state['unitTestTimeMap']
+        if state.get('banditScheduler') is not None and hasattr(self.testcaseGenerator.mutator, 'scheduler'):
+            self.testcaseGenerator.mutator.scheduler = state['banditScheduler']
+        sysTester = self.testValidator.sysTester
+        if hasattr(sysTester, 'exceptionMap'):
+            sysTester.exceptionMap = state['exceptionMap']
+            sysTester.exceptionMapReason = state['exceptionMapReason']
+        if state.get('coverageTracker') is not None and getattr(sysTester, 'coverage', None) is not None:
+            sysTester.coverage.coverageMap = state['coverageTracker'].coverageMap
+        self.logger.info(f">>>>[fuzzer] restored {len(self.seedGenerator.seedPool)} seeds, "
+                         f"{ShowStats.iterationCounts} iterations")
 
     def deleteDir(self, directory):
         if os.path.exists( directory ):
@@ -190,7 +271,7 @@ class Fuzzer(object):
         argv = sys.argv[1:]
         res = {}
         try:
-            opts, args = getopt.getopt(argv, "p",["project=","seed_pool_selection_ratio=","seed_gen_seq_ratio=","data_viewer=","data_viewer_env=","ctests_trim_sampling=","ctests_trim_scale=","skip_unit_test=","force_system_testing_ratio=","host_ip=","host_port=","run_time=","mutator=","systemtester=","ctest_total_time=","misconf_mode="])
+            opts, args = getopt.getopt(argv, "p",["project=","seed_pool_selection_ratio=","seed_gen_seq_ratio=","data_viewer=","data_viewer_env=","ctests_trim_sampling=","ctests_trim_scale=","skip_unit_test=","force_system_testing_ratio=","host_ip=","host_port=","run_time=","mutator=","systemtester=","ctest_total_time=","misconf_mode=","resume="])
             # opts, args = getopt.getopt(argv, ["project=","seed_pool_selection_ratio=","seed_gen_seq_ratio=","data_viewer=","data_viewer_env=","ctests_trim_sampling=","ctests_trim_scale=","skip_unit_test=","force_system_testing_ratio="])
         except:
             self.logger.info("Parameter Setting Error")
@@ -227,6 +308,8 @@ class Fuzzer(object):
                 res["ctest_total_time"] = arg
             elif opt in ['--misconf_mode']:
                 res["misconf_mode"] = arg
+            elif opt in ['--resume']:
+                res["resume"] = arg
         return res
 
     def run(self):
@@ -242,26 +325,37 @@ class Fuzzer(object):
             from utils.DataViewer import startDrawing
             startDrawing(self.dataViewer)
 
-        ShowStats.initPlotData()
+        if not self.resumePath:
+            ShowStats.initPlotData()
         ShowStats.writeToPlotData()
 
         signal.signal(signal.SIGINT, self.sigintHandler)
-        t1 = threading.Thread(target=ShowStats.run, args=[stopSoon])
-        t1.start()
+        # the stats display refreshes on the shared event loop
+        display = EventLoop.shared().submit(ShowStats.display(stopSoon))
         fuzzingLoop = int(self.fuzzerConf['fuzzing_loop'])
 
-        self.deleteDir(Configuration.fuzzerConf['unit_testcase_dir'])
-        self.deleteDir(Configuration.fuzzerConf['unit_test_results_dir'])
-        self.deleteDir(Configuration.fuzzerConf['sys_test_results_dir'])
-        self.deleteDir(Configuration.fuzzerConf['sys_testcase_fail_dir'])
+        if not self.resumePath:
+            self.deleteDir(Configuration.fuzzerConf['unit_testcase_dir'])
+            self.deleteDir(Configuration.fuzzerConf['unit_test_results_dir'])
+            self.deleteDir(Configuration.fuzzerConf['sys_test_results_dir'])
+            self.deleteDir(Configuration.fuzzerConf['sys_testcase_fail_dir'])
+            if self.testValidator.testcaseStore is not None:
+                self.testValidator.testcaseStore.reset()
+            if self.resultsDb is not None:
+                self.resultsDb.reset()
 
         # print("\033[37m")
-        if fuzzingLoop > 0:
+        role = self.fuzzerConf.get('distributed_role', '')
+        if role == 'worker':
+            self.runWorker()
+        elif role == 'coordinator':
+            self.runCoordinator(fuzzingLoop)
+        elif fuzzingLoop > 0:
             self.logger.info(f"Fuzzer ready to run for {fuzzingLoop} loops...")
             for _ in range(fuzzingLoop):
                 try:
                     if (not stopSoon.empty()):
-                        t1.join()
+                        display.result()
                         break
                 except Exception as e:
                     print(e)
@@ -280,7 +374,7 @@ class Fuzzer(object):
             while True:
                 try:
                     if not stopSoon.empty():
-                        t1.join()
+                        display.result()
                         break
                 except Exception as e:
                     print(e)
@@ -295,6 +389,22 @@ class Fuzzer(object):
                     self.logger.info(e)
                     break
         stopSoon.put(True)
+        self.logger.info(f">>>>[fuzzer] excludeConf : {ConfAnalyzer.excludeConf}; confMutationInfo : {ConfAnalyzer.confMutationInfo}")
+        self.drainPipeline()
+        # the plot rows up to this point must be on disk when the campaign is resumed;
+        # the writer flushes on its own while the campaign runs
+        ShowStats.flushPlotData()
+        if self.coordinator is not None:
+            # request threads of the coordinator may still be committing a result
+            with self.coordinator.lock:
+                self.checkpoint.saveNow(self.captureState())
+        else:
+            self.checkpoint.saveNow(self.captureState())
+        self.checkpoint.close()
+        if self.testValidator.testcaseStore is not None:
+            self.testValidator.testcaseStore.close()
+        if self.resultsDb is not None:
+            self.resultsDb.close()
         # write data to db
         result_data = {}
         result_data['totalSystemTestFailed'] = ShowStats.totalSystemTestFailed
@@ -302,12 +412,13 @@ class Fuzzer(object):
         result_data['totalSystemTestFailed_Type2'] = ShowStats.totalSystemTestFailed_Type2
         result_data['totalSystemTestFailed_Type3'] = ShowStats.totalSystemTestFailed_Type3
         result_data['system_testcase_num'] = ShowStats.totalSystemTestcases
-        if self.testValidator.useMongo == 'True':
-            self.testValidator.mongoDb.insert_result_to_db(result_data)
-            # save exception map
-            self.testValidator.mongoDb.insert_exception_to_db(self.testValidator.sysTester.exceptionMap)
-            self.logger.info(f'map reason is: {self.testValidator.sysTester.exceptionMapReason}')
-            self.testValidator.mongoDb.insert_map_to_db("ExceptionMapReason", self.testValidator.sysTester.exceptionMapReason)
+        mongoWriter = self.testValidator.mongoWriter
+        mongoWriter.insert("result", result_data)
+        # save exception map
+        mongoWriter.insert("exception-map", self.testValidator.sysTester.exceptionMap)
+        self.logger.info(f'map reason is: {self.testValidator.sysTester.exceptionMapReason}')
+        mongoWriter.insert("ExceptionMapReason", self.testValidator.sysTester.exceptionMapReason)
+        mongoWriter.close(timeout=float(self.fuzzerConf.get('mongo_close_timeout', 30)))
         # save cov data
         # self.testValidator.mongoDb.insert_cov_unit_to_db(self.testValidator.covUnitData)
         # self.testValidator.mongoDb.insert_cov_sys_to_db(self.testValidator.covSysData)
@@ -320,6 +431,68 @@ class Fuzzer(object):
             from utils.DataViewer import stopDrawing
             stopDrawing(self.dataViewer)
 
+    def runCoordinator(self, fuzzingLoop: int) -> None:
+        """
+        Serve testcases to remote workers instead of testing them here, see `Coordinator`.
+        """
+        # workers on other hosts need an explicit address, and should share a token
+        host, port = self.fuzzerConf.get('coordinator_address', '127.0.0.1:9860').rsplit(':', 1)
+        token = self.fuzzerConf.get('coordinator_token', '')
+        coordinator = self.coordinator = Coordinator(self.nextRemoteTestcase, self.commitRemote,
+                                                     float(self.fuzzerConf.get('lease_timeout', 1800)))
+        server = CoordinatorServer(coordinator, host, int(port), token).start()
+        self.logger.info(f">>>>[fuzzer] coordinator listening on {host}:{port}")
+        if not token and host not in ('127.0.0.1', 'localhost', '::1'):
+            self.logger.warning(f">>>>[fuzzer] coordinator on {host}:{port} has no coordinator_token, "
+                                f"anyone who can reach it can submit results")
+        maxJobs = fuzzingLoop * int(self.fuzzerConf['testcase_per_seed'])
+        while stopSoon.empty():
+            if time.time() - ShowStats.fuzzerStartTime > 3600 * int(Configuration.fuzzerConf['run_time']) or \
+                    (maxJobs > 0 and coordinator.stats['completed'] >= maxJobs):
+                break
+            time.sleep(1)
+            with coordinator.lock:
+                self.checkpoint.maybeSave(self.captureState)
+        # workers asking for work are told to stop, run() saves the last checkpoint
+        server.close()
+        self.logger.info(f">>>>[fuzzer] coordinator stopped: {coordinator.status()}")
+
+    def runWorker(self) -> None:
+        from utils.Worker import Worker, WorkerClient
+        client = WorkerClient(self.fuzzerConf.get('coordinator_address', '127.0.0.1:9860'),
+                              token=self.fuzzerConf.get('coordinator_token', ''))
+        Worker(client, self.testValidator, self.fuzzerConf.get('worker_corpus_dir')).run(stopSoon)
+
+    def nextRemoteTestcase(self):
+        # each seed is mutated `testcase_per_seed` times, as in `loop`
+        if self.remoteSeed is None or self.remoteSeedUses >= int(self.fuzzerConf['testcase_per_seed']):
+            self.seedGenerator.updateConfMutable()
+            self.remoteSeed = self.seedGenerator.generateSeed()
+            self.remoteSeedUses = 0
+            ShowStats.loopCounts += 1
+        self.remoteSeedUses += 1
+        return self.remoteSeed, self.testcaseGenerator.mutate(self.remoteSeed)
+
+    def commitRemote(self, seed: Seed, testcase, utResult, sysResult, trimmedTestcase):
+        # the testers ran on a worker, so their counters are kept here
+        if sysResult is not None:
+            # a worker only knows the exceptions it raised itself, the campaign-wide map lives here
+            sysTester = self.testValidator.sysTester
+            if sysResult.exception and hasattr(sysTester, 'recordException'):
+                sysResult.newException = sysTester.recordException(sysResult.exception, testcase)
+            else:
+                sysResult.newException = False
+            ShowStats.totalSystemTestcases += 1
+            if sysResult.status == 1:
+                ShowStats.totalSystemTestFailed += 1
+                if sysResult.sysFailType == 1:
+                    ShowStats.totalSystemTestFailed_Type1 += 1
+                elif sysResult.sysFailType == 2:
+                    ShowStats.totalSystemTestFailed_Type2 += 1
+                elif sysResult.sysFailType == 3:
+                    ShowStats.totalSystemTestFailed_Type3 += 1
+        return self.commitResult(seed, testcase, utResult, sysResult, trimmedTestcase)
+
     def loop(self, stopSoon: Queue):
         """
         The loop function is the core of the fuzzer. It is meant to be run in a while loop,
@@ -342,21 +515,85 @@ class Fuzzer(object):
         for _ in range(testcasePerSeed):
             self.logger.info(">>>>[fuzzer] start to mutate seed")
             self.logger.info(">>>>[fuzzer] seed len is : {}".format(seed.confItemList.__len__()))
+            mutateStart = time.time()
             testcase = self.testcaseGenerator.mutate(seed)
             self.logger.info(">>>>[fuzzer] mutated testcase's length is : {}".format(len(testcase.confItemList)))
-            utResult, sysResult, trimmedTestcase = self.testValidator.runTest(testcase, stopSoon)
-            self.logger.info(">>>>[fuzzer] testValidator done")
-            if (utResult != None) and (utResult.status == 1) and (sysResult != None) and (sysResult.status == 0):
-                self.seedGenerator.addSeedToPool(trimmedTestcase)
-            self.logger.info(">>>>[fuzzer] handle seed done")
-            ShowStats.writeToPlotData()
-            ShowStats.iterationCounts += 1
+            if self.pipeline is None:
+                utResult, sysResult, trimmedTestcase = self.testValidator.runTest(testcase, stopSoon)
+                self.logger.info(">>>>[fuzzer] testValidator done")
+                self.commitResult(seed, testcase, utResult, sysResult, trimmedTestcase)
+            else:
+                self.pipeline.recordBusy("mutate", time.time() - mutateStart)
+                self.pipeline.submit((seed, testcase))
+                # results are committed in mutation order, at most `pipelineDepth` testcases behind
+                while self.pipeline.inFlight() > self.pipelineDepth:
+                    self.commitPipelined()
         ShowStats.loopCounts += 1
+        self.checkpoint.maybeSave(self.captureState)
         # if ShowStats.loopCounts % 5 == 0:
         #     # gc on each five round
         #     gc.collect()
         self.logger.info("run() loop end -150")
 
+    def commitResult(self, seed: Seed, testcase, utResult, sysResult, trimmedTestcase) -> Seed:
+        """
+        Feed the results of a testcase back to the generators and the seed pool.
+
+        Returns:
+            the seed offered to the seed pool, None if the testcase was not interesting.
+        """
+        self.seedGenerator.feedback(seed, utResult, sysResult)
+        self.testcaseGenerator.feedback(testcase, utResult, sysResult)
+        poolSeed = None
+        if (utResult != None) and (utResult.status == 1) and (sysResult != None) and (sysResult.status == 0):
+            poolSeed = trimmedTestcase
+        elif (sysResult != None) and (sysResult.newCoverage > 0):
+            # keep testcases that exercise code no earlier testcase reached
+            poolSeed = testcase
+            ShowStats.coverageSeeds += 1
+        if poolSeed is not None:
+            self.seedGenerator.addSeedToPool(poolSeed)
+        if self.resultsDb is not None:
+            self.resultsDb.record(testcase, utResult, sysResult, poolSeed is not None)
+        self.logger.info(">>>>[fuzzer] handle seed done")
+        ShowStats.writeToPlotData()
+        ShowStats.iterationCounts += 1
+        return poolSeed
+
+    def unitStage(self, payload):
+        seed, testcase = payload
+        utResult, needSystemTest = self.testValidator.runUnitStage(testcase)
+        return not needSystemTest, (seed, testcase, utResult, None, testcase)
+
+    def systemStage(self, payload):
+        seed, testcase, utResult, _, trimmedTestcase = payload
+        # unit tests of the next testcases run meanwhile, so no check for running maven here
+        sysResult = self.testValidator.runSystemStage(testcase, stopSoon, checkMaven=False)
+        return True, (seed, testcase, utResult, sysResult, trimmedTestcase)
+
+    def commitPipelined(self) -> None:
+        result = self.pipeline.take()
+        self.logger.info(">>>>[fuzzer] testValidator done")
+        # the stages overlap, so the exec speed is based on the time between commits
+        now = time.time()
+        self.testValidator.addTestTime(now - (self.lastCommitTime or self.pipeline.startTime))
+        self.lastCommitTime = now
+        self.commitResult(*result)
+        ShowStats.stageOccupancy = self.pipeline.describeOccupancy()
+
+    def drainPipeline(self) -> None:
+        """
+        Commit the testcases still in the pipeline and stop its workers.
+        """
+        if self.pipeline is None:
+            return
+        while self.pipeline.inFlight() > 0:
+            try:
+                self.commitPipelined()
+            except Exception as e:
+                self.logger.info(f">>>>[fuzzer] pipelined testcase failed: {e}")
+        self.pipeline.close()
+
 
 if __name__ == "__main__":
     fuzzer = Fuzzer()
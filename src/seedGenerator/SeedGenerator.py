@@ -1,10 +1,11 @@
-import copy
 import csv
 import random
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Set
 
 from dataModel.ConfItem import ConfItem
 from dataModel.Seed import Seed
+from dataModel.TestResult import TestResult
+from seedGenerator.SeedPool import SeedPool
 from utils.ConfAnalyzer import ConfAnalyzer
 from utils.Configuration import Configuration
 from utils.Logger import getLogger
@@ -17,10 +18,16 @@ class SeedGenerator(object):
     offered by `ConfAnalyzer`.
     """
 
+    # energy given to a pool seed for the outcome of a testcase mutated from it
+    sysFailTypeRewards: Dict[int, float] = {1: 2.0, 2: 3.0, 3: 1.0, 4: 1.0}
+    newExceptionReward: float = 5.0
+    unitFailureReward: float = 0.5
+    newCoverageReward: float = 1.0
+
     def __init__(self) -> None:
         self.logger = getLogger()
-        self.seedPool: List[Seed] = []
         fuzzerConf = Configuration.fuzzerConf
+        self.seedPool: SeedPool = SeedPool(capacity=int(fuzzerConf.get('seed_pool_capacity', 0)))
 
         self.seedPoolSelectionRatio = float(fuzzerConf['seed_pool_selection_ratio'])
 
@@ -29,6 +36,13 @@ class SeedGenerator(object):
         self.confItemMutableSize: int = len(self.confItemMutable)
         self.sequentialGeneratorIndex: int = 0
         self.confItems: List[str] = self.confItemsBasic + self.confItemMutable
+        self.confItemSet: Set[str] = set(self.confItems)
+        # exclusions already removed from the lists above, see updateConfMutable
+        self.appliedExcludeVersion: int = -1
+        self.appliedExcludeConf: Set[str] = set()
+        # unmutated items shared by all generated seeds, created on first use;
+        # mutators copy an item before changing it, so these are never modified
+        self.baseConfItems: Dict[str, ConfItem] = {}
         self.confItemRelations: Dict[str, List[List[str, str]]] = ConfAnalyzer.confItemRelations
         self.confItemTypeMap: Dict[str, str] = ConfAnalyzer.confItemTypeMap
         self.confItemValueMap: Dict[str, str] = ConfAnalyzer.confItemValueMap
@@ -37,17 +51,30 @@ class SeedGenerator(object):
         self.logger.info("SeedGenerator initialized.")
 
     def updateConfMutable(self) -> None:
-        # update mutable 
-        for confName in ConfAnalyzer.excludeConf:
-            if confName in self.confItemMutable:
-                self.confItemMutable.remove(confName)
+        # nothing to do unless ConfAnalyzer excluded something since the last call
+        if self.appliedExcludeVersion == ConfAnalyzer.excludeVersion:
+            return
+        self.appliedExcludeVersion = ConfAnalyzer.excludeVersion
+        newlyExcluded = ConfAnalyzer.excludeConf - self.appliedExcludeConf
+        if not newlyExcluded:
+            return
+        self.appliedExcludeConf |= newlyExcluded
+        # update mutable, in place since the list is shared with ConfAnalyzer
+        self.confItemMutable[:] = [confName for confName in self.confItemMutable if confName not in newlyExcluded]
         # update size
         self.confItemMutableSize = len(self.confItemMutable)
+        if self.sequentialGeneratorIndex >= self.confItemMutableSize:
+            self.sequentialGeneratorIndex = 0
         # update confItems
-        for confName in ConfAnalyzer.excludeConf:
-            if confName in self.confItems:
-                self.confItems.remove(confName)
-        
+        self.confItems = [confName for confName in self.confItems if confName not in newlyExcluded]
+        self.confItemSet -= newlyExcluded
+
+    def baseConfItem(self, confName: str) -> ConfItem:
+        confItem = self.baseConfItems.get(confName)
+        if confItem is None:
+            confItem = ConfItem(confName, self.confItemTypeMap[confName], self.confItemValueMap[confName])
+            self.baseConfItems[confName] = confItem
+        return confItem
 
     def generateSeed(self) -> Seed:
         """
@@ -67,26 +94,25 @@ class SeedGenerator(object):
         ShowStats.currentJob = 'generating seed'
         fromPool = self.seedPool.__len__() > 0 and random.random() > self.seedPoolSelectionRatio
         if fromPool:
-            self.logger.info("Random Choose a Seed from pool.")
-            self.lastGeneratedSeed = random.choice(self.seedPool)
+            self.logger.info("Choose a Seed from pool by energy.")
+            self.lastGeneratedSeed = self.seedPool.select()
         else:  
             self.logger.info("Try creating a Seed...")
             
-            confItemList = copy.deepcopy(self.confItemMutable)
             if Configuration.fuzzerConf['mutator'].split(".")[-1] == "SingleMutator":
                 k = 1
             else:
                 k = random.randint(3, 6)
 
+            # only the k chosen names are copied, never the whole mutable list
             if random.random() > float(Configuration.fuzzerConf['seed_gen_seq_ratio']):
-                random.shuffle(confItemList)
-                confItemList = confItemList[:k]
+                confItemList = random.sample(self.confItemMutable, min(k, self.confItemMutableSize))
             else:
                 b = min(self.confItemMutableSize, self.sequentialGeneratorIndex + k)
                 if self.sequentialGeneratorIndex > b:
-                    confItemList = confItemList[b : self.sequentialGeneratorIndex]
+                    confItemList = self.confItemMutable[b : self.sequentialGeneratorIndex]
                 else:
-                    confItemList = confItemList[self.sequentialGeneratorIndex: b]
+                    confItemList = self.confItemMutable[self.sequentialGeneratorIndex: b]
                 self.sequentialGeneratorIndex = b
                 if self.sequentialGeneratorIndex >= self.confItemMutableSize:
                     self.sequentialGeneratorIndex = 0
@@ -94,15 +120,14 @@ class SeedGenerator(object):
             relatedConfItems = []
             for confItemName in confItemList:
                 if self.confItemRelations.__contains__(confItemName):
-                    relatedConfItems.extend(relation[0] for relation in self.confItemRelations[confItemName] if relation[0] in self.confItems)
+                    relatedConfItems.extend(relation[0] for relation in self.confItemRelations[confItemName] if relation[0] in self.confItemSet)
                     
             if float(Configuration.fuzzerConf['seed_pool_selection_ratio']) == float(1) and float(Configuration.fuzzerConf['seed_gen_seq_ratio']) == 0:
                 relatedConfItems = []
 
             confItemList += relatedConfItems
 
-            confItemList = [ConfItem(name, self.confItemTypeMap[name], self.confItemValueMap[name])
-                            for name in confItemList]
+            confItemList = [self.baseConfItem(name) for name in confItemList]
 
             self.lastGeneratedSeed = Seed(confItemList)
             # self.addSeedToPool(self.lastGeneratedSeed)
@@ -119,5 +144,31 @@ class SeedGenerator(object):
         Returns:
             None
         """
-        self.seedPool.append(seed)
-        ShowStats.queueLength += 1
+        if self.seedPool.add(seed):
+            ShowStats.queueLength = len(self.seedPool)
+        else:
+            self.logger.info("Seed already in pool, skipped.")
+
+    def feedback(self, seed: Seed, utResult: TestResult, sysResult: TestResult) -> None:
+        """
+        Reward a pool seed according to the results of a testcase mutated from it.
+        Seeds that are not in the pool are ignored.
+
+        Args:
+            seed: the seed the testcase was mutated from.
+            utResult: unit test result, may be None.
+            sysResult: system test result, may be None.
+
+        Returns:
+            None
+        """
+        reward = 0.0
+        if utResult is not None and utResult.status == 1:
+            reward += self.unitFailureReward
+        if sysResult is not None and sysResult.status != 0:
+            reward += self.sysFailTypeRewards.get(sysResult.sysFailType, 0.0)
+            if sysResult.newException:
+                reward += self.newExceptionReward
+        if sysResult is not None and sysResult.newCoverage > 0:
+            reward += self.newCoverageReward
+        self.seedPool.reward(seed, reward)
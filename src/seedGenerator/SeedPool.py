@@ -0,0 +1,195 @@
+import heapq
+import random
+from typing import Dict, List, Optional
+
+from dataModel.Seed import Seed
+
+
+class FenwickTree(object):
+    """
+    A Fenwick (binary indexed) tree over seed energies, giving O(log n) updates,
+    prefix sums and weighted lookups.
+    """
+
+    def __init__(self, size: int = 0) -> None:
+        self.size: int = size
+        self.tree: List[float] = [0.0] * (size + 1)
+
+    def add(self, index: int, delta: float) -> None:
+        index += 1
+        while index <= self.size:
+            self.tree[index] += delta
+            index += index & -index
+
+    def prefixSum(self, index: int) -> float:
+        """
+        Sum of the weights of slots [0, index).
+        """
+        total = 0.0
+        while index > 0:
+            total += self.tree[index]
+            index -= index & -index
+        return total
+
+    def total(self) -> float:
+        return self.prefixSum(self.size)
+
+    def find(self, target: float) -> int:
+        """
+        Return the first slot whose prefix sum (inclusive) exceeds `target`.
+        """
+        index = 0
+        step = 1 << self.size.bit_length()
+        while step > 0:
+            nextIndex = index + step
+            if nextIndex <= self.size and self.tree[nextIndex] <= target:
+                index = nextIndex
+                target -= self.tree[nextIndex]
+            step >>= 1
+        return min(index, self.size - 1)
+
+    @staticmethod
+    def build(weights: List[float], size: int) -> 'FenwickTree':
+        tree = FenwickTree(size)
+        for i, weight in enumerate(weights):
+            tree.tree[i + 1] += weight
+        for i in range(1, size + 1):
+            parent = i + (i & -i)
+            if parent <= size:
+                tree.tree[parent] += tree.tree[i]
+        return tree
+
+
+class SeedPool(object):
+    """
+    A seed pool with energy-weighted selection, deduplication and bounded capacity.
+
+    Seeds are deduplicated by `Seed.fingerprint()`. Every seed carries an energy:
+    selection probability is proportional to it, `reward` decays it and adds the
+    reward of the latest outcome, so productive seeds are picked more and dead
+    ones fade towards `minEnergy`. When the pool holds `capacity` seeds (0 means
+    unbounded) the seed with the lowest energy is evicted to make room.
+    """
+
+    def __init__(self, capacity: int = 0, initialEnergy: float = 1.0, minEnergy: float = 0.05,
+                 decay: float = 0.9) -> None:
+        self.capacity: int = capacity
+        self.initialEnergy: float = initialEnergy
+        self.minEnergy: float = minEnergy
+        self.decay: float = decay
+
+        self.seeds: List[Optional[Seed]] = []
+        self.energies: List[float] = []
+        self.versions: List[int] = []
+        self.freeSlots: List[int] = []
+        self.slotOf: Dict[str, int] = {}
+        self.tree: FenwickTree = FenwickTree()
+        # (energy, version, slot); entries whose version is outdated are skipped
+        self.heap: List[tuple] = []
+        self.evictedCount: int = 0
+        self.duplicateCount: int = 0
+
+    def __len__(self) -> int:
+        return len(self.slotOf)
+
+    def __contains__(self, seed: Seed) -> bool:
+        return seed.fingerprint() in self.slotOf
+
+    def __iter__(self):
+        return (seed for seed in self.seeds if seed is not None)
+
+    def add(self, seed: Seed, energy: float = None) -> bool:
+        """
+        Add a seed to the pool. Returns False if an identical seed is already in it.
+        """
+        fingerprint = seed.fingerprint()
+        if fingerprint in self.slotOf:
+            self.duplicateCount += 1
+            return False
+        if self.capacity > 0 and len(self) >= self.capacity:
+            self.evict()
+        if not self.freeSlots:
+            self.grow()
+        slot = self.freeSlots.pop()
+        self.seeds[slot] = seed
+        self.slotOf[fingerprint] = slot
+        self.setEnergy(slot, self.initialEnergy if energy is None else max(self.minEnergy, energy))
+        return True
+
+    def select(self) -> Seed:
+        """
+        Pick a seed with probability proportional to its energy.
+        """
+        if len(self) == 0:
+            raise IndexError("select from an empty seed pool")
+        slot = self.tree.find(random.random() * self.tree.total())
+        if self.seeds[slot] is None:
+            # only reachable through float rounding at the very end of the range
+            slot = max(self.slotOf.values())
+        return self.seeds[slot]
+
+    def energyOf(self, seed: Seed) -> float:
+        slot = self.slotOf.get(seed.fingerprint())
+        return 0.0 if slot is None else self.energies[slot]
+
+    def reward(self, seed: Seed, reward: float) -> bool:
+        """
+        Decay the energy of `seed` and add `reward` to it. Returns False if the seed is not in the pool.
+        """
+        slot = self.slotOf.get(seed.fingerprint())
+        if slot is None:
+            return False
+        self.setEnergy(slot, max(self.minEnergy, self.energies[slot] * self.decay + reward))
+        return True
+
+    def remove(self, seed: Seed) -> bool:
+        slot = self.slotOf.pop(seed.fingerprint(), None)
+        if slot is None:
+            return False
+        self.freeSlot(slot)
+        return True
+
+    def evict(self) -> Seed:
+        """
+        Remove and return the seed with the lowest energy.
+        """
+        while self.heap:
+            energy, version, slot = heapq.heappop(self.heap)
+            if self.versions[slot] == version and self.seeds[slot] is not None:
+                seed = self.seeds[slot]
+                del self.slotOf[seed.fingerprint()]
+                self.freeSlot(slot)
+                self.evictedCount += 1
+                return seed
+        raise IndexError("evict from an empty seed pool")
+
+    def setEnergy(self, slot: int, energy: float) -> None:
+        self.tree.add(slot, energy - self.energies[slot])
+        self.energies[slot] = energy
+        self.versions[slot] += 1
+        heapq.heappush(self.heap, (energy, self.versions[slot], slot))
+        if len(self.heap) > 4 * len(self) + 64:
+            self.compactHeap()
+
+    def freeSlot(self, slot: int) -> None:
+        self.tree.add(slot, -self.energies[slot])
+        self.energies[slot] = 0.0
+        self.versions[slot] += 1
+        self.seeds[slot] = None
+        self.freeSlots.append(slot)
+
+    def grow(self) -> None:
+        oldSize = len(self.seeds)
+        newSize = max(16, oldSize * 2)
+        if self.capacity > 0:
+            newSize = max(oldSize + 1, min(newSize, self.capacity))
+        self.seeds.extend([None] * (newSize - oldSize))
+        self.energies.extend([0.0] * (newSize - oldSize))
+        self.versions.extend([0] * (newSize - oldSize))
+        # hand out low slots first
+        self.freeSlots.extend(range(newSize - 1, oldSize - 1, -1))
+        self.tree = FenwickTree.build(self.energies, newSize)
+
+    def compactHeap(self) -> None:
+        self.heap = [(self.energies[slot], self.versions[slot], slot) for slot in self.slotOf.values()]
+        heapq.heapify(self.heap)
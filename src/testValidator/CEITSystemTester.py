@@ -10,25 +10,29 @@ from testValidator.ceit.TestEngine import TestEngine
 from testValidator.ceit.DataEngine import DataEngine
 from testValidator.ceit.ResultEngine import ResultEngine
 from testValidator.ceit.data_recorder.data_structure import DetailedResults
-from utils.Configuration import Configuration
+from testValidator.ceit.system_tester.async_runner import AsyncTestRunner
+from utils.FuzzContext import FuzzContext
 from utils.Logger import getLogger
-from utils.ShowStats import ShowStats
 
 
 class CEITSystemTester(Tester):
-    def __init__(self):
+    def __init__(self, context: FuzzContext = None):
         super().__init__()
         self.logger = getLogger()
-        self.project: str = Configuration.fuzzerConf['project']
-        self.putConf = Configuration.putConf
+        self.context = context or FuzzContext.default()
+        self.stats = self.context.stats
+        self.project: str = self.context.fuzzerConf['project']
+        self.putConf = self.context.putConf
         self.test_mode = self.putConf['test_mode']
         self.conf_path = self.putConf['replace_conf_path']
         self.testEngine = TestEngine(self.logger, self.test_mode,
                                      float(self.putConf['interval']), self.putConf['log_file_path'])
         self.dataEngine = DataEngine(self.logger, self.project)
         self.resultEngine = ResultEngine(self.logger, self.putConf['char2cut'])
+        # how many independent test scripts may run at the same time
+        self.parallelism = int(self.putConf.get('parallelism', '1'))
         # init pre_find_time as fuzzer start time
-        self.preFindTime: float = ShowStats.fuzzerStartTime
+        self.preFindTime: float = self.stats.fuzzerStartTime
         self.totalTime: float = 0.0 # total time for run time
         self.totalCount: int = 0 # it equals to the testcases' number  
 
@@ -51,7 +55,7 @@ class CEITSystemTester(Tester):
         # self.logger.info(f"filter list:{conf_name_list}")
 
         self.misconf = 'ecfuzz'
-        self.misconf_mode = Configuration.fuzzerConf['mutator']
+        self.misconf_mode = self.context.fuzzerConf['mutator']
 
     def run(self) -> int:
         if self.test_mode == "Default":
@@ -73,12 +77,9 @@ class CEITSystemTester(Tester):
             # res = os.system(cleancom)
             sysStartTime = time.time()
             try:
-                for test_case in test_cases:
-                    self.logger.info(f"run testscript {test_case.id}")
-                    test_case.run()
-                    if not test_case.result:
-                        self.failed_case.append(str(test_case.id))
-                        self.dataEngine.set_testcase_results_fail(test_case.id)                
+                for test_case_id in AsyncTestRunner(test_cases, self.parallelism).run():
+                    self.failed_case.append(test_case_id)
+                    self.dataEngine.set_testcase_results_fail(test_case_id)
             except Exception as e:
                 self.logger.error(f"Exception while testing: {e}")
             finally:
@@ -90,10 +91,10 @@ class CEITSystemTester(Tester):
             onceSysTime = sysEndTime - sysStartTime
             self.totalTime += onceSysTime
             self.totalCount += 1
-            ShowStats.averageSystemTestTime = self.totalTime / self.totalCount
-            ShowStats.systemTestExecSpeed = self.totalCount / self.totalTime
-            ShowStats.totalSystemTestcases = self.totalCount
-            ShowStats.longgestSystemTestTime = max(ShowStats.longgestSystemTestTime, onceSysTime)
+            self.stats.averageSystemTestTime = self.totalTime / self.totalCount
+            self.stats.systemTestExecSpeed = self.totalCount / self.totalTime
+            self.stats.totalSystemTestcases = self.totalCount
+            self.stats.longgestSystemTestTime = max(self.stats.longgestSystemTestTime, onceSysTime)
             self.logger.info(f"{self.dataEngine.value()}")
             self.dataEngine.flush()
             self.logger.info("-----------Test Report-------------")
@@ -193,36 +194,36 @@ class CEITSystemTester(Tester):
         analyzer_results = self.dataEngine.value.overall_results.results["analyzer_results"]
         if testcase_results == "Fail":
             status = 1
-            ShowStats.lastNewFailSystemTest = 0.0
+            self.stats.lastNewFailSystemTest = 0.0
             self.preFindTime = sysEndTime
-            ShowStats.totalSystemTestFailed += 1
+            self.stats.totalSystemTestFailed += 1
         else:
-            ShowStats.lastNewFailSystemTest = sysEndTime - self.preFindTime
+            self.stats.lastNewFailSystemTest = sysEndTime - self.preFindTime
         if testcase_results == "Pass" and analyzer_results == "Good":
             ceitType = 1
-            ShowStats.totalSystemTestReaction_1 += 1
+            self.stats.totalSystemTestReaction_1 += 1
         elif testcase_results == "Fail" and analyzer_results == "Good":
             ceitType = 2
-            ShowStats.totalSystemTestReaction_2 += 1
+            self.stats.totalSystemTestReaction_2 += 1
         elif testcase_results == "Fail" and analyzer_results == "Bad":
             ceitType = 3
-            ShowStats.totalSystemTestReaction_3 += 1
+            self.stats.totalSystemTestReaction_3 += 1
         elif testcase_results == "Pass" and analyzer_results == "Bad":
             ceitType = 4
-            ShowStats.totalSystemTestReaction_4 += 1
+            self.stats.totalSystemTestReaction_4 += 1
         observer_crash_results = str(self.dataEngine.value.overall_results.results["observer_results"]["crash"])
         observer_hang_results = str(self.dataEngine.value.overall_results.results["observer_results"]["hang"])
         observer_termination_results = str(self.dataEngine.value.overall_results.results["observer_results"]["termination"])
         if observer_crash_results == "True" or observer_hang_results == "True" or observer_termination_results == "True":
             abObservation = 1
-            ShowStats.totalAbnormalObservation += 1
+            self.stats.totalAbnormalObservation += 1
         # self.dataEngine.dump_overall_results(file_path)
         return status, ceitType, abObservation        
         
 
     def replaceConfig(self, testcase: Testcase):
         srcReplacePath = testcase.filePath
-        dstReplacePath = Configuration.putConf['replace_conf_path']
+        dstReplacePath = self.context.putConf['replace_conf_path']
         shutil.copyfile(srcReplacePath, dstReplacePath)
         self.logger.info(
             f">>>>[CEIT systest] {srcReplacePath} replacement to the corresponding configuration file:{dstReplacePath}")
@@ -233,7 +234,7 @@ class CEITSystemTester(Tester):
         sysEndTime = self.run()
         # self.start_offline_analyzing()
         self.failures_analyzing(testcase=testcase)
-        ceitStatus, ceitType, abObservation = self.classify_overall_results(os.path.join(Configuration.fuzzerConf['sys_test_results_dir'],'ceit.csv'), sysEndTime)
+        ceitStatus, ceitType, abObservation = self.classify_overall_results(os.path.join(self.context.fuzzerConf['sys_test_results_dir'],'ceit.csv'), sysEndTime)
         self.logger.info("ceit-run-173")
         self.logger.info(f">>>>[CEIT systest] status: {ceitStatus}, ceitType: {ceitType}, abnormalObservation: {abObservation}.")
         return TestResult(status = ceitStatus, ceitType = ceitType, abnormalObservation = abObservation, description = str(self.dataEngine.value.overall_results()))
@@ -33,7 +33,7 @@ class DichotomyTrimmer(NormalTrimmer):
         """
         The dichotomySingle function takes a list of configuration items and returns a trimmed list of configuration items.
         The dichotomySingle function will try to trim the testcase by setting half of the configurations to default values,
-        and run the test case. If it fails, then it will restore all original values and set another half to default values.
+        and run the test case. If it fails, then it will set another half of the original items to default values.
         This process is repeated until all configurations are set to default value, or we reach maximum try times.
 
         Args:
@@ -56,16 +56,13 @@ class DichotomyTrimmer(NormalTrimmer):
 
             fixConfItemsIndexes = indexes[:confItemsLen//2]
 
-            oldValueMap = {}
-
-            # set half of configuration items to default values,
-            # and store the original values.
+            # set half of configuration items to default values in copies,
+            # the original items may be shared with other seeds.
+            trialConfItems = list(confItems)
             for i in fixConfItemsIndexes:
-                confItem = confItems[i]
-                oldValueMap[confItem.name] = confItem.value
-                confItem.value = self.defaultValueMap[confItem.name]
+                trialConfItems[i] = self.defaultConfItem(confItems[i])
 
-            testcase.confItemList = confItems
+            testcase.confItemList = trialConfItems
             testcase.writeToFile('tmp_testcase')
 
             result = self.systemTester.runTest(testcase)
@@ -74,11 +71,6 @@ class DichotomyTrimmer(NormalTrimmer):
                 trimmedConfItems = [confItems[i] for i in indexes[confItemsLen//2:]]
                 return trimmedConfItems, True
 
-            # restore the values of configuration items
-            for i in fixConfItemsIndexes:
-                confItem = confItems[i]
-                confItem.value = oldValueMap[confItem.name]
-
             tryCount += 1
             if tryCount > self.maxTry:
                 return confItems, False
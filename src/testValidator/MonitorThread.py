@@ -1,64 +1,43 @@
-import psutil, time, os, threading
+import concurrent.futures
+import psutil, os
 from queue import Queue
 
+from utils.EventLoop import EventLoop
+
 class MonitorThread(object):
     # static filed
     CpuException : bool = False
     MemoryException : bool = False
     FileSizeException : bool = False
     
+    # the monitor sets the flags on `flags`, MonitorThread itself or a FuzzContext's MonitorFlags
     @staticmethod
-    def cpuMonitorThread(stopQueue: Queue, stopSoon) -> None:
-        # init the flag
-        MonitorThread.CpuException = False
-        data = []
-        while True:
-            # check the cpuPercent per second
-            time.sleep(2)
-            cpuPercent = psutil.cpu_percent()
-            data.append(cpuPercent)
-            if len(data) >= 5 and MonitorThread.isContinue(data):
-                MonitorThread.CpuException = True
-            # determine when to kill the thread
-            if not stopQueue.empty():
-                break
-            if not stopSoon.empty():
-                break
-            
-    @staticmethod
-    def memoryMonitorThread(stopQueue: Queue, stopSoon) -> None:
-        # init the flag
-        MonitorThread.MemoryException = False
-        data = []
-        while True:
-            # check the memoryPercent per second
-            time.sleep(2)
-            memoryPercent = psutil.virtual_memory().percent
-            data.append(memoryPercent)
-            if len(data) >= 5 and MonitorThread.isContinue(data):
-                MonitorThread.MemoryException = True
-            # determine when to kill the thread
-            if not stopQueue.empty():
-                break
-            if not stopSoon.empty():
-                break
-    
-    @staticmethod
-    def fileSizeMonitorThread(stopQueue: Queue, fileDir:str, stopSoon) -> None:
-        # init the flag
-        MonitorThread.FileSizeException = False
-        while True:
-            # check the cpuPercent per second
-            time.sleep(2)
-            fileSize = MonitorThread.get_dir_size(fileDir)
-            if fileSize > 500:
-                MonitorThread.FileSizeException = True
-            # determine when to kill the thread
-            if not stopQueue.empty():
-                break
-            if not stopSoon.empty():
-                break
-    
+    async def monitor(stopQueue: Queue, fileDir: str, stopSoon, flags=None, interval: float = 2) -> None:
+        """
+        Sample cpu, memory and the size of `fileDir` every `interval` seconds
+        until `stopQueue` or `stopSoon` is not empty.
+        """
+        flags = flags or MonitorThread
+        # init the flags
+        flags.CpuException = False
+        flags.MemoryException = False
+        flags.FileSizeException = False
+        cpuData = []
+        memoryData = []
+
+        async def sample():
+            cpuData.append(psutil.cpu_percent())
+            if len(cpuData) >= 5 and MonitorThread.isContinue(cpuData):
+                flags.CpuException = True
+            memoryData.append(psutil.virtual_memory().percent)
+            if len(memoryData) >= 5 and MonitorThread.isContinue(memoryData):
+                flags.MemoryException = True
+            # walking the log dir blocks, keep it off the loop thread
+            if await EventLoop.offload(MonitorThread.get_dir_size, fileDir) > 500:
+                flags.FileSizeException = True
+
+        await EventLoop.periodic(interval, sample, stopQueue, stopSoon)
+
     @staticmethod
     def get_dir_size(dir_path:str):
         total_size = 0
@@ -84,8 +63,6 @@ class MonitorThread(object):
         return False
         
     @staticmethod
-    def threadMonitor(stopQueue: Queue, fileDir:str, stopSoon):
-        # use stopQueue as a stop signal
-        threading.Thread(target=MonitorThread.cpuMonitorThread, args=[stopQueue, stopSoon]).start()
-        threading.Thread(target=MonitorThread.memoryMonitorThread, args=[stopQueue, stopSoon]).start()
-        threading.Thread(target=MonitorThread.fileSizeMonitorThread, args=[stopQueue, fileDir, stopSoon]).start()
\ No newline at end of file
+    def threadMonitor(stopQueue: Queue, fileDir:str, stopSoon, flags=None) -> concurrent.futures.Future:
+        # use stopQueue as a stop signal; the monitor runs on the shared event loop, no thread is started
+        return EventLoop.shared().submit(MonitorThread.monitor(stopQueue, fileDir, stopSoon, flags))
@@ -37,18 +37,25 @@ class NormalTrimmer(Trimmer):
 
         testcase = Testcase()
 
-        for confItem in confItems:
-            oldValue = confItem.value
-            confItem.value = self.defaultValueMap[confItem.name]
+        for i, confItem in enumerate(confItems):
+            # the items may be shared with other seeds, so the default value goes into a copy
+            trialConfItems = list(confItems)
+            trialConfItems[i] = self.defaultConfItem(confItem)
 
-            testcase.confItemList = confItems
+            testcase.confItemList = trialConfItems
             testcase.writeToFile('tmp_testcase')
 
             result = self.systemTester.runTest(testcase)
 
-            confItem.value = oldValue
-
             if result.status == 0:
                 trimmedConfItems.append(confItem)
 
         return trimmedConfItems
+
+    def defaultConfItem(self, confItem: ConfItem) -> ConfItem:
+        """
+        A copy of `confItem` set to its default value.
+        """
+        defaultConfItem = confItem.copy()
+        defaultConfItem.value = self.defaultValueMap[confItem.name]
+        return defaultConfItem
@@ -1,35 +1,37 @@
 import os, shutil, time, stat
-import subprocess, threading
-from subprocess import Popen, PIPE, STDOUT
+import shlex
 
 from dataModel.TestResult import TestResult
 from dataModel.Testcase import Testcase
 from testValidator.Tester import Tester
-from utils.Configuration import Configuration
+from utils.FuzzContext import FuzzContext
 from utils.Logger import getLogger
-from utils.ShowStats import ShowStats
-from utils.ConfAnalyzer import ConfAnalyzer
 from queue import Queue
 from testValidator.MonitorThread import MonitorThread
 from utils.UnitConstant import DATA_DIR
+from utils.JacocoCoverage import JacocoClient, CoverageTracker
+from utils.ProcessRunner import ProcessRunner
 
 class SystemTester(Tester):
     """
     System Tester perform system level testing to validate the testcase.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, context: FuzzContext = None) -> None:
         super().__init__()
         self.logger = getLogger()
-        self.project: str = Configuration.fuzzerConf['project']
+        self.context = context or FuzzContext.default()
+        self.stats = self.context.stats
+        self.project: str = self.context.fuzzerConf['project']
         # self.Result = TestResult()
         # init pre_find_time as fuzzer start time
-        self.preFindTime: float = ShowStats.fuzzerStartTime
+        self.preFindTime: float = self.stats.fuzzerStartTime
         self.totalTime: float = 0.0 # total time for run time
         self.totalCount: int = 0 # it equals to the testcases' number
         self.exceptionMap = {} #
         self.exceptionMapReason = {} #
-        self.valueMap = ConfAnalyzer.confItemValueMap
+        self.valueMap = self.context.analyzer.confItemValueMap
+        self.runner = ProcessRunner()
         self.logLocation = {
             "hbase": os.path.join(DATA_DIR,"app_sysTest/hbase-2.2.2-work/logs"),
             "hadoop-hdfs": os.path.join(DATA_DIR, "app_sysTest/hadoop-2.8.5-work/logs"),
@@ -37,10 +39,17 @@ class SystemTester(Tester):
             "alluxio": os.path.join(DATA_DIR, "app_sysTest/alluxio-2.1.0-work/logs"),
             "zookeeper": os.path.join(DATA_DIR, "app_sysTest/zookeeper-3.5.6-work/logs")
         }
+        # coverage feedback from a JaCoCo agent (output=tcpserver) in the system under test, e.g. 127.0.0.1:6300
+        self.coverage: CoverageTracker = None
+        jacocoAddress = self.context.putConf.get('jacoco_address', '')
+        if jacocoAddress:
+            host, port = jacocoAddress.rsplit(":", 1)
+            client = JacocoClient(host, int(port), float(self.context.fuzzerConf.get('jacoco_timeout', 10)))
+            self.coverage = CoverageTracker(client, float(self.context.fuzzerConf.get('coverage_max_overhead', 0.05)))
 
     def replaceConfig(self, testcase: Testcase):
         srcReplacePath = testcase.filePath
-        dstReplacePath = Configuration.putConf['replace_conf_path']
+        dstReplacePath = self.context.putConf['replace_conf_path']
         shutil.copyfile(srcReplacePath, dstReplacePath)
         self.logger.info(
             f">>>>[systest] {srcReplacePath} replacement to the corresponding configuration file:{dstReplacePath}")
@@ -51,12 +60,14 @@ class SystemTester(Tester):
         # if self.project == "alluxio":
         #     sysChmod = "echo kb310 | sudo -S chmod -R 777 /home/hadoop/ecfuzz/data/app_sysTest/alluxio-2.1.0-work/underFSStorage"
         #     process = subprocess.run(sysChmod, shell=True, stdout=PIPE, stderr=PIPE, universal_newlines=True)
-        sysCmd = f"cd {Configuration.putConf['systest_shell_dir']} && {Configuration.putConf['systest_java']} {Configuration.putConf['systest_shell']}"
+        putConf = self.context.putConf
+        sysCmd = shlex.split(putConf['systest_java']) + shlex.split(putConf['systest_shell'])
         self.logger.info(f">>>>[systest] {self.project} is undergoing system test validation...")
         sysStartTime = time.time()
         stop = Queue()
-        threading.Thread(target=MonitorThread.threadMonitor, args=[stop, logDir, stopSoon]).start()
-        process = subprocess.run(sysCmd, shell=True, stdout=PIPE, stderr=PIPE, universal_newlines=True)
+        MonitorThread.threadMonitor(stop, logDir, stopSoon, self.context.monitor)
+        # same process group as the fuzzer, so the system test gets Ctrl-C too; stderr is the failure description
+        process = self.runner.run(sysCmd, cwd=putConf['systest_shell_dir'], capture=True, newSession=False)
         Result.status = process.returncode
         sysEndTime = time.time()
         stop.put(1)
@@ -65,15 +76,21 @@ class SystemTester(Tester):
         self.totalTime += onceSysTime
         self.totalCount += 1
 
-        ShowStats.averageSystemTestTime = self.totalTime / self.totalCount
-        ShowStats.systemTestExecSpeed = self.totalCount / self.totalTime
-        ShowStats.totalSystemTestcases = self.totalCount
-        ShowStats.longgestSystemTestTime = max(ShowStats.longgestSystemTestTime, onceSysTime)
+        self.stats.averageSystemTestTime = self.totalTime / self.totalCount
+        self.stats.systemTestExecSpeed = self.totalCount / self.totalTime
+        self.stats.totalSystemTestcases = self.totalCount
+        self.stats.longgestSystemTestTime = max(self.stats.longgestSystemTestTime, onceSysTime)
+
+        if self.coverage is not None:
+            Result.newCoverage = self.coverage.collect(onceSysTime)
+            self.stats.coveredProbes = len(self.coverage.coverageMap)
+            self.stats.coverageOverhead = self.coverage.overhead()
+            self.logger.info(f">>>>[systest] {Result.newCoverage} new probes, {self.stats.coveredProbes} covered in total")
 
         self.logger.info(
             f">>>>[systest] The return code of {testcase.filePath} system test verification is {Result.status}.")
         if Result.status != 0:
-            ShowStats.lastNewFailSystemTest = 0.0
+            self.stats.lastNewFailSystemTest = 0.0
             self.preFindTime = sysEndTime
             # ShowStats.totalSystemTestFailed += 1
             Result.description = process.stderr
@@ -85,13 +102,13 @@ class SystemTester(Tester):
 
             if failType1Str in Result.description:
                 Result.sysFailType = 1
-                ShowStats.totalSystemTestFailed_Type1 += 1
+                self.stats.totalSystemTestFailed_Type1 += 1
                 # modify confMutaionInfo
                 for confItem in testcase.confItemList:
                     if confItem.isMutated == True:
                         # [Fix] 增加安全检查，防止 RAG 生成的新参数导致 KeyError
-                        if confItem.name in ConfAnalyzer.confMutationInfo:
-                            ConfAnalyzer.confMutationInfo[confItem.name][1] += 1
+                        if confItem.name in self.context.analyzer.confMutationInfo:
+                            self.context.analyzer.confMutationInfo[confItem.name][1] += 1
                         else:
                             # 记录一下未知的参数，方便调试，但不崩溃
                             # self.logger.warning(f"[SystemTester] Unknown config item found: {confItem.name}, skipping stats update.")
@@ -101,46 +118,56 @@ class SystemTester(Tester):
                         # if confItem.name not in ConfAnalyzer.excludeConf:
                         #     num1, num2 = ConfAnalyzer.confMutationInfo[confItem.name][0], ConfAnalyzer.confMutationInfo[confItem.name][1]
                         #     if num2 >= 10 and (float(num2) / num1) > 0.75:
-                        #         ConfAnalyzer.excludeConf.append(confItem.name)
+                        #         ConfAnalyzer.excludeConfItem(confItem.name)
             elif failType2Str in Result.description:
                 Result.sysFailType = 2
-                ShowStats.totalSystemTestFailed_Type2 += 1
+                self.stats.totalSystemTestFailed_Type2 += 1
                 expList = self.dealWithExp(Result.description)
                 exp = "" if len(expList) == 0 else expList[0] if len(expList) == 1 else expList[1]
+                Result.exception = exp
                 if exp != "":
-                    if exp not in self.exceptionMap:
-                        self.exceptionMap[exp] = 1
-                    else:
-                        self.exceptionMap[exp] += 1
-                if exp != "":
-                    # deal with exceptionMapReason
-                    # testcase of different
-                    diffVal = {}
-                    for conf in testcase.confItemList:
-                        # if value is different from orginal value, add it to diffval
-                        if conf.name in self.valueMap and conf.value != self.valueMap[conf.name]:
-                            if conf.name not in diffVal:
-                                diffVal[conf.name] = conf.value
-                    if exp not in self.exceptionMapReason:
-                        self.exceptionMapReason[exp] = []
-                    if len(diffVal) != 0:
-                        self.exceptionMapReason[exp].append(diffVal)
+                    Result.newException = self.recordException(exp, testcase)
 
             elif failType3Str in Result.description:
                 Result.sysFailType = 3
-                ShowStats.totalSystemTestFailed_Type3 += 1
+                self.stats.totalSystemTestFailed_Type3 += 1
             else:
                 self.logger.info(
                 f">>>>[systest] conf_file {testcase.filePath} system test failure is cannot be classified.")
                 Result.sysFailType = 4
-            ShowStats.totalSystemTestFailed = ShowStats.totalSystemTestFailed_Type1 + ShowStats.totalSystemTestFailed_Type2 + ShowStats.totalSystemTestFailed_Type3
+            self.stats.totalSystemTestFailed = self.stats.totalSystemTestFailed_Type1 + self.stats.totalSystemTestFailed_Type2 + self.stats.totalSystemTestFailed_Type3
         else:
-            ShowStats.lastNewFailSystemTest = sysEndTime - self.preFindTime
+            self.stats.lastNewFailSystemTest = sysEndTime - self.preFindTime
             Result.description = "System Testing Succeed."
         self.logger.info(f">>>>[systest] exceptionMap is : {self.exceptionMap}")
         self.logger.info(f">>>>[systest] exceptionmapreason is : {self.exceptionMapReason}")
         return Result
 
+    def recordException(self, exp: str, testcase: Testcase) -> bool:
+        """
+        Count the exception `exp` raised by `testcase` and remember the values that caused it.
+
+        Returns: True if `exp` was not seen before.
+        """
+        newException = exp not in self.exceptionMap
+        if newException:
+            self.exceptionMap[exp] = 1
+        else:
+            self.exceptionMap[exp] += 1
+        # deal with exceptionMapReason
+        # testcase of different
+        diffVal = {}
+        for conf in testcase.confItemList:
+            # if value is different from orginal value, add it to diffval
+            if conf.name in self.valueMap and conf.value != self.valueMap[conf.name]:
+                if conf.name not in diffVal:
+                    diffVal[conf.name] = conf.value
+        if exp not in self.exceptionMapReason:
+            self.exceptionMapReason[exp] = []
+        if len(diffVal) != 0:
+            self.exceptionMapReason[exp].append(diffVal)
+        return newException
+
     def dealWithExp(self, description:str) -> str:
         exceptionFilter = "[info_excetion]"
         res = []
@@ -171,7 +198,7 @@ class SystemTester(Tester):
     def runTest(self, testcase: Testcase, stopSoon) -> TestResult:
         # if Configuration.fuzzerConf['project'] == 'hbase':
         #     self.deleteDir("/home/hadoop/ecfuzz/data/app_sysTest/hbase-2.2.2-work/logs")
-        logLoc = self.logLocation[Configuration.fuzzerConf["project"]]
+        logLoc = self.logLocation[self.context.fuzzerConf["project"]]
         self.deleteDir(logLoc)
         self.replaceConfig(testcase)
         Result = self.runSystemTestUtils(testcase, logLoc, stopSoon)
@@ -1,7 +1,5 @@
-import random, time, os
+import random, time, os, threading
 from re import sub
-import subprocess
-from subprocess import Popen, PIPE
 
 from dataModel.ConfItem import ConfItem
 from dataModel.TestResult import TestResult
@@ -9,14 +7,14 @@ from dataModel.Testcase import Testcase
 from testValidator.DichotomyTrimmer import DichotomyTrimmer
 from testValidator.SystemTester import SystemTester
 from testValidator.UnitTester import UnitTester
-from utils.ConfAnalyzer import ConfAnalyzer
-from utils.Configuration import Configuration
+from utils.FuzzContext import FuzzContext
 from utils.InstanceCreator import InstanceCreator
-from utils.ShowStats import ShowStats
 from utils.Logger import Logger, getLogger
 from utils.MongoDb import MongoDb
+from utils.MongoWriter import MongoWriter
+from utils.ProcessRunner import ProcessRunner
+from utils.TestcaseStore import TestcaseStore
 from utils.getCov import getCov
-from testValidator.MonitorThread import MonitorThread
 from queue import Queue
 
 class TestValidator(object):
@@ -24,15 +22,18 @@ class TestValidator(object):
     Test Validator starts and collects the results of a configuration fuzzing execution campaign.
     """
 
-    def __init__(self) -> None:
-        self.fuzzerConf = Configuration.fuzzerConf
-        self.putConf = Configuration.putConf
-        self.unitTester = UnitTester()
+    def __init__(self, context: FuzzContext = None) -> None:
+        # configuration, analyzer state and stats of this worker, the globals by default
+        self.context = context or FuzzContext.default()
+        self.stats = self.context.stats
+        self.fuzzerConf = self.context.fuzzerConf
+        self.putConf = self.context.putConf
+        self.unitTester = UnitTester(self.context)
         self.skipUnitTest = self.fuzzerConf['skip_unit_test']
-        self.sysTester = InstanceCreator.getInstance(self.fuzzerConf['systemtester'])
+        self.sysTester = InstanceCreator.getInstance(self.fuzzerConf['systemtester'], context=self.context)
         self.forceSystemTestingRatio = float(self.fuzzerConf['force_system_testing_ratio'])
-        confItems = ConfAnalyzer.confItemsBasic + ConfAnalyzer.confItemsMutable
-        confItemValueMap = ConfAnalyzer.confItemValueMap
+        confItems = self.context.analyzer.confItemsBasic + self.context.analyzer.confItemsMutable
+        confItemValueMap = self.context.analyzer.confItemValueMap
         defaultValueMap = {name: confItemValueMap[name] for name in confItems}
         trimmerClassPath = self.fuzzerConf['trimmer']
         self.trimmer = InstanceCreator.getInstance(trimmerClassPath, self.sysTester, defaultValueMap)
@@ -40,18 +41,27 @@ class TestValidator(object):
         self.logger = getLogger()
         self.totalTime = 0
         self.testcaseNum = 0
-        self.preFindTime: float = ShowStats.fuzzerStartTime
-        self.twoH : int = 2 * 3600
-        self.oneH : int = 1 * 3600
-        self.useMongo = Configuration.fuzzerConf['mongodb']
+        # runUnitStage and runSystemStage may run in different threads, see utils.Pipeline
+        self.statsLock = threading.Lock()
+        self.preFindTime: float = self.stats.fuzzerStartTime
+        self.useMongo = self.fuzzerConf['mongodb']
         self.mongoDb = MongoDb(self.fuzzerConf['host_ip'],(int)(self.fuzzerConf['host_port'])) if self.useMongo == 'True' else None
+        # documents are written in batches by a background thread, or kept on disk without mongo
+        self.mongoWriter = MongoWriter(self.mongoDb, self.fuzzerConf.get('mongo_spill_dir', os.path.join(self.context.workDir, 'mongo_spill')),
+                                       batchSize=int(self.fuzzerConf.get('mongo_batch_size', 64)),
+                                       maxBuffered=int(self.fuzzerConf.get('mongo_max_buffered', 10000)))
         self.getCov = getCov()
         self.covCnt = 1
         self.covUnitData = {}
         self.covSysData = {}
-        self.covStartTime = ShowStats.fuzzerStartTime
-        self.startTime = ShowStats.fuzzerStartTime
-        self.saveTime = ShowStats.fuzzerStartTime
+        self.covStartTime = self.stats.fuzzerStartTime
+        self.startTime = self.stats.fuzzerStartTime
+        self.saveTime = self.stats.fuzzerStartTime
+        # with a testcase store, testcases are packed instead of written file by file
+        self.testcaseStore = None
+        if self.fuzzerConf.get('testcase_store', 'False') == 'True':
+            storeDir = self.fuzzerConf.get('testcase_store_dir', os.path.join(self.context.workDir, 'testcase_store'))
+            self.testcaseStore = TestcaseStore(storeDir)
 
     def runTest(self, testcase: Testcase, stopSoon: Queue) -> TestResult:
         """
@@ -120,80 +130,99 @@ class TestValidator(object):
         
         # self.logger.info(f'>>>>[TestValidator] this time unit-cov is : {self.covUnitData}; sys-cov is : {self.covSysData}')
         
-        if Configuration.fuzzerConf['project'] == 'hadoop-common':
+        startTime = time.time()
+        utRes, needSystemTest = self.runUnitStage(testcase)
+        stRes = self.runSystemStage(testcase, stopSoon) if needSystemTest else None
+        self.addTestTime(time.time() - startTime)
+        # self.logger.info("testvalidator-88")
+        return utRes, stRes, testcase
+        # return stRes, self.trimmedTestcase
+
+    def addTestcaseNum(self, count: int) -> None:
+        with self.statsLock:
+            self.testcaseNum += count
+
+    def addTestTime(self, seconds: float) -> None:
+        with self.statsLock:
+            self.totalTime += seconds
+            if self.totalTime > 0:
+                self.stats.ecFuzzExecSpeed = self.testcaseNum / self.totalTime
+
+    def prepareTestcase(self, testcase: Testcase) -> None:
+        if self.fuzzerConf['project'] == 'hadoop-common':
             # add fs.defaultFS=hdfs://127.0.0.1:9000
             conf = ConfItem('fs.defaultFS','PORT','hdfs://127.0.0.1:9000')
             if  not testcase.__contains__(conf):
                 testcase.addConfItem(ConfItem('fs.defaultFS','PORT','hdfs://127.0.0.1:9000'))
 
-        if Configuration.fuzzerConf['project'] == 'hbase':
+        if self.fuzzerConf['project'] == 'hbase':
             # add hbase.rootdir=/home/hadoop/hbase-2.2.2-work/hbase-tmp
             conf = ConfItem('hbase.rootdir','DIRPATH','/home/hadoop/hbase-2.2.2-work/hbase-tmp')
             if  not testcase.__contains__(conf):
                 testcase.addConfItem(ConfItem('hbase.rootdir','DIRPATH','/home/hadoop/hbase-2.2.2-work/hbase-tmp'))
-        
-        # update flag
-        if ShowStats.mutationStrategy == "SmartMutator":
-            if ShowStats.stackMutationFlag == 0:
-                if ShowStats.lastError23 > self.twoH:
-                    ShowStats.stackMutationFlag = 1
-                    ShowStats.lastError23 = 0
-                    if ShowStats.mutationStrategy == "SmartMutator" or ShowStats.mutationStrategy == "SmartMutator/SingleMutator":
-                        ShowStats.mutationStrategy = "SmartMutator/StackedMutator"
-            elif ShowStats.stackMutationFlag == 1:
-                if ShowStats.lastError23 > self.oneH:
-                    ShowStats.stackMutationFlag = 0
-                    ShowStats.lastError23 = 0
-                    if ShowStats.mutationStrategy == "SmartMutator" or ShowStats.mutationStrategy == "SmartMutator/StackedMutator":
-                        ShowStats.mutationStrategy = "SmartMutator/SingleMutator"
-            else:
-                pass
-    
-        startTime = time.time()
+
+    def runUnitStage(self, testcase: Testcase):
+        """
+        Run the unit tests (ctests) of a testcase.
+
+        Returns:
+            (utRes, needSystemTest): the unit test result, None if unit tests are skipped,
+            and whether the testcase goes on to the system test.
+        """
+        self.prepareTestcase(testcase)
         utRes = None
         if self.skipUnitTest == "False":
-            ShowStats.currentJob = 'unit testing'
+            self.stats.currentJob = 'unit testing'
+            unitStart = time.time()
             utRes = self.unitTester.runTest(testcase)
+            utRes.duration = time.time() - unitStart
             utRes.fileDir = self.fuzzerConf['unit_test_results_dir']
             self.logger.info(">>>>[TestValidator] before write utresult to file")
             utRes.writeToFile()
             self.logger.info(">>>>[TestValidator] after write utresult to file")
-            self.testcaseNum += UnitTester.cur_unittest_count
+            self.addTestcaseNum(self.unitTester.cur_unittest_count)
             if utRes.status == 0 and self.unitTester.isNoMappingTests == False:
                 # add if there is no mapping tests for testcase, then go to system test
                 if random.random() > self.forceSystemTestingRatio:
-                    endTime = time.time()
-                    self.totalTime += endTime -startTime
-                    ShowStats.ecFuzzExecSpeed = self.testcaseNum / self.totalTime
-                    return utRes, None, testcase
+                    return utRes, False
                 else:
                     self.logger.info(">>>>[TestValidator] force system testing")
         else:
             # testcase.generateFileName()
             self.logger.info(">>>>[TestValidator] skip unit test!")
         # testcase.fileDir = Configuration.fuzzerConf['unit_testcase_dir']
-        testcase.writeToFile(fileDir=Configuration.fuzzerConf['unit_testcase_dir'])
+        # the system tester injects this file; with a store it is removed after the system test
+        testcase.writeToFile(fileDir=self.fuzzerConf['unit_testcase_dir'])
+        if self.testcaseStore is not None:
+            self.testcaseStore.put(testcase, 'unit_testcase_dir')
 
-        self.testcaseNum += 1
+        self.addTestcaseNum(1)
+        return utRes, True
 
-        ShowStats.currentJob = 'system testing'
+    def runSystemStage(self, testcase: Testcase, stopSoon: Queue, checkMaven: bool = True) -> TestResult:
+        """
+        Run the system test of a testcase that passed `runUnitStage`.
+        """
+        self.stats.currentJob = 'system testing'
         
-        mvn_check = subprocess.run('ps -ef | grep maven', shell=True, stdout=subprocess.PIPE, stderr=PIPE, universal_newlines=True)
-        mvn_check_len = len(mvn_check.stdout.split("\n"))
-        if (mvn_check_len > 3):
-            self.logger.info("maven exist!")
-            os._exit(1)
-            # exit(1)
+        # a leftover maven process would interfere with the system under test; in the
+        # pipelined loop unit tests run concurrently on purpose, so the check is skipped
+        if checkMaven:
+            if ProcessRunner.processExists('maven'):
+                self.logger.info("maven exist!")
+                os._exit(1)
+                # exit(1)
         
         # before the system run, write seed to mongodb if pro is alluxio
-        if Configuration.fuzzerConf['project'] == 'alluxio':
+        if self.fuzzerConf['project'] == 'alluxio':
             new_seed_data = {}
             for item in testcase.confItemList:
                 new_seed_data[item.name] = item.value
             # write to db
-            if self.useMongo == 'True':
-                self.mongoDb.insert_map_to_db("newEastSeed", new_seed_data)
+            self.mongoWriter.insert("newEastSeed", new_seed_data)
+        systemStart = time.time()
         stRes = self.sysTester.runTest(testcase, stopSoon)
+        stRes.duration = time.time() - systemStart
         # self.logger.info("testvalidator-73")
         stRes.fileDir = self.fuzzerConf['sys_test_results_dir']
         # self.logger.info("testvalidator-75")
@@ -212,29 +241,29 @@ class TestValidator(object):
             self.logger.info(f">>>>[TestValidator] {testcase.fileName} system testing failed with {stRes.sysFailType}")
             stRes.writeToFile()
             if stRes.sysFailType == 1:
-                testcase.writeToFile(fileDir=Configuration.fuzzerConf['sys_testcase_fail1_dir'])
+                self.saveTestcase(testcase, 'sys_testcase_fail1_dir')
                 # self.mongoDb.insert_seed_file_to_db(testcase.filePath)
-                ShowStats.lastError23 = thisTime - self.preFindTime
+                self.stats.lastError23 = thisTime - self.preFindTime
             elif stRes.sysFailType == 2:
-                testcase.writeToFile(fileDir=Configuration.fuzzerConf['sys_testcase_fail2_dir'])
+                self.saveTestcase(testcase, 'sys_testcase_fail2_dir')
                 # self.mongoDb.insert_seed_file_to_db(testcase.filePath)
-                ShowStats.lastError23 = 0
+                self.stats.lastError23 = 0
                 self.preFindTime = thisTime
             elif stRes.sysFailType == 3:
-                testcase.writeToFile(fileDir=Configuration.fuzzerConf['sys_testcase_fail3_dir'])
+                self.saveTestcase(testcase, 'sys_testcase_fail3_dir')
                 # self.mongoDb.insert_seed_file_to_db(testcase.filePath)
-                ShowStats.lastError23 = 0
+                self.stats.lastError23 = 0
                 self.preFindTime = thisTime
             else:
-                ShowStats.lastError23 = thisTime - self.preFindTime
+                self.stats.lastError23 = thisTime - self.preFindTime
                 self.logger.info(
                 f">>>>[systest] conf_file {testcase.filePath} system test failure is cannot be classified.")          
         else:
-            ShowStats.lastError23 = thisTime - self.preFindTime
+            self.stats.lastError23 = thisTime - self.preFindTime
             self.logger.info(f">>>>[TestValidator] {testcase.fileName} system testing succeed!")
         
-        if MonitorThread.CpuException == True or MonitorThread.MemoryException == True or MonitorThread.FileSizeException == True:
-            testcase.writeToFile(fileDir=Configuration.fuzzerConf['sys_testcase_other_dir'])
+        if self.context.monitor.CpuException == True or self.context.monitor.MemoryException == True or self.context.monitor.FileSizeException == True:
+            self.saveTestcase(testcase, 'sys_testcase_other_dir')
             if stRes.status == 1 and stRes.sysFailType == 2:
                 pass
             else:
@@ -243,29 +272,31 @@ class TestValidator(object):
                 pass
         
         # deal the testcase, determine whether to save it
-        if MonitorThread.CpuException == True or MonitorThread.MemoryException == True or MonitorThread.FileSizeException == True or (stRes.status == 1 and  stRes.sysFailType != 1):
+        if self.context.monitor.CpuException == True or self.context.monitor.MemoryException == True or self.context.monitor.FileSizeException == True or (stRes.status == 1 and  stRes.sysFailType != 1):
             expSeed = {}
             for item in testcase.confItemList:
                 expSeed[item.name] = item.value
             # write to db
-            if self.useMongo == 'True':
-                self.mongoDb.insert_map_to_db("expSeed", expSeed)
-        
-        endTime = time.time()
-        self.totalTime += endTime - startTime
-        ShowStats.ecFuzzExecSpeed = self.testcaseNum / self.totalTime
-        # self.logger.info("testvalidator-88")
-        return utRes, stRes, testcase
-        # return stRes, self.trimmedTestcase
+            self.mongoWriter.insert("expSeed", expSeed)
+        if self.testcaseStore is not None and os.path.exists(testcase.filePath):
+            os.remove(testcase.filePath)
+        return stRes
+
+    def saveTestcase(self, testcase: Testcase, dirKey: str) -> None:
+        """
+        Keep `testcase` in the result directory `dirKey`: a file in that directory,
+        or an entry labelled `dirKey` in the testcase store.
+        """
+        if self.testcaseStore is None:
+            testcase.writeToFile(fileDir=self.fuzzerConf[dirKey])
+        else:
+            self.testcaseStore.put(testcase, dirKey)
 
     def insert_data(self, unit_data, sys_data) -> None:
         # first delete data, and then insert
         # it gurantees there is only one data in collection
-        if self.useMongo == 'True':
-            self.mongoDb.cov_unit_collection.delete_many({})
-            self.mongoDb.insert_cov_unit_to_db(unit_data)
-            self.mongoDb.cov_sys_collection.delete_many({})
-            self.mongoDb.insert_cov_sys_to_db(sys_data)
+        self.mongoWriter.replace("unit-coverage", unit_data)
+        self.mongoWriter.replace("sys-coverage", sys_data)
 
     def getTrimmedTestcase(self) -> Testcase:
         return self.trimmedTestcase
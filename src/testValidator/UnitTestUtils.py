@@ -5,21 +5,26 @@ from dataModel.Testcase import Testcase
 from utils.Configuration import Configuration
 import xml.etree.ElementTree as ET
 
-from utils.Logger import Logger, getLogger
+from utils.Logger import Logger, getItemLogger, getLogger
 
 
 class UnitTestUtils(object):
-    def __init__(self) -> None:
+    def __init__(self, putConf: Dict[str, str] = None, fuzzerConf: Dict[str, str] = None) -> None:
         self.logger = getLogger()
-        self.project = Configuration.fuzzerConf['project']
-        self.default_conf = self.load_default_conf(Configuration.putConf['default_conf_path'])
+        # one record per surefire report and testcase, DEBUG and sampled
+        self.itemLogger = getItemLogger('surefire')
+        # the configuration of the FuzzContext, the PUT part decides where configs are injected
+        self.fuzzerConf = fuzzerConf if fuzzerConf is not None else Configuration.fuzzerConf
+        self.project = self.fuzzerConf['project']
+        self.putConf = putConf if putConf is not None else Configuration.putConf
+        self.default_conf = self.load_default_conf(self.putConf['default_conf_path'])
 
     def inject_config(self, param_value_pairs: dict) -> None:
         for p, v in param_value_pairs.items():
             self.logger.info(f">>>>[UnitTestUtils] injecting {p} with value {v}")
 
         if self.project in ["zookeeper", "alluxio"]:
-            for inject_path in Configuration.putConf['injecting_location']:
+            for inject_path in self.putConf['injecting_location']:
                 self.logger.info(">>>>[UnitTestUtils] injecting into file: {}".format(inject_path))
                 with open(inject_path, "w") as file:
                     for p, v in param_value_pairs.items():
@@ -32,7 +37,7 @@ class UnitTestUtils(object):
                 value = ET.SubElement(prop, "value")
                 name.text = p
                 value.text = v
-            for inject_path in Configuration.putConf['injecting_location']:
+            for inject_path in self.putConf['injecting_location']:
                 self.logger.info(">>>>[UnitTestUtils] injecting into file: {}".format(inject_path))
                 with open(inject_path, "wb") as file:
                     file.write(str.encode(
@@ -44,12 +49,12 @@ class UnitTestUtils(object):
     def clean_config(self) -> None:
         self.logger.info(">>>> cleaning injected configuration from file")
         if self.project in ["zookeeper", "alluxio"]:
-            for inject_path in Configuration.putConf['injecting_location']:
+            for inject_path in self.putConf['injecting_location']:
                 with open(inject_path, "w") as file:
                     file.write("\n")
         elif self.project in ["hadoop-common", "hadoop-hdfs", "hbase"]:
             conf = ET.Element("configuration")
-            for inject_path in Configuration.putConf['injecting_location']:
+            for inject_path in self.putConf['injecting_location']:
                 with open(inject_path, "wb") as file:
                     file.write(str.encode(
                         '<?xml version=\"1.0\"?>\n<?xml-stylesheet type=\"text/xsl\" href=\"configuration.xsl\"?>\n'))
@@ -69,8 +74,8 @@ class UnitTestUtils(object):
         errors = {}
         try:
             fpath = None
-            for surefire_path in Configuration.putConf['surefire_location']:
-                self.logger.info("surefire_path is : {}".format(surefire_path))
+            for surefire_path in self.putConf['surefire_location']:
+                self.itemLogger.debug("surefire_path is : %s", surefire_path)
                 xml_path = os.path.join(surefire_path, "TEST-{}.xml".format(clsname))
                 if os.path.exists(xml_path):
                     self.logger.info(f">>>>[UnitTestUtils] surefire report path: {xml_path}")
@@ -80,7 +85,7 @@ class UnitTestUtils(object):
             tsinfo = root.attrib
             self.logger.info(">>>>[UnitTestUtils] test class outcome: {}".format(tsinfo))
             for tc in tree.iter(tag="testcase"):
-                self.logger.info(">>>>[UnitTestUtils] unit test outcome: {}".format(tc.attrib))
+                self.itemLogger.debug(">>>>[UnitTestUtils] unit test outcome", extra={'fields': tc.attrib})
                 tname = tc.attrib["name"]
                 ttime = tc.attrib["time"]
                 times[tname] = str(ttime)
@@ -122,7 +127,7 @@ class UnitTestUtils(object):
         except Exception as e:
             self.logger.info(">>>>[UnitTestUtils] failed to parse surefire file: {}".format(e))
             # if project is not alluxio, treat the methods as failed
-            if Configuration.fuzzerConf['project'] != "alluxio":
+            if self.project != "alluxio":
                 for m in expected_methods:
                     times[m] = str(0)
                     errors[m] = "fail"
@@ -162,7 +167,7 @@ class UnitTestUtils(object):
         for confItem in testcase.confItemList:
             conf_name, conf_value = confItem.name, confItem.value
             new_conf_map[conf_name] = conf_value
-        self.logger.info(">>>>[UnitTestUtils] default conf file: {}".format(Configuration.putConf['default_conf_path']))
+        self.logger.info(">>>>[UnitTestUtils] default conf file: {}".format(self.putConf['default_conf_path']))
         self.logger.info(">>>>[UnitTestUtils] new input conf file: {} (param, value) pairs".format(len(new_conf_map.keys())))
         conf_diff = {}
         for param, value in new_conf_map.items():
@@ -1,8 +1,7 @@
 import operator
-import subprocess
 import os, time, stat
+import shlex
 import shutil
-from subprocess import PIPE, Popen, TimeoutExpired
 
 from dataModel.Testcase import Testcase
 from dataModel.TestResult import TestResult
@@ -12,26 +11,27 @@ from testValidator.unit_result import unit_result
 from testValidator.run_unit_test_utils import run_unit_test_utils
 from utils.SampleTrimmer import SampleTrimmer
 from utils.TimeFilterTrimmer import TimeFilterTrimmer
-from utils.ConfAnalyzer import ConfAnalyzer
-from utils.Configuration import Configuration
+from utils.FuzzContext import FuzzContext
 from utils.Logger import Logger, getLogger
-from utils.ShowStats import ShowStats
-from utils.UnitConstant import FUZZER_DIR
+from utils.ProcessRunner import ProcessResult, ProcessRunner
 
 class UnitTester(Tester):
     """
     Unit Tester perform unit tests to look for possible vulnerabilities.
     """
     cur_unittest_count: int = 0
-    def __init__(self) -> None:
+    def __init__(self, context: FuzzContext = None) -> None:
         super().__init__()
         self.logger = getLogger()
+        self.context = context or FuzzContext.default()
+        self.stats = self.context.stats
         self.rutils = run_unit_test_utils()
-        self.unitUtils = UnitTestUtils()
+        self.runner = ProcessRunner()
+        self.unitUtils = UnitTestUtils(self.context.putConf, self.context.fuzzerConf)
         self.SampleTrimmer = SampleTrimmer()
         self.TimeFilterTrimmer = TimeFilterTrimmer()
         # init pre_find_time as fuzzer start time
-        self.pre_find_time: float = ShowStats.fuzzerStartTime
+        self.pre_find_time: float = self.stats.fuzzerStartTime
         self.total_time: float = 0.0 # total time for run time
         self.total_count: int = 0 # it equals to the testcases' number
         # unittest time info
@@ -51,7 +51,7 @@ class UnitTester(Tester):
         start_time = time.time()
         tr = unit_result(ran_tests_and_time=set(), failed_tests=set())
         for index, group in enumerate(param_test_group):
-            # do injection for different test group and chdir for testing everytime
+            # do injection for different test group and run maven in the testing dir everytime
             tested_params, tests = group
             self.unitUtils.inject_config({p: param_values[p] for p in tested_params})
             self.logger.info(
@@ -64,27 +64,16 @@ class UnitTester(Tester):
                     timeout = max(timeout, self.unitTestTimeMap[test])
             timeout = timeout * len(tests) * 1.5 if timeout != -1 else 50 * len(tests)
             timeout = timeout + 60
-            ShowStats.unitCmdTimeout = int(timeout)
+            self.stats.unitCmdTimeout = int(timeout)
             self.logger.info(f">>>>[UnitTester] timeout for grop {index} is {timeout}")
             
             test_str = self.rutils.join_test_string(tests)
-            os.chdir(Configuration.putConf['testing_dir'])
-            self.logger.info(f">>>>[UnitTester] chdir to {Configuration.putConf['testing_dir']}")
-
             cmd = self.rutils.maven_cmd(test_str)
             
-            with open(os.devnull, 'w') as devnull:
-                try:
-                    process = subprocess.Popen(cmd, stdout=devnull, stderr=devnull, preexec_fn=os.setsid)
-                    process.communicate(timeout=int(timeout))
-                except TimeoutExpired as e:
-                    # for test hanged
-                    # process.kill()
-                    os.killpg(os.getpgid(process.pid), 9)
-                    self.logger.info(f">>>>[UnitTester] process killed of {e}")
-                    
-            os.chdir(Configuration.putConf['run_unit_dir'])
-            self.logger.info(f">>>>[UnitTester] chdir to {Configuration.putConf['run_unit_dir']}")
+            result = self.runner.run(cmd, cwd=self.context.testingDir, timeout=int(timeout))
+            if result.timedOut:
+                # for test hanged
+                self.logger.info(f">>>>[UnitTester] process killed of timeout {int(timeout)}")
 
             # print_output = self.rutils.strip_ansi(stdout.decode("ascii", "ignore"))
             # print(print_output)
@@ -100,8 +89,6 @@ class UnitTester(Tester):
                         if m in errors:
                             tr.failed_tests.add(f"{clsname}#{m}")
         duration = time.time() - start_time
-        os.chdir(Configuration.putConf['run_unit_dir'])
-        self.logger.info(f">>>>[UnitTester] chdir to {Configuration.putConf['run_unit_dir']}")
 
         self.logger.info(f">>>>[UnitTester] python-timed for running config file: {duration}")
 
@@ -112,7 +99,7 @@ class UnitTester(Tester):
 
     def test_conf_file(self, testcase: Testcase) -> TestResult:
         self.total_count += 1
-        ShowStats.totalUnitTestcases = self.total_count
+        self.stats.totalUnitTestcases = self.total_count
         # every loop, it needs to create a new TestResult
         unit_start_time = time.time()
         unitResult = TestResult()
@@ -120,8 +107,8 @@ class UnitTester(Tester):
         params = test_input.keys()
         associated_test_map, associated_tests = {}, []
         for p in params:
-            if p in ConfAnalyzer.confUnitMap:
-                tests = ConfAnalyzer.confUnitMap[p]
+            if p in self.context.analyzer.confUnitMap:
+                tests = self.context.analyzer.confUnitMap[p]
                 self.logger.info(f">>>>[UnitTester] parameter {p} has {len(tests)} tests")
                 associated_test_map[p] = tests
                 # associated_tests = associated_tests + tests
@@ -162,33 +149,33 @@ class UnitTester(Tester):
         self.total_time += once_unit_time
         # self.total_count += 1
         
-        UnitTester.cur_unittest_count = len(associated_tests)
+        self.cur_unittest_count = len(associated_tests)
 
-        ShowStats.totalRunUnitTestsCount += len(associated_tests)
-        ShowStats.averageUnitTestTime = self.total_time / ShowStats.totalRunUnitTestsCount
+        self.stats.totalRunUnitTestsCount += len(associated_tests)
+        self.stats.averageUnitTestTime = self.total_time / self.stats.totalRunUnitTestsCount
     
         # ShowStats.totalUnitTestcases = self.total_count
-        ShowStats.unitTestExecSpeed = ShowStats.totalRunUnitTestsCount / self.total_time
+        self.stats.unitTestExecSpeed = self.stats.totalRunUnitTestsCount / self.total_time
         # ShowStats.longgestUnitTestTime = max(ShowStats.longgestUnitTestTime, once_unit_time / len(associated_tests))
         
         if unitResult.status == 1:
             # find new failed unit tests
-            ShowStats.lastNewFailUnitTest = 0.0
+            self.stats.lastNewFailUnitTest = 0.0
             self.pre_find_time = unit_end_time
             # ShowStats.totalUnitTestFailed += unitResult.failed_tests_count
         else :
             # this round don't find failed unit tests
-            ShowStats.lastNewFailUnitTest = unit_end_time - self.pre_find_time
+            self.stats.lastNewFailUnitTest = unit_end_time - self.pre_find_time
         self.logger.info("update unit run time done!!!")
         self.logger.info(">>>>[UnitTester] unit_end_time is : {}".format(unit_end_time))
         
         self.logger.info(">>>>[UnitTester]  pre_find_time is : {}".format(self.pre_find_time))
-        self.logger.info(">>>>[UnitTester] ShowStats.lastNewFailUnitTest is : {}".format(ShowStats.lastNewFailUnitTest))
+        self.logger.info(">>>>[UnitTester] ShowStats.lastNewFailUnitTest is : {}".format(self.stats.lastNewFailUnitTest))
         return unitResult
 
     def runWithMutilprocess(self, testcase: Testcase) -> TestResult:
         self.total_count += 1
-        ShowStats.totalUnitTestcases = self.total_count
+        self.stats.totalUnitTestcases = self.total_count
         
         unit_start_time = time.time()
         unitResult = TestResult()
@@ -196,8 +183,8 @@ class UnitTester(Tester):
         params = test_input.keys()
         associated_test_map, associated_tests = {}, []
         for p in params:
-            if p in ConfAnalyzer.confUnitMap:
-                tests = ConfAnalyzer.confUnitMap[p]
+            if p in self.context.analyzer.confUnitMap:
+                tests = self.context.analyzer.confUnitMap[p]
                 self.logger.info(f">>>>[UnitTester] parameter {p} has {len(tests)} tests")
                 associated_test_map[p] = tests
                 # associated_tests = associated_tests + tests
@@ -220,23 +207,21 @@ class UnitTester(Tester):
                 timeout = max(timeout, self.unitTestTimeMap[test])
         timeout = timeout * len(tests) * 1.5 if timeout != -1 else 50 * len(tests)
         timeout = timeout + 60
-        ShowStats.unitCmdTimeout = int(timeout)
+        self.stats.unitCmdTimeout = int(timeout)
 
         if not associated_tests:
             return unitResult
         # inject key,value to file
         self.unitUtils.inject_config(test_input)
-        # change to the dir
-        os.chdir(Configuration.putConf['testing_dir'])
-        self.logger.info(f">>>>[UnitTester] change to testing dir : {Configuration.putConf['testing_dir']}")
+        # maven runs in the testing dir, the process itself never changes directory
         # start to run
         mvn_str = ""
-        if Configuration.fuzzerConf['use_surefire'] == "True":
+        if self.context.fuzzerConf['use_surefire'] == "True":
             mvn_str = "mvn surefire:test -Dtest={}"
         else :
             mvn_str = "mvn test -Dtest={}"
-        if Configuration.fuzzerConf['project'] == "alluxio":
-            if Configuration.fuzzerConf['use_surefire'] == "True":
+        if self.context.fuzzerConf['project'] == "alluxio":
+            if self.context.fuzzerConf['use_surefire'] == "True":
                 mvn_str = "mvn license:format surefire:test -Dtest={} -DfailIfNoTests=false -Dcheckstyle.skip -Dlicense.skip -Dfindbugs.skip -Dmaven.javadoc.skip=true"
             else :
                 mvn_str = "mvn license:format test -Dtest={} -DfailIfNoTests=false -Dcheckstyle.skip -Dlicense.skip -Dfindbugs.skip -Dmaven.javadoc.skip=true"
@@ -246,34 +231,22 @@ class UnitTester(Tester):
         # self.logger.info(f">>>>[UnitTester] mvn_str is : {mvn_str}")
         self.logger.info(f">>>>[UnitTester] all tests count is : {len(all_tests)}")
         self.logger.info(">>>>[UniTester] start to run with mutil-process")
-        with open(os.devnull, 'w') as devnull:
-            for index in range(len(all_tests)):
-                # run each test by a shell
-                cur_str = mvn_str.format(all_tests[index]) # override cur_str every time
-                # self.logger.info(f">>>>[UniTester] run with tests : {all_tests[index]}")
-                self.logger.info(f">>>>[UniTester] mvn str is : {cur_str}")
-                popen = subprocess.Popen(cur_str, shell=True, stderr=devnull, stdout=devnull)
-                popen_list.append(popen)
-                ShowStats.currentUnitRoundRatio = (index + 1) / len(all_tests)
-                if index % 4 == 3:
-                    # each time run 5 process
-                    self.logger.info(">>>>[UniTester] wait for 4 process running done")
-                    for popen in popen_list:
-                        # wait fall each shell execute done
-                        try:
-                            popen.communicate(timeout=int(timeout))
-                        except TimeoutExpired as e:
-                            popen.kill()
-                            self.logger.info(f">>>>[UnitTester] process killed of {e}")
-                    popen_list = []
-                    self.logger.info(">>>>[UniTester] 4 process runned done")
-            # wait for the rest of process
-            for popen in popen_list:
-                try:
-                    popen.communicate(timeout=int(timeout))
-                except TimeoutExpired as e:
-                    popen.kill()
-                    self.logger.info(f">>>>[UnitTester] process killed of {e}")
+        for index in range(len(all_tests)):
+            # run each test as its own maven process, no shell in between
+            cur_str = mvn_str.format(all_tests[index]) # override cur_str every time
+            # self.logger.info(f">>>>[UniTester] run with tests : {all_tests[index]}")
+            self.logger.info(f">>>>[UniTester] mvn str is : {cur_str}")
+            popen = self.runner.start(shlex.split(cur_str), cwd=self.context.testingDir)
+            popen_list.append(popen)
+            self.stats.currentUnitRoundRatio = (index + 1) / len(all_tests)
+            if index % 4 == 3:
+                # each time run 5 process
+                self.logger.info(">>>>[UniTester] wait for 4 process running done")
+                self.waitAll(popen_list, timeout)
+                popen_list = []
+                self.logger.info(">>>>[UniTester] 4 process runned done")
+        # wait for the rest of process
+        self.waitAll(popen_list, timeout)
         self.logger.info(">>>>[UniTester] run all tests done")
         self.logger.info(">>>>[UniTester] start to parse all output file")
         # parse output
@@ -297,9 +270,6 @@ class UnitTester(Tester):
         parse_out_end_time = time.time()
         self.logger.info(f">>>>[UnitTester] this round for parse output time is : {parse_out_end_time - parse_out_start_time}")
         self.unitUtils.clean_config()
-        # change to origin dir
-        os.chdir(Configuration.putConf['run_unit_dir'])
-        self.logger.info(f">>>>[UnitTester] change to origin dir : {Configuration.putConf['run_unit_dir']}")
 
         unit_end_time = time.time()
         once_unit_time = unit_end_time - unit_start_time
@@ -307,23 +277,23 @@ class UnitTester(Tester):
         if len(tr.failed_tests) != 0:
             self.logger.info(f">>>>[UnitTester] failed {len(tr.failed_tests)} test")
             unitResult.status = 1
-            ShowStats.lastNewFailUnitTest = 0.0
+            self.stats.lastNewFailUnitTest = 0.0
             unitResult.failed_tests_count = len(tr.failed_tests)
             self.pre_find_time = unit_end_time
         else :
-            ShowStats.lastNewFailUnitTest = unit_end_time - self.pre_find_time
+            self.stats.lastNewFailUnitTest = unit_end_time - self.pre_find_time
 
         self.total_time += once_unit_time
         # self.total_count += 1
         
-        UnitTester.cur_unittest_count = len(associated_tests)
+        self.cur_unittest_count = len(associated_tests)
 
-        ShowStats.totalRunUnitTestsCount += len(associated_tests)
-        ShowStats.averageUnitTestTime = self.total_time / ShowStats.totalRunUnitTestsCount
+        self.stats.totalRunUnitTestsCount += len(associated_tests)
+        self.stats.averageUnitTestTime = self.total_time / self.stats.totalRunUnitTestsCount
         # ShowStats.totalUnitTestFailed += unitResult.failed_tests_count
 
         # ShowStats.totalUnitTestcases = self.total_count
-        ShowStats.unitTestExecSpeed = ShowStats.totalRunUnitTestsCount / self.total_time
+        self.stats.unitTestExecSpeed = self.stats.totalRunUnitTestsCount / self.total_time
         self.logger.info(f">>>>[UnitTester] status is : {unitResult.status}; failed tests is : {unitResult.failed_tests_count}")
 
         self.logger.info(">>>>[UnitTester] run one round unit test with mutil-process done")
@@ -342,8 +312,8 @@ class UnitTester(Tester):
             TestResult: _description_
         """
         self.total_count += 1
-        ShowStats.totalUnitTestcases = self.total_count
-        UnitTester.cur_unittest_count = 0
+        self.stats.totalUnitTestcases = self.total_count
+        self.cur_unittest_count = 0
         
         unit_start_time = time.time()
         unitResult = TestResult()
@@ -351,8 +321,8 @@ class UnitTester(Tester):
         params = test_input.keys()
         associated_test_map, associated_tests = {}, []
         for p in params:
-            if p in ConfAnalyzer.confUnitMap:
-                tests = ConfAnalyzer.confUnitMap[p]
+            if p in self.context.analyzer.confUnitMap:
+                tests = self.context.analyzer.confUnitMap[p]
                 self.logger.info(f">>>>[UnitTester] parameter {p} has {len(tests)} tests")
                 associated_test_map[p] = tests
                 # associated_tests = associated_tests + tests
@@ -375,7 +345,7 @@ class UnitTester(Tester):
                 timeout = max(timeout, self.unitTestTimeMap[test])
         timeout = timeout * len(associated_tests) * 1.5 if timeout != -1 else 50 * len(associated_tests)
         timeout = timeout + 60
-        ShowStats.unitCmdTimeout = int(timeout)
+        self.stats.unitCmdTimeout = int(timeout)
 
         if not associated_tests:
             # return empty result
@@ -384,13 +354,11 @@ class UnitTester(Tester):
             return unitResult
         # inject key,value to file
         self.unitUtils.inject_config(test_input)
-        # change to the dir
-        os.chdir(Configuration.putConf['testing_dir'])
-        self.logger.info(f">>>>[UnitTester] change to testing dir : {Configuration.putConf['testing_dir']}")
+        # maven runs in the testing dir, the process itself never changes directory
         # start to run
         mvn_cmd =[]
-        test_mode = "surefire:test" if Configuration.fuzzerConf['use_surefire'] == "True" else "test"
-        maven_args = ["-DfailIfNoTests=false", "-Dcheckstyle.skip", "-Dlicense.skip", "-Dfindbugs.skip", "-Dmaven.javadoc.skip=true"] if Configuration.fuzzerConf['project'] == "alluxio" else []
+        test_mode = "surefire:test" if self.context.fuzzerConf['use_surefire'] == "True" else "test"
+        maven_args = ["-DfailIfNoTests=false", "-Dcheckstyle.skip", "-Dlicense.skip", "-Dfindbugs.skip", "-Dmaven.javadoc.skip=true"] if self.context.fuzzerConf['project'] == "alluxio" else []
         # if Configuration.fuzzerConf['project'] == "alluxio":
         #     if Configuration.fuzzerConf['use_surefire'] == "True":
         #         mvn_str = "mvn license:format surefire:test -Dtest={} -DfailIfNoTests=false -Dcheckstyle.skip -Dlicense.skip -Dfindbugs.skip -Dmaven.javadoc.skip=true"
@@ -401,131 +369,90 @@ class UnitTester(Tester):
         # self.logger.info(f">>>>[UnitTester] mvn_str is : {mvn_str}")
         test_str = self.rutils.cal_strs(all_tests)
         
-        if Configuration.fuzzerConf['project'] == "alluxio":
+        if self.context.fuzzerConf['project'] == "alluxio":
             mvn_cmd = ["mvn", "license:format" ,test_mode, "-Dtest={}".format(test_str)] + maven_args
         else:
             mvn_cmd = ["mvn" ,test_mode, "-Dtest={}".format(test_str)] + maven_args
         
         # mvn_str = mvn_str.format(test_str)
         self.logger.info(">>>>[UnitTester] start to run by pre kill")
-        outfile = os.path.join(FUZZER_DIR,"unitResult.txt")
+        outfile = os.path.join(self.context.workDir, "unitResult.txt")
         # mvn_cmd[-1] = mvn_cmd[-1] + f" > {outfile} 2>&1"
         # mvn_cmd = mvn_cmd + [">",f"{outfile}","2>&1"]
         # mvn_str = mvn_str + " " + f"> {outfile} 2>&1"
         self.logger.info(f">>>>[UnitTester] mvn cmd is : {mvn_cmd}")
-        cur_total_unit_test = 0
-        
-        # with open(os.devnull, 'w') as devnull:
-        # each run will cover the old data
-        # process = subprocess.Popen(mvn_str, shell=True, stdout=devnull, stderr=devnull)
-        outfd = open(outfile, "w")
-        # process = subprocess.Popen(mvn_cmd, stderr=PIPE, stdout=PIPE, preexec_fn=os.setsid)
-        process = subprocess.Popen(mvn_cmd, stderr=outfd, stdout=outfd, preexec_fn=os.setsid)
-        self.logger.info(">>>>[UnitTester] real start to run")
-        time.sleep(2)
-        total_time = int(timeout)
         self.logger.info(f">>>>[UnitTester] timeout is : {int(timeout)}")
-        s_time = time.time()
-        with open(outfile, "r") as file:
-            while (1):
-                # each sec to check the outfile
-                time.sleep(0.1)
-                # total_time -= 1
-                if int(time.time() - s_time) >= total_time:
-                    # here it's running time is over timeout
-                    # process.kill()
-                    # determine process is done?
-                    cur_total_unit_test += 1
-                    if process.poll() != None:
-                        break
-                    os.killpg(os.getpgid(process.pid), 15)
-                    time.sleep(3)
-                    os.killpg(os.getpgid(process.pid), 9)
-                    unitResult.status = 1
-                    unitResult.description = "killed by timeout"
-                    # cur_total_unit_test += 1
-                    self.logger.info(">>>>[UnitTester] kill process by timeout")
-                    break
-                line_info = file.readline()
-                # line_info = self.rutils.strip_ansi(process.stdout.readline().decode("ascii", "ignore"))
-                # self.logger.info(f">>>>[UnitTester] line info is : {line_info}")
-                if line_info:
-                    # self.logger.info(f">>>>[UnitTester] line info is : {line_info}")
-                    # deal the line info : str
-                    round_count, is_failed = self.rutils.deal_line_info(line_info=line_info)
-                    if is_failed:
-                        # process.kill()
-                        cur_total_unit_test += round_count
-                        if process.poll() != None:
-                            break
-                        os.killpg(os.getpgid(process.pid), 15)
-                        time.sleep(3)
-                        os.killpg(os.getpgid(process.pid), 9)
-                        unitResult.status = 1
-                        unitResult.description = "killed by pre"
-                        # cur_total_unit_test += round_count
-                        self.logger.info(">>>>[UnitTester] kill process by pre")
-                        break
-                    else:
-                        # no falied 
-                        cur_total_unit_test += round_count
-                        pass
-                else :
-                    # no info, determine whether process is done
-                    code = process.poll()
-                    if code == 0:
-                        # normally terminate
-                        unitResult.status = 0
-                        unitResult.description = "normally terminate"
-                        self.logger.info(">>>>[UnitTester] process normally terminated")
-                        break
-                    elif code == None:
-                        # running
-                        continue
-                    elif code == 137:
-                        # killed by -9, it needs to break
-                        unitResult.status = 1
-                        unitResult.description = "killed by -9"
-                        self.logger.info(">>>>[UnitTester] process has be killed by -9")
-                        break
-                    else:
-                        self.logger.info(">>>>[UnitTester] process done by else")
-                        break
-                    
+        # each run will cover the old data; maven's output is read as it is written
+        counts = []
+        with open(outfile, "w") as outfd:
+            def onLine(line_info: str) -> bool:
+                outfd.write(line_info)
+                # deal the line info : str
+                round_count, is_failed = self.rutils.deal_line_info(line_info=line_info)
+                counts.append(round_count)
+                # stop maven at the first failed ctest
+                return is_failed
+            result = self.runner.run(mvn_cmd, cwd=self.context.testingDir, timeout=int(timeout), onLine=onLine)
+        cur_total_unit_test = sum(counts)
+        if result.stopped:
+            unitResult.status = 1
+            unitResult.description = "killed by pre"
+            self.logger.info(">>>>[UnitTester] kill process by pre")
+        elif result.timedOut:
+            cur_total_unit_test += 1
+            unitResult.status = 1
+            unitResult.description = "killed by timeout"
+            self.logger.info(">>>>[UnitTester] kill process by timeout")
+        elif result.returncode == 0:
+            # normally terminate
+            unitResult.status = 0
+            unitResult.description = "normally terminate"
+            self.logger.info(">>>>[UnitTester] process normally terminated")
+        elif result.returncode in (137, -9):
+            # killed by -9
+            unitResult.status = 1
+            unitResult.description = "killed by -9"
+            self.logger.info(">>>>[UnitTester] process has be killed by -9")
+        else:
+            self.logger.info(">>>>[UnitTester] process done by else")
+
         self.logger.info(f">>>>[UnitTester] this testcase's unittests count is : {cur_total_unit_test}")
         self.logger.info(">>>>[UnitTester] run by pre kill done")               
         self.unitUtils.clean_config()
-        # outfd.close()
-        # change to origin dir
-        os.chdir(Configuration.putConf['run_unit_dir'])
-        self.logger.info(f">>>>[UnitTester] change to origin dir : {Configuration.putConf['run_unit_dir']}")
         
-        UnitTester.cur_unittest_count = cur_total_unit_test
+        self.cur_unittest_count = cur_total_unit_test
 
         unit_end_time = time.time()
         once_unit_time = unit_end_time - unit_start_time
         # deal with result
         if unitResult.status == 1:
-            ShowStats.lastNewFailUnitTest = 0.0
+            self.stats.lastNewFailUnitTest = 0.0
             self.pre_find_time = unit_end_time
         else :
-            ShowStats.lastNewFailUnitTest = unit_end_time - self.pre_find_time
+            self.stats.lastNewFailUnitTest = unit_end_time - self.pre_find_time
 
         self.total_time += once_unit_time
         # self.total_count += 1
 
-        ShowStats.totalRunUnitTestsCount += cur_total_unit_test
-        ShowStats.averageUnitTestTime = self.total_time / ShowStats.totalRunUnitTestsCount
+        self.stats.totalRunUnitTestsCount += cur_total_unit_test
+        self.stats.averageUnitTestTime = self.total_time / self.stats.totalRunUnitTestsCount
         # ShowStats.totalUnitTestFailed += unitResult.failed_tests_count
 
         # ShowStats.totalUnitTestcases = self.total_count
-        ShowStats.unitTestExecSpeed = ShowStats.totalRunUnitTestsCount / self.total_time
+        self.stats.unitTestExecSpeed = self.stats.totalRunUnitTestsCount / self.total_time
         self.logger.info(f">>>>[UnitTester] status is : {unitResult.status}")
         # sort the time
         # self.unitTestTimeMap = dict(sorted(self.unitTestTimeMap.items(), key=operator.itemgetter(1)))
 
         return unitResult
 
+    def waitAll(self, popen_list: list, timeout: float) -> None:
+        for popen in popen_list:
+            # wait all maven processes of the round, kill the hanged ones
+            result = self.runner.wait(popen, ProcessResult(popen.args), timeout=int(timeout))
+            if result.timedOut:
+                self.logger.info(f">>>>[UnitTester] process killed of timeout {int(timeout)}")
+
     def runTest(self, testcase: Testcase) -> TestResult:
         """run the mutated conf, it will just run the diff conf
 
@@ -539,7 +466,7 @@ class UnitTester(Tester):
         self.isNoMappingTests = False
         # when running a new testcase, it should create a new UnitTester instance to reset it's attribute
         # rewrite runTest
-        surefire_reports = Configuration.putConf['surefire_location']
+        surefire_reports = self.context.putConf['surefire_location']
         # clean the surefire-reports
         for surefire_dir in surefire_reports:
             if os.path.exists(surefire_dir):
@@ -548,9 +475,9 @@ class UnitTester(Tester):
                     os.chmod(surefire_dir, stat.S_IWRITE)
                 shutil.rmtree(surefire_dir, ignore_errors=True)
                 
-        if Configuration.fuzzerConf["use_pre_kill"] == 'True':
+        if self.context.fuzzerConf["use_pre_kill"] == 'True':
             return self.preKillRun(testcase=testcase)
-        if Configuration.fuzzerConf['use_mutil_pro'] == 'True':
+        if self.context.fuzzerConf['use_mutil_pro'] == 'True':
             return self.runWithMutilprocess(testcase)
         
         return self.test_conf_file(testcase=testcase)
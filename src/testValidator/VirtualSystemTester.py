@@ -10,8 +10,8 @@ class VirtualSystemTester(SystemTester):
     """
     """
 
-    def __init__(self, vulnerableConfItems: Dict[str, List[str]] = None):
-        super(VirtualSystemTester, self).__init__()
+    def __init__(self, vulnerableConfItems: Dict[str, List[str]] = None, context=None):
+        super(VirtualSystemTester, self).__init__(context)
         self.vulnerableConfItems: Dict = vulnerableConfItems
 
     def runTest(self, testcase: Testcase) -> TestResult:
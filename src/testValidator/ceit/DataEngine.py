@@ -1,5 +1,9 @@
+import os
+
 from testValidator.ceit.data_recorder.data_recorder import DataRecorder
 from testValidator.ceit.data_recorder.data_structure import RedisDataKey, RedisDataValue
+from utils.Configuration import Configuration
+from utils.UnitConstant import FUZZER_DIR
 
 
 class DataEngine( object ):
@@ -17,7 +21,14 @@ class DataEngine( object ):
     def __init__(self, log_engine, prefix):
         self.log_engine = log_engine
         self.log_engine.info( "DataEngine Startup." )
-        self.data_recorder = DataRecorder()
+        putConf = Configuration.putConf
+        # `redis` keeps the original behavior; `sqlite` needs no server running
+        self.data_recorder = DataRecorder( backend=putConf.get( 'data_recorder_backend', 'redis' ),
+                                           batch_size=putConf.get( 'data_recorder_batch_size', 32 ),
+                                           host=putConf.get( 'redis_host', '127.0.0.1' ),
+                                           port=putConf.get( 'redis_port', 6379 ),
+                                           path=putConf.get( 'data_recorder_path',
+                                                             os.path.join( FUZZER_DIR, 'ceit_results.db' ) ) )
         self.prefix = prefix
         self.clean_all()
 
@@ -98,8 +109,11 @@ class DataEngine( object ):
         self.value = self.value(value)
         return self.value.overall_results()
 
-    def dump_overall_results(self, file_path):
-        self.data_recorder.dump_overall_results(file_path)
+    def sync(self):
+        self.data_recorder.sync()
+
+    def dump_overall_results(self, file_path, file_format=None):
+        return self.data_recorder.dump_overall_results(file_path, file_format)
 
 
     def clean_all(self):
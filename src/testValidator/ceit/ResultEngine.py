@@ -1,7 +1,6 @@
-import json
-
 from testValidator.ceit.result_analyzer.result_analyzer import ResultAnalyzer
 from testValidator.ceit.ceitutils.file_system_utils import get_files_in_dir
+from testValidator.ceit.system_tester.suite_loader import load_suite
 
 from utils.Configuration import Configuration
 
@@ -12,7 +11,7 @@ class ResultEngine( object ):
     result_dir = ""
     char2cut = 0
     result_analyzer = None
-    oracles = Configuration.putConf['test_oracles_path']
+    oracles = ""
     oracle_dict = {}
 
     def __init__(self, log_engine, char2cut):
@@ -21,9 +20,8 @@ class ResultEngine( object ):
         self.char2cut = char2cut
         self.result_analyzer = ResultAnalyzer()
 
-        with open( self.oracles, 'r' ) as fp1:
-            content = fp1.read()
-            self.oracle_dict = json.loads( content )
+        self.oracles = Configuration.putConf['test_oracles_path']
+        self.oracle_dict = load_suite( Configuration.putConf['test_scripts_path'], self.oracles )[1]
 
     def set_directory(self, directory):
         self.result_dir = directory
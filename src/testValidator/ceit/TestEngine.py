@@ -1,4 +1,3 @@
-import json
 from logging import getLogger
 import os
 import shutil
@@ -9,6 +8,7 @@ from importlib import reload
 
 from testValidator.ceit.system_tester.observer import EventListener
 from testValidator.ceit.system_tester.observer import Observer
+from testValidator.ceit.system_tester.suite_loader import load_suite
 from testValidator.ceit.system_tester.testcase import TestCase
 from utils.Configuration import Configuration
 
@@ -21,9 +21,8 @@ class TestEngine( object ):
     log_engine = None
     test_mode = ""
     test_cases = []
-    Configuration.parseConfiguration()
-    scripts = Configuration.putConf['test_scripts_path']
-    oracles = Configuration.putConf['test_oracles_path']
+    scripts = ""
+    oracles = ""
     observer = None
     directory = ""
     reactions_matrixs = {}
@@ -33,6 +32,8 @@ class TestEngine( object ):
         self.log_engine = log_engine
         self.log_engine.info( "TestEngine Startup." )
         self.test_mode = test_mode
+        self.scripts = Configuration.putConf['test_scripts_path']
+        self.oracles = Configuration.putConf['test_oracles_path']
         self.set_interval(interval )
         self.set_log_file_path( log_file_path )
         self.load_test_cases()
@@ -50,20 +51,15 @@ class TestEngine( object ):
             os.makedirs( RESULTS_PATH )
 
     def load_test_cases(self):
-        with open( self.oracles, 'r' ) as fp1:
-            with open( self.scripts, 'r' ) as fp2:
-                content1 = fp1.read()
-                content2 = fp2.read()
-                oracle_dict = json.loads( content1 )
-                script_dict = json.loads( content2 )
-                length = oracle_dict.__len__()
-                for i in range( length ):
-                    id = i + 1
-                    # print self.event_listener
-                    test_case = TestCase( id=str( id ), script_dict=script_dict[str( id )],
-                                          oracle_dict=oracle_dict[str( id )],
-                                          interval=INTERVAL, log_file=LOGFILE, end=str( length ) )
-                    self.test_cases.append( test_case )
+        script_dict, oracle_dict = load_suite( self.scripts, self.oracles )
+        self.test_cases = []
+        length = oracle_dict.__len__()
+        for i in range( length ):
+            id = i + 1
+            test_case = TestCase( id=str( id ), script_dict=script_dict[str( id )],
+                                  oracle_dict=oracle_dict[str( id )],
+                                  interval=INTERVAL, log_file=LOGFILE, end=str( length ) )
+            self.test_cases.append( test_case )
 
     def set_directory(self, directory):
         directory = RESULTS_PATH + '/' + directory
@@ -0,0 +1,152 @@
+# encoding:utf-8
+import sqlite3
+
+
+class RedisBackend( object ):
+    """
+    Store CEIT results as redis hashes: one hash per option, one field per mutant.
+    """
+
+    def __init__(self, host='127.0.0.1', port=6379):
+        import redis
+        self.redis_cli = redis.Redis( host=host, port=int( port ), decode_responses=True )
+
+    def write_batch(self, batch):
+        # one round trip for the whole batch instead of one hset per value
+        pipe = self.redis_cli.pipeline( transaction=False )
+        for name, mapping in batch.items():
+            pipe.hset( name, mapping=mapping )
+        pipe.execute()
+
+    def iter_names(self, prefix, count=500):
+        # SCAN walks the keyspace with a cursor instead of blocking redis like KEYS
+        return self.redis_cli.scan_iter( match=prefix + "*", count=count )
+
+    def get_names(self, prefix):
+        return list( self.iter_names( prefix ) )
+
+    def get_keys(self, name):
+        return self.redis_cli.hkeys( name )
+
+    def get_values(self, name):
+        return self.redis_cli.hvals( name )
+
+    def get_value(self, name, key):
+        return self.redis_cli.hget( name, key )
+
+    def delete(self, name):
+        self.redis_cli.delete( name )
+
+    def delete_prefix(self, prefix, count=500):
+        names = []
+        for name in self.iter_names( prefix, count ):
+            names.append( name )
+            if len( names ) >= count:
+                self.redis_cli.delete( *names )
+                names = []
+        if names:
+            self.redis_cli.delete( *names )
+
+    def iter_entries(self, prefix, chunk_size=100, large_hash=1000):
+        """
+        Yield `(name, key, value)` for every hash under `prefix`, `chunk_size` hashes at a time.
+
+        Hashes are fetched with one pipelined HGETALL per chunk; hashes with more than
+        `large_hash` fields are walked with HSCAN so a single one never has to fit in memory.
+        """
+        chunk = []
+        for name in self.iter_names( prefix, chunk_size ):
+            chunk.append( name )
+            if len( chunk ) >= chunk_size:
+                yield from self.read_chunk( chunk, large_hash )
+                chunk = []
+        if chunk:
+            yield from self.read_chunk( chunk, large_hash )
+
+    def read_chunk(self, names, large_hash):
+        pipe = self.redis_cli.pipeline( transaction=False )
+        for name in names:
+            pipe.hlen( name )
+        lengths = pipe.execute()
+        small = [name for name, length in zip( names, lengths ) if length <= large_hash]
+        for name in small:
+            pipe.hgetall( name )
+        for name, mapping in zip( small, pipe.execute() ):
+            for key, value in mapping.items():
+                yield name, key, value
+        for name, length in zip( names, lengths ):
+            if length > large_hash:
+                for key, value in self.redis_cli.hscan_iter( name ):
+                    yield name, key, value
+
+    def close(self):
+        self.redis_cli.close()
+
+
+class SqliteBackend( object ):
+    """
+    Store CEIT results in an embedded SQLite file, so CEIT runs without a redis server.
+    """
+
+    def __init__(self, path):
+        self.conn = sqlite3.connect( path, check_same_thread=False )
+        self.conn.execute( "PRAGMA journal_mode=WAL" )
+        self.conn.execute( "CREATE TABLE IF NOT EXISTS ceit_results ("
+                           "name TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, "
+                           "PRIMARY KEY (name, key))" )
+        self.conn.commit()
+
+    def write_batch(self, batch):
+        rows = [(name, key, value) for name, mapping in batch.items() for key, value in mapping.items()]
+        with self.conn:
+            self.conn.executemany( "INSERT OR REPLACE INTO ceit_results (name, key, value) VALUES (?, ?, ?)", rows )
+
+    def get_names(self, prefix):
+        cursor = self.conn.execute( "SELECT DISTINCT name FROM ceit_results WHERE substr(name, 1, ?) = ?",
+                                    (len( prefix ), prefix) )
+        return [row[0] for row in cursor]
+
+    def get_keys(self, name):
+        return [row[0] for row in self.conn.execute( "SELECT key FROM ceit_results WHERE name = ?", (name,) )]
+
+    def get_values(self, name):
+        return [row[0] for row in self.conn.execute( "SELECT value FROM ceit_results WHERE name = ?", (name,) )]
+
+    def get_value(self, name, key):
+        row = self.conn.execute( "SELECT value FROM ceit_results WHERE name = ? AND key = ?", (name, key) ).fetchone()
+        return row[0] if row else None
+
+    def delete(self, name):
+        with self.conn:
+            self.conn.execute( "DELETE FROM ceit_results WHERE name = ?", (name,) )
+
+    def delete_prefix(self, prefix):
+        with self.conn:
+            self.conn.execute( "DELETE FROM ceit_results WHERE substr(name, 1, ?) = ?", (len( prefix ), prefix) )
+
+    def iter_entries(self, prefix, chunk_size=100, large_hash=1000):
+        """
+        Yield `(name, key, value)` for every row under `prefix`, reading `chunk_size` rows at a time.
+        """
+        cursor = self.conn.execute( "SELECT name, key, value FROM ceit_results WHERE substr(name, 1, ?) = ? "
+                                    "ORDER BY name, key", (len( prefix ), prefix) )
+        while True:
+            rows = cursor.fetchmany( chunk_size )
+            if not rows:
+                break
+            yield from rows
+
+    def close(self):
+        self.conn.close()
+
+
+def create_backend(backend, **kwargs):
+    """
+    Create a storage backend for `DataRecorder` by its name ("redis" or "sqlite").
+    """
+    if backend == "redis":
+        return RedisBackend( host=kwargs.get( "host", '127.0.0.1' ), port=kwargs.get( "port", 6379 ) )
+    elif backend == "sqlite":
+        return SqliteBackend( kwargs["path"] )
+    else:
+        raise ValueError( "unsupported data recorder backend: " + str( backend ) )
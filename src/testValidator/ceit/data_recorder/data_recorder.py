@@ -1,92 +1,80 @@
 # encoding:utf-8
+import atexit
+import json
 
-from testValidator.ceit.data_recorder.data_structure import RedisDataValue
-import redis
+from testValidator.ceit.data_recorder.backends import create_backend
+from testValidator.ceit.data_recorder.result_exporter import ResultExporter
 
 
 class DataRecorder( object ):
+    """
+    Buffer CEIT results in memory and write them to the backend in batches.
+
+    Values are serialized as JSON. Reads see the buffered values too, so callers
+    do not need to care whether a value has already been written out.
+    """
     prefix = ""
-    redis_cli = None
+    backend = None
     main_keys = []
 
-    def __init__(self):
-        try:
-            self.redis_cli = redis.Redis( host='127.0.0.1', port=6379 )
-        except Exception as e:
-            print(e.message)
-        finally:
-            pass
+    def __init__(self, backend="redis", batch_size=32, **backend_args):
+        self.backend = create_backend( backend, **backend_args )
+        self.batch_size = max( 1, int( batch_size ) )
+        # {name: {key: serialized value}} not yet written to the backend
+        self.pending = {}
+        self.pending_count = 0
+        atexit.register( self.sync )
 
     def set_prefix(self, prefix):
         self.prefix = prefix
 
+    def serialize(self, value):
+        return value if isinstance( value, str ) else json.dumps( value )
+
     def insert(self, name, key, value):
-        self.redis_cli.hset( name, key, str(value) )
+        self.pending.setdefault( name, {} )[key] = self.serialize( value )
+        self.pending_count += 1
+        if self.pending_count >= self.batch_size:
+            self.sync()
+
+    def sync(self):
+        """
+        Write all buffered values to the backend.
+        """
+        if self.pending:
+            self.backend.write_batch( self.pending )
+            self.pending = {}
+            self.pending_count = 0
 
     def get_names(self):
-        return self.redis_cli.keys( pattern=self.prefix + "*" )
+        names = list( self.backend.get_names( self.prefix ) )
+        names.extend( name for name in self.pending if name.startswith( self.prefix ) and name not in names )
+        return names
 
     def get_keys(self, name):
-        return self.redis_cli.hkeys( name )
+        keys = list( self.backend.get_keys( name ) )
+        keys.extend( key for key in self.pending.get( name, {} ) if key not in keys )
+        return keys
 
     def get_all_value_from_name(self, name):
-        return self.redis_cli.hvals( name )
+        values = dict( zip( self.backend.get_keys( name ), self.backend.get_values( name ) ) )
+        values.update( self.pending.get( name, {} ) )
+        return list( values.values() )
 
     def get_value_from_key(self, name, key):
-        return self.redis_cli.hget( name, key )
+        if key in self.pending.get( name, {} ):
+            return self.pending[name][key]
+        return self.backend.get_value( name, key )
 
     def delete(self, key):
-        self.redis_cli.delete( key )
+        if key in self.pending:
+            self.pending_count -= len( self.pending.pop( key ) )
+        self.backend.delete( key )
 
     def clean(self):
-        redis_cli = self.redis_cli
-        if self.get_names():
-            redis_cli.delete( *redis_cli.keys( pattern=self.prefix + "*" ) )
-
-    def dump_overall_results(self, file_path):
-        with open(file_path, 'w') as fp:
-            fp.write("Option Name, Mutation Name, Testcase Results, Analyzer Results, Observer4Crash, Observer4Hang, Observer4Termination\n")
-            r = RedisDataValue()
-            for name in self.get_names():
-                for key in self.get_keys(name):
-                    value = self.get_value_from_key(name, key)
-                    r = r(value)
-                    testcase_results = r.overall_results.results["testcase_results"]
-                    analyzer_results = r.overall_results.results["analyzer_results"]
-                    observer_crash_results = str(r.overall_results.results["observer_results"]["crash"])
-                    observer_hang_results = str(r.overall_results.results["observer_results"]["hang"])
-                    observer_termination_results = str(r.overall_results.results["observer_results"]["termination"])
-                    ls = [name, key, testcase_results, analyzer_results, observer_crash_results, observer_hang_results, observer_termination_results]
-                    line = ', '.join(ls)
-                    line = line + '\n'
-                    fp.write(line)
-
-
-
-def main():
-    # dh = DataRecorder()
-    #
-    # dh.insert("name1", "key1", {"key1":"value"})
-    # dh.insert("name1", "key2", {"key2":"value"})
-    # dh.insert("name2", "key3", {"key3":"value"})
-
-    # print dh.get_names()
-    # print dh.get_value_from_key("name1", "key1")
-    # for name in dh.get_names():
-    #     print dh.get_all_value_from_name(name)
-    # dh.clean()
-    # print dh.redis_cli.keys()
-    dh = DataRecorder()
-    # dh.clean()
-    # dh.insert( "name1", "key1", {"key1": "value"} )
-    # for key in dh.get_names():
-    #     print "key: " + key
-    #     for i in dh.get_all_value_from_name( key ):
-    #         print i
-    # print dh.get_all_value_from_name("IPaddress")
-
-    dh.dump_overall_results()
-
-
-if __name__ == '__main__':
-    main()
+        for name in [name for name in self.pending if name.startswith( self.prefix )]:
+            self.pending_count -= len( self.pending.pop( name ) )
+        self.backend.delete_prefix( self.prefix )
+
+    def dump_overall_results(self, file_path, file_format=None):
+        return ResultExporter( self ).export( file_path, file_format )
@@ -49,9 +49,18 @@ class RedisDataValue( object ):
 
     def __call__(self, string2json=None):
         if string2json:
-            string2json = string2json.replace( "'", '"' ).replace( 'u"', '"' ).replace( "False", "false" ).replace(
-                "True", "true" )
-            value_dict = json.loads( string2json )
+            if isinstance( string2json, dict ):
+                value_dict = string2json
+            else:
+                if isinstance( string2json, bytes ):
+                    string2json = string2json.decode( "utf-8" )
+                try:
+                    value_dict = json.loads( string2json )
+                except ValueError:
+                    # values written before the recorder switched to json were stored as `str(dict)`
+                    string2json = string2json.replace( "'", '"' ).replace( 'u"', '"' ).replace( "False", "false" ).replace(
+                        "True", "true" )
+                    value_dict = json.loads( string2json )
             self.reload( value_dict )
             return self
 
@@ -0,0 +1,75 @@
+# encoding:utf-8
+import os
+
+from testValidator.ceit.data_recorder.data_structure import RedisDataValue
+
+
+class ResultExporter( object ):
+    """
+    Stream the overall CEIT results of a `DataRecorder` to a CSV or parquet file.
+
+    Rows are read from the backend with cursors in chunks of `chunk_size` and
+    written out as they arrive, so memory use does not grow with the campaign.
+    """
+    header = ["Option Name", "Mutation Name", "Testcase Results", "Analyzer Results",
+              "Observer4Crash", "Observer4Hang", "Observer4Termination"]
+
+    def __init__(self, data_recorder, chunk_size=100):
+        self.data_recorder = data_recorder
+        self.chunk_size = chunk_size
+
+    def rows(self):
+        self.data_recorder.sync()
+        r = RedisDataValue()
+        for name, key, value in self.data_recorder.backend.iter_entries( self.data_recorder.prefix, self.chunk_size ):
+            results = r( value ).overall_results.results
+            yield [name, key, results["testcase_results"], results["analyzer_results"],
+                   str( results["observer_results"]["crash"] ), str( results["observer_results"]["hang"] ),
+                   str( results["observer_results"]["termination"] )]
+
+    def export(self, file_path, file_format=None):
+        """
+        Write all results to `file_path` and return the number of rows written.
+
+        `file_format` is "csv" or "parquet"; by default it follows the file extension.
+        """
+        if file_format is None:
+            file_format = "parquet" if os.path.splitext( file_path )[1] == ".parquet" else "csv"
+        if file_format == "parquet":
+            return self.export_parquet( file_path )
+        elif file_format == "csv":
+            return self.export_csv( file_path )
+        else:
+            raise ValueError( "unsupported export format: " + str( file_format ) )
+
+    def export_csv(self, file_path):
+        count = 0
+        with open( file_path, 'w' ) as fp:
+            fp.write( ', '.join( self.header ) + '\n' )
+            for row in self.rows():
+                fp.write( ', '.join( row ) + '\n' )
+                count += 1
+        return count
+
+    def export_parquet(self, file_path):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        schema = pa.schema( [(column, pa.string()) for column in self.header] )
+        count = 0
+        with pq.ParquetWriter( file_path, schema ) as writer:
+            chunk = []
+            for row in self.rows():
+                chunk.append( row )
+                if len( chunk ) >= self.chunk_size:
+                    writer.write_batch( self.to_batch( pa, schema, chunk ) )
+                    count += len( chunk )
+                    chunk = []
+            if chunk:
+                writer.write_batch( self.to_batch( pa, schema, chunk ) )
+                count += len( chunk )
+        return count
+
+    def to_batch(self, pa, schema, chunk):
+        columns = [pa.array( [row[i] for row in chunk], type=pa.string() ) for i in range( len( self.header ) )]
+        return pa.RecordBatch.from_arrays( columns, schema=schema )
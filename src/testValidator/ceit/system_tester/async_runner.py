@@ -0,0 +1,76 @@
+import asyncio
+
+from utils.EventLoop import EventLoop
+from utils.Logger import getLogger
+
+
+class AsyncTestRunner( object ):
+    """
+    Run the CEIT test scripts on an asyncio event loop instead of one by one.
+
+    Scripts keep their declared order, except that consecutive scripts marked
+    `"independent": true` in the test-script file (no shared ports or dirs) are
+    started together, at most `parallelism` at a time. A script that is not
+    independent waits for everything before it and blocks everything after it.
+    Scripts that share a `log_file` never run together: each one saves the part
+    of the log written between its start and its commit, which would otherwise
+    hold the lines of the other scripts.
+
+    Results are committed in script order: the observer event of script N is
+    pushed only after script N-1 has been committed, so the crash/hang/termination
+    observers see the same event sequence as in a serial run.
+    """
+
+    def __init__(self, test_cases, parallelism=1):
+        self.logger = getLogger()
+        self.test_cases = test_cases
+        self.parallelism = max( 1, int( parallelism ) )
+
+    def batches(self):
+        """
+        Split the scripts into batches that may run concurrently.
+        """
+        batches = []
+        current = []
+        for test_case in self.test_cases:
+            if test_case.independent and self.parallelism > 1:
+                if test_case.log_file != "" and any( t.log_file == test_case.log_file for t in current ):
+                    batches.append( current )
+                    current = []
+                current.append( test_case )
+                continue
+            if current:
+                batches.append( current )
+                current = []
+            batches.append( [test_case] )
+        if current:
+            batches.append( current )
+        return batches
+
+    def run(self):
+        """
+        Run all scripts and return the ids of the failed ones, in script order.
+        """
+        return EventLoop.shared().run( self.run_async() )
+
+    async def run_async(self):
+        semaphore = asyncio.Semaphore( self.parallelism )
+        for batch in self.batches():
+            if len( batch ) > 1:
+                self.logger.info(f">>>>[AsyncTestRunner] running scripts {[t.id for t in batch]} concurrently")
+            committed = [asyncio.Event() for _ in batch]
+            await asyncio.gather( *[self.run_one( batch, i, committed, semaphore ) for i in range( len( batch ) )] )
+        return [str( test_case.id ) for test_case in self.test_cases if not test_case.result]
+
+    async def run_one(self, batch, index, committed, semaphore):
+        test_case = batch[index]
+        self.logger.info(f"run testscript {test_case.id}")
+        try:
+            async with semaphore:
+                await test_case.execute_async()
+            if index > 0:
+                await committed[index - 1].wait()
+            await test_case.commit_async()
+        finally:
+            # never leave the following scripts waiting for this one
+            committed[index].set()
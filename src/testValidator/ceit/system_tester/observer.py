@@ -1,7 +1,9 @@
 import os
 import subprocess
 import time
-from threading import Thread
+from abc import ABCMeta, abstractmethod
+from queue import Queue
+from threading import Event, Thread
 from copy import deepcopy
 from utils.UnitConstant import SRC_DIR
 
@@ -65,120 +67,49 @@ class Observer(object):
         return self.termination_observer.stop()
 
 
-class CrashObserver(Thread):
-    event = None
-    running = False
-    detailed_results = {}
+class EventObserver(Thread, metaclass=ABCMeta):
+    """
+    Handles the testcase ids pushed by the EventListener, one at a time.
+    The thread blocks on its event queue instead of spinning on `self.event`,
+    and `stop` waits for the last testcase instead of polling `finished`.
+    """
     result = False
+    running = False
     finished = False
 
     def __init__(self):
         Thread.__init__(self)
-        self.event = None
-        # /ceitinspector-code/examples/Nginx/
-        subprocess.Popen(
-            "bash " + os.path.join(SRC_DIR, 'testValidator',
-                                   'ceit', 'system_tester',
-                                   'shell', 'coredumpSetting.sh'),
-            shell=True)
-        # exit(0)
+        self.events = Queue()
+        self.done = Event()
+        self.detailed_results = {}
 
     def run(self):
         self.running = True
         self.finished = False
-        while True:
-            if self.running == True:
-                self.result = False
-                if self.event:
-                    test_case_id = self.event
-                    test_case = TESTCASES[test_case_id]
-                    script = test_case.script
-                    oracle_dict = test_case.oracle_dict
-                    running = oracle_dict["running"]
-
-                    if running == True:
-                        pass
-                    else:
-                        if self.check_crash():
-                            # find crash
-                            self.result = True
-                        else:
-                            self.result = False
-                    result = self.result
-                    self.detailed_results[test_case_id] = result
-                    self.event = None
-                    if test_case_id == str(TESTCASES.__len__()):
-                        self.finished = True
-                        self.running = False
-            else:
-                break
-
-    def check_crash(self):
-        for root, dir, file in os.walk("/corefile/"):
-            if file != []:
-                return True
-            else:
-                return False
+        while self.running:
+            test_case_id = self.events.get()
+            test_case = TESTCASES[test_case_id]
+            self.result = self.observe(test_case)
+            self.detailed_results[test_case_id] = self.result
+            if test_case_id == str(TESTCASES.__len__()):
+                self.finished = True
+                self.running = False
+                self.done.set()
+
+    @abstractmethod
+    def observe(self, test_case):
+        """
+        Return True if the event this observer watches for happened in `test_case`.
+        """
+        pass
 
     def stop(self):
-        while True:
-            time.sleep(0.1)
-            if self.finished:
-                detailed_results = deepcopy(self.detailed_results)
-                return detailed_results
+        self.done.wait()
+        detailed_results = deepcopy(self.detailed_results)
+        return detailed_results
 
     def get_event(self, event):
-        while True:
-            if self.event == None:
-                self.event = event
-                break
-
-
-class HangObserver(Thread):
-    event = None
-    result = False
-    running = False
-    finished = False
-    detailed_results = {}
-
-    def __init__(self):
-        Thread.__init__(self)
-        self.event = None
-
-    def run(self):
-        self.running = True
-        self.finished = False
-        while True:
-            if self.running == True:
-                self.result = False
-                if self.event:
-                    test_case_id = self.event
-                    test_case = TESTCASES[test_case_id]
-                    script = test_case.script
-                    oracle_dict = test_case.oracle_dict
-                    running = oracle_dict["running"]
-
-                    if running == True:
-                        pass
-                    else:
-                        if self.check_script_running(script):
-                            # find Hang
-                            self.result = True
-                            self.terminate_script(script)
-                        else:
-                            self.result = False
-                    result = self.result
-                    self.detailed_results[test_case_id] = result
-                    self.event = None
-                    if test_case_id == str(TESTCASES.__len__()):
-                        self.finished = True
-                        self.running = False
-            else:
-                break
-
-    def terminate_script(self, script):
-
-        os.popen('ps -ef | grep "' + script + '" | grep -v grep | awk ' + "'{print $2}' | xargs kill -9")
+        self.events.put(event)
 
     def check_script_running(self, script):
         output = os.popen('ps -ef | grep "' + script + '"')
@@ -189,104 +120,82 @@ class HangObserver(Thread):
             else:
                 return False
 
-    def stop(self):
-        while True:
-            time.sleep(0.1)
-            if self.finished:
-                detailed_results = deepcopy(self.detailed_results)
-                return detailed_results
-
-    def get_event(self, event):
-        while True:
-            if self.event == None:
-                self.event = event
-                break
-
 
-class TerminationObserver(Thread):
-    event = None
-    result = False
-    running = False
-    finished = False
-    detailed_results = {}
+class CrashObserver(EventObserver):
 
     def __init__(self):
-        Thread.__init__(self)
-        self.event = None
+        EventObserver.__init__(self)
+        # /ceitinspector-code/examples/Nginx/
+        subprocess.Popen(
+            "bash " + os.path.join(SRC_DIR, 'testValidator',
+                                   'ceit', 'system_tester',
+                                   'shell', 'coredumpSetting.sh'),
+            shell=True)
+        # exit(0)
 
-    def run(self):
-        self.running = True
-        self.finished = False
-        while True:
-            if self.running == True:
-                self.result = False
-                if self.event:
-                    test_case_id = self.event
-                    test_case = TESTCASES[test_case_id]
-                    script = test_case.script
-                    oracle_dict = test_case.oracle_dict
-                    running = oracle_dict["running"]
-                    if running == False:
-                        pass
-                    else:
-                        if self.check_script_running(script):
-                            self.result = False
-                        else:
-                            # find Termination
-                            self.result = True
-                    result = self.result
-                    self.detailed_results[test_case_id] = result
-                    self.event = None
-                    if test_case_id == str(TESTCASES.__len__()):
-                        self.finished = True
-                        self.running = False
-            else:
-                break
+    def observe(self, test_case):
+        running = test_case.oracle_dict["running"]
+        if running == True:
+            return False
+        # find crash
+        return bool(self.check_crash())
 
-    def check_script_running(self, script):
-        output = os.popen('ps -ef | grep "' + script + '"')
-        lines = output.readlines()
-        for line in lines:
-            if "grep" not in line:
+    def check_crash(self):
+        for root, dir, file in os.walk("/corefile/"):
+            if file != []:
                 return True
             else:
                 return False
 
-    def stop(self):
-        while True:
-            time.sleep(0.1)
-            if self.finished:
-                detailed_results = deepcopy(self.detailed_results)
-                return detailed_results
 
-    def get_event(self, event):
-        while True:
-            if self.event == None:
-                self.event = event
-                break
+class HangObserver(EventObserver):
+
+    def observe(self, test_case):
+        script = test_case.script
+        running = test_case.oracle_dict["running"]
+        if running == True:
+            return False
+        if self.check_script_running(script):
+            # find Hang
+            self.terminate_script(script)
+            return True
+        return False
+
+    def terminate_script(self, script):
+
+        os.popen('ps -ef | grep "' + script + '" | grep -v grep | awk ' + "'{print $2}' | xargs kill -9")
+
+
+class TerminationObserver(EventObserver):
+
+    def observe(self, test_case):
+        script = test_case.script
+        running = test_case.oracle_dict["running"]
+        if running == False:
+            return False
+        # find Termination
+        return not self.check_script_running(script)
 
 
 class EventListener(Thread):
-    observer_event_queue = []
-    daemon_event_queue = []
     observer = None
     running = False
 
     def __init__(self):
         Thread.__init__(self)
+        # (kind, event) pairs, (None, None) stops the listener
+        self.events = Queue()
 
     def listen(self):
         self.running = True
         while True:
-            if self.running == True:
-                if self.observer_event_queue:
-                    event = self.observer_event_queue.pop()
-                    self.observer.get_event(event)
-                if self.daemon_event_queue:
-                    event = self.daemon_event_queue.pop()
-                    self.daemon_process.get_event(event)
-            else:
+            kind, event = self.events.get()
+            if kind is None:
                 break
+            if kind == "observer":
+                self.observer.get_event(event)
+            else:
+                self.daemon_process.get_event(event)
 
     def run(self):
         try:
@@ -295,10 +204,10 @@ class EventListener(Thread):
             print(e)
 
     def push_observer_event(self, string):
-        self.observer_event_queue.append(string)
+        self.events.put(("observer", string))
 
     def push_daemon_event(self, string):
-        self.daemon_event_queue.append(string)
+        self.events.put(("daemon", string))
 
     def bind_observer(self, observer):
         self.observer = observer
@@ -310,6 +219,7 @@ class EventListener(Thread):
 
         # self.observer = None
         self.running = False
+        self.events.put((None, None))
 
     def is_running(self):
         if self.running == True:
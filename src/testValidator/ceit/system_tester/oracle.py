@@ -0,0 +1,42 @@
+import re
+
+
+class Oracle( object ):
+    """
+    An oracle of a CEIT test script, compiled once when the script is loaded.
+
+    `oracle` is a string or a list of strings; the oracle holds when any of them
+    appears in the console output (or when none does, with `check_for_absence`).
+    The strings are matched literally unless the oracle file sets `"regex": true`.
+    """
+
+    def __init__(self, oracle, check_for_absence=False, regex=False):
+        self.patterns = oracle if isinstance( oracle, list ) else [oracle]
+        self.check_for_absence = check_for_absence
+        self.regex = regex
+        if not regex and len( self.patterns ) == 1:
+            # a single literal is cheapest as a plain substring search
+            self.literal = self.patterns[0]
+            self.compiled = None
+        else:
+            self.literal = None
+            if regex:
+                source = "|".join( "(?:" + pattern + ")" for pattern in self.patterns )
+            else:
+                source = "|".join( re.escape( pattern ) for pattern in self.patterns )
+            self.compiled = re.compile( source )
+
+    @staticmethod
+    def from_dict(oracle_dict):
+        return Oracle( oracle_dict["oracle"], oracle_dict.get( "check_for_absence", False ),
+                       oracle_dict.get( "regex", False ) )
+
+    def found(self, raw_result):
+        if self.compiled is None:
+            return self.literal in raw_result
+        return self.compiled.search( raw_result ) is not None
+
+    def __call__(self, raw_result):
+        if self.check_for_absence:
+            return not self.found( raw_result )
+        return self.found( raw_result )
@@ -0,0 +1,58 @@
+import hashlib
+import json
+import os
+import pickle
+
+from utils.Logger import getLogger
+from utils.UnitConstant import FUZZER_DIR
+
+# (scripts_path, oracles_path) -> (signature, scripts, oracles)
+_loaded = {}
+
+
+def file_signature(*paths):
+    signature = []
+    for path in paths:
+        stat = os.stat( path )
+        signature.append( (path, stat.st_mtime_ns, stat.st_size) )
+    return tuple( signature )
+
+
+def cache_path(scripts_path, oracles_path, cache_dir):
+    digest = hashlib.sha1( (scripts_path + "\n" + oracles_path).encode( "utf-8" ) ).hexdigest()[:12]
+    return os.path.join( cache_dir, "ceit_suite_" + digest + ".pkl" )
+
+
+def load_suite(scripts_path, oracles_path, cache_dir=FUZZER_DIR):
+    """
+    Load the CEIT test-script and oracle files as `(script_dict, oracle_dict)`.
+
+    The parsed files are kept in memory and pickled to `cache_dir`; both copies are
+    reused until the mtime or size of either file changes.
+    """
+    signature = file_signature( scripts_path, oracles_path )
+    key = (scripts_path, oracles_path)
+    if key in _loaded and _loaded[key][0] == signature:
+        return _loaded[key][1], _loaded[key][2]
+
+    path = cache_path( scripts_path, oracles_path, cache_dir )
+    try:
+        with open( path, 'rb' ) as fp:
+            cached_signature, scripts, oracles = pickle.load( fp )
+        if cached_signature != signature:
+            raise ValueError( "stale suite cache" )
+    except (OSError, ValueError, EOFError, pickle.UnpicklingError):
+        with open( scripts_path, 'r' ) as fp:
+            scripts = json.load( fp )
+        with open( oracles_path, 'r' ) as fp:
+            oracles = json.load( fp )
+        try:
+            tmp_path = path + ".tmp"
+            with open( tmp_path, 'wb' ) as fp:
+                pickle.dump( (signature, scripts, oracles), fp, protocol=pickle.HIGHEST_PROTOCOL )
+            os.replace( tmp_path, path )
+        except OSError as e:
+            getLogger().warning(f">>>>[SuiteLoader] cannot write suite cache {path}: {e}")
+
+    _loaded[key] = (signature, scripts, oracles)
+    return scripts, oracles
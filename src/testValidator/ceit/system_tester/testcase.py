@@ -1,9 +1,9 @@
-import os, gc
-import subprocess
-import time
-from threading import Timer
+import asyncio
+import os
 
+from testValidator.ceit.system_tester.oracle import Oracle
 from utils.Configuration import Configuration
+from utils.EventLoop import EventLoop
 from utils.Logger import getLogger
 
 class TestCase( object ):
@@ -30,68 +30,88 @@ class TestCase( object ):
         self.logger = getLogger()
         self.log_file = log_file
         self.timeout = oracle_dict["timeout"]
+        if self.timeout == "default":
+            self.timeout = 0
         self.test_path = Configuration.putConf['test_path']
         self.test_mode = Configuration.putConf['test_mode']
-        self.timeout_flag = False
+        # scripts declared independent share no ports or dirs with other scripts,
+        # so AsyncTestRunner may run them concurrently
+        self.independent = script_dict.get("independent", False)
         if "check_for_absence" in oracle_dict:
             self.check_for_absence = oracle_dict["check_for_absence"]
         else:
             self.check_for_absence = False
+        self.compiled_oracle = Oracle.from_dict( oracle_dict )
 
-    def timeout_callback(self):
-        self.timeout_flag = True
+    def console_path(self):
+        return self.directory + '/' + str( self.id ) + "_console.txt"
 
+    def log_path(self):
+        return self.directory + '/' + str( self.id ) + "_log.txt"
 
-    def run(self):
-        if self.test_mode == "Default":
-            if self.test_path != "":
-                self.logger.info(f"cd {self.test_path}")
-                os.chdir( self.test_path )
-            console2save = self.directory + '/' + str( self.id ) + "_console.txt"
-            log2save = self.directory + '/' + str( self.id ) + "_log.txt"
-            cov2save = self.directory + '/' + str( self.id ) + "_cov"
-
-            # command = self.script + " > " + console2save + " 2>&1 ; " + "lcov --directory /postgresql-11.2 --capture --output-file --rc lcov_branch_coverage=1  " + cov2save + " "
-            command = self.script + " > " + console2save + " 2>&1 ; "
-            self.start_log_record()
-            self.logger.info("---------------------" + command)
-            # print("!!!!!!!!!!!!",os.environ)
-            path_map = os.environ
-            path_map["PATH"] = path_map["PATH"] + ":/home/hadoop/hadoop-3.1.3-work/bin"
-            gc.collect()
-            res = subprocess.Popen( command, shell=True, env=path_map)
-            # res = subprocess.run(command, shell=True)
-            if self.timeout == "default":
-                self.timeout = 0
-            #time.sleep( self.timeout )
-            self.timeout_flag = False
-            my_timer = Timer( self.timeout, self.timeout_callback, [])
-            my_timer.start()
-            while True:
-                time.sleep(0.1)
-                if self.timeout_flag == True:
-                    break
-                elif res.poll() != None:
-                    break
-                else:
-                    pass
-            self.logger.info("script execution finished")
-            self.event_listener.push_observer_event( self.id )
-
-            time.sleep( self.interval )
-
-            self.stop_log_record( log2save )
+    def build_command(self):
+        # command = self.script + " > " + console2save + " 2>&1 ; " + "lcov --directory /postgresql-11.2 --capture --output-file --rc lcov_branch_coverage=1  " + cov2save + " "
+        return self.script + " > " + self.console_path() + " 2>&1 ; "
 
-            with open( console2save, 'r' ) as fp:
-                raw_result = fp.read()
+    def build_env(self):
+        env = dict( os.environ )
+        env["PATH"] = env["PATH"] + ":/home/hadoop/hadoop-3.1.3-work/bin"
+        return env
+
+    def build_cwd(self):
+        return self.test_path if self.test_path != "" else None
 
-            self.result = self.check_oracle( raw_result )
+    def run(self):
+        if self.test_mode == "Default":
+            # the script is awaited on the shared event loop instead of polling it
+            EventLoop.shared().run( self.run_async() )
         else:
             return
 
+    async def run_async(self):
+        await self.execute_async()
+        await self.commit_async()
+
+    async def execute_async(self):
+        """
+        Launch the script and wait (without polling) until it exits or times out.
+        The result is collected later by `commit_async`, so that a runner can
+        commit scripts in order even if they finish out of order.
+        """
+        if self.test_mode != "Default":
+            return
+        command = self.build_command()
+        self.start_log_record()
+        self.logger.info("---------------------" + command)
+        res = await asyncio.create_subprocess_shell( command, env=self.build_env(), cwd=self.build_cwd() )
+        try:
+            await asyncio.wait_for( res.wait(), timeout=self.timeout )
+        except asyncio.TimeoutError:
+            # the script keeps running, the hang observer decides what to do with it
+            pass
+        self.logger.info("script execution finished")
+
+    async def commit_async(self):
+        if self.test_mode != "Default":
+            return
+        self.event_listener.push_observer_event( self.id )
+
+        await asyncio.sleep( self.interval )
+
+        # reading the console and matching the oracle block, keep them off the loop
+        await EventLoop.offload( self.collect_result )
+
+    def collect_result(self):
+        self.stop_log_record( self.log_path() )
+
+        with open( self.console_path(), 'r' ) as fp:
+            raw_result = fp.read()
+
+        self.result = self.check_oracle( raw_result )
+
     def run_offline(self):
 
-        console2save = self.directory + '/' + str( self.id ) + "_console.txt"
+        console2save = self.console_path()
 
         try:
             with open( console2save, 'r' ) as fp:
@@ -135,12 +155,7 @@ class TestCase( object ):
             fp.write( result )
 
     def check_oracle(self, raw_result):
-        if self.check_for_absence and self.oracle not in raw_result:
-            return True
-        elif self.check_for_absence == False and self.oracle in raw_result:
-            return True
-        else:
-            return False
+        return self.compiled_oracle( raw_result )
 
     def bind(self, listener):
         self.event_listener = listener
@@ -1,12 +1,14 @@
 import re
 from typing import Set, List, Tuple
 
-from utils.Logger import Logger, getLogger
+from utils.Logger import Logger, getItemLogger, getLogger
 from utils.Configuration import Configuration
 
 class run_unit_test_utils(object):
     def __init__(self) -> None:
         self.logger = getLogger()
+        # one record per test class summary line of maven, DEBUG and sampled
+        self.itemLogger = getItemLogger('maven')
         # self.use_surefire = False
         # self.display_mode = False
         # self.cmd_timeout = None
@@ -95,7 +97,8 @@ class run_unit_test_utils(object):
                 flag = False
                 if fail_num != 0 or error_num != 0:
                     flag = True
-                self.logger.info(f"<<<<[unit utils] flag is : {flag}, total_run is : {total_run}, fail is : {fail_num}, error is : {error_num}")
+                self.itemLogger.debug("<<<<[unit utils] flag is : %s, total_run is : %s, fail is : %s, error is : %s",
+                                      flag, total_run, fail_num, error_num)
                 return total_run, flag 
             except Exception as e:
                 self.logger.info(f"<<<<[unit utils] exception is : {e}")
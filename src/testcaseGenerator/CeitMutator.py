@@ -3,23 +3,30 @@ from logging import raiseExceptions
 from dataModel.Seed import Seed
 from dataModel.Testcase import Testcase
 from dataModel.ConfItem import ConfItem
-from utils.ceit.OptionsForCEIT import OptionsForCEIT
-from utils.ceit.misconf import MisconfEngine
+from utils.ceit.option_registry import OptionRegistry
+from utils.ceit.misconf_corpus import MisconfCorpus
 from utils.Configuration import Configuration
 from testcaseGenerator.Mutator import Mutator
 
 import random, logging
-from utils.UnitConstant import DATA_DIR
+from utils.UnitConstant import DATA_DIR, FUZZER_DIR
 from utils.ShowStats import ShowStats
-from utils.Logger import getLogger
+from utils.Logger import getItemLogger, getLogger
 
 class CeitMutator(Mutator):
     def __init__(self) -> None:
         super().__init__()
         self.logger = getLogger()
-        self.optionsForCeit = OptionsForCEIT()
-        self.options = self.optionsForCeit.run()
-        self.misconf_engine = MisconfEngine()
+        # one record per mutated value, DEBUG and sampled
+        self.itemLogger = getItemLogger('mutator')
+        # options by name, constraints parsed once and shared with the misconf generators
+        self.optionRegistry = OptionRegistry.from_conf()
+        misconfMode = Configuration.fuzzerConf['misconf_mode']
+        corpusPath = Configuration.fuzzerConf.get('misconf_corpus_path', os.path.join(FUZZER_DIR, "misconf_corpus.db"))
+        workers = Configuration.fuzzerConf.get('misconf_corpus_workers')
+        # all misconfs are generated up front; mutate() only draws from the corpus
+        self.misconfCorpus = MisconfCorpus(corpusPath, misconfMode)
+        self.misconfCorpus.build(self.optionRegistry.values(), int(workers) if workers else None)
 
     def mutate(self, seed: Seed) -> Testcase:
         """
@@ -34,26 +41,21 @@ class CeitMutator(Mutator):
             item.name = conf.name
             item.type = conf.type
             if index == choose_conf_index:
-                option = None
-                self.logger.info(f"<<<<[CEITMutator] for item conf name is : {conf.name}; conf value is : {conf.value}; conf type is : {conf.type}")
+                self.itemLogger.debug("<<<<[CEITMutator] for item conf name is : %s; conf value is : %s; conf type is : %s", conf.name, conf.value, conf.type)
+                option = self.optionRegistry.get(conf.name)
 
-                for confInfo in self.options.values():
-                    if confInfo["key"] == conf.name:
-                        option = confInfo
-                
                 ShowStats.nowTestConfigurationName = conf.name
                 ShowStats.nowMutationType = Configuration.fuzzerConf['misconf_mode'] + ":" + option["constraint"]
-                
-                mutants = self.misconf_engine.mutate( option )
-                misconfIndex = random.randint(0, len(mutants) - 1) 
-                misconf = mutants[misconfIndex] 
-                if "value" in misconf:
+
+                misconf = self.misconfCorpus.draw(option["key"])
+                if misconf is not None and "value" in misconf:
                     err = misconf["value"]
-                    self.logger.info("<<<<[CEITMutator] for option name is : {}; before_value is : {}; after_value is : {}; option constraint is : {}".format(option["key"], option["value"], err, option["constraint"])) 
+                    self.itemLogger.debug("<<<<[CEITMutator] for option name is : %s; before_value is : %s; after_value is : %s; option constraint is : %s", option["key"], option["value"], err, option["constraint"])
                     item.value = err
                 else:
                     self.logger.info("<<<<[CEITMutator] for option name is : {} generates 0 misconf.".format(option["key"])) 
                     item.value = "CeitMutator"
+                item.isMutated = True
             else:
                 item.value = conf.value
             testcase.confItemList.append(item)
@@ -7,6 +7,18 @@ class Mutator(object, metaclass=ABCMeta):
     def __init__(self) -> None:
         pass
 
+    def feedback(self, testcase: Testcase, utResult, sysResult) -> None:
+        """
+        Called with the results of every testcase this mutator generated.
+        Mutators that learn from outcomes override it; the default ignores them.
+
+        Args:
+            testcase (Testcase): the testcase returned by `mutate`.
+            utResult (TestResult): unit test result, may be None.
+            sysResult (TestResult): system test result, may be None.
+        """
+        pass
+
     @abstractmethod
     def mutate(self, seed: Seed) -> Testcase:
         """
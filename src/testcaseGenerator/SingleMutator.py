@@ -15,6 +15,8 @@ class SingleMutator(Mutator):
     def __init__(self) -> None:
         super().__init__()
         self.logger: logging.Logger = Logger.get_logger()
+        # one record per mutated value, DEBUG and sampled
+        self.itemLogger: logging.Logger = Logger.get_item_logger('mutator')
 
     def findConfItem(self, seed: Seed, confName: str):
         """
@@ -31,20 +33,7 @@ class SingleMutator(Mutator):
         Returns:
             A tuple with the index of the configuration item and its value
         """
-        confItemIndex = -1
-        res = ConfItem()
-        for index in range(0, len(seed.confItemList)):
-            conf = seed.confItemList[index]
-            if confName == conf.name:
-                res.name = conf.name
-                res.type = conf.type
-                res.value = conf.value
-                confItemIndex = index
-                break
-        if confItemIndex == -1:
-            return confItemIndex, None
-        else:
-            return confItemIndex, res
+        return seed.findConfItem(confName)
 
     def mutate(self, seed: Seed) -> Testcase:
         testcase = Testcase()
@@ -59,23 +48,21 @@ class SingleMutator(Mutator):
             itemA.name = conf.name
             itemA.type = conf.type
             itemA.value = conf.value
-            self.logger.info(f"<<<<[SingleMutator] for itemA conf name is : {itemA.name}; conf value is : {itemA.value}; conf type is : {itemA.type}")
+            self.itemLogger.debug("<<<<[SingleMutator] for itemA conf name is : %s; conf value is : %s; conf type is : %s", itemA.name, itemA.value, itemA.type)
             if index == choose_conf_index:
                 if conf.name in dependency.keys():
                     for one in dependency[conf.name]:                        
                         confItemIndex, itemB = self.findConfItem(seed, one[0])                        
                         if confItemIndex == -1:
-                            ConfAnalyzer.confMutationInfo[itemA.name][0] += 1
                             itemA.isMutated = True
                             ShowStats.nowTestConfigurationName = conf.name
                             ShowStats.nowMutationType = conf.type
                             itemA.value = newValue.genValue(conf.type, conf.value)
                         else:
-                            ConfAnalyzer.confMutationInfo[itemB.name][0] += 1
                             itemB.isMutated = True
-                            self.logger.info(f"<<<<[SingleMutator] for itemB conf name is : {itemB.name}; conf value is : {itemB.value}; conf type is : {itemB.type}")
+                            self.itemLogger.debug("<<<<[SingleMutator] for itemB conf name is : %s; conf value is : %s; conf type is : %s", itemB.name, itemB.value, itemB.type)
                             newValue.constraint_method(one[1], itemA, itemB)
-                            self.logger.info(f"<<<<[SingleMutator] for new itemB conf name is : {itemB.name}; conf value is : {itemB.value}; conf type is : {itemB.type}")
+                            self.itemLogger.debug("<<<<[SingleMutator] for new itemB conf name is : %s; conf value is : %s; conf type is : %s", itemB.name, itemB.value, itemB.type)
                             itemB_dict[confItemIndex] = itemB 
                 else:
                     ShowStats.nowTestConfigurationName = conf.name
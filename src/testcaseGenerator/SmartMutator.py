@@ -6,6 +6,7 @@ from dataModel.ConfItem import ConfItem
 from testcaseGenerator.Mutator import Mutator
 import random, logging
 from utils.NewValue import NewValue
+from utils.BanditScheduler import BanditScheduler
 from utils.ConfAnalyzer import ConfAnalyzer
 from utils.UnitConstant import DATA_DIR
 from utils.ShowStats import ShowStats
@@ -15,22 +16,13 @@ class SmartMutator(Mutator):
     def __init__(self) -> None:
         super().__init__()
         self.logger: logging.Logger = Logger.get_logger()
+        # one record per mutated value, DEBUG and sampled
+        self.itemLogger: logging.Logger = Logger.get_item_logger('mutator')
+        # picks single vs. stacked mutation and the items to mutate from past outcomes
+        self.scheduler: BanditScheduler = BanditScheduler()
 
     def findConfItem(self, seed: Seed, confName: str):
-        confItemIndex = -1
-        res = ConfItem()
-        for index in range(0, len(seed.confItemList)):
-            conf = seed.confItemList[index]
-            if confName == conf.name:
-                res.name = conf.name
-                res.value = conf.value
-                res.type = conf.type
-                confItemIndex = index
-                break
-        if confItemIndex == -1:
-            return confItemIndex, None
-        else:
-            return confItemIndex, res
+        return seed.findConfItem(confName)
 
     def mutate(self, seed: Seed) -> Testcase:
         """
@@ -45,28 +37,32 @@ class SmartMutator(Mutator):
 
         # number = [i for i in range(3, 6)]
         # mutate_num = number[random.randint(0, len(number) - 1)]
-        mutate_num = 0
-        if ShowStats.stackMutationFlag == 1:
+        operator = self.scheduler.selectOperator()
+        testcase.mutationOperator = operator
+        if operator == BanditScheduler.STACKED:
+            ShowStats.stackMutationFlag = 1
+            ShowStats.mutationStrategy = "SmartMutator/StackedMutator"
             mutate_num = seed.confItemList.__len__()
-        elif ShowStats.stackMutationFlag == 0:
-            mutate_num = 1
         else:
-            pass
-        
+            ShowStats.stackMutationFlag = 0
+            ShowStats.mutationStrategy = "SmartMutator/SingleMutator"
+            mutate_num = 1
+        names = [conf.name for conf in seed.confItemList]
+
         item_dict = {}
         dependency = ConfAnalyzer.confItemRelations
         newValue = NewValue()
         # index_list = random.sample(range(0, len(seed.confItemList)), mutate_num)
 
-        for times in range(0, mutate_num):
-            # [Patch 2] 这里的 randint 范围依赖于 seed.confItemList 的实时长度，已自适应 RAG
-            choose_conf_index = random.randint(0, len(seed.confItemList) - 1)
+        # [Patch 2] 选择范围依赖于 seed.confItemList 的实时长度，已自适应 RAG
+        # one posterior sample per item for the whole testcase, not one round of samples per mutation
+        for choose_conf_index in self.scheduler.selectParameters(names, mutate_num):
             conf = seed.confItemList[choose_conf_index]
             itemA = ConfItem()
             itemA.name = conf.name
             itemA.type = conf.type
             itemA.value = conf.value
-            self.logger.info(f"<<<<[StackedMutator] for itemA conf name is : {itemA.name}; conf value is : {itemA.value}; conf type is : {itemA.type}")
+            self.itemLogger.debug("<<<<[StackedMutator] for itemA conf name is : %s; conf value is : %s; conf type is : %s", itemA.name, itemA.value, itemA.type)
             
             if conf.name in dependency.keys():
                 for one in dependency[conf.name]:
@@ -76,9 +72,9 @@ class SmartMutator(Mutator):
                         ShowStats.nowMutationType = conf.type
                         itemA.value = newValue.genValue(conf.type, conf.value)
                     else:
-                        self.logger.info(f"<<<<[StackedMutator] for itemB conf name is : {itemB.name}; conf value is : {itemB.value}; conf type is : {itemB.type}")
+                        self.itemLogger.debug("<<<<[StackedMutator] for itemB conf name is : %s; conf value is : %s; conf type is : %s", itemB.name, itemB.value, itemB.type)
                         newValue.constraint_method(one[1], itemA, itemB)
-                        self.logger.info(f"<<<<[StackedMutator] for new itemB conf name is : {itemB.name}; conf value is : {itemB.value}; conf type is : {itemB.type}")
+                        self.itemLogger.debug("<<<<[StackedMutator] for new itemB conf name is : %s; conf value is : %s; conf type is : %s", itemB.name, itemB.value, itemB.type)
                         itemB.isMutated = True
                         item_dict[confItemIndex] = itemB
             else:
@@ -91,23 +87,20 @@ class SmartMutator(Mutator):
             
             itemA.isMutated = True
             item_dict[choose_conf_index] = itemA
-            self.logger.info(f"<<<<[StackedMutator] for new itemA conf name is : {itemA.name}; conf value is : {itemA.value}; conf type is : {itemA.type}")
+            self.itemLogger.debug("<<<<[StackedMutator] for new itemA conf name is : %s; conf value is : %s; conf type is : %s", itemA.name, itemA.value, itemA.type)
 
-        # 构建最终测试用例并更新统计
+        # 构建最终测试用例 (mutation counts are updated by TestcaseGenerator for the testcase it keeps)
         for index in range(0, len(seed.confItemList)):
             if index in item_dict.keys():
-                # [Patch 3] 修复 IndexError 崩溃：更新统计前先检查 key 是否存在
-                try:
-                    conf_name = item_dict[index].name
-                    if conf_name in ConfAnalyzer.confMutationInfo:
-                        ConfAnalyzer.confMutationInfo[conf_name][0] += 1
-                except Exception as e:
-                    # 捕获所有统计更新异常，保证 Fuzzing 主流程不中断
-                    # self.logger.warning(f"[SmartMutator] Stats update skipped for {item_dict[index].name}: {e}")
-                    pass
-                
                 testcase.confItemList.append(item_dict[index])
+                testcase.mutatedConfNames.append(item_dict[index].name)
             else:
                 testcase.confItemList.append(seed.confItemList[index])
         
         return testcase
+
+    def feedback(self, testcase: Testcase, utResult, sysResult) -> None:
+        names = testcase.mutatedConfNames
+        reward = self.scheduler.update(testcase.mutationOperator, names, utResult, sysResult)
+        if reward > 0:
+            self.logger.info(f">>>>[SmartMutator] reward {reward} for {testcase.mutationOperator} mutation of {names}")
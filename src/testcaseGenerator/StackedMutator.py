@@ -15,22 +15,11 @@ class StackedMutator(Mutator):
     def __init__(self) -> None:
         super().__init__()
         self.logger: logging.Logger = Logger.get_logger()
+        # one record per mutated value, DEBUG and sampled
+        self.itemLogger: logging.Logger = Logger.get_item_logger('mutator')
 
     def findConfItem(self, seed: Seed, confName: str):
-        confItemIndex = -1
-        res = ConfItem()
-        for index in range(0, len(seed.confItemList)):
-            conf = seed.confItemList[index]
-            if confName == conf.name:
-                res.name = conf.name
-                res.value = conf.value
-                res.type = conf.type
-                confItemIndex = index
-                break
-        if confItemIndex == -1:
-            return confItemIndex, None
-        else:
-            return confItemIndex, res
+        return seed.findConfItem(confName)
 
     def mutate(self, seed: Seed) -> Testcase:
         """
@@ -52,20 +41,18 @@ class StackedMutator(Mutator):
             itemA.name = conf.name
             itemA.type = conf.type
             itemA.value = conf.value
-            self.logger.info(f"<<<<[StackedMutator] for itemA conf name is : {itemA.name}; conf value is : {itemA.value}; conf type is : {itemA.type}")
+            self.itemLogger.debug("<<<<[StackedMutator] for itemA conf name is : %s; conf value is : %s; conf type is : %s", itemA.name, itemA.value, itemA.type)
             if conf.name in dependency.keys():
                 for one in dependency[conf.name]:
                     confItemIndex, itemB = self.findConfItem(seed, one[0])
                     if confItemIndex == -1:
-                        ConfAnalyzer.confMutationInfo[itemA.name][0] += 1
                         ShowStats.nowTestConfigurationName = conf.name
                         ShowStats.nowMutationType = conf.type
                         itemA.value = newValue.genValue(conf.type, conf.value)
                     else:
-                        ConfAnalyzer.confMutationInfo[itemB.name][0] += 1
-                        self.logger.info(f"<<<<[StackedMutator] for itemB conf name is : {itemB.name}; conf value is : {itemB.value}; conf type is : {itemB.type}")
+                        self.itemLogger.debug("<<<<[StackedMutator] for itemB conf name is : %s; conf value is : %s; conf type is : %s", itemB.name, itemB.value, itemB.type)
                         newValue.constraint_method(one[1], itemA, itemB)
-                        self.logger.info(f"<<<<[StackedMutator] for new itemB conf name is : {itemB.name}; conf value is : {itemB.value}; conf type is : {itemB.type}")
+                        self.itemLogger.debug("<<<<[StackedMutator] for new itemB conf name is : %s; conf value is : %s; conf type is : %s", itemB.name, itemB.value, itemB.type)
                         itemB.isMutated = True
                         item_dict[confItemIndex] = itemB
             else:
@@ -77,11 +64,10 @@ class StackedMutator(Mutator):
                 #     co.value = str(new_value)
             itemA.isMutated = True
             item_dict[choose_conf_index] = itemA
-            self.logger.info(f"<<<<[StackedMutator] for new itemA conf name is : {itemA.name}; conf value is : {itemA.value}; conf type is : {itemA.type}")
+            self.itemLogger.debug("<<<<[StackedMutator] for new itemA conf name is : %s; conf value is : %s; conf type is : %s", itemA.name, itemA.value, itemA.type)
         for index in range(0, len(seed.confItemList)):
             if index in item_dict.keys():
                 testcase.confItemList.append(item_dict[index])
-                ConfAnalyzer.confMutationInfo[item_dict[index].name][0] += 1
             else:
                 testcase.confItemList.append(seed.confItemList[index])
         return testcase
\ No newline at end of file
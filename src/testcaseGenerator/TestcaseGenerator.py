@@ -1,7 +1,9 @@
 from dataModel.Seed import Seed
 from dataModel.Testcase import Testcase
 from testcaseGenerator.StackedMutator import Mutator
-from utils.ShowStats import ShowStats
+from utils.BloomFilter import ScalableBloomFilter
+from utils.FuzzContext import FuzzContext
+from utils.Logger import getLogger
 from dataModel.ConfItem import ConfItem
 
 
@@ -11,8 +13,16 @@ class TestcaseGenerator(object):
     A Testcase Generator may have different implements via different combination of mutators and constraintMaps.
     """
 
-    def __init__(self, mutator: Mutator) -> None:
+    def __init__(self, mutator: Mutator, dedupRetry: int = 5, context: FuzzContext = None) -> None:
         self.mutator = mutator
+        self.logger = getLogger()
+        context = context or FuzzContext.default()
+        self.stats = context.stats
+        self.analyzer = context.analyzer
+        # fingerprints of all testcases handed out so far
+        self.executedFilter = ScalableBloomFilter()
+        # how many times a duplicate testcase is regenerated before it is run anyway
+        self.dedupRetry = dedupRetry
         # self.seed_all = Seed()
 
     def mutate(self, seed: Seed) -> Testcase:
@@ -20,18 +30,47 @@ class TestcaseGenerator(object):
         Perform some mutation on the configuration items of a seed, so as to generate a testcase.
         Based on the constraint map it contains.
 
+        A testcase whose (name, value) set was already generated is mutated again, up to
+        `dedupRetry` times, so the same configuration is not tested twice. Only the
+        returned testcase counts in the mutation numbers of `confMutationInfo`.
+
         Args:
             seed (Seed): a seed needed to be mutated.
 
         Returns:
             testcase (Testcase): a new testcase.
         """
-        ShowStats.currentJob = 'mutating'
+        self.stats.currentJob = 'mutating'
         conf1 = ConfItem('fs.defaultFS','PORT','hdfs://127.0.0.1:9000')
         conf2 = ConfItem('hbase.rootdir','DIRPATH','/home/hadoop/hbase-2.2.2-work/hbase-tmp')
         if seed.__contains__(conf1):
             seed.confItemList.remove(conf1)
         if seed.__contains__(conf2):
             seed.confItemList.remove(conf2) 
-            
-        return self.mutator.mutate(seed)
+
+        for _ in range(self.dedupRetry + 1):
+            testcase = self.mutator.mutate(seed)
+            self.stats.generatedTestcases += 1
+            if self.executedFilter.add(testcase.fingerprint().encode()):
+                self.countMutations(seed, testcase)
+                return testcase
+            self.stats.duplicateTestcases += 1
+        self.logger.info(">>>>[TestcaseGenerator] retry budget exhausted, running a duplicate testcase")
+        self.countMutations(seed, testcase)
+        return testcase
+
+    def countMutations(self, seed: Seed, testcase: Testcase) -> None:
+        """
+        Count one mutation for each item mutated into `testcase`. Items taken over
+        from the seed are skipped: a pooled seed keeps the flags of its own mutation.
+        """
+        seedItems = {id(confItem) for confItem in seed.confItemList}
+        for confItem in testcase.confItemList:
+            if confItem.isMutated and id(confItem) not in seedItems and confItem.name in self.analyzer.confMutationInfo:
+                self.analyzer.confMutationInfo[confItem.name][0] += 1
+
+    def feedback(self, testcase: Testcase, utResult, sysResult) -> None:
+        """
+        Pass the results of a testcase back to the mutator that generated it.
+        """
+        self.mutator.feedback(testcase, utResult, sysResult)
@@ -0,0 +1,140 @@
+import heapq
+import random
+from typing import Dict, Hashable, List, Sequence, Tuple
+
+
+class ThompsonSampler(object):
+    """
+    Thompson sampling over Bernoulli arms with Beta(alpha, beta) posteriors.
+
+    Arms are created lazily with the prior Beta(priorAlpha, priorBeta). A reward
+    in [0, 1] is a fractional success, so an update is O(1). With `discount` < 1
+    old observations fade, letting the sampler follow a campaign whose
+    productive arms change over time.
+    """
+
+    def __init__(self, priorAlpha: float = 1.0, priorBeta: float = 1.0, discount: float = 1.0) -> None:
+        self.priorAlpha: float = priorAlpha
+        self.priorBeta: float = priorBeta
+        self.discount: float = discount
+        # arm -> [alpha, beta, pulls]
+        self.posteriors: Dict[Hashable, List[float]] = {}
+
+    def __len__(self) -> int:
+        return len(self.posteriors)
+
+    def posterior(self, arm: Hashable) -> List[float]:
+        posterior = self.posteriors.get(arm)
+        if posterior is None:
+            posterior = [self.priorAlpha, self.priorBeta, 0]
+            self.posteriors[arm] = posterior
+        return posterior
+
+    def sample(self, arm: Hashable) -> float:
+        posterior = self.posteriors.get(arm)
+        if posterior is None:
+            return random.betavariate(self.priorAlpha, self.priorBeta)
+        return random.betavariate(posterior[0], posterior[1])
+
+    def select(self, arms: Sequence[Hashable]) -> int:
+        """
+        Return the index in `arms` of the arm with the highest posterior sample.
+        """
+        best, bestSample = 0, -1.0
+        for i, arm in enumerate(arms):
+            sample = self.sample(arm)
+            if sample > bestSample:
+                best, bestSample = i, sample
+        return best
+
+    def ranking(self, arms: Sequence[Hashable], count: int) -> List[int]:
+        """
+        Return the indices in `arms` of the `count` arms with the highest posterior
+        samples, best first. Each arm is sampled once.
+        """
+        samples = [self.sample(arm) for arm in arms]
+        return heapq.nlargest(count, range(len(arms)), key=samples.__getitem__)
+
+    def update(self, arm: Hashable, reward: float) -> None:
+        reward = min(1.0, max(0.0, reward))
+        posterior = self.posterior(arm)
+        if self.discount < 1.0:
+            posterior[0] = self.priorAlpha + (posterior[0] - self.priorAlpha) * self.discount
+            posterior[1] = self.priorBeta + (posterior[1] - self.priorBeta) * self.discount
+        posterior[0] += reward
+        posterior[1] += 1.0 - reward
+        posterior[2] += 1
+
+    def mean(self, arm: Hashable) -> float:
+        alpha, beta, _ = self.posteriors.get(arm, (self.priorAlpha, self.priorBeta, 0))
+        return alpha / (alpha + beta)
+
+    def best(self, count: int = 10) -> List[Tuple[Hashable, float]]:
+        """
+        The `count` arms with the highest posterior mean, for logging.
+        """
+        return sorted(((arm, self.mean(arm)) for arm in self.posteriors), key=lambda x: -x[1])[:count]
+
+
+class BanditScheduler(object):
+    """
+    Decide which configuration items a mutator mutates and which mutation operator it uses.
+
+    Both decisions are Thompson samplers; the reward of a testcase is computed from
+    its test results by `reward` and credited to its operator and to every
+    configuration item it mutated. The scheduler is pickled with the campaign
+    checkpoint, so posteriors survive a restart.
+    """
+
+    SINGLE: str = "single"
+    STACKED: str = "stacked"
+
+    # rewards in [0, 1]; type-1 system failures are usually caused by invalid values alone
+    newExceptionReward: float = 1.0
+    sysFailTypeRewards: Dict[int, float] = {1: 0.1, 2: 1.0, 3: 1.0, 4: 0.3}
+    unitFailureReward: float = 0.3
+    # unit test failures needed for the full unit failure reward
+    unitFailureScale: int = 5
+
+    def __init__(self, operators: Sequence[str] = (SINGLE, STACKED), discount: float = 0.999) -> None:
+        self.operators: List[str] = list(operators)
+        self.operatorBandit: ThompsonSampler = ThompsonSampler(discount=discount)
+        self.parameterBandit: ThompsonSampler = ThompsonSampler(discount=discount)
+
+    def selectOperator(self) -> str:
+        return self.operators[self.operatorBandit.select(self.operators)]
+
+    def selectParameter(self, names: Sequence[str]) -> int:
+        """
+        Return the index in `names` of the configuration item to mutate.
+        """
+        return self.parameterBandit.select(names)
+
+    def selectParameters(self, names: Sequence[str], count: int) -> List[int]:
+        """
+        Return the indices in `names` of the `count` configuration items to mutate.
+        """
+        return self.parameterBandit.ranking(names, count)
+
+    @staticmethod
+    def reward(utResult, sysResult) -> float:
+        reward = 0.0
+        if utResult is not None and utResult.status == 1:
+            failures = max(1, utResult.failed_tests_count)
+            reward = BanditScheduler.unitFailureReward * min(1.0, failures / BanditScheduler.unitFailureScale)
+        if sysResult is not None and sysResult.status != 0:
+            reward = max(reward, BanditScheduler.sysFailTypeRewards.get(sysResult.sysFailType, 0.0))
+            if sysResult.newException:
+                reward = BanditScheduler.newExceptionReward
+        return reward
+
+    def update(self, operator: str, names: Sequence[str], utResult, sysResult) -> float:
+        """
+        Credit the outcome of one testcase. Returns the reward.
+        """
+        reward = BanditScheduler.reward(utResult, sysResult)
+        if operator:
+            self.operatorBandit.update(operator, reward)
+        for name in names:
+            self.parameterBandit.update(name, reward)
+        return reward
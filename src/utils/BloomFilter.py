@@ -0,0 +1,81 @@
+import hashlib
+import math
+from typing import List
+
+
+class BloomFilter(object):
+    """
+    A fixed-size Bloom filter for `capacity` items at false positive rate `errorRate`.
+    The k bit positions of an item come from double hashing a single blake2b digest.
+    """
+
+    def __init__(self, capacity: int, errorRate: float) -> None:
+        self.capacity: int = capacity
+        self.errorRate: float = errorRate
+        self.bitCount: int = max(8, int(math.ceil(-capacity * math.log(errorRate) / (math.log(2) ** 2))))
+        self.hashCount: int = max(1, int(round(self.bitCount / capacity * math.log(2))))
+        self.bits: bytearray = bytearray((self.bitCount + 7) // 8)
+        self.count: int = 0
+
+    def positions(self, item: bytes) -> List[int]:
+        digest = hashlib.blake2b(item, digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.bitCount for i in range(self.hashCount)]
+
+    def __contains__(self, item: bytes) -> bool:
+        return all(self.bits[p >> 3] & (1 << (p & 7)) for p in self.positions(item))
+
+    def add(self, item: bytes) -> bool:
+        """
+        Add an item. Returns False if it was (probably) already present.
+        """
+        isNew = False
+        for p in self.positions(item):
+            mask = 1 << (p & 7)
+            if not self.bits[p >> 3] & mask:
+                self.bits[p >> 3] |= mask
+                isNew = True
+        if isNew:
+            self.count += 1
+        return isNew
+
+    def isFull(self) -> bool:
+        return self.count >= self.capacity
+
+
+class ScalableBloomFilter(object):
+    """
+    A Bloom filter that grows without bound while keeping its overall false positive rate.
+
+    When the current filter is full a new one, `growth` times larger and with an
+    error rate tightened by `tightening`, is appended; the sum of all error rates
+    stays below `errorRate`.
+    """
+
+    def __init__(self, initialCapacity: int = 10000, errorRate: float = 0.001, growth: int = 2,
+                 tightening: float = 0.5) -> None:
+        self.initialCapacity: int = initialCapacity
+        self.errorRate: float = errorRate
+        self.growth: int = growth
+        self.tightening: float = tightening
+        self.filters: List[BloomFilter] = [BloomFilter(initialCapacity, errorRate * (1 - tightening))]
+
+    def __contains__(self, item: bytes) -> bool:
+        return any(item in f for f in reversed(self.filters))
+
+    def __len__(self) -> int:
+        return sum(f.count for f in self.filters)
+
+    def add(self, item: bytes) -> bool:
+        """
+        Add an item. Returns False if it was (probably) already present.
+        """
+        if item in self:
+            return False
+        last = self.filters[-1]
+        if last.isFull():
+            last = BloomFilter(last.capacity * self.growth, last.errorRate * self.tightening)
+            self.filters.append(last)
+        last.add(item)
+        return True
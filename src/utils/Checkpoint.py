@@ -0,0 +1,120 @@
+import os
+import pickle
+import threading
+import time
+import zlib
+from typing import Any, Callable, Dict, Optional
+
+from utils.Logger import getLogger
+
+
+class Checkpoint(object):
+    """
+    Periodic, atomic snapshots of the fuzzing campaign.
+
+    The fuzzing loop captures its state with `pickle` (cheap, and consistent
+    because it happens between iterations); compressing and writing the snapshot
+    is left to a background thread, so the loop never waits on the disk. A
+    snapshot is written to a temporary file and moved over the previous one with
+    `os.replace`, so a crash while writing never leaves a broken checkpoint.
+    """
+
+    version: int = 1
+
+    def __init__(self, path: str, interval: float = 600.0) -> None:
+        self.logger = getLogger()
+        self.path: str = path
+        self.interval: float = interval
+        self.lastSaveTime: float = time.time()
+        # only the latest pending snapshot matters, older ones are dropped
+        self.pending: Optional[tuple] = None
+        self.condition = threading.Condition()
+        # snapshots are numbered so an older one never overwrites a newer one
+        self.sequence: int = 0
+        self.writtenSequence: int = 0
+        self.writeLock = threading.Lock()
+        self.stopped: bool = False
+        self.savedCount: int = 0
+        self.writer = threading.Thread(target=self.writeLoop, name="checkpoint-writer", daemon=True)
+        self.writer.start()
+
+    def maybeSave(self, capture: Callable[[], Dict[str, Any]]) -> bool:
+        """
+        Capture and queue a snapshot if `interval` seconds passed since the last one.
+        """
+        if self.interval <= 0 or time.time() - self.lastSaveTime < self.interval:
+            return False
+        self.submit(capture())
+        return True
+
+    def submit(self, state: Dict[str, Any]) -> None:
+        """
+        Serialize `state` now and hand it to the writer thread.
+        """
+        state['checkpointVersion'] = Checkpoint.version
+        blob = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+        self.lastSaveTime = time.time()
+        with self.condition:
+            self.sequence += 1
+            self.pending = (self.sequence, blob)
+            self.condition.notify()
+
+    def saveNow(self, state: Dict[str, Any]) -> None:
+        """
+        Write `state` synchronously, e.g. right before the fuzzer exits.
+        """
+        state['checkpointVersion'] = Checkpoint.version
+        blob = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+        with self.condition:
+            self.sequence += 1
+            sequence = self.sequence
+            self.pending = None
+        self.write(sequence, blob)
+
+    def writeLoop(self) -> None:
+        while True:
+            with self.condition:
+                while self.pending is None and not self.stopped:
+                    self.condition.wait()
+                if self.pending is None and self.stopped:
+                    return
+                (sequence, blob), self.pending = self.pending, None
+            try:
+                self.write(sequence, blob)
+            except OSError as e:
+                self.logger.error(f">>>>[Checkpoint] failed to write {self.path}: {e}")
+
+    def write(self, sequence: int, blob: bytes) -> None:
+        data = zlib.compress(blob, 6)
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        with self.writeLock:
+            if sequence < self.writtenSequence:
+                return
+            tmpPath = self.path + ".tmp"
+            with open(tmpPath, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmpPath, self.path)
+            self.writtenSequence = sequence
+            self.savedCount += 1
+        self.logger.info(f">>>>[Checkpoint] saved {len(data)} bytes to {self.path}")
+
+    def close(self) -> None:
+        """
+        Stop the writer thread after it has written the pending snapshot.
+        """
+        with self.condition:
+            self.stopped = True
+            self.condition.notify()
+        self.writer.join()
+
+    @staticmethod
+    def load(path: str) -> Dict[str, Any]:
+        with open(path, 'rb') as f:
+            state = pickle.loads(zlib.decompress(f.read()))
+        if state.get('checkpointVersion') != Checkpoint.version:
+            raise ValueError(f"unsupported checkpoint version in {path}: {state.get('checkpointVersion')}")
+        return state
@@ -1,6 +1,7 @@
-from typing import Dict, List
+from typing import Dict, List, Set
 from utils.ClassifyConfItems import ClassifyConfItems
 from utils.Constraint import Constraint
+from utils.ConstraintGraph import ConstraintGraph
 from utils.ConfParser import ConfParser
 from utils.Configuration import Configuration
 from utils.Logger import getLogger
@@ -18,11 +19,22 @@ class ConfAnalyzer(object):
 
     #{confa:[[confb,contorl],[confc, dependency]],confa:[[confb,contorl],[confc, dependency]]}
     confItemRelations: Dict[str, List[List[str]]] = {}
+    constraintGraph: ConstraintGraph = ConstraintGraph()
     confUnitMap: Dict[str, List[str]] = {}
     
-    excludeConf:List[str] = [] # the exclude conf
+    excludeConf:Set[str] = set() # the exclude conf
+    excludeVersion:int = 0 # bumped on every change of excludeConf
     confMutationInfo:Dict[str, List[int]] = {} # list[int](mutationNumber, firstBugNumber) 
 
+    @staticmethod
+    def excludeConfItem(confName: str) -> None:
+        """
+        Stop mutating `confName`; SeedGenerator picks the change up on its next update.
+        """
+        if confName not in ConfAnalyzer.excludeConf:
+            ConfAnalyzer.excludeConf.add(confName)
+            ConfAnalyzer.excludeVersion += 1
+
     @staticmethod
     def analyzeConfItems() -> None:
         with open(Configuration.putConf['unit_test_mapping_path']) as map_file:
@@ -37,7 +49,8 @@ class ConfAnalyzer(object):
         for confName in ConfAnalyzer.confItemValueMap:
             ConfAnalyzer.confItemsMutable.append(confName)
         # relations contains all configuration params
-        ConfAnalyzer.confItemRelations = Constraint().getConstraintMap()
+        ConfAnalyzer.constraintGraph = Constraint().getConstraintGraph()
+        ConfAnalyzer.confItemRelations = ConfAnalyzer.constraintGraph.relationMap
         # init the confMutationInfo
         for confName in ConfAnalyzer.confItemValueMap:
             if confName not in ConfAnalyzer.confMutationInfo:
@@ -4,7 +4,7 @@ from typing import Dict
 
 from utils.IdentifyType import IdentifyType
 from utils.Configuration import Configuration
-from utils.Logger import getLogger
+from utils.Logger import getItemLogger, getLogger
 
 class ConfParser(object):
     """parse the conf based the specified project
@@ -18,6 +18,8 @@ class ConfParser(object):
         self.path: str = Configuration.putConf['conf_path']
         self.deprecate_conf : dict = self.load_deprecate_config_map()
         self.logger = getLogger()
+        # one record per deprecated item, DEBUG and sampled
+        self.itemLogger = getItemLogger('confparser')
 
     def load_deprecate_config_map(self) -> Dict:
         """ 
@@ -86,8 +88,8 @@ class ConfParser(object):
                     cur_value = prop.text
             if cur_key not in conf_map:
                 if cur_key in deprecate_conf:
-                    self.logger.info(">>>>[ConfParser] {} in your input conf file is deprecated in the project,".format(cur_key)
-                          + " replaced with {}".format(deprecate_conf[cur_key]))
+                    self.itemLogger.debug(">>>>[ConfParser] %s in your input conf file is deprecated in the project,"
+                                          " replaced with %s", cur_key, deprecate_conf[cur_key])
                     cur_key = deprecate_conf[cur_key]
                 conf_map[cur_key] = cur_value
         return conf_map
@@ -112,9 +114,8 @@ class ConfParser(object):
                     cur_key, cur_value = [x.strip() for x in seg]
                     if cur_key not in conf_map:
                         if cur_key in deprecate_conf:
-                            self.logger.info(
-                                ">>>>[ConfParser] {} in your input conf file is deprecated in the project,".format(cur_key)
-                                + " replaced with {}".format(deprecate_conf[cur_key]))
+                            self.itemLogger.debug(">>>>[ConfParser] %s in your input conf file is deprecated in the "
+                                                  "project, replaced with %s", cur_key, deprecate_conf[cur_key])
                             cur_key = deprecate_conf[cur_key]
                         conf_map[cur_key] = cur_value
         return conf_map
@@ -1,5 +1,4 @@
-import csv
-from utils.UnitConstant import DATA_DIR
+from utils.ConstraintGraph import ConstraintGraph
 from utils.Configuration import Configuration
 
 class Constraint(object):
@@ -10,35 +9,9 @@ class Constraint(object):
         self.project: str = Configuration.fuzzerConf['project']
         self.constraintPath: str = Configuration.putConf['constraint_path']
 
-    def getConstraintMap(self) -> dict:
-        dependency = dict()
-        
-        # baseConf = ConfAnalyzer.confItemsBasic
-        # constraint_type_set = set()
-        with open(self.constraintPath, mode = "r", encoding = "utf-8-sig") as f:
-            reader = csv.reader(f)
-            header = next(reader)
-            for row in reader:
-                tmp1 = []
-                #Configuration Parameter B
-                tmp1.append(row[2])
-                #Dependency Taxonomy
-                tmp1.append(row[0])
-                if row[1] in dependency.keys():
-                    dependency[row[1]].append(tmp1)
-                else:
-                    dependency[row[1]] = []
-                    dependency[row[1]].append(tmp1)
-                    
-                tmp2 = []
-                #Configuration Parameter A
-                tmp2.append(row[1])
-                #Dependency Taxonomy
-                tmp2.append(row[0])
-                if row[2] in dependency.keys():
-                    dependency[row[2]].append(tmp2)
-                else:
-                    dependency[row[2]] = []
-                    dependency[row[2]].append(tmp2)
+    def getConstraintGraph(self) -> ConstraintGraph:
+        return ConstraintGraph.load(self.constraintPath)
 
-        return dependency
\ No newline at end of file
+    def getConstraintMap(self) -> dict:
+        # {confA: [[confB, DependencyType], ...]}, one entry per direction of every row
+        return self.getConstraintGraph().relationMap
@@ -0,0 +1,186 @@
+import csv
+import hashlib
+import os
+import pickle
+from collections import deque
+from enum import Enum
+from typing import Dict, FrozenSet, List, Tuple
+
+from utils.Logger import getLogger
+from utils.UnitConstant import FUZZER_DIR
+
+
+class DependencyType(str, Enum):
+    """
+    The dependency taxonomy of `intra.csv`. Members compare equal to the CSV strings.
+    """
+    CONTROL = "Control Dependency"
+    VALUE_RELATIONSHIP = "Value Relationship Dependency"
+    DEFAULT_VALUE = "Default Value Dependency"
+    BEHAVIOR = "Behavior Dependency"
+    OVERWRITE = "Overwrite"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+class ConstraintGraph(object):
+    """
+    The configuration constraints compiled into an adjacency structure.
+
+    Parameters get integer ids in order of first appearance. `edges[i]` holds the
+    typed relations of parameter i in both directions (the layout of the legacy
+    relation map), `closures[i]` the parameters reachable from i along the
+    A -> B direction of the CSV, and `components[i]` the connected component of i.
+    Everything is computed once, so the queries are lookups.
+    """
+
+    version: int = 1
+
+    def __init__(self) -> None:
+        self.names: List[str] = []
+        self.idOf: Dict[str, int] = {}
+        self.edges: List[List[Tuple[int, DependencyType]]] = []
+        self.successors: List[List[int]] = []
+        self.closures: List[FrozenSet[int]] = []
+        self.components: List[int] = []
+        self.componentMembers: List[Tuple[str, ...]] = []
+        # {name: [[relatedName, DependencyType], ...]}, the format of ConfAnalyzer.confItemRelations
+        self.relationMap: Dict[str, List[list]] = {}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.idOf
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def paramId(self, name: str) -> int:
+        paramId = self.idOf.get(name)
+        if paramId is None:
+            paramId = len(self.names)
+            self.idOf[name] = paramId
+            self.names.append(name)
+            self.edges.append([])
+            self.successors.append([])
+        return paramId
+
+    def addConstraint(self, dependencyType: DependencyType, paramA: str, paramB: str) -> None:
+        a, b = self.paramId(paramA), self.paramId(paramB)
+        self.edges[a].append((b, dependencyType))
+        self.edges[b].append((a, dependencyType))
+        self.successors[a].append(b)
+
+    def compile(self) -> 'ConstraintGraph':
+        """
+        Precompute closures, connected components and the legacy relation map.
+        """
+        self.closures = [self.reach(i) for i in range(len(self.names))]
+
+        self.components = [-1] * len(self.names)
+        self.componentMembers = []
+        for start in range(len(self.names)):
+            if self.components[start] != -1:
+                continue
+            component = len(self.componentMembers)
+            members = []
+            queue = deque([start])
+            self.components[start] = component
+            while queue:
+                node = queue.popleft()
+                members.append(self.names[node])
+                for neighbor, _ in self.edges[node]:
+                    if self.components[neighbor] == -1:
+                        self.components[neighbor] = component
+                        queue.append(neighbor)
+            self.componentMembers.append(tuple(members))
+
+        self.relationMap = {self.names[i]: [[self.names[j], dependencyType] for j, dependencyType in edges]
+                            for i, edges in enumerate(self.edges)}
+        return self
+
+    def reach(self, start: int) -> FrozenSet[int]:
+        seen = set()
+        stack = list(self.successors[start])
+        while stack:
+            node = stack.pop()
+            if node not in seen:
+                seen.add(node)
+                stack.extend(self.successors[node])
+        seen.discard(start)
+        return frozenset(seen)
+
+    def relations(self, name: str) -> List[list]:
+        """
+        The [relatedName, DependencyType] pairs of `name`.
+        """
+        return self.relationMap.get(name, [])
+
+    def neighbors(self, name: str) -> List[str]:
+        return [relation[0] for relation in self.relations(name)]
+
+    def reachable(self, name: str) -> FrozenSet[str]:
+        """
+        The parameters `name` transitively constrains.
+        """
+        paramId = self.idOf.get(name)
+        if paramId is None:
+            return frozenset()
+        return frozenset(self.names[i] for i in self.closures[paramId])
+
+    def component(self, name: str) -> Tuple[str, ...]:
+        """
+        All parameters connected to `name` by some chain of constraints, `name` included.
+        """
+        paramId = self.idOf.get(name)
+        if paramId is None:
+            return ()
+        return self.componentMembers[self.components[paramId]]
+
+    def related(self, nameA: str, nameB: str) -> bool:
+        a, b = self.idOf.get(nameA), self.idOf.get(nameB)
+        return a is not None and b is not None and self.components[a] == self.components[b]
+
+    @staticmethod
+    def fromCsv(constraintPath: str) -> 'ConstraintGraph':
+        graph = ConstraintGraph()
+        with open(constraintPath, mode="r", encoding="utf-8-sig") as f:
+            reader = csv.reader(f)
+            next(reader)
+            for row in reader:
+                # Dependency Taxonomy, Configuration Parameter A, Configuration Parameter B, ...
+                try:
+                    dependencyType = DependencyType(row[0])
+                except ValueError:
+                    getLogger().warning(f">>>>[ConstraintGraph] skipping {row[1]} -> {row[2]} in {constraintPath}: "
+                                        f"unknown dependency type {row[0]!r}")
+                    continue
+                graph.addConstraint(dependencyType, row[1], row[2])
+        return graph.compile()
+
+    @staticmethod
+    def load(constraintPath: str, cacheDir: str = FUZZER_DIR) -> 'ConstraintGraph':
+        """
+        Compile `constraintPath`, or load the compiled graph cached for the same CSV content.
+        """
+        with open(constraintPath, 'rb') as f:
+            digest = hashlib.sha1(f.read()).hexdigest()
+        cachePath = os.path.join(cacheDir, f"constraint_graph_{digest[:16]}.pkl")
+        try:
+            with open(cachePath, 'rb') as f:
+                version, graph = pickle.load(f)
+            if version == ConstraintGraph.version:
+                return graph
+        except (OSError, EOFError, ValueError, AttributeError, pickle.UnpicklingError):
+            pass
+
+        graph = ConstraintGraph.fromCsv(constraintPath)
+        try:
+            if not os.path.exists(cacheDir):
+                os.makedirs(cacheDir)
+            tmpPath = cachePath + ".tmp"
+            with open(tmpPath, 'wb') as f:
+                pickle.dump((ConstraintGraph.version, graph), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmpPath, cachePath)
+        except OSError as e:
+            getLogger().warning(f">>>>[ConstraintGraph] cannot write cache {cachePath}: {e}")
+        return graph
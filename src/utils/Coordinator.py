@@ -0,0 +1,271 @@
+import hmac
+import json
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from dataModel.ConfItem import ConfItem
+from dataModel.Seed import Seed
+from dataModel.TestResult import TestResult
+from dataModel.Testcase import Testcase
+from utils.Logger import getLogger
+
+RESULT_FIELDS = ('status', 'sysFailType', 'description', 'failed_tests_count', 'newException', 'newCoverage',
+                 'exception', 'duration')
+
+
+def encodeTestcase(seed: Seed) -> List[List[str]]:
+    return [[conf.name, conf.type, conf.value] for conf in seed.confItemList]
+
+
+def decodeTestcase(confItems: List[List[str]]) -> Testcase:
+    return Testcase([ConfItem(name, type, value) for name, type, value in confItems])
+
+
+def encodeResult(result: TestResult) -> Optional[dict]:
+    if result is None:
+        return None
+    return {field: getattr(result, field) for field in RESULT_FIELDS}
+
+
+def decodeResult(data: Optional[dict]) -> Optional[TestResult]:
+    if data is None:
+        return None
+    result = TestResult()
+    for field in RESULT_FIELDS:
+        if field in data:
+            setattr(result, field, data[field])
+    return result
+
+
+class Job(object):
+    __slots__ = ('id', 'seed', 'testcase', 'worker', 'deadline')
+
+    def __init__(self, id: int, seed: Seed, testcase: Testcase) -> None:
+        self.id = id
+        self.seed = seed
+        self.testcase = testcase
+        self.worker: str = ''
+        self.deadline: float = 0.0
+
+
+class Coordinator(object):
+    """
+    Hands out testcases to workers and commits their results, for a campaign spread over several hosts.
+
+    The coordinator keeps all campaign state (seed pool, dedup filter, mutator
+    feedback, statistics) in its own process: `nextTestcase` generates the next
+    (seed, testcase) and `commit` feeds a result back, returning the seed it
+    added to the pool, if any. Workers only run tests. A job is leased to a
+    worker for `leaseTimeout` seconds; a worker that leaves or stops answering
+    loses its jobs to the next worker asking for work. Seeds added to the pool
+    are appended to a corpus log that workers read incrementally by offset.
+    """
+
+    def __init__(self, nextTestcase: Callable[[], Tuple[Seed, Testcase]],
+                 commit: Callable[[Seed, Testcase, TestResult, TestResult, Testcase], Optional[Seed]],
+                 leaseTimeout: float = 1800.0) -> None:
+        self.logger = getLogger()
+        self.nextTestcase = nextTestcase
+        self.commit = commit
+        self.leaseTimeout: float = leaseTimeout
+        self.lock = threading.Lock()
+        self.nextJobId: int = 0
+        self.leased: Dict[int, Job] = {}
+        self.requeued: deque = deque()
+        self.workers: Dict[str, float] = {}
+        self.corpus: List[List[List[str]]] = []
+        self.corpusFingerprints = set()
+        self.stopping: bool = False
+        self.stats: Dict[str, int] = {'assigned': 0, 'completed': 0, 'expired': 0, 'stale': 0}
+
+    def assign(self, worker: str) -> Optional[dict]:
+        """
+        Lease a job to `worker`. Returns None once the coordinator is stopping.
+        """
+        with self.lock:
+            now = time.time()
+            self.workers[worker] = now
+            if self.stopping:
+                return None
+            self.expireLeases(now)
+            if self.requeued:
+                job = self.requeued.popleft()
+            else:
+                seed, testcase = self.nextTestcase()
+                job = Job(self.nextJobId, seed, testcase)
+                self.nextJobId += 1
+            job.worker = worker
+            job.deadline = now + self.leaseTimeout
+            self.leased[job.id] = job
+            self.stats['assigned'] += 1
+            return {'job': job.id, 'testcase': encodeTestcase(job.testcase), 'corpusSize': len(self.corpus)}
+
+    def complete(self, worker: str, jobId: int, utResult: TestResult, sysResult: TestResult) -> bool:
+        """
+        Commit the results of a job. Results of jobs the worker no longer holds are dropped.
+        """
+        with self.lock:
+            self.workers[worker] = time.time()
+            job = self.leased.get(jobId)
+            if job is None or job.worker != worker:
+                self.stats['stale'] += 1
+                return False
+            del self.leased[jobId]
+            self.stats['completed'] += 1
+            added = self.commit(job.seed, job.testcase, utResult, sysResult, job.testcase)
+            if added is not None:
+                self.publish(added)
+            return True
+
+    def leave(self, worker: str) -> int:
+        """
+        Forget `worker` and requeue its jobs. Returns the number of requeued jobs.
+        """
+        with self.lock:
+            self.workers.pop(worker, None)
+            jobs = [job for job in self.leased.values() if job.worker == worker]
+            for job in jobs:
+                del self.leased[job.id]
+                self.requeued.append(job)
+            return len(jobs)
+
+    def expireLeases(self, now: float) -> None:
+        for job in [job for job in self.leased.values() if job.deadline < now]:
+            self.logger.info(f">>>>[Coordinator] lease of job {job.id} held by {job.worker} expired")
+            del self.leased[job.id]
+            self.requeued.append(job)
+            self.stats['expired'] += 1
+
+    def publish(self, seed: Seed) -> None:
+        fingerprint = seed.fingerprint()
+        if fingerprint not in self.corpusFingerprints:
+            self.corpusFingerprints.add(fingerprint)
+            self.corpus.append(encodeTestcase(seed))
+
+    def corpusSince(self, offset: int) -> dict:
+        with self.lock:
+            return {'offset': len(self.corpus), 'seeds': self.corpus[max(0, offset):]}
+
+    def activeWorkers(self) -> List[str]:
+        with self.lock:
+            deadline = time.time() - self.leaseTimeout
+            return [worker for worker, lastSeen in self.workers.items() if lastSeen >= deadline]
+
+    def status(self) -> dict:
+        status = dict(self.stats)
+        status['workers'] = len(self.activeWorkers())
+        with self.lock:
+            status['leased'] = len(self.leased)
+            status['requeued'] = len(self.requeued)
+            status['corpus'] = len(self.corpus)
+        return status
+
+    def stop(self) -> None:
+        with self.lock:
+            self.stopping = True
+
+
+class CoordinatorHandler(BaseHTTPRequestHandler):
+    """
+    JSON over HTTP front end of a `Coordinator`:
+
+        POST /work    {"worker"}                                  -> {"job", "testcase", "corpusSize"} or {"stop": true}
+        POST /result  {"worker", "job", "utResult", "sysResult"}  -> {"accepted"}
+        POST /leave   {"worker"}                                  -> {"requeued"}
+        GET  /corpus?since=<offset>                               -> {"offset", "seeds"}
+        GET  /status                                              -> counters
+
+    With a `token`, every request must carry it in the `X-Coordinator-Token` header.
+    """
+
+    coordinator: Coordinator = None
+    token: str = None
+
+    def authorized(self) -> bool:
+        if not self.token:
+            return True
+        if hmac.compare_digest(self.headers.get('X-Coordinator-Token', ''), self.token):
+            return True
+        self.reply({'error': 'unauthorized'}, 401)
+        return False
+
+    def do_GET(self) -> None:
+        if not self.authorized():
+            return
+        url = urlparse(self.path)
+        if url.path == '/corpus':
+            since = int(parse_qs(url.query).get('since', ['0'])[0])
+            self.reply(self.coordinator.corpusSince(since))
+        elif url.path == '/status':
+            self.reply(self.coordinator.status())
+        else:
+            self.reply({'error': f'unknown path {url.path}'}, 404)
+
+    def do_POST(self) -> None:
+        if not self.authorized():
+            return
+        length = int(self.headers.get('Content-Length', 0))
+        try:
+            body = json.loads(self.rfile.read(length) or b'{}')
+            worker = body['worker']
+        except (ValueError, KeyError):
+            self.reply({'error': 'invalid request'}, 400)
+            return
+        if self.path == '/work':
+            job = self.coordinator.assign(worker)
+            self.reply(job if job is not None else {'stop': True})
+        elif self.path == '/result':
+            accepted = self.coordinator.complete(worker, body['job'], decodeResult(body.get('utResult')),
+                                                 decodeResult(body.get('sysResult')))
+            self.reply({'accepted': accepted})
+        elif self.path == '/leave':
+            self.reply({'requeued': self.coordinator.leave(worker)})
+        else:
+            self.reply({'error': f'unknown path {self.path}'}, 404)
+
+    def reply(self, data: dict, code: int = 200) -> None:
+        payload = json.dumps(data).encode('utf-8')
+        self.send_response(code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args) -> None:
+        getLogger().debug(">>>>[Coordinator] " + format % args)
+
+
+class CoordinatorServer(object):
+    """
+    Serves a `Coordinator` on `host:port` from a background thread.
+
+    Anyone who can reach the server can steer the campaign, so it listens on the
+    loopback interface unless told otherwise; a server on a shared network should
+    be given a `token` that its workers send along.
+    """
+
+    def __init__(self, coordinator: Coordinator, host: str = '127.0.0.1', port: int = 9860,
+                 token: str = None) -> None:
+        handler = type('BoundCoordinatorHandler', (CoordinatorHandler,), {'coordinator': coordinator, 'token': token})
+        self.coordinator = coordinator
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name='coordinator', daemon=True)
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        return self.httpd.server_address[:2]
+
+    def start(self) -> 'CoordinatorServer':
+        self.thread.start()
+        return self
+
+    def close(self) -> None:
+        self.coordinator.stop()
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.thread.join()
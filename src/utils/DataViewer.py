@@ -5,9 +5,9 @@ import time
 import numpy as np
 import visdom
 
-from utils import CSVReader
 from utils.Configuration import Configuration
 from utils.ShowStats import ShowStats
+from utils.TimeSeries import TimeSeriesReader, binaryPath
 
 
 class DataViewer(object):
@@ -17,10 +17,13 @@ class DataViewer(object):
                                  port=int(self.fuzzerConf['data_viewer_server_port']),
                                  env=env)
         self.stop = False
+        # plot rows are read incrementally from the binary sidecar of the plot data
+        self.plotReader: TimeSeriesReader = None
+        self.plotOffset: int = 0
 
     def run(self):
         self.drawText()
-        self.drawData(None)
+        self.drawData()
         cnt: int = 0
         while True:
             if self.stop:
@@ -80,11 +83,22 @@ class DataViewer(object):
 """
         self.vis.text(text, win='text')
 
-    def drawData(self, update='update') -> None:
-        if not os.path.exists(self.fuzzerConf['plot_data_path']):
+    def drawData(self) -> None:
+        """
+        Draw the plot rows written since the last call; the first call creates the window.
+        """
+        if self.plotReader is None:
+            path = binaryPath(self.fuzzerConf['plot_data_path'])
+            if not os.path.exists(path):
+                return
+            self.plotReader = TimeSeriesReader(path)
+        rows, offset = self.plotReader.rowsSince(self.plotOffset)
+        if not rows:
             return
-        header, data = CSVReader.readCSVFile(self.fuzzerConf['plot_data_path'])
-        data = np.array(data, dtype=np.int64)
+        update = 'append' if self.plotOffset > 0 else None
+        self.plotOffset = offset
+        header = self.plotReader.columns
+        data = np.array(rows, dtype=np.int64)
         timestack = data[:, 0]
         data = data[:, 3:10]
         self.vis.line(data,
@@ -0,0 +1,95 @@
+import asyncio
+import concurrent.futures
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue
+from typing import Callable, Coroutine
+
+from utils.Logger import getLogger
+
+
+class EventLoop(object):
+    """
+    One asyncio event loop, running on a daemon thread, shared by the runtime.
+
+    Periodic work (monitor sampling, the stats display) and waits on child
+    processes are coroutines on this loop instead of threads that sleep and
+    poll. Blocking calls (directory walks, oracle parsing) are handed to the
+    loop's executor with `offload`. Code running on other threads schedules
+    coroutines with `submit`, or `run` to wait for the result.
+    """
+
+    _shared: 'EventLoop' = None
+    _sharedLock = threading.Lock()
+
+    def __init__(self, name: str = 'eventloop', workers: int = 4) -> None:
+        self.logger = getLogger()
+        self.loop = asyncio.new_event_loop()
+        self.executor = ThreadPoolExecutor(workers, thread_name_prefix=name)
+        self.loop.set_default_executor(self.executor)
+        self.thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self.thread.start()
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    @staticmethod
+    def shared() -> 'EventLoop':
+        with EventLoop._sharedLock:
+            if EventLoop._shared is None or EventLoop._shared.loop.is_closed():
+                EventLoop._shared = EventLoop()
+            return EventLoop._shared
+
+    def submit(self, coro: Coroutine) -> concurrent.futures.Future:
+        """
+        Schedule `coro` on the loop from any thread.
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Coroutine, timeout: float = None):
+        """
+        Run `coro` on the loop and block the calling thread until it returns.
+        Must not be called from the loop thread itself.
+        """
+        if threading.current_thread() is self.thread:
+            coro.close()
+            raise RuntimeError("EventLoop.run called from the loop thread, await the coroutine instead")
+        return self.submit(coro).result(timeout)
+
+    def every(self, interval: float, tick: Callable, *stopQueues: Queue) -> concurrent.futures.Future:
+        """
+        Call `tick` every `interval` seconds until one of `stopQueues` is not empty.
+        """
+        return self.submit(EventLoop.periodic(interval, tick, *stopQueues))
+
+    @staticmethod
+    async def periodic(interval: float, tick: Callable, *stopQueues: Queue) -> None:
+        """
+        `tick` may be a plain function or a coroutine function; a plain function
+        runs on the loop thread, so anything that blocks should be offloaded.
+        """
+        while True:
+            await asyncio.sleep(interval)
+            if any(not stopQueue.empty() for stopQueue in stopQueues):
+                break
+            result = tick()
+            if asyncio.iscoroutine(result):
+                await result
+
+    @staticmethod
+    async def offload(fn: Callable, *args, **kwargs):
+        """
+        Run the blocking `fn` in the executor of the running loop.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(fn, *args, **kwargs))
+
+    def close(self) -> None:
+        if self.loop.is_closed():
+            return
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+        self.executor.shutdown(wait=False)
@@ -0,0 +1,132 @@
+import copy
+import os
+from typing import Dict, List, Set
+
+from utils.Configuration import Configuration
+from utils.UnitConstant import FUZZER_DIR
+
+
+class AnalyzerState(object):
+    """
+    The per-context counterpart of `ConfAnalyzer`: the same attributes and
+    `excludeConfItem`, but on an instance.
+    """
+
+    # attributes copied from ConfAnalyzer; containers are copied so exclusions and
+    # mutation counts of one context do not leak into another
+    fields = ('confItemValueMap', 'confItemTypeMap', 'confItemsBasic', 'confItemsMutable', 'confItemRelations',
+              'constraintGraph', 'confUnitMap', 'excludeConf', 'excludeVersion', 'confMutationInfo')
+
+    def __init__(self) -> None:
+        self.confItemValueMap: Dict[str, str] = {}
+        self.confItemTypeMap: Dict[str, str] = {}
+        self.confItemsBasic: List[str] = []
+        self.confItemsMutable: List[str] = []
+        self.confItemRelations: Dict[str, List[List[str]]] = {}
+        self.constraintGraph = None
+        self.confUnitMap: Dict[str, List[str]] = {}
+        self.excludeConf: Set[str] = set()
+        self.excludeVersion: int = 0
+        self.confMutationInfo: Dict[str, List[int]] = {}
+
+    def excludeConfItem(self, confName: str) -> None:
+        if confName not in self.excludeConf:
+            self.excludeConf.add(confName)
+            self.excludeVersion += 1
+
+    @staticmethod
+    def copyOf(analyzer) -> 'AnalyzerState':
+        state = AnalyzerState()
+        for field in AnalyzerState.fields:
+            value = getattr(analyzer, field)
+            if field == 'confMutationInfo':
+                value = {name: list(info) for name, info in value.items()}
+            elif isinstance(value, (dict, list, set)):
+                # the read-only maps are shared, only their outer container is copied
+                value = copy.copy(value)
+            setattr(state, field, value)
+        return state
+
+
+class MonitorFlags(object):
+    """
+    The per-context counterpart of the `MonitorThread` exception flags.
+    """
+
+    def __init__(self) -> None:
+        self.CpuException: bool = False
+        self.MemoryException: bool = False
+        self.FileSizeException: bool = False
+
+
+class StatsCounters(object):
+    """
+    The per-context counterpart of `ShowStats`: plain counters, not displayed.
+    """
+
+    @staticmethod
+    def like(stats) -> 'StatsCounters':
+        """
+        Counters with the scalar attributes of `stats`, reset to zero except the start time.
+        """
+        counters = StatsCounters()
+        for name in dir(stats):
+            value = getattr(stats, name)
+            if not name.startswith('_') and isinstance(value, (int, float, str)):
+                setattr(counters, name, value if name == 'fuzzerStartTime' else type(value)())
+        return counters
+
+
+class FuzzContext(object):
+    """
+    The state one fuzz worker reads and writes: configuration, analyzer state,
+    statistics, monitor flags and its working directory.
+
+    `FuzzContext.default()` wraps the process-wide globals (`Configuration`,
+    `ConfAnalyzer`, `ShowStats`, `MonitorThread`), so a single fuzzer behaves
+    as before. `fork` creates an isolated context whose testers can run in
+    another thread of the same process.
+    """
+
+    _default: 'FuzzContext' = None
+
+    def __init__(self, fuzzerConf: Dict[str, str], putConf: Dict[str, str], analyzer, stats, monitor,
+                 workDir: str = FUZZER_DIR, name: str = 'main') -> None:
+        self.fuzzerConf: Dict[str, str] = fuzzerConf
+        self.putConf: Dict[str, str] = putConf
+        self.analyzer = analyzer
+        self.stats = stats
+        self.monitor = monitor
+        self.workDir: str = workDir
+        self.name: str = name
+
+    @property
+    def testingDir(self) -> str:
+        return self.putConf['testing_dir']
+
+    @staticmethod
+    def default() -> 'FuzzContext':
+        if FuzzContext._default is None:
+            # imported here: ShowStats needs the terminal and MonitorThread psutil
+            from testValidator.MonitorThread import MonitorThread
+            from utils.ConfAnalyzer import ConfAnalyzer
+            from utils.ShowStats import ShowStats
+            FuzzContext._default = FuzzContext(Configuration.fuzzerConf, Configuration.putConf, ConfAnalyzer,
+                                               ShowStats, MonitorThread)
+        return FuzzContext._default
+
+    def fork(self, name: str, fuzzerConf: Dict[str, str] = None, putConf: Dict[str, str] = None) -> 'FuzzContext':
+        """
+        An isolated copy of this context for the worker `name`, with its own
+        working directory under this one. Entries of `fuzzerConf` and `putConf`
+        override the copied configuration, e.g. a separate `testing_dir` and
+        `injecting_location` so the workers' ctests do not share a checkout.
+        """
+        workDir = os.path.join(self.workDir, name)
+        os.makedirs(workDir, exist_ok=True)
+        forkedFuzzerConf = dict(self.fuzzerConf)
+        forkedFuzzerConf.update(fuzzerConf or {})
+        forkedPutConf = dict(self.putConf)
+        forkedPutConf.update(putConf or {})
+        return FuzzContext(forkedFuzzerConf, forkedPutConf, AnalyzerState.copyOf(self.analyzer),
+                           StatsCounters.like(self.stats), MonitorFlags(), workDir, name)
@@ -0,0 +1,233 @@
+import math
+import socket
+import struct
+import time
+from typing import Dict, List, Tuple
+
+from utils.Logger import getLogger
+
+# JaCoCo execution data protocol (org.jacoco.core.data.ExecutionDataWriter, RemoteControlWriter)
+BLOCK_HEADER = 0x01
+BLOCK_SESSIONINFO = 0x10
+BLOCK_EXECUTIONDATA = 0x11
+BLOCK_CMDOK = 0x20
+BLOCK_CMDDUMP = 0x40
+MAGIC_NUMBER = 0xC0C0
+FORMAT_VERSION = 0x1007
+
+
+class JacocoProtocolError(Exception):
+    pass
+
+
+class BlockReader(object):
+    """
+    Reads the primitive types of the JaCoCo data format from a socket.
+    """
+
+    def __init__(self, sock: socket.socket) -> None:
+        self.sock = sock
+        self.buffer = bytearray()
+
+    def read(self, n: int) -> bytes:
+        while len(self.buffer) < n:
+            chunk = self.sock.recv(max(65536, n - len(self.buffer)))
+            if not chunk:
+                raise JacocoProtocolError("connection closed by the agent")
+            self.buffer += chunk
+        data = bytes(self.buffer[:n])
+        del self.buffer[:n]
+        return data
+
+    def byte(self) -> int:
+        return self.read(1)[0]
+
+    def char(self) -> int:
+        return struct.unpack(">H", self.read(2))[0]
+
+    def long(self) -> int:
+        return struct.unpack(">q", self.read(8))[0]
+
+    def utf(self) -> str:
+        # java modified UTF-8, identical to UTF-8 for class names
+        return self.read(self.char()).decode("utf-8", errors="replace")
+
+    def varInt(self) -> int:
+        value, shift = 0, 0
+        while True:
+            b = self.byte()
+            value |= (b & 0x7F) << shift
+            if not b & 0x80:
+                return value
+            shift += 7
+
+    def booleanArray(self) -> Tuple[int, int]:
+        """
+        Returns (length, probes) with probe i in bit i of `probes`. JaCoCo packs
+        the array LSB first, so the bytes are the little-endian bitset as is.
+        """
+        length = self.varInt()
+        probes = int.from_bytes(self.read((length + 7) // 8), "little")
+        return length, probes
+
+
+class JacocoClient(object):
+    """
+    Dumps execution data from a JaCoCo agent started with `output=tcpserver`.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 6300, timeout: float = 10.0) -> None:
+        self.host: str = host
+        self.port: int = port
+        self.timeout: float = timeout
+
+    def dump(self, retrieve: bool = True, reset: bool = True) -> List[Tuple[int, str, int, int]]:
+        """
+        Request a dump (and a reset of the agent's probes) and return the
+        execution data as (classId, className, probeCount, probes) tuples.
+        With `retrieve` False the agent sends no execution data and the call
+        only resets it.
+        """
+        with socket.create_connection((self.host, self.port), timeout=self.timeout) as sock:
+            sock.sendall(struct.pack(">BHH", BLOCK_HEADER, MAGIC_NUMBER, FORMAT_VERSION)
+                         + struct.pack(">B??", BLOCK_CMDDUMP, retrieve, reset))
+            reader = BlockReader(sock)
+            executionData = []
+            while True:
+                block = reader.byte()
+                if block == BLOCK_HEADER:
+                    if reader.char() != MAGIC_NUMBER:
+                        raise JacocoProtocolError("invalid magic number")
+                    version = reader.char()
+                    if version != FORMAT_VERSION:
+                        raise JacocoProtocolError(f"unsupported format version {version:#x}")
+                elif block == BLOCK_SESSIONINFO:
+                    reader.utf()
+                    reader.long()
+                    reader.long()
+                elif block == BLOCK_EXECUTIONDATA:
+                    classId = reader.long()
+                    name = reader.utf()
+                    length, probes = reader.booleanArray()
+                    executionData.append((classId, name, length, probes))
+                elif block == BLOCK_CMDOK:
+                    return executionData
+                else:
+                    raise JacocoProtocolError(f"unknown block type {block:#x}")
+
+
+class CoverageMap(object):
+    """
+    Global probe coverage, one int bitset per class id.
+    """
+
+    def __init__(self) -> None:
+        self.classes: Dict[int, int] = {}
+        self.probeCount: int = 0
+
+    def __len__(self) -> int:
+        return self.probeCount
+
+    def merge(self, executionData: List[Tuple[int, str, int, int]]) -> int:
+        """
+        Add a dump to the map. Returns the number of probes no earlier dump hit.
+        """
+        newProbes = 0
+        for classId, _, _, probes in executionData:
+            known = self.classes.get(classId, 0)
+            new = probes & ~known
+            if new:
+                newProbes += new.bit_count()
+                self.classes[classId] = known | new
+        self.probeCount += newProbes
+        return newProbes
+
+
+class CoverageTracker(object):
+    """
+    Collect per-testcase coverage deltas from a JaCoCo agent within an overhead budget.
+
+    The time spent dumping and merging is compared with the time of the system
+    test it belongs to. While the average overhead stays below `maxOverhead`
+    every run is measured; above it, only every n-th run is, with n chosen so
+    the overhead comes back under the budget. The agent is still reset after a
+    skipped run so the next measured dump holds only its own run; if that reset
+    fails, the next dump spans several runs and is merged without being
+    reported as a delta.
+    """
+
+    def __init__(self, client: JacocoClient, maxOverhead: float = 0.05) -> None:
+        self.logger = getLogger()
+        self.client: JacocoClient = client
+        self.maxOverhead: float = maxOverhead
+        self.coverageMap: CoverageMap = CoverageMap()
+        self.collectTime: float = 0.0
+        self.testTime: float = 0.0
+        self.collectCount: int = 0
+        self.skippedRuns: int = 0
+        self.failedCount: int = 0
+        # the agent holds probes of more than one run
+        self.aggregated: bool = False
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state['logger']
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.aggregated = False
+        self.__dict__.update(state)
+        self.logger = getLogger()
+
+    def overhead(self) -> float:
+        return self.collectTime / self.testTime if self.testTime > 0 else 0.0
+
+    def sampleInterval(self) -> int:
+        overhead = self.overhead()
+        if self.maxOverhead <= 0 or overhead <= self.maxOverhead:
+            return 1
+        return math.ceil(overhead / self.maxOverhead)
+
+    def collect(self, testTime: float) -> int:
+        """
+        Dump the coverage of the run that took `testTime` seconds and merge it.
+        Returns the number of new probes, or -1 if the run was not measured.
+        """
+        self.testTime += testTime
+        if self.skippedRuns + 1 < self.sampleInterval():
+            self.skippedRuns += 1
+            self.reset()
+            return -1
+        self.skippedRuns = 0
+        start = time.time()
+        try:
+            newProbes = self.coverageMap.merge(self.client.dump(reset=True))
+        except (OSError, JacocoProtocolError) as e:
+            self.failedCount += 1
+            self.aggregated = True
+            self.logger.warning(f">>>>[JacocoCoverage] cannot dump coverage from "
+                                f"{self.client.host}:{self.client.port}: {e}")
+            return -1
+        finally:
+            self.collectTime += time.time() - start
+        self.collectCount += 1
+        if self.aggregated:
+            # the probes may come from earlier runs, they say nothing about this testcase
+            self.aggregated = False
+            return -1
+        return newProbes
+
+    def reset(self) -> None:
+        """
+        Discard the probes of a run that is not measured.
+        """
+        start = time.time()
+        try:
+            self.client.dump(retrieve=False, reset=True)
+        except (OSError, JacocoProtocolError) as e:
+            self.failedCount += 1
+            self.aggregated = True
+            self.logger.warning(f">>>>[JacocoCoverage] cannot reset coverage of "
+                                f"{self.client.host}:{self.client.port}: {e}")
+        finally:
+            self.collectTime += time.time() - start
@@ -1,9 +1,16 @@
+import atexit
+import json
 import logging
+import logging.handlers
 import os
-import sys
+import queue
+import threading
 
 from utils import UnitConstant
 
+LOG_FORMAT = '[%(asctime)s-%(levelname)s-%(pathname)s-%(funcName)s:%(lineno)d]\n%(message)s'
+LOG_DATEFMT = "%Y-%m-%d %H:%M:%S"
+
 
 def getLogger():
     """(Facade)get the logger instance. Which is designed by single pattern.
@@ -14,9 +21,77 @@ def getLogger():
     return Logger.get_logger()
 
 
+def getItemLogger(stream: str) -> logging.Logger:
+    """(Facade)get the logger of a per-item event stream, e.g. every mutated value or
+    every surefire testcase. Log to it at DEBUG with %-style arguments: nothing is
+    formatted unless `log_level` is DEBUG, and then only one record in
+    `log_sample_every` is kept.
+
+    Returns:
+        logging.Logger: the logger of `stream`
+    """
+    return Logger.get_item_logger(stream)
+
+
+class SampleFilter(logging.Filter):
+    """
+    Lets one record in `every` through. The kept records are marked with the
+    sampling rate in their structured fields.
+    """
+
+    def __init__(self, every: int = 1) -> None:
+        super().__init__()
+        self.every: int = max(1, int(every))
+        self.seen: int = 0
+        self.lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        with self.lock:
+            self.seen += 1
+            keep = (self.seen - 1) % self.every == 0
+        if keep and self.every > 1:
+            record.fields = dict(getattr(record, 'fields', None) or {}, sample=self.every)
+        return keep
+
+
+class StructuredFormatter(logging.Formatter):
+    """
+    The usual text format, with the structured fields of a record (`extra={'fields': {...}}`)
+    appended as key=value pairs; or one JSON object per line.
+    """
+
+    def __init__(self, asJson: bool = False) -> None:
+        super().__init__(LOG_FORMAT, LOG_DATEFMT)
+        self.asJson: bool = asJson
+
+    def format(self, record: logging.LogRecord) -> str:
+        fields = getattr(record, 'fields', None)
+        if not self.asJson:
+            text = super().format(record)
+            if fields:
+                text += " " + " ".join(f"{key}={value}" for key, value in fields.items())
+            return text
+        entry = {'time': self.formatTime(record, self.datefmt), 'level': record.levelname,
+                 'where': f"{record.pathname}:{record.lineno}", 'func': record.funcName, 'msg': record.getMessage()}
+        if fields:
+            entry.update(fields)
+        return json.dumps(entry, default=str)
+
+
 class Logger(object):
+    """
+    Records are put on a queue by a `QueueHandler` in the logging thread and
+    formatted and written to `fuzzer.log` by a `QueueListener` thread, so the
+    fuzzing threads never wait on the file. `configure` applies the `log_level`,
+    `log_sample_every` and `log_format` options of the fuzzer configuration.
+    """
     # a static member of 'Logger' class
     logger = None
+    listener: logging.handlers.QueueListener = None
+    fileHandler: logging.FileHandler = None
+    itemFilters = {}
+    sampleEvery: int = 100
+    lock = threading.RLock()
 
     def __init__(self) -> None:
         pass
@@ -30,31 +105,66 @@ class Logger(object):
         """
         # return 'logger' if it exists
         if Logger.logger is None:
-            # create a new log file in current working path
-            log_dir = UnitConstant.FUZZER_DIR
-
-            log_path = os.path.join(log_dir, 'fuzzer.log')
-
-            # remove the previous one if it exists
-            if os.path.exists(log_path):
-                try:
-                    os.remove(log_path)
-                except Exception:
-                    pass
-
-            # some initialization work
-            logging.basicConfig(
-                level=logging.INFO,
-                format='[%(asctime)s-%(levelname)s-%(pathname)s-%(funcName)s:%(lineno)d]\n%(message)s',
-                datefmt="%Y-%m-%d %H:%M:%S",
-                filename=log_path,
-                filemode='w'
-            )
-
-            # create an instance from library 'logging'
-            Logger.logger = logging.getLogger()
+            with Logger.lock:
+                if Logger.logger is None:
+                    # create a new log file in current working path
+                    Logger.start(os.path.join(UnitConstant.FUZZER_DIR, 'fuzzer.log'))
         return Logger.logger
 
+    @staticmethod
+    def start(log_path: str, level: int = logging.INFO) -> None:
+        # remove the previous one if it exists
+        if os.path.exists(log_path):
+            try:
+                os.remove(log_path)
+            except Exception:
+                pass
+        Logger.fileHandler = logging.FileHandler(log_path, mode='w')
+        Logger.fileHandler.setFormatter(StructuredFormatter())
+        records = queue.SimpleQueue()
+        Logger.listener = logging.handlers.QueueListener(records, Logger.fileHandler)
+        Logger.listener.start()
+        # create an instance from library 'logging'
+        root = logging.getLogger()
+        root.setLevel(level)
+        root.addHandler(logging.handlers.QueueHandler(records))
+        atexit.register(Logger.stop)
+        Logger.logger = root
+
+    @staticmethod
+    def stop() -> None:
+        """
+        Write out the queued records and stop the writer thread.
+        """
+        with Logger.lock:
+            if Logger.listener is not None:
+                Logger.listener.stop()
+                Logger.listener = None
+                Logger.fileHandler.close()
+
+    @staticmethod
+    def configure(fuzzerConf: dict) -> None:
+        logger = Logger.get_logger()
+        with Logger.lock:
+            level = logging.getLevelName(fuzzerConf.get('log_level', 'INFO').upper())
+            # DEBUG only opens the per-item streams, not the debug output of every library
+            logger.setLevel(max(level, logging.INFO))
+            logging.getLogger('ecfuzz').setLevel(level)
+            Logger.sampleEvery = int(fuzzerConf.get('log_sample_every', 100))
+            for sampleFilter in Logger.itemFilters.values():
+                sampleFilter.every = max(1, Logger.sampleEvery)
+            Logger.fileHandler.setFormatter(StructuredFormatter(fuzzerConf.get('log_format', 'text') == 'json'))
+
+    @staticmethod
+    def get_item_logger(stream: str) -> logging.Logger:
+        Logger.get_logger()
+        itemLogger = logging.getLogger(f"ecfuzz.{stream}")
+        with Logger.lock:
+            if stream not in Logger.itemFilters:
+                Logger.itemFilters[stream] = SampleFilter(Logger.sampleEvery)
+                itemLogger.addFilter(Logger.itemFilters[stream])
+        return itemLogger
+
     @staticmethod
     def info(msg: str):
         Logger.get_logger().info(msg)
@@ -77,10 +77,17 @@ class MongoDb(object):
         print(self.mongo_client.list_database_names())
         
     def get_local_ip(self):
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.connect(("8.8.8.8", 80))
-        # print(s.getsockname()[0])
-        return s.getsockname()[0]
+        # read the address from the local interfaces instead of opening a socket to the internet,
+        # which stalls (or fails) on hosts without a route out
+        try:
+            import psutil
+            for addrs in psutil.net_if_addrs().values():
+                for addr in addrs:
+                    if addr.family == socket.AF_INET and not addr.address.startswith("127."):
+                        return addr.address
+        except ImportError:
+            pass
+        return socket.gethostname()
 
     def get_time(self) -> str:
         return str(time.time())
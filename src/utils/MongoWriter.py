@@ -0,0 +1,208 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, Tuple
+
+from utils.Logger import getLogger
+
+# an operation on a collection: ('insert', collection, doc), or ('replace', collection, doc)
+# which empties the collection first so it only keeps the latest document
+Operation = Tuple[str, str, dict]
+
+
+class MongoWriter(object):
+    """
+    Writes documents to Mongo from a background thread, so the fuzz loop never
+    waits on the database.
+
+    `insert` and `replace` only queue the document. The writer thread sends
+    queued inserts with one `insert_many` per collection, at most `batchSize`
+    documents at a time, at least every `flushInterval` seconds, and retries a
+    failed batch `retries` times. At most `maxBuffered` operations are queued;
+    beyond that, and for batches that still fail, documents are spilled to
+    JSONL segments in `spillDir` instead of being dropped. Without a Mongo
+    connection (`mongoDb` is None) every document goes to the segments, which
+    `replay` can upload later.
+    """
+
+    segmentSize: int = 16 * 1024 * 1024
+
+    def __init__(self, mongoDb=None, spillDir: str = None, batchSize: int = 64, flushInterval: float = 2.0,
+                 maxBuffered: int = 10000, retries: int = 3, retryDelay: float = 1.0) -> None:
+        self.logger = getLogger()
+        self.mongoDb = mongoDb
+        self.spillDir: str = spillDir
+        self.batchSize: int = batchSize
+        self.flushInterval: float = flushInterval
+        self.maxBuffered: int = maxBuffered
+        self.retries: int = retries
+        self.retryDelay: float = retryDelay
+        self.buffer: Deque[Operation] = deque()
+        self.condition = threading.Condition()
+        # operations taken from the buffer but not written yet
+        self.inFlight: int = 0
+        self.stopped: bool = False
+        self.stats: Dict[str, int] = {'written': 0, 'batches': 0, 'retried': 0, 'spilled': 0}
+        self.spillLock = threading.Lock()
+        self.spillFile = None
+        self.spillIndex: int = 0
+        if mongoDb is None:
+            self.logger.info(f">>>>[MongoWriter] no mongo configured, documents go to {spillDir}")
+        self.writer = threading.Thread(target=self.writeLoop, name="mongo-writer", daemon=True)
+        self.writer.start()
+
+    def insert(self, collection: str, doc: dict) -> None:
+        self.submit(('insert', collection, doc))
+
+    def replace(self, collection: str, doc: dict) -> None:
+        self.submit(('replace', collection, doc))
+
+    def submit(self, operation: Operation) -> None:
+        if self.mongoDb is None:
+            self.spill([operation])
+            return
+        with self.condition:
+            if len(self.buffer) >= self.maxBuffered:
+                full = True
+            else:
+                full = False
+                self.buffer.append(operation)
+                if len(self.buffer) >= self.batchSize:
+                    self.condition.notify()
+        if full:
+            # mongo cannot keep up, keep the document on disk rather than blocking the loop
+            self.spill([operation])
+
+    def writeLoop(self) -> None:
+        while True:
+            with self.condition:
+                if not self.buffer and not self.stopped:
+                    self.condition.wait(self.flushInterval)
+                if not self.buffer:
+                    if self.stopped:
+                        return
+                    continue
+                operations = list(self.buffer)
+                self.buffer.clear()
+                self.inFlight = len(operations)
+            try:
+                self.write(operations)
+            finally:
+                with self.condition:
+                    self.inFlight = 0
+                    self.condition.notify_all()
+
+    def write(self, operations: List[Operation]) -> None:
+        """
+        Write `operations` in order, grouping consecutive inserts into one collection.
+        """
+        start = 0
+        while start < len(operations):
+            kind, collection, _ = operations[start]
+            end = start + 1
+            if kind == 'insert':
+                while end < len(operations) and end - start < self.batchSize \
+                        and operations[end][0] == 'insert' and operations[end][1] == collection:
+                    end += 1
+            batch = operations[start:end]
+            if not self.writeBatch(kind, collection, [doc for _, _, doc in batch]):
+                self.spill(batch)
+            start = end
+
+    def writeBatch(self, kind: str, collection: str, docs: List[dict]) -> bool:
+        for attempt in range(self.retries + 1):
+            try:
+                col = self.mongoDb.data_base[collection]
+                if kind == 'replace':
+                    col.delete_many({})
+                # the documents get an `_id` from the driver, the caller's dicts are left alone
+                col.insert_many([dict(doc) for doc in docs], ordered=False)
+                self.stats['written'] += len(docs)
+                self.stats['batches'] += 1
+                return True
+            except Exception as e:
+                self.logger.info(f">>>>[MongoWriter] writing {len(docs)} docs to {collection} failed "
+                                 f"(attempt {attempt + 1}): {e}")
+                if attempt < self.retries:
+                    self.stats['retried'] += 1
+                    time.sleep(self.retryDelay * (2 ** attempt))
+        return False
+
+    def spill(self, operations: List[Operation]) -> None:
+        lines = "".join(json.dumps({'op': kind, 'collection': collection, 'doc': doc}, default=str) + "\n"
+                        for kind, collection, doc in operations)
+        with self.spillLock:
+            if self.spillFile is None or self.spillFile.tell() >= MongoWriter.segmentSize:
+                self.openSegment()
+            self.spillFile.write(lines)
+            self.spillFile.flush()
+            self.stats['spilled'] += len(operations)
+
+    def openSegment(self) -> None:
+        if self.spillFile is not None:
+            self.spillFile.close()
+        os.makedirs(self.spillDir, exist_ok=True)
+        while True:
+            self.spillIndex += 1
+            path = os.path.join(self.spillDir, f"spill-{self.spillIndex:05d}.jsonl")
+            if not os.path.exists(path):
+                break
+        self.spillFile = open(path, 'w', encoding='utf-8')
+
+    def flush(self, timeout: float = None) -> bool:
+        """
+        Wait until every queued document is written or spilled.
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        with self.condition:
+            self.condition.notify()
+            while self.buffer or self.inFlight:
+                remaining = None if deadline is None else deadline - time.time()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self.condition.wait(remaining)
+        return True
+
+    def close(self, timeout: float = None) -> None:
+        self.flush(timeout)
+        with self.condition:
+            self.stopped = True
+            # what mongo did not take in time is kept on disk
+            leftover = list(self.buffer)
+            self.buffer.clear()
+            self.condition.notify_all()
+        if leftover:
+            self.spill(leftover)
+        self.writer.join(timeout)
+        with self.spillLock:
+            if self.spillFile is not None:
+                self.spillFile.close()
+                self.spillFile = None
+        self.logger.info(f">>>>[MongoWriter] closed: {self.stats}")
+
+    @staticmethod
+    def replay(spillDir: str, mongoDb) -> int:
+        """
+        Upload the spilled segments of `spillDir` to `mongoDb`, removing each
+        segment once it is written. Returns the number of documents written.
+        """
+        written = 0
+        for name in sorted(os.listdir(spillDir)):
+            if not (name.startswith("spill-") and name.endswith(".jsonl")):
+                continue
+            path = os.path.join(spillDir, name)
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    entry = json.loads(line)
+                    entry['doc'].pop('_id', None)
+                    col = mongoDb.data_base[entry['collection']]
+                    if entry['op'] == 'replace':
+                        col.delete_many({})
+                    col.insert_one(entry['doc'])
+                    written += 1
+            os.remove(path)
+        return written
@@ -1,75 +1,75 @@
-# some special param's value
-FILEPATHS = ["/valid/file1", "/valid/file2", "/dev/shm", "@name@", "///file", "/", ""]
-DIRPATHS = ["/valid/dir1", "/valid/dir2", "/dev/shm", "valid/dir", "@name@", "file:///root/hdfs", "/", ""]
-USERS = ['xdsuper', 'samsuper', "hadoop", "+-#$", "12", "root"]
-GROUPS = ['xdgroup', 'samgroup', "hadoop", "+-#$", "12", "root"]
-PORTS = ["3000", "3001", "80", "0", "-1", "65599", "@@", "[names]"]
-NAMESERVICES = ["ns1", "ns2", "@root", "11"]
-INTERFACES = ["eth1", "eth2", "0", "@[+]@"]
-IPS = ["127.0.0.1"]
-PERMISSIONMASKS = ["007", "002", "999", "rwx", "4444", "777", "755"]
-PERMISSIONCODES = ["rwx------", "rwxrwx---", "rwx++++++" ,"oxw---ikd", "111", "#&^%Zio"]
-timeunits = ["ms", "millisecond", "s", "sec", "second", "m", "min", "minute", "h", "hr", "hour", "d", "day"]
-datasize = ["MB"]
-
-import random,re,sys
-from utils.IdentifyType import IdentifyType
+import random
 from dataModel.ConfItem import ConfItem
 from utils.ShowStats import ShowStats
+from utils.ConstraintGraph import DependencyType
+from utils.ValueEngine import (FILEPATHS, DIRPATHS, USERS, GROUPS, PORTS, NAMESERVICES, INTERFACES, IPS,
+                               PERMISSIONMASKS, PERMISSIONCODES, IPVALUES, timeunits, datasize, ValueEngine,
+                               intDomain, floatDomain, ipPortDomain, timeDomain, dataSizeDomain,
+                               intListValue, stringListValue)
 
 class NewValue(object):
     """
     Constraint contains how to generate values for different types of configuration items.
+
+    `genValue` goes through a `ValueEngine` shared by all instances; the per-type
+    `gen*` methods draw from the same candidate values one at a time.
     """
+    engine: ValueEngine = ValueEngine()
+
     def __init__(self) -> None:
         pass
 
     def constraint_method(self, constraint_type: str, confItemA: ConfItem, confItemB: ConfItem):
-        if constraint_type == "Control Dependency":
-            if confItemA.type == "BOOL":
-                ShowStats.nowTestConfigurationName = confItemA.name
-                ShowStats.nowMutationType = confItemA.type
-                confItemA.value = self.genValue(confItemA.type, confItemA.value)
-            else:
-                if confItemB.type == "BOOL":
-                    ShowStats.nowTestConfigurationName = confItemB.name + ","
-                    ShowStats.nowMutationType = confItemB.type + ","
-                    confItemB.value = "True"
-                if ShowStats.nowTestConfigurationName.endswith(","):
-                    ShowStats.nowTestConfigurationName = ShowStats.nowTestConfigurationName + confItemA.name
-                    ShowStats.nowMutationType = ShowStats.nowMutationType + confItemA.type
-                else:
-                    ShowStats.nowTestConfigurationName = confItemA.name
-                    ShowStats.nowMutationType = confItemA.type
-
-                confItemA.value = self.genValue(confItemA.type, confItemA.value)
-
-        elif constraint_type == "Value Relationship Dependency":
-            ShowStats.nowTestConfigurationName = confItemA.name + "," + confItemB.name
-            ShowStats.nowMutationType = confItemA.type + "," + confItemB.type
-            confItemA.value = self.genValue(confItemA.type, confItemA.value)
-            confItemB.value = self.genValue(confItemB.type, confItemB.value)
+        try:
+            method = NewValue.constraintMethods[DependencyType(constraint_type)]
+        except ValueError:
+            raise Exception("unsupported dependencies")
+        method(self, confItemA, confItemB)
 
-        elif constraint_type == "Overwrite":
+    def mutateControlDependency(self, confItemA: ConfItem, confItemB: ConfItem):
+        if confItemA.type == "BOOL":
             ShowStats.nowTestConfigurationName = confItemA.name
             ShowStats.nowMutationType = confItemA.type
             confItemA.value = self.genValue(confItemA.type, confItemA.value)
+        else:
+            if confItemB.type == "BOOL":
+                ShowStats.nowTestConfigurationName = confItemB.name + ","
+                ShowStats.nowMutationType = confItemB.type + ","
+                confItemB.value = "True"
+            if ShowStats.nowTestConfigurationName.endswith(","):
+                ShowStats.nowTestConfigurationName = ShowStats.nowTestConfigurationName + confItemA.name
+                ShowStats.nowMutationType = ShowStats.nowMutationType + confItemA.type
+            else:
+                ShowStats.nowTestConfigurationName = confItemA.name
+                ShowStats.nowMutationType = confItemA.type
 
-        elif constraint_type == "Default Value Dependency":
-            ShowStats.nowTestConfigurationName = confItemA.name + "," + confItemB.name
-            ShowStats.nowMutationType = confItemA.type + "," + confItemB.type
-            confItemA.value = self.genValue(confItemA.type, confItemA.value)
-            confItemB.value = confItemA.value
-
-        elif constraint_type == "Behavior Dependency":
-            ShowStats.nowTestConfigurationName = confItemA.name + "," + confItemB.name
-            ShowStats.nowMutationType = confItemA.type + "," + confItemB.type
             confItemA.value = self.genValue(confItemA.type, confItemA.value)
-            confItemB.value = self.genValue(confItemB.type, confItemB.value)
-
-        else:
-            raise Exception("unsupported dependencies")
 
+    def mutateBoth(self, confItemA: ConfItem, confItemB: ConfItem):
+        # Value Relationship Dependency and Behavior Dependency
+        ShowStats.nowTestConfigurationName = confItemA.name + "," + confItemB.name
+        ShowStats.nowMutationType = confItemA.type + "," + confItemB.type
+        confItemA.value = self.genValue(confItemA.type, confItemA.value)
+        confItemB.value = self.genValue(confItemB.type, confItemB.value)
+
+    def mutateOverwrite(self, confItemA: ConfItem, confItemB: ConfItem):
+        ShowStats.nowTestConfigurationName = confItemA.name
+        ShowStats.nowMutationType = confItemA.type
+        confItemA.value = self.genValue(confItemA.type, confItemA.value)
+
+    def mutateDefaultValueDependency(self, confItemA: ConfItem, confItemB: ConfItem):
+        ShowStats.nowTestConfigurationName = confItemA.name + "," + confItemB.name
+        ShowStats.nowMutationType = confItemA.type + "," + confItemB.type
+        confItemA.value = self.genValue(confItemA.type, confItemA.value)
+        confItemB.value = confItemA.value
+
+    constraintMethods = {
+        DependencyType.CONTROL: mutateControlDependency,
+        DependencyType.VALUE_RELATIONSHIP: mutateBoth,
+        DependencyType.OVERWRITE: mutateOverwrite,
+        DependencyType.DEFAULT_VALUE: mutateDefaultValueDependency,
+        DependencyType.BEHAVIOR: mutateBoth,
+    }
 
     def genStr(self, max_length: int, char_start: int = 32, char_range: int = 90) -> str:
         string_length = random.randrange(0, max_length + 1)
@@ -89,46 +89,13 @@ class NewValue(object):
             value (str): a new value.
         """
 
-        if(confType == "BOOL"):
-            return self.genBool(value)
-        if(confType == "PORT"):
-            return self.genPort(value)
-        if(confType == "PM"):
-            return self.genPermissionMask(value)
-        if(confType == "INT"):
-            return str(self.genInt(value))
-        if(confType == "FLOAT"):
-            return str(self.genFloat(value))
-        if(confType == "PC"):
-            return self.genPermissionCode(value)
-        if(confType == "INTLIST"):
-            return str(self.genIntList(value))
-        if(confType == "STRLIST"):
-            return str(self.genStringList(value))
-        if(confType == "IP"):
-            return self.genIp(value)
-        if(confType == "IPPORT"):
-            return self.genIpPortAddr(value)
-        if(confType == "CLASSNAME"):
-            return self.genClassName(value)
-        if(confType == "FILEPATH"):
-            return self.genFilePath(value)
-        if(confType == "TIME"):
-            return self.genTime(value)
-        if(confType == "DATA"):
-            return self.genDataSize(value)
-        if(confType == "DIRPATH"):
-            return self.genDirPath(value)
-        if(confType == "USER"):
-            return self.genUser(value)
-        if(confType == "GROUP"):
-            return self.genGroup(value)
-        if(confType == "NAMESERVICES"):
-            return self.genNameservices(value)
-        if(confType == "INTERFACE"):
-            return self.genInterface(value)
-        else:
-            return value
+        return NewValue.engine.genValue(confType, value)
+
+    def genValues(self, confTypesAndValues: list) -> list:
+        """
+        Generate new values for a batch of (type, value) pairs.
+        """
+        return NewValue.engine.genValues(confTypesAndValues)
 
     # based old value to generate new value as a list
     def genBool(self, value: str) -> str:
@@ -144,114 +111,26 @@ class NewValue(object):
         return random.choice(PERMISSIONMASKS)
 
     def genInt(self, value) -> int:
-        # [修复] 增加异常处理，防止遇到 ${variable} 时崩溃
-        try:
-            tmp = int(value)
-        except (ValueError, TypeError):
-            # 如果转换失败（例如遇到变量引用），默认使用 1 或者随机数
-            tmp = 1
-            
-        res = [tmp + 1, tmp - 1, tmp >> 1, tmp << 1, 0, -tmp, -1, 99999999, -99999999, 2**32 - 1, -2**32]
-
-        return random.choice(res)
+        return random.choice(intDomain(value))
 
     def genFloat(self, value) -> float:
-        s = value
-        tmp = re.match(r"^\d+\.\d+[fF]$", s)
-        res =[]
-        if tmp:
-            s = s[:-1]
-        
-        # [修复] 增加异常处理，防止遇到 ${variable} 时崩溃
-        try:
-            val = float(s)
-        except (ValueError, TypeError):
-            val = 1.0
-
-        res.append(val/2)
-        res.append(val*2)
-        res.append(-val)
-        res.append(0.0)
-        res.append(val+1)
-        res.append(val-1)
-        res.append(-1.0)
-        res.append(float(2**32-1))
-        res.append(float(-2**32))
-        res.append(99999999.8)
-        res.append(-99999999.8)
-        return random.choice(res)
+        return random.choice(floatDomain(value))
 
     def genPermissionCode(self, value) -> str:
         return random.choice(PERMISSIONCODES)
 
     def genIntList(self, value) -> str:
         # based on list to generate one list
-        # same size compared to old list
-        vals = value.split(",")
-        res = []
-        for val in vals:
-            rand = random.random()
-            try:
-                # 这里的 int(val) 也可能失败，最好也加上 try-except，但原逻辑有 try
-                if(rand < 0.1):
-                    res.append(int(val)<<1)
-                elif(rand < 0.2):
-                    res.append(-1)
-                elif(rand < 0.3):
-                    res.append(int(val)>>1)
-                elif(rand < 0.4):
-                    res.append(1)
-                elif(rand < 0.5):
-                    res.append(0)
-                elif(rand < 0.6):
-                    res.append(0.0)
-                elif(rand < 0.75):
-                    res.append(-int(val))
-                elif(rand < 0.9):
-                    res.append(sys.maxsize)
-                else:
-                    res.append(-sys.maxsize-1)
-            except Exception as e:
-                res.append(val)
-        return str(res)[1:-1]
+        return intListValue(value, random.random)
 
     def genStringList(self, value) -> list:
-        vals = value.split(",")
-        res = []
-        for val in vals:
-            if (len(val)>0):
-                rand = random.random()
-                length = len(val)//2
-                if (rand < 0.1):
-                    res.append(f"/{val}")
-                elif (rand < 0.2):
-                    res.append(f"@/+{val}")
-                elif (rand < 0.3):
-                    res.append(f"{val}/")
-                elif (rand < 0.4):
-                    res.append(f"{val}@/-")
-                elif(rand < 0.5):
-                    res.append("null")
-                elif(rand < 0.75):
-                    res.append(val[length:]+val[:length-1])
-                elif(rand < 0.9):
-                    res.append(val[:length])
-                else:
-                    res.append(val[length:])
-            else:
-                res.append(val)
-        return str(res)[1:-2]
+        return stringListValue(value, random.random)
 
     def genIp(self, value) -> str:
-        res = ["127.0.0.1","192.168.2.53","0.0.0.0","728.59.66.723","255.255.255.255","isip@"]
-        return random.choice(res)
+        return random.choice(IPVALUES)
 
     def genIpPortAddr(self, value) -> str:
-        s = value
-        s = s[:s.find(":")]
-        res = [f"{s}:{str(PORTS[0])}", f"{s}:{str(PORTS[1])}", f"{s}:20000", f"{s}:22", f"{s}:65599", f"745.657.25.3:{str(PORTS[3])}",f"{s}:{str(PORTS[4])}"]
-
-        return random.choice(res)
+        return random.choice(ipPortDomain(value))
 
     def genClassName(self, value) -> str:
         return value
@@ -260,54 +139,16 @@ class NewValue(object):
         return random.choice(FILEPATHS)
 
     def genTime(self, value) -> str:
-        res = []
-        s = value
-        for unit in timeunits:
-            if s.endswith(unit):
-                t = s[:s.find(unit)]
-                identifyType = IdentifyType()
-                if identifyType.isInt(t):
-                    t = int(t)
-                    res.append("1"+unit)
-                    res.append(str(2*t)+unit)
-                    res.append(str(10*t)+unit)
-                    res.append("0"+unit)
-                    res.append("-"+str(t)+unit)
-                    res.append("-100"+unit)
-                    res.append("00x")
-                    res.append("999999"+unit)
-                    res.append("00s")
-        if len(res) == 0:
-            p = random.random()
-            if p > 0.5:
-                res.append("10"+ timeunits[0])
-            else:
-                max_length = min(len(value)+2, 50)
-                res.append(self.genStr(max_length))
-        return random.choice(res)
+        return self.genUnitValue(timeDomain(value), value, "10" + timeunits[0])
 
     def genDataSize(self, value) -> str:
-        res = []
-        s = value
-        for unit in datasize:
-            if(s.endswith(unit)):
-                t = s[:s.find(unit)]
-                identifyType = IdentifyType()
-                if identifyType.isInt(t):
-                    t = int(t)
-                    res.append("1"+unit)
-                    res.append(str(2*t)+unit)
-                    res.append(str(10*t)+unit)
-                    res.append("0"+unit)
-                    res.append("-"+str(t)+unit)
-                    res.append("-100"+unit)
-                    res.append("00x")
-                    res.append("999999"+unit)
-                    res.append("00mb")
+        return self.genUnitValue(dataSizeDomain(value), value, "10" + datasize[0])
+
+    def genUnitValue(self, res: list, value: str, default: str) -> str:
         if len(res) == 0:
             p = random.random()
             if p > 0.5:
-                res.append("10"+ datasize[0])
+                res.append(default)
             else:
                 max_length = min(len(value)+2, 50)
                 res.append(self.genStr(max_length))
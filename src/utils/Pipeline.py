@@ -0,0 +1,127 @@
+import threading
+import time
+from queue import Queue
+from typing import Any, Callable, Dict, List, Tuple
+
+# a stage returns (finished, payload); a finished payload skips the remaining stages
+StageFn = Callable[[Any], Tuple[bool, Any]]
+
+_STOP = object()
+
+
+class StageError(object):
+    """
+    Carries an exception raised by a stage to `Pipeline.take`.
+    """
+
+    def __init__(self, stage: str, error: BaseException) -> None:
+        self.stage = stage
+        self.error = error
+
+
+class Pipeline(object):
+    """
+    Runs payloads through a chain of stages, one worker thread per stage.
+
+    Stages are connected by bounded queues, so a slow stage blocks the ones
+    before it instead of letting work pile up (`submit` blocks too once the
+    first queue is full). Results are handed back by `take` in submit order,
+    whatever order the stages finish them in.
+    """
+
+    def __init__(self, stages: List[Tuple[str, StageFn]], depth: int = 1) -> None:
+        self.stageNames: List[str] = [name for name, _ in stages]
+        self.queues: List[Queue] = [Queue(maxsize=max(1, depth)) for _ in stages]
+        self.doneQueue: Queue = Queue()
+        self.pending: Dict[int, Any] = {}
+        self.nextSeq: int = 0
+        self.nextTake: int = 0
+        self.busyTime: Dict[str, float] = {name: 0.0 for name in self.stageNames}
+        self.busyLock = threading.Lock()
+        self.startTime: float = time.time()
+        self.workers: List[threading.Thread] = []
+        for i, (name, fn) in enumerate(stages):
+            worker = threading.Thread(target=self.work, args=(i, name, fn), name=f"pipeline-{name}", daemon=True)
+            worker.start()
+            self.workers.append(worker)
+
+    def work(self, index: int, name: str, fn: StageFn) -> None:
+        inQueue = self.queues[index]
+        isLast = index == len(self.queues) - 1
+        while True:
+            item = inQueue.get()
+            if item is _STOP:
+                # pass the stop on behind the payloads this stage has forwarded
+                if not isLast:
+                    self.queues[index + 1].put(_STOP)
+                return
+            seq, payload = item
+            if isinstance(payload, StageError):
+                finished = True
+            else:
+                start = time.time()
+                try:
+                    finished, payload = fn(payload)
+                except Exception as e:
+                    finished, payload = True, StageError(name, e)
+                self.recordBusy(name, time.time() - start)
+            if finished or isLast:
+                self.doneQueue.put((seq, payload))
+            else:
+                self.queues[index + 1].put((seq, payload))
+
+    def submit(self, payload: Any) -> int:
+        """
+        Queue a payload for the first stage, blocking while that stage is full.
+        Returns its sequence number.
+        """
+        seq = self.nextSeq
+        self.nextSeq += 1
+        self.queues[0].put((seq, payload))
+        return seq
+
+    def take(self) -> Any:
+        """
+        Wait for and return the result of the oldest payload not taken yet.
+        Re-raises the exception if one of its stages failed.
+        """
+        if self.nextTake >= self.nextSeq:
+            raise IndexError("nothing in flight")
+        while self.nextTake not in self.pending:
+            seq, payload = self.doneQueue.get()
+            self.pending[seq] = payload
+        payload = self.pending.pop(self.nextTake)
+        self.nextTake += 1
+        if isinstance(payload, StageError):
+            raise payload.error
+        return payload
+
+    def inFlight(self) -> int:
+        return self.nextSeq - self.nextTake
+
+    def recordBusy(self, name: str, seconds: float) -> None:
+        """
+        Account `seconds` of work to stage `name`, which may also be a stage run
+        outside the pipeline (e.g. the caller producing the payloads).
+        """
+        with self.busyLock:
+            self.busyTime[name] = self.busyTime.get(name, 0.0) + seconds
+
+    def occupancy(self) -> Dict[str, float]:
+        """
+        Fraction of the wall time since the pipeline started each stage was busy.
+        """
+        elapsed = max(time.time() - self.startTime, 1e-9)
+        with self.busyLock:
+            return {name: min(1.0, busy / elapsed) for name, busy in self.busyTime.items()}
+
+    def describeOccupancy(self) -> str:
+        return ", ".join(f"{name} {ratio:.0%}" for name, ratio in self.occupancy().items())
+
+    def close(self) -> None:
+        """
+        Stop the workers once the payloads already queued have gone through.
+        """
+        self.queues[0].put(_STOP)
+        for worker in self.workers:
+            worker.join()
@@ -0,0 +1,196 @@
+import os
+import signal
+import subprocess
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from utils.Logger import getLogger
+
+# a line hook returns True to stop the process early
+LineHook = Callable[[str], Optional[bool]]
+
+
+class ProcessResult(object):
+    __slots__ = ('argv', 'returncode', 'stdout', 'stderr', 'timedOut', 'stopped', 'duration')
+
+    def __init__(self, argv: List[str]) -> None:
+        self.argv: List[str] = argv
+        self.returncode: int = None
+        self.stdout: str = None
+        self.stderr: str = None
+        # killed because the timeout expired / because the line hook asked for it
+        self.timedOut: bool = False
+        self.stopped: bool = False
+        self.duration: float = 0.0
+
+    def __str__(self) -> str:
+        return f"ProcessResult({self.argv[0]}, returncode:{self.returncode}, timedOut:{self.timedOut}, " \
+               f"stopped:{self.stopped}, duration:{self.duration:.2f}s)"
+
+
+class ProcessRunner(object):
+    """
+    Launches argv lists with an explicit cwd and environment, never through a shell.
+
+    The process cwd is never changed, so several runners can be used from
+    different threads. By default every child gets its own session (process
+    group), so on timeout the whole tree (e.g. maven and its forked JVMs) is
+    terminated, then killed after `killGrace` seconds. `start_new_session`
+    replaces `preexec_fn=os.setsid`, which forced a plain fork and is not safe
+    with threads. The time spent launching processes is accumulated in
+    `launchTime` to keep an eye on the per-launch overhead.
+    """
+
+    def __init__(self, env: Dict[str, str] = None, killGrace: float = 3.0) -> None:
+        self.logger = getLogger()
+        # added to the inherited environment of every launch
+        self.env: Dict[str, str] = env or {}
+        self.killGrace: float = killGrace
+        self.launches: int = 0
+        self.launchTime: float = 0.0
+        self.statsLock = threading.Lock()
+
+    def averageLaunchTime(self) -> float:
+        return self.launchTime / self.launches if self.launches else 0.0
+
+    def buildEnv(self, env: Dict[str, str] = None) -> Optional[Dict[str, str]]:
+        if not self.env and not env:
+            return None
+        merged = dict(os.environ)
+        merged.update(self.env)
+        merged.update(env or {})
+        return merged
+
+    def start(self, argv: List[str], cwd: str = None, env: Dict[str, str] = None, stdout=subprocess.DEVNULL,
+              stderr=subprocess.DEVNULL, newSession: bool = True) -> subprocess.Popen:
+        start = time.perf_counter()
+        process = subprocess.Popen(argv, cwd=cwd, env=self.buildEnv(env), stdin=subprocess.DEVNULL, stdout=stdout,
+                                   stderr=stderr, start_new_session=newSession, universal_newlines=True)
+        with self.statsLock:
+            self.launches += 1
+            self.launchTime += time.perf_counter() - start
+        return process
+
+    def kill(self, process: subprocess.Popen, newSession: bool = True) -> None:
+        """
+        SIGTERM the process (group), SIGKILL it if it is still alive after `killGrace` seconds.
+        """
+        for sig in (signal.SIGTERM, signal.SIGKILL):
+            try:
+                if newSession:
+                    os.killpg(process.pid, sig)
+                else:
+                    process.send_signal(sig)
+            except ProcessLookupError:
+                return
+            try:
+                process.wait(timeout=self.killGrace)
+                if newSession:
+                    # the leader is gone, make sure the rest of its group is too
+                    os.killpg(process.pid, signal.SIGKILL)
+                return
+            except subprocess.TimeoutExpired:
+                continue
+            except ProcessLookupError:
+                return
+
+    def wait(self, process: subprocess.Popen, result: ProcessResult, timeout: float = None,
+             newSession: bool = True) -> ProcessResult:
+        try:
+            result.stdout, result.stderr = process.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            result.timedOut = True
+            self.logger.info(f">>>>[ProcessRunner] {result.argv[0]} timed out after {timeout}s, killing it")
+            self.kill(process, newSession)
+            result.stdout, result.stderr = process.communicate()
+        result.returncode = process.returncode
+        return result
+
+    def run(self, argv: List[str], cwd: str = None, env: Dict[str, str] = None, timeout: float = None,
+            capture: bool = False, onLine: LineHook = None, newSession: bool = True) -> ProcessResult:
+        """
+        Run `argv` to completion and return its ProcessResult.
+
+        Args:
+            argv: program and arguments.
+            cwd: working directory of the child; the caller's cwd is left alone.
+            env: variables added to the inherited environment.
+            timeout: seconds before the process (group) is killed, None to wait forever.
+            capture: keep stdout and stderr in the result instead of discarding them.
+            onLine: called with each line of the merged stdout/stderr as it is produced;
+                returning True kills the process (`stopped` is set in the result).
+            newSession: run in a new session so the whole process group can be killed.
+        """
+        result = ProcessResult(argv)
+        startTime = time.time()
+        if onLine is None:
+            pipe = subprocess.PIPE if capture else subprocess.DEVNULL
+            process = self.start(argv, cwd, env, pipe, pipe, newSession)
+            self.wait(process, result, timeout, newSession)
+        else:
+            process = self.start(argv, cwd, env, subprocess.PIPE, subprocess.STDOUT, newSession)
+            self.stream(process, result, timeout, onLine, capture, newSession)
+        result.duration = time.time() - startTime
+        return result
+
+    def stream(self, process: subprocess.Popen, result: ProcessResult, timeout: float, onLine: LineHook,
+               capture: bool, newSession: bool) -> None:
+        killed = threading.Event()
+
+        def expire():
+            if process.poll() is None and not killed.is_set():
+                killed.set()
+                result.timedOut = True
+                self.logger.info(f">>>>[ProcessRunner] {result.argv[0]} timed out after {timeout}s, killing it")
+                self.kill(process, newSession)
+
+        timer = threading.Timer(timeout, expire) if timeout is not None else None
+        if timer is not None:
+            timer.daemon = True
+            timer.start()
+        lines = [] if capture else None
+        try:
+            for line in process.stdout:
+                if capture:
+                    lines.append(line)
+                if not killed.is_set() and onLine(line):
+                    killed.set()
+                    result.stopped = True
+                    self.kill(process, newSession)
+                    break
+        finally:
+            if timer is not None:
+                timer.cancel()
+            process.stdout.close()
+            process.wait()
+        result.returncode = process.returncode
+        if capture:
+            result.stdout = "".join(lines)
+
+    @staticmethod
+    def processExists(keyword: str) -> bool:
+        """
+        Whether a process other than this one has `keyword` in its command line,
+        like `ps -ef | grep keyword` but without spawning anything.
+        """
+        ownPid = os.getpid()
+        try:
+            import psutil
+            for process in psutil.process_iter(['pid', 'cmdline']):
+                if process.info['pid'] != ownPid and keyword in " ".join(process.info['cmdline'] or ()):
+                    return True
+            return False
+        except ImportError:
+            pass
+        for entry in os.listdir('/proc'):
+            if not entry.isdigit() or int(entry) == ownPid:
+                continue
+            try:
+                with open(f'/proc/{entry}/cmdline', 'rb') as f:
+                    cmdline = f.read().replace(b'\0', b' ').decode('utf-8', errors='replace')
+            except OSError:
+                continue
+            if keyword in cmdline:
+                return True
+        return False
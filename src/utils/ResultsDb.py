@@ -0,0 +1,325 @@
+"""
+The campaign results database, and a command line tool to query it.
+
+    cd src && python -m utils.ResultsDb <results.db> summary
+    cd src && python -m utils.ResultsDb <results.db> new-exceptions --since 1h
+    cd src && python -m utils.ResultsDb <results.db> params --exception java.io.IOException --since 2d
+"""
+import argparse
+import datetime
+import sqlite3
+import sys
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from utils.Logger import getLogger
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS testcases (
+    id INTEGER PRIMARY KEY,
+    name TEXT,
+    time REAL NOT NULL,
+    pooled INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS params (
+    testcase_id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS unit_outcomes (
+    testcase_id INTEGER PRIMARY KEY,
+    status INTEGER NOT NULL,
+    failed_tests INTEGER NOT NULL,
+    description TEXT
+);
+CREATE TABLE IF NOT EXISTS system_outcomes (
+    testcase_id INTEGER PRIMARY KEY,
+    status INTEGER NOT NULL,
+    fail_type INTEGER NOT NULL,
+    new_coverage INTEGER NOT NULL,
+    description TEXT
+);
+CREATE TABLE IF NOT EXISTS exceptions (
+    testcase_id INTEGER NOT NULL,
+    signature TEXT NOT NULL,
+    is_new INTEGER NOT NULL,
+    time REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS timings (
+    testcase_id INTEGER NOT NULL,
+    stage TEXT NOT NULL,
+    seconds REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS testcases_time ON testcases (time);
+CREATE INDEX IF NOT EXISTS params_name ON params (name, value);
+CREATE INDEX IF NOT EXISTS params_testcase ON params (testcase_id);
+CREATE INDEX IF NOT EXISTS exceptions_signature ON exceptions (signature, time);
+CREATE INDEX IF NOT EXISTS exceptions_time ON exceptions (time);
+CREATE INDEX IF NOT EXISTS timings_stage ON timings (stage, seconds);
+"""
+
+TABLES = ('testcases', 'params', 'unit_outcomes', 'system_outcomes', 'exceptions', 'timings')
+
+INSERTS = {
+    'testcases': "INSERT INTO testcases (id, name, time, pooled) VALUES (?, ?, ?, ?)",
+    'params': "INSERT INTO params (testcase_id, name, value) VALUES (?, ?, ?)",
+    'unit_outcomes': "INSERT INTO unit_outcomes (testcase_id, status, failed_tests, description) VALUES (?, ?, ?, ?)",
+    'system_outcomes': "INSERT INTO system_outcomes (testcase_id, status, fail_type, new_coverage, description) "
+                       "VALUES (?, ?, ?, ?, ?)",
+    'exceptions': "INSERT INTO exceptions (testcase_id, signature, is_new, time) VALUES (?, ?, ?, ?)",
+    'timings': "INSERT INTO timings (testcase_id, stage, seconds) VALUES (?, ?, ?)",
+}
+
+
+def parseSince(since: Optional[str]) -> Optional[float]:
+    """
+    A point in time given as an age (`90s`, `30m`, `1h`, `2d`), a unix timestamp
+    or an ISO date, as a unix timestamp.
+    """
+    if since is None:
+        return None
+    units = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+    if since[-1:] in units:
+        try:
+            return time.time() - float(since[:-1]) * units[since[-1]]
+        except ValueError:
+            pass
+    try:
+        return float(since)
+    except ValueError:
+        return datetime.datetime.fromisoformat(since).timestamp()
+
+
+class ResultsDb(object):
+    """
+    SQLite database (WAL mode) with one row per tested testcase and its mutated
+    params, unit and system outcomes, exception signature and stage timings.
+
+    `record` is called from the fuzz loop and only queues the rows; they are
+    written in one transaction when `flushRows` testcases are pending or
+    `flushInterval` seconds passed since the last write. Readers such as
+    `ResultsQuery` are not blocked by the writer.
+    """
+
+    def __init__(self, path: str, flushInterval: float = 10.0, flushRows: int = 64) -> None:
+        self.logger = getLogger()
+        self.path: str = path
+        self.flushInterval: float = flushInterval
+        self.flushRows: int = flushRows
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self.nextId: int = (self.conn.execute("SELECT MAX(id) FROM testcases").fetchone()[0] or 0) + 1
+        self.pending: Dict[str, List[tuple]] = {table: [] for table in TABLES}
+        self.pendingTestcases: int = 0
+        self.lastFlushTime: float = time.time()
+        self.lock = threading.Lock()
+
+    def record(self, testcase, utResult=None, sysResult=None, pooled: bool = False, when: float = None) -> int:
+        """
+        Queue the results of `testcase` and return its id in the database.
+        """
+        when = time.time() if when is None else when
+        with self.lock:
+            testcaseId = self.nextId
+            self.nextId += 1
+            pending = self.pending
+            pending['testcases'].append((testcaseId, testcase.fileName or None, when, int(pooled)))
+            pending['params'].extend((testcaseId, item.name, item.value)
+                                     for item in testcase.confItemList if item.isMutated)
+            if utResult is not None:
+                # descriptions are only kept for failures, they are long and say little otherwise
+                pending['unit_outcomes'].append((testcaseId, utResult.status, utResult.failed_tests_count,
+                                                 utResult.description if utResult.status != 0 else None))
+                pending['timings'].append((testcaseId, 'unit', utResult.duration))
+            if sysResult is not None:
+                pending['system_outcomes'].append((testcaseId, sysResult.status, sysResult.sysFailType,
+                                                   sysResult.newCoverage,
+                                                   sysResult.description if sysResult.status != 0 else None))
+                pending['timings'].append((testcaseId, 'system', sysResult.duration))
+                if sysResult.exception:
+                    pending['exceptions'].append((testcaseId, sysResult.exception, int(sysResult.newException), when))
+            self.pendingTestcases += 1
+            due = self.pendingTestcases >= self.flushRows or time.time() - self.lastFlushTime >= self.flushInterval
+        if due:
+            self.flush()
+        return testcaseId
+
+    def flush(self) -> None:
+        with self.lock:
+            self.lastFlushTime = time.time()
+            if self.pendingTestcases == 0:
+                return
+            try:
+                with self.conn:
+                    for table in TABLES:
+                        if self.pending[table]:
+                            self.conn.executemany(INSERTS[table], self.pending[table])
+            except sqlite3.Error as e:
+                # the fuzz loop goes on, the rows are kept for the next flush
+                self.logger.info(f">>>>[ResultsDb] writing {self.pendingTestcases} testcases failed: {e}")
+                return
+            for rows in self.pending.values():
+                rows.clear()
+            self.pendingTestcases = 0
+
+    def reset(self) -> None:
+        """
+        Drop every result, like deleting the result directories of a new campaign.
+        """
+        with self.lock:
+            with self.conn:
+                for table in TABLES:
+                    self.conn.execute(f"DELETE FROM {table}")
+            for rows in self.pending.values():
+                rows.clear()
+            self.pendingTestcases = 0
+            self.nextId = 1
+
+    def close(self) -> None:
+        self.flush()
+        with self.lock:
+            self.conn.close()
+
+
+class ResultsQuery(object):
+    """
+    Read-only queries on a results database, usable while the fuzzer writes it.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+
+    def sql(self, query: str, args: Sequence = ()) -> List[tuple]:
+        return self.conn.execute(query, args).fetchall()
+
+    def summary(self) -> Dict[str, int]:
+        row = self.conn.execute("""
+            SELECT (SELECT COUNT(*) FROM testcases),
+                   (SELECT COUNT(*) FROM unit_outcomes WHERE status != 0),
+                   (SELECT COUNT(*) FROM system_outcomes),
+                   (SELECT COUNT(*) FROM system_outcomes WHERE status != 0),
+                   (SELECT COUNT(DISTINCT signature) FROM exceptions),
+                   (SELECT COUNT(*) FROM testcases WHERE pooled != 0)
+        """).fetchone()
+        summary = dict(zip(('testcases', 'unit_failed', 'system_tested', 'system_failed', 'exceptions', 'pooled'),
+                           row))
+        for failType, count in self.conn.execute(
+                "SELECT fail_type, COUNT(*) FROM system_outcomes WHERE status != 0 GROUP BY fail_type"):
+            summary[f'system_failed_type{failType}'] = count
+        return summary
+
+    def exceptions(self, since: float = None) -> List[Tuple[str, int, float, float]]:
+        """
+        Each exception signature with the number of testcases that raised it, first and last time.
+        """
+        return self.conn.execute("""
+            SELECT signature, COUNT(*), MIN(time), MAX(time) FROM exceptions
+            WHERE time >= ? GROUP BY signature ORDER BY COUNT(*) DESC
+        """, (since or 0,)).fetchall()
+
+    def newExceptions(self, since: float = None) -> List[Tuple[float, str, str, str]]:
+        """
+        The exceptions first raised since `since`, with the testcase that raised them and its mutated params.
+        """
+        return self.conn.execute("""
+            SELECT e.time, e.signature, t.name, GROUP_CONCAT(p.name || '=' || p.value, ' ')
+            FROM exceptions e JOIN testcases t ON t.id = e.testcase_id
+            LEFT JOIN params p ON p.testcase_id = e.testcase_id
+            WHERE e.is_new != 0 AND e.time >= ?
+            GROUP BY e.testcase_id ORDER BY e.time
+        """, (since or 0,)).fetchall()
+
+    def params(self, exception: str = None, since: float = None, newOnly: bool = False) -> List[Tuple[str, int]]:
+        """
+        The mutated params of the testcases that raised an exception (`exception`,
+        or any), ranked by how many of those testcases mutated them.
+        """
+        query = """
+            SELECT p.name, COUNT(DISTINCT e.testcase_id) FROM exceptions e
+            JOIN params p ON p.testcase_id = e.testcase_id
+            WHERE e.time >= ?
+        """
+        args = [since or 0]
+        if exception is not None:
+            query += " AND e.signature = ?"
+            args.append(exception)
+        if newOnly:
+            query += " AND e.is_new != 0"
+        query += " GROUP BY p.name ORDER BY COUNT(DISTINCT e.testcase_id) DESC, p.name"
+        return self.conn.execute(query, args).fetchall()
+
+    def param(self, name: str) -> List[Tuple[str, int, int, int]]:
+        """
+        For each value `name` was mutated to: testcases, unit failures and system failures.
+        """
+        return self.conn.execute("""
+            SELECT p.value, COUNT(*), SUM(COALESCE(u.status, 0) != 0), SUM(COALESCE(s.status, 0) != 0)
+            FROM params p
+            LEFT JOIN unit_outcomes u ON u.testcase_id = p.testcase_id
+            LEFT JOIN system_outcomes s ON s.testcase_id = p.testcase_id
+            WHERE p.name = ? GROUP BY p.value ORDER BY COUNT(*) DESC
+        """, (name,)).fetchall()
+
+    def slowest(self, stage: str, limit: int = 10) -> List[Tuple[str, float]]:
+        return self.conn.execute("""
+            SELECT t.name, g.seconds FROM timings g JOIN testcases t ON t.id = g.testcase_id
+            WHERE g.stage = ? ORDER BY g.seconds DESC LIMIT ?
+        """, (stage, limit)).fetchall()
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+def formatTime(value: float) -> str:
+    return datetime.datetime.fromtimestamp(value).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def main(argv: Sequence[str] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m utils.ResultsDb", description="Query a campaign results database.")
+    parser.add_argument("db", help="path of the results database (`results_db_path`)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("summary", help="testcase and failure counts")
+    exceptions = commands.add_parser("exceptions", help="exception signatures by number of testcases")
+    exceptions.add_argument("--since", help="age (30m, 1h, 2d), unix time or ISO date")
+    newExceptions = commands.add_parser("new-exceptions", help="exceptions first raised since a time")
+    newExceptions.add_argument("--since", help="age (30m, 1h, 2d), unix time or ISO date")
+    params = commands.add_parser("params", help="params mutated by the testcases raising exceptions")
+    params.add_argument("--exception", help="only this exception signature")
+    params.add_argument("--since", help="age (30m, 1h, 2d), unix time or ISO date")
+    params.add_argument("--new", action="store_true", help="only exceptions raised for the first time")
+    param = commands.add_parser("param", help="outcomes for each value of a param")
+    param.add_argument("name")
+    slowest = commands.add_parser("slowest", help="testcases with the slowest stage")
+    slowest.add_argument("--stage", default="system", choices=("unit", "system"))
+    slowest.add_argument("--limit", type=int, default=10)
+    sql = commands.add_parser("sql", help="any read-only SQL query")
+    sql.add_argument("query")
+    args = parser.parse_args(argv)
+
+    query = ResultsQuery(args.db)
+    if args.command == "summary":
+        rows = list(query.summary().items())
+    elif args.command == "exceptions":
+        rows = [(sig, count, formatTime(first), formatTime(last))
+                for sig, count, first, last in query.exceptions(parseSince(args.since))]
+    elif args.command == "new-exceptions":
+        rows = [(formatTime(when), sig, name, params)
+                for when, sig, name, params in query.newExceptions(parseSince(args.since))]
+    elif args.command == "params":
+        rows = query.params(args.exception, parseSince(args.since), args.new)
+    elif args.command == "param":
+        rows = query.param(args.name)
+    elif args.command == "slowest":
+        rows = query.slowest(args.stage, args.limit)
+    else:
+        rows = query.sql(args.query)
+    query.close()
+    for row in rows:
+        print("\t".join("" if value is None else str(value) for value in row))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
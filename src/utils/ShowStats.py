@@ -1,8 +1,11 @@
+import asyncio
 import time
 
 from reprint import output
 
 from utils.Configuration import Configuration
+from utils.EventLoop import EventLoop
+from utils.TimeSeries import TimeSeriesWriter
 
 
 # import curses
@@ -45,6 +48,14 @@ class ShowStats(object):
 
     #seedGenerator.py
     queueLength: int = 0
+    #SystemTester.py, JaCoCo coverage feedback
+    coveredProbes: int = 0
+    coverageOverhead: float = 0.0
+    #fuzzer.py, testcases kept because they reached new probes
+    coverageSeeds: int = 0
+    #TestcaseGenerator.py, testcases rejected as already generated
+    generatedTestcases: int = 0
+    duplicateTestcases: int = 0
     #unit test
     # totalUnitTestFailed: int = 0
     #system test
@@ -60,58 +71,77 @@ class ShowStats(object):
 
     #SeedGenerator.py, TestcaseGenerator.py, TestValidator.py
     currentJob: str = 'init...'
+    #fuzzer.py, busy share of each stage of the pipelined loop
+    stageOccupancy: str = 'off'
     
     # 距离上一次发现第二第三类错误的时间
     lastError23 : float = 0.0 
     stackMutationFlag : int = 0
     
     @staticmethod
-    def initPlotData():
-        plotDataPath = Configuration.fuzzerConf['plot_data_path']
-        with open(plotDataPath, 'w') as f:
-            f.write("time, loop_counts, iteration_counts, "
-                    "unit_testcase_cnt, unit_ctests_cnt ,system_test_cnt, system_test_failures, "
-                    "total system test failed1, total system test failed2, "
-                    "total system test failed3, "
-                    "longest system test time, average unit test time, average system test time, "
-                    "total unit test cases, total run unit test count, "
-                    "total system test cases, unit test cmd timeout, "
-                    "unit test exec speed, system test exec speed, "
-                    "ecFuzz exec speed, "
-                    "queue length, total system test failed"
-                    "\n"
-                    )
+    def snapshot() -> dict:
+        # all scalar counters; the start time is stored as elapsed time and rebased on restore
+        stats = {name: value for name, value in vars(ShowStats).items()
+                 if not name.startswith('_') and isinstance(value, (int, float, str))}
+        stats['fuzzerStartTime'] = time.time() - ShowStats.fuzzerStartTime
+        return stats
+
+    @staticmethod
+    def restore(stats: dict):
+        for name, value in stats.items():
+            setattr(ShowStats, name, value)
+        ShowStats.fuzzerStartTime = time.time() - stats.get('fuzzerStartTime', 0.0)
 
+    # plot data columns and the attribute each one records, `time` is int(runTime)
+    plotColumns = [("time", "runTime"), ("loop_counts", "loopCounts"), ("iteration_counts", "iterationCounts"),
+                   ("unit_testcase_cnt", "totalUnitTestcases"), ("unit_ctests_cnt", "totalRunUnitTestsCount"),
+                   ("system_test_cnt", "totalSystemTestcases"), ("system_test_failures", "totalSystemTestFailed"),
+                   ("total system test failed1", "totalSystemTestFailed_Type1"),
+                   ("total system test failed2", "totalSystemTestFailed_Type2"),
+                   ("total system test failed3", "totalSystemTestFailed_Type3"),
+                   ("longest system test time", "longgestSystemTestTime"),
+                   ("average unit test time", "averageUnitTestTime"),
+                   ("average system test time", "averageSystemTestTime"),
+                   ("total unit test cases", "totalUnitTestcases"),
+                   ("total run unit test count", "totalRunUnitTestsCount"),
+                   ("total system test cases", "totalSystemTestcases"), ("unit test cmd timeout", "unitCmdTimeout"),
+                   ("unit test exec speed", "unitTestExecSpeed"), ("system test exec speed", "systemTestExecSpeed"),
+                   ("ecFuzz exec speed", "ecFuzzExecSpeed"), ("queue length", "queueLength"),
+                   ("total system test failed", "totalSystemTestFailed"),
+                   ("duplicate testcases", "duplicateTestcases")]
+    plotWriter = None
+
+    @staticmethod
+    def openPlotData(truncate: bool) -> None:
+        fuzzerConf = Configuration.fuzzerConf
+        ShowStats.plotWriter = TimeSeriesWriter(fuzzerConf['plot_data_path'],
+                                                [column for column, _ in ShowStats.plotColumns], truncate,
+                                                float(fuzzerConf.get('plot_flush_interval', 10)),
+                                                int(fuzzerConf.get('plot_flush_rows', 32)))
+
+    @staticmethod
+    def initPlotData():
+        ShowStats.openPlotData(truncate=True)
 
     @staticmethod
     def writeToPlotData():
-        plotDataPath = Configuration.fuzzerConf['plot_data_path']
-        with open(plotDataPath, 'a+') as f:
-            f.write(f"{int(ShowStats.runTime)}, "
-                    f"{ShowStats.loopCounts}, "
-                    f"{ShowStats.iterationCounts}, "
-                    f"{ShowStats.totalUnitTestcases}, "
-                    f"{ShowStats.totalRunUnitTestsCount}, "
-                    f"{ShowStats.totalSystemTestcases}, "
-                    f"{ShowStats.totalSystemTestFailed},"
-                    f"{ShowStats.totalSystemTestFailed_Type1}, "
-                    f"{ShowStats.totalSystemTestFailed_Type2}, "
-                    f"{ShowStats.totalSystemTestFailed_Type3}, "
-                    f"{ShowStats.longgestSystemTestTime}, "
-                    f"{ShowStats.averageUnitTestTime}, "
-                    f"{ShowStats.averageSystemTestTime}, "
-                    f"{ShowStats.totalUnitTestcases}, "
-                    f"{ShowStats.totalRunUnitTestsCount}, "
-                    f"{ShowStats.totalSystemTestcases}, "
-                    f"{ShowStats.unitCmdTimeout}, "
-                    f"{ShowStats.unitTestExecSpeed}, "
-                    f"{ShowStats.systemTestExecSpeed}, "
-                    f"{ShowStats.ecFuzzExecSpeed}, "
-                    f"{ShowStats.queueLength}, "
-                    f"{ShowStats.totalSystemTestFailed}"
-                    "\n"
-                    )
+        # rows are buffered, see TimeSeriesWriter
+        if ShowStats.plotWriter is None:
+            ShowStats.openPlotData(truncate=False)
+        row = [getattr(ShowStats, attribute) for _, attribute in ShowStats.plotColumns]
+        row[0] = int(row[0])
+        ShowStats.plotWriter.append(row)
+
+    @staticmethod
+    def flushPlotData():
+        if ShowStats.plotWriter is not None:
+            ShowStats.plotWriter.flush()
 
+    @staticmethod
+    def duplicateRate() -> float:
+        if ShowStats.generatedTestcases == 0:
+            return 0.0
+        return ShowStats.duplicateTestcases / ShowStats.generatedTestcases
 
     @staticmethod
     def getTime(seconds: int):
@@ -140,12 +170,17 @@ class ShowStats(object):
 
     @staticmethod
     def run(stopSoon) -> None:
+        # blocks until the display is done, it refreshes on the shared event loop
+        EventLoop.shared().run(ShowStats.display(stopSoon))
+
+    @staticmethod
+    async def display(stopSoon) -> None:
         # curses.initscr()
         # curses.curs_set(0)
  
         # print("\33[2J")
         print("\33[?25l ")
-        with output(initial_len=26, interval=0) as output_lines:
+        with output(initial_len=30, interval=0) as output_lines:
             while True:
                 output_lines[0]  = f"\033[33m          effective configuration fuzzing \033[32m({Configuration.fuzzerConf['project']})           "
                 output_lines[1]  = f"\033[34m-------------------------------Time--------------------------------"
@@ -169,15 +204,19 @@ class ShowStats(object):
                 output_lines[19] = f"\033[34m-------------------------Overall results---------------------------"
                 output_lines[20] = f"\033[36m                 fuzzing progress: \033[37m{ShowStats.loopCounts}:{ShowStats.iterationCounts}({ShowStats.currentJob})"
                 output_lines[21] = f"\033[36m                     queue length: \033[37m{ShowStats.queueLength}"
-                output_lines[22] = f"\033[36m         total system test failed: \033[37m{ShowStats.totalSystemTestFailed} ({ShowStats.totalSystemTestFailed_Type1}, {ShowStats.totalSystemTestFailed_Type2}, {ShowStats.totalSystemTestFailed_Type3})"
-                output_lines[23] = f"\033[34m------------------------------End----------------------------------"
-                output_lines[24] = " "
+                output_lines[22] = f"\033[36m              duplicate testcases: \033[37m{ShowStats.duplicateTestcases} ({ShowStats.duplicateRate():.1%})"
+                output_lines[23] = f"\033[36m         total system test failed: \033[37m{ShowStats.totalSystemTestFailed} ({ShowStats.totalSystemTestFailed_Type1}, {ShowStats.totalSystemTestFailed_Type2}, {ShowStats.totalSystemTestFailed_Type3})"
+                output_lines[24] = f"\033[36m                  stage occupancy: \033[37m{ShowStats.stageOccupancy}"
+                output_lines[25] = f"\033[36m                   covered probes: \033[37m{ShowStats.coveredProbes}"
+                output_lines[26] = f"\033[36m                coverage overhead: \033[37m{ShowStats.coverageOverhead:.1%}"
+                output_lines[27] = f"\033[34m------------------------------End----------------------------------"
+                output_lines[28] = " "
                 if not stopSoon.empty():
-                    output_lines[25] = f"\033[32m Have a good day!"
+                    output_lines[29] = f"\033[32m Have a good day!"
                     # print("\033[37m")
                     # print("\33[?25h")
                     break
-                time.sleep(1)
+                await asyncio.sleep(1)
                 ShowStats.runTime = time.time() - ShowStats.fuzzerStartTime
             # print("         fast configuration fuzzing (", Configuration.fuzzerConf['project'],")           ")
             # print("-------------------------------Time--------------------------------")
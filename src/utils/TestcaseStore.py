@@ -0,0 +1,187 @@
+import hashlib
+import os
+import threading
+import zlib
+from typing import Dict, List, Optional
+
+from utils.Logger import getLogger
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+class StoredTestcase(object):
+    """
+    A reference to a testcase in the store: the result directory it belongs to
+    (`label`), the file name it would have had, its extension and its content hash.
+    """
+    __slots__ = ('label', 'name', 'extension', 'digest')
+
+    def __init__(self, label: str, name: str, extension: str, digest: str) -> None:
+        self.label: str = label
+        self.name: str = name
+        self.extension: str = extension
+        self.digest: str = digest
+
+    @property
+    def fileName(self) -> str:
+        return f"{self.name}{self.extension}"
+
+
+class TestcaseStore(object):
+    """
+    Content-addressed, append-only store for testcase files.
+
+    The rendered testcases (see `Testcase.render`) are compressed one by one
+    (zstd if `zstandard` is installed, zlib otherwise) and appended to
+    `testcases.pack`; identical contents are stored once. `testcases.idx` is an
+    append-only text index with two kinds of lines:
+
+        E <digest> <offset> <length> <codec>       a blob in the pack
+        R <label> <name> <extension> <digest>      a testcase saved under a label
+
+    Both files are only appended to and the index line is written after its blob,
+    so a crash can at worst lose the last testcase. `materialize` writes a stored
+    testcase back as a regular file, for injection or replay.
+    """
+
+    packName = "testcases.pack"
+    indexName = "testcases.idx"
+
+    def __init__(self, storeDir: str, level: int = 3) -> None:
+        self.logger = getLogger()
+        self.storeDir: str = storeDir
+        os.makedirs(storeDir, exist_ok=True)
+        self.level: int = level
+        self.codec: str = 'zstd' if zstandard is not None else 'zlib'
+        # digest -> (offset, length, codec)
+        self.blobs: Dict[str, tuple] = {}
+        self.refs: List[StoredTestcase] = []
+        self.byName: Dict[str, StoredTestcase] = {}
+        self.dedupHits: int = 0
+        self.lock = threading.Lock()
+        self.loadIndex()
+        self.pack = open(os.path.join(storeDir, TestcaseStore.packName), 'ab')
+        self.index = open(os.path.join(storeDir, TestcaseStore.indexName), 'a', encoding='utf-8')
+
+    def loadIndex(self) -> None:
+        indexPath = os.path.join(self.storeDir, TestcaseStore.indexName)
+        if not os.path.exists(indexPath):
+            return
+        with open(indexPath, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.endswith('\n'):
+                    # torn last line of a crashed run
+                    break
+                fields = line.rstrip('\n').split('\t')
+                if fields[0] == 'E' and len(fields) == 5:
+                    self.blobs[fields[1]] = (int(fields[2]), int(fields[3]), fields[4])
+                elif fields[0] == 'R' and len(fields) == 5:
+                    self.addRef(StoredTestcase(*fields[1:]))
+        self.logger.info(f">>>>[TestcaseStore] loaded {len(self.refs)} testcases, {len(self.blobs)} blobs")
+
+    def addRef(self, ref: StoredTestcase) -> None:
+        self.refs.append(ref)
+        self.byName[ref.name] = ref
+
+    def compress(self, data: bytes) -> bytes:
+        if self.codec == 'zstd':
+            return zstandard.ZstdCompressor(level=self.level).compress(data)
+        return zlib.compress(data, self.level)
+
+    @staticmethod
+    def decompress(blob: bytes, codec: str) -> bytes:
+        if codec == 'zstd':
+            if zstandard is None:
+                raise RuntimeError("the testcase store was written with zstd, install `zstandard` to read it")
+            return zstandard.ZstdDecompressor().decompress(blob)
+        return zlib.decompress(blob)
+
+    def putBytes(self, data: bytes) -> str:
+        """
+        Store `data` if it is new and return its digest.
+        """
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        with self.lock:
+            if digest in self.blobs:
+                self.dedupHits += 1
+                return digest
+            blob = self.compress(data)
+            offset = self.pack.tell()
+            self.pack.write(blob)
+            self.pack.flush()
+            self.blobs[digest] = (offset, len(blob), self.codec)
+            self.index.write(f"E\t{digest}\t{offset}\t{len(blob)}\t{self.codec}\n")
+            self.index.flush()
+        return digest
+
+    def put(self, testcase, label: str) -> Optional[StoredTestcase]:
+        """
+        Store `testcase` under `label` (e.g. the result directory it used to be
+        copied to). The testcase gets a file name if it has none yet.
+        """
+        rendered = testcase.render()
+        if rendered is None:
+            return None
+        content, extension = rendered
+        if not testcase.fileName:
+            testcase.fileName = testcase.generateFileName()
+        ref = StoredTestcase(label, testcase.fileName, extension, self.putBytes(content))
+        with self.lock:
+            self.addRef(ref)
+            self.index.write(f"R\t{ref.label}\t{ref.name}\t{ref.extension}\t{ref.digest}\n")
+            self.index.flush()
+        return ref
+
+    def get(self, digest: str) -> bytes:
+        with self.lock:
+            offset, length, codec = self.blobs[digest]
+            self.pack.flush()
+        with open(os.path.join(self.storeDir, TestcaseStore.packName), 'rb') as f:
+            f.seek(offset)
+            blob = f.read(length)
+        return TestcaseStore.decompress(blob, codec)
+
+    def find(self, label: str = None) -> List[StoredTestcase]:
+        """
+        The stored testcases, in the order they were saved, optionally only those under `label`.
+        """
+        with self.lock:
+            return [ref for ref in self.refs if label is None or ref.label == label]
+
+    def materialize(self, ref, fileDir: str) -> str:
+        """
+        Write a stored testcase (a StoredTestcase or a testcase name) into `fileDir`
+        and return the file path.
+        """
+        if isinstance(ref, str):
+            ref = self.byName[ref]
+        os.makedirs(fileDir, exist_ok=True)
+        filePath = os.path.join(fileDir, ref.fileName)
+        with open(filePath, 'wb') as f:
+            f.write(self.get(ref.digest))
+        return filePath
+
+    def reset(self) -> None:
+        """
+        Drop every stored testcase, like deleting the result directories of a new campaign.
+        """
+        with self.lock:
+            # truncate keeps the position, which `putBytes` uses as the next offset
+            for f in (self.pack, self.index):
+                f.truncate(0)
+                f.seek(0)
+            self.blobs.clear()
+            self.refs.clear()
+            self.byName.clear()
+            self.dedupHits = 0
+
+    def __len__(self) -> int:
+        return len(self.refs)
+
+    def close(self) -> None:
+        with self.lock:
+            self.pack.close()
+            self.index.close()
@@ -0,0 +1,112 @@
+import os
+import struct
+import threading
+import time
+from typing import List, Sequence, Tuple
+
+from utils.Logger import getLogger
+
+MAGIC = b'TSv1'
+
+
+def binaryPath(csvPath: str) -> str:
+    """
+    The binary sidecar of the CSV file `csvPath`.
+    """
+    return f"{csvPath}.bin"
+
+
+class TimeSeriesWriter(object):
+    """
+    Buffered writer for a numeric time series, e.g. the plot data of `ShowStats`.
+
+    Rows are kept in memory and written when `flushRows` rows are pending or
+    `flushInterval` seconds passed since the last write, instead of opening the
+    file for every row. Each flush appends the rows to the CSV file (same format
+    as before, for people and scripts) and to a binary sidecar with fixed-width
+    float64 rows, which `TimeSeriesReader` reads incrementally: row N starts at
+    `headerSize + N * rowSize`, so no separate index is needed.
+    """
+
+    def __init__(self, csvPath: str, columns: Sequence[str], truncate: bool = False, flushInterval: float = 10.0,
+                 flushRows: int = 32) -> None:
+        self.logger = getLogger()
+        self.csvPath: str = csvPath
+        self.columns: List[str] = list(columns)
+        self.flushInterval: float = flushInterval
+        self.flushRows: int = flushRows
+        self.rowFormat = struct.Struct(f'<{len(self.columns)}d')
+        self.pending: List[Tuple[float, ...]] = []
+        self.lastFlushTime: float = time.time()
+        self.lock = threading.Lock()
+        if truncate or not os.path.exists(csvPath):
+            with open(csvPath, 'w') as f:
+                f.write(", ".join(self.columns) + "\n")
+        if truncate or not os.path.exists(binaryPath(csvPath)):
+            self.createBinary()
+
+    def createBinary(self) -> None:
+        header = "\t".join(self.columns).encode('utf-8')
+        rows = []
+        # rows of an existing CSV (a campaign resumed from before the sidecar existed)
+        with open(self.csvPath, 'r') as f:
+            next(f, None)
+            for line in f:
+                if line.strip():
+                    rows.append(tuple(float(x) for x in line.split(',')))
+        with open(binaryPath(self.csvPath), 'wb') as f:
+            f.write(MAGIC + struct.pack('<I', len(header)) + header)
+            for row in rows:
+                f.write(self.rowFormat.pack(*row))
+
+    def append(self, row: Sequence[float]) -> None:
+        if len(row) != len(self.columns):
+            raise ValueError(f"expected {len(self.columns)} values, got {len(row)}")
+        with self.lock:
+            self.pending.append(tuple(row))
+            due = len(self.pending) >= self.flushRows or time.time() - self.lastFlushTime >= self.flushInterval
+        if due:
+            self.flush()
+
+    def flush(self) -> None:
+        with self.lock:
+            rows, self.pending = self.pending, []
+            self.lastFlushTime = time.time()
+            if not rows:
+                return
+            with open(self.csvPath, 'a') as f:
+                f.write("".join(", ".join(str(value) for value in row) + "\n" for row in rows))
+            with open(binaryPath(self.csvPath), 'ab') as f:
+                f.write(b"".join(self.rowFormat.pack(*row) for row in rows))
+
+
+class TimeSeriesReader(object):
+    """
+    Reads the binary sidecar written by `TimeSeriesWriter`, a few rows at a time.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path: str = path
+        with open(path, 'rb') as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{path} is not a time series file")
+            headerLength, = struct.unpack('<I', f.read(4))
+            self.columns: List[str] = f.read(headerLength).decode('utf-8').split("\t")
+        self.headerSize: int = len(MAGIC) + 4 + headerLength
+        self.rowFormat = struct.Struct(f'<{len(self.columns)}d')
+
+    def rowCount(self) -> int:
+        # a row being written is not counted until it is complete
+        return (os.path.getsize(self.path) - self.headerSize) // self.rowFormat.size
+
+    def rowsSince(self, offset: int) -> Tuple[List[Tuple[float, ...]], int]:
+        """
+        The rows from row `offset` on, and the offset to pass next time.
+        """
+        count = self.rowCount()
+        if offset >= count:
+            return [], offset
+        with open(self.path, 'rb') as f:
+            f.seek(self.headerSize + offset * self.rowFormat.size)
+            data = f.read((count - offset) * self.rowFormat.size)
+        return list(self.rowFormat.iter_unpack(data)), count
@@ -0,0 +1,247 @@
+# some special param's value
+FILEPATHS = ["/valid/file1", "/valid/file2", "/dev/shm", "@name@", "///file", "/", ""]
+DIRPATHS = ["/valid/dir1", "/valid/dir2", "/dev/shm", "valid/dir", "@name@", "file:///root/hdfs", "/", ""]
+USERS = ['xdsuper', 'samsuper', "hadoop", "+-#$", "12", "root"]
+GROUPS = ['xdgroup', 'samgroup', "hadoop", "+-#$", "12", "root"]
+PORTS = ["3000", "3001", "80", "0", "-1", "65599", "@@", "[names]"]
+NAMESERVICES = ["ns1", "ns2", "@root", "11"]
+INTERFACES = ["eth1", "eth2", "0", "@[+]@"]
+IPS = ["127.0.0.1"]
+PERMISSIONMASKS = ["007", "002", "999", "rwx", "4444", "777", "755"]
+PERMISSIONCODES = ["rwx------", "rwxrwx---", "rwx++++++" ,"oxw---ikd", "111", "#&^%Zio"]
+IPVALUES = ["127.0.0.1","192.168.2.53","0.0.0.0","728.59.66.723","255.255.255.255","isip@"]
+timeunits = ["ms", "millisecond", "s", "sec", "second", "m", "min", "minute", "h", "hr", "hour", "d", "day"]
+datasize = ["MB"]
+
+import random, re, sys
+from typing import Callable, Dict, List, Tuple
+
+FLOAT_SUFFIX = re.compile(r"^\d+\.\d+[fF]$")
+
+
+# Candidate values of a configuration item, given its current value. NewValue picks
+# one uniformly per call; ValueEngine builds each table once per (type, value).
+
+def intDomain(value) -> List[int]:
+    try:
+        tmp = int(value)
+    except (ValueError, TypeError):
+        # 如果转换失败（例如遇到变量引用），默认使用 1
+        tmp = 1
+    return [tmp + 1, tmp - 1, tmp >> 1, tmp << 1, 0, -tmp, -1, 99999999, -99999999, 2**32 - 1, -2**32]
+
+
+def floatDomain(value) -> List[float]:
+    s = value
+    if FLOAT_SUFFIX.match(s):
+        s = s[:-1]
+    try:
+        val = float(s)
+    except (ValueError, TypeError):
+        val = 1.0
+    return [val/2, val*2, -val, 0.0, val+1, val-1, -1.0, float(2**32-1), float(-2**32), 99999999.8, -99999999.8]
+
+
+def ipPortDomain(value) -> List[str]:
+    s = value[:value.find(":")]
+    return [f"{s}:{str(PORTS[0])}", f"{s}:{str(PORTS[1])}", f"{s}:20000", f"{s}:22", f"{s}:65599",
+            f"745.657.25.3:{str(PORTS[3])}", f"{s}:{str(PORTS[4])}"]
+
+
+def unitDomain(value: str, units: List[str], lowerCaseForm: str) -> List[str]:
+    """
+    Boundary values in the unit of `value`; empty if `value` is not an int with one of `units`.
+    """
+    res = []
+    for unit in units:
+        if value.endswith(unit):
+            t = value[:value.find(unit)]
+            try:
+                t = int(t)
+            except ValueError:
+                continue
+            res.extend(["1"+unit, str(2*t)+unit, str(10*t)+unit, "0"+unit, "-"+str(t)+unit, "-100"+unit,
+                        "00x", "999999"+unit, lowerCaseForm])
+    return res
+
+
+def timeDomain(value) -> List[str]:
+    return unitDomain(value, timeunits, "00s")
+
+
+def dataSizeDomain(value) -> List[str]:
+    return unitDomain(value, datasize, "00mb")
+
+
+def intListValue(value: str, rand: Callable[[], float]) -> str:
+    # same size compared to old list
+    res = []
+    for val in value.split(","):
+        r = rand()
+        try:
+            if(r < 0.1):
+                res.append(int(val)<<1)
+            elif(r < 0.2):
+                res.append(-1)
+            elif(r < 0.3):
+                res.append(int(val)>>1)
+            elif(r < 0.4):
+                res.append(1)
+            elif(r < 0.5):
+                res.append(0)
+            elif(r < 0.6):
+                res.append(0.0)
+            elif(r < 0.75):
+                res.append(-int(val))
+            elif(r < 0.9):
+                res.append(sys.maxsize)
+            else:
+                res.append(-sys.maxsize-1)
+        except Exception:
+            res.append(val)
+    return str(res)[1:-1]
+
+
+def stringListValue(value: str, rand: Callable[[], float]) -> str:
+    res = []
+    for val in value.split(","):
+        if (len(val)>0):
+            r = rand()
+            length = len(val)//2
+            if (r < 0.1):
+                res.append(f"/{val}")
+            elif (r < 0.2):
+                res.append(f"@/+{val}")
+            elif (r < 0.3):
+                res.append(f"{val}/")
+            elif (r < 0.4):
+                res.append(f"{val}@/-")
+            elif(r < 0.5):
+                res.append("null")
+            elif(r < 0.75):
+                res.append(val[length:]+val[:length-1])
+            elif(r < 0.9):
+                res.append(val[:length])
+            else:
+                res.append(val[length:])
+        else:
+            res.append(val)
+    return str(res)[1:-2]
+
+
+class RandomBuffer(object):
+    """
+    Random numbers drawn in batches of `size` and handed out one by one.
+    Uses a NumPy `Generator` when NumPy is installed, the `random` module otherwise.
+    """
+
+    def __init__(self, size: int = 4096, seed: int = None) -> None:
+        self.size = size
+        try:
+            import numpy
+            self.rng = numpy.random.default_rng(seed)
+        except ImportError:
+            self.rng = None
+            self.random = random.Random(seed) if seed is not None else random
+        self.floats: List[float] = []
+
+    def nextFloat(self) -> float:
+        if not self.floats:
+            if self.rng is not None:
+                self.floats = self.rng.random(self.size).tolist()
+            else:
+                r = self.random.random
+                self.floats = [r() for _ in range(self.size)]
+        return self.floats.pop()
+
+    def index(self, n: int) -> int:
+        return int(self.nextFloat() * n)
+
+    def string(self, maxLength: int, charStart: int = 32, charRange: int = 90) -> str:
+        length = self.index(maxLength + 1)
+        if self.rng is not None:
+            return "".join(map(chr, self.rng.integers(charStart, charStart + charRange, size=length).tolist()))
+        return "".join(chr(charStart + self.index(charRange)) for _ in range(length))
+
+
+class ValueEngine(object):
+    """
+    Generate new values for configuration items from cached per-(type, value) tables.
+
+    The candidate values of a type only depend on the current value, so each table
+    is built once and afterwards a value costs one dict lookup and one buffered
+    random draw. Types are dispatched through a dict instead of an if-chain.
+    `genValues` generates a whole batch, e.g. for a stacked mutation.
+    """
+
+    maxTables: int = 100000
+
+    def __init__(self, bufferSize: int = 4096, seed: int = None) -> None:
+        self.random = RandomBuffer(bufferSize, seed)
+        self.tables: Dict[Tuple[str, str], List[str]] = {}
+        self.generators: Dict[str, Callable[[str], str]] = {
+            "BOOL": self.genBool,
+            "PORT": self.fixedTable(PORTS),
+            "PM": self.fixedTable(PERMISSIONMASKS),
+            "INT": self.cachedTable("INT", lambda value: [str(v) for v in intDomain(value)]),
+            "FLOAT": self.cachedTable("FLOAT", lambda value: [str(v) for v in floatDomain(value)]),
+            "PC": self.fixedTable(PERMISSIONCODES),
+            "INTLIST": lambda value: intListValue(value, self.random.nextFloat),
+            "STRLIST": lambda value: stringListValue(value, self.random.nextFloat),
+            "IP": self.fixedTable(IPVALUES),
+            "IPPORT": self.cachedTable("IPPORT", ipPortDomain),
+            "CLASSNAME": lambda value: value,
+            "FILEPATH": self.fixedTable(FILEPATHS),
+            "TIME": self.unitTable("TIME", timeDomain, "10" + timeunits[0]),
+            "DATA": self.unitTable("DATA", dataSizeDomain, "10" + datasize[0]),
+            "DIRPATH": self.fixedTable(DIRPATHS),
+            "USER": self.fixedTable(USERS),
+            "GROUP": self.fixedTable(GROUPS),
+            "NAMESERVICES": self.fixedTable(NAMESERVICES),
+            "INTERFACE": self.fixedTable(INTERFACES),
+        }
+
+    def genValue(self, confType: str, value: str) -> str:
+        generator = self.generators.get(confType)
+        if generator is None:
+            return value
+        return generator(value)
+
+    def genValues(self, confTypesAndValues: List[Tuple[str, str]]) -> List[str]:
+        genValue = self.genValue
+        return [genValue(confType, value) for confType, value in confTypesAndValues]
+
+    def genBool(self, value: str) -> str:
+        return "False" if value.lower() == "true" else "True"
+
+    def table(self, confType: str, value: str, build: Callable[[str], List[str]]) -> List[str]:
+        key = (confType, value)
+        table = self.tables.get(key)
+        if table is None:
+            if len(self.tables) >= self.maxTables:
+                self.tables.clear()
+            table = build(value)
+            self.tables[key] = table
+        return table
+
+    def fixedTable(self, table: List[str]) -> Callable[[str], str]:
+        def generate(value: str) -> str:
+            return table[self.random.index(len(table))]
+        return generate
+
+    def cachedTable(self, confType: str, build: Callable[[str], List[str]]) -> Callable[[str], str]:
+        def generate(value: str) -> str:
+            table = self.table(confType, value, build)
+            return table[self.random.index(len(table))]
+        return generate
+
+    def unitTable(self, confType: str, build: Callable[[str], List[str]], default: str) -> Callable[[str], str]:
+        def generate(value: str) -> str:
+            table = self.table(confType, value, build)
+            if table:
+                return table[self.random.index(len(table))]
+            # no recognizable unit: a default value or a random string
+            if self.random.nextFloat() > 0.5:
+                return default
+            return self.random.string(min(len(value)+2, 50))
+        return generate
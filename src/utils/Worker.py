@@ -0,0 +1,120 @@
+import json
+import os
+import socket
+import time
+import uuid
+from queue import Queue
+from typing import List
+from urllib import request
+from urllib.error import URLError
+
+from dataModel.Testcase import Testcase
+from utils.Coordinator import decodeTestcase, encodeResult
+from utils.Logger import getLogger
+
+
+class WorkerClient(object):
+    """
+    Talks to a `CoordinatorServer` at `address` (host:port), sending `token` if the server requires one.
+    """
+
+    def __init__(self, address: str, timeout: float = 30.0, token: str = None) -> None:
+        self.baseUrl: str = address if address.startswith('http') else f'http://{address}'
+        self.timeout: float = timeout
+        self.headers: dict = {'Content-Type': 'application/json'}
+        if token:
+            self.headers['X-Coordinator-Token'] = token
+
+    def call(self, path: str, body: dict = None) -> dict:
+        data = json.dumps(body).encode('utf-8') if body is not None else None
+        req = request.Request(self.baseUrl + path, data=data, headers=self.headers)
+        with request.urlopen(req, timeout=self.timeout) as response:
+            return json.loads(response.read())
+
+    def work(self, worker: str) -> dict:
+        return self.call('/work', {'worker': worker})
+
+    def result(self, worker: str, job: int, utResult, sysResult) -> bool:
+        return self.call('/result', {'worker': worker, 'job': job, 'utResult': encodeResult(utResult),
+                                     'sysResult': encodeResult(sysResult)})['accepted']
+
+    def leave(self, worker: str) -> int:
+        return self.call('/leave', {'worker': worker})['requeued']
+
+    def corpus(self, since: int) -> dict:
+        return self.call(f'/corpus?since={since}')
+
+    def status(self) -> dict:
+        return self.call('/status')
+
+
+class Worker(object):
+    """
+    Pulls testcases from a coordinator, runs them with `testValidator` and pushes the results back.
+
+    The worker keeps a local copy of the shared corpus, fetched incrementally
+    whenever the coordinator reports it grew, and writes new seeds to
+    `corpusDir` if one is given. It can join or leave a campaign at any time;
+    on leaving, its unfinished job goes back to the coordinator.
+    """
+
+    def __init__(self, client: WorkerClient, testValidator, corpusDir: str = None, workerId: str = None,
+                 retryInterval: float = 5.0) -> None:
+        self.logger = getLogger()
+        self.client: WorkerClient = client
+        self.testValidator = testValidator
+        self.corpusDir: str = corpusDir
+        self.workerId: str = workerId or f'{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}'
+        self.retryInterval: float = retryInterval
+        self.corpus: List[Testcase] = []
+        self.corpusOffset: int = 0
+        self.jobsDone: int = 0
+
+    def syncCorpus(self) -> int:
+        """
+        Fetch the seeds added since the last sync. Returns how many were new.
+        """
+        update = self.client.corpus(self.corpusOffset)
+        seeds = [decodeTestcase(confItems) for confItems in update['seeds']]
+        self.corpus.extend(seeds)
+        self.corpusOffset = update['offset']
+        if self.corpusDir:
+            for seed in seeds:
+                seed.writeToFile(fileDir=self.corpusDir)
+        return len(seeds)
+
+    def runOnce(self, stopSoon: Queue) -> bool:
+        """
+        Run one job. Returns False once the coordinator has no more work.
+        """
+        job = self.client.work(self.workerId)
+        if job.get('stop'):
+            return False
+        if job['corpusSize'] > self.corpusOffset:
+            self.syncCorpus()
+        testcase = decodeTestcase(job['testcase'])
+        utResult, sysResult, _ = self.testValidator.runTest(testcase, stopSoon)
+        if not self.client.result(self.workerId, job['job'], utResult, sysResult):
+            self.logger.info(f">>>>[Worker] result of job {job['job']} was rejected, its lease expired")
+        self.jobsDone += 1
+        return True
+
+    def run(self, stopSoon: Queue, maxJobs: int = 0) -> None:
+        self.logger.info(f">>>>[Worker] {self.workerId} joins {self.client.baseUrl}")
+        try:
+            while stopSoon.empty() and (maxJobs <= 0 or self.jobsDone < maxJobs):
+                try:
+                    if not self.runOnce(stopSoon):
+                        break
+                except (URLError, OSError) as e:
+                    self.logger.info(f">>>>[Worker] coordinator unreachable: {e}, retry in {self.retryInterval}s")
+                    time.sleep(self.retryInterval)
+        finally:
+            self.leave()
+
+    def leave(self) -> None:
+        try:
+            self.client.leave(self.workerId)
+        except (URLError, OSError) as e:
+            self.logger.info(f">>>>[Worker] cannot leave the coordinator: {e}")
+        self.logger.info(f">>>>[Worker] {self.workerId} left after {self.jobsDone} jobs")
@@ -13,33 +13,38 @@ errs = {"name": None,
         "operator": None,
         "value": None}
 
+generators = {"Fuzzing": Fuzzing,
+              "ConfErr": ConfErr,
+              "ConfTest": ConfTest,
+              "ConfDiagDetector": ConfDiagDetector,
+              "CaseAlt": CaseAlt}
+
 class MisconfEngine( object ):
 
     def __init__(self):
         self.logger = getLogger()
         self.misconf_mode = Configuration.fuzzerConf['misconf_mode']
 
+    @staticmethod
+    def generate(misconf_mode, option):
+        """
+        Generate all misconfigurations of `option` with the generator of `misconf_mode`.
+        Returns None if the mode is unknown.
+        """
+        if misconf_mode not in generators:
+            return None
+        return generators[misconf_mode]( option ).get_misconfs()
+
+    @staticmethod
+    def is_deterministic(misconf_mode):
+        """
+        Whether the generator of `misconf_mode` always gives the same misconfs for the same option.
+        """
+        return getattr( generators.get( misconf_mode ), "deterministic", True )
+
     def mutate(self, option):
         self.logger.info(f">>>>[MisconfEngine] misconf_mode : {self.misconf_mode}")
-        if self.misconf_mode == "Fuzzing":
-            fuzzing = Fuzzing( option )
-            errs = fuzzing.get_misconfs()
-            return errs
-        elif self.misconf_mode == "ConfErr":
-            conferr = ConfErr( option )
-            errs = conferr.get_misconfs()
-            return errs
-        elif self.misconf_mode == "ConfTest":
-            conftest = ConfTest( option )
-            errs = conftest.get_misconfs()
-            return errs
-        elif self.misconf_mode == "ConfDiagDetector":
-            confdiagdetector = ConfDiagDetector( option )
-            errs = confdiagdetector.get_misconfs()
-            return errs
-        elif self.misconf_mode == "CaseAlt":
-            casealt = CaseAlt( option )
-            errs = casealt.get_misconfs()
-            return errs
-        else:
+        errs = MisconfEngine.generate( self.misconf_mode, option )
+        if errs is None:
             self.logger.info( "misconf_mode could not recognize." )
+        return errs
@@ -0,0 +1,121 @@
+import hashlib
+import json
+import os
+import random
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from utils.ceit.misconf import MisconfEngine
+from utils.Logger import getLogger
+
+
+def option_signature(option):
+    return hashlib.sha1( json.dumps( option, sort_keys=True, default=str ).encode( "utf-8" ) ).hexdigest()
+
+
+def generate_misconfs(task):
+    misconf_mode, option = task
+    return option["key"], MisconfEngine.generate( misconf_mode, option ) or []
+
+
+class MisconfCorpus( object ):
+    """
+    All misconfigurations of every CEIT option, generated once and kept in a SQLite file.
+
+    `build` runs the misconf generators for the options that are new or whose
+    value/constraint changed since the corpus was written, in a process pool.
+    `draw` then picks a random misconfiguration of an option with a single
+    primary-key lookup instead of re-running the generators.
+
+    Generators that make random values (`Fuzzing`, `ConfDiagDetector`) are not
+    cached: `build` only remembers the options and `draw` runs the generator
+    each time, so every draw gets fresh values.
+    """
+
+    def __init__(self, path, misconf_mode):
+        self.logger = getLogger()
+        self.misconf_mode = misconf_mode
+        self.deterministic = MisconfEngine.is_deterministic( misconf_mode )
+        # option key -> option, for the generators run at draw time
+        self.options = {}
+        self.conn = sqlite3.connect( path, check_same_thread=False )
+        self.conn.execute( "CREATE TABLE IF NOT EXISTS options ("
+                           "mode TEXT NOT NULL, key TEXT NOT NULL, signature TEXT NOT NULL, count INTEGER NOT NULL, "
+                           "PRIMARY KEY (mode, key))" )
+        self.conn.execute( "CREATE TABLE IF NOT EXISTS misconfs ("
+                           "mode TEXT NOT NULL, key TEXT NOT NULL, idx INTEGER NOT NULL, misconf TEXT NOT NULL, "
+                           "PRIMARY KEY (mode, key, idx))" )
+        self.conn.commit()
+        # option key -> number of misconfs in the corpus
+        self.counts = {}
+        signatures = {}
+        for key, signature, count in self.conn.execute( "SELECT key, signature, count FROM options WHERE mode = ?",
+                                                        (misconf_mode,) ):
+            self.counts[key] = count
+            signatures[key] = signature
+        self.signatures = signatures
+
+    def build(self, options, workers=None):
+        """
+        Make sure the corpus holds the misconfs of every option in `options`
+        (an iterable of option dicts) and return the number of options generated.
+        """
+        if not self.deterministic:
+            for option in options:
+                self.options[option["key"]] = option
+            return 0
+        stale = []
+        for option in options:
+            if self.signatures.get( option["key"] ) != option_signature( option ):
+                stale.append( option )
+        if not stale:
+            return 0
+
+        self.logger.info(f">>>>[MisconfCorpus] generating {self.misconf_mode} misconfs for {len( stale )} options")
+        tasks = [(self.misconf_mode, option) for option in stale]
+        if workers is None:
+            workers = os.cpu_count() or 1
+        results = None
+        if workers > 1 and len( tasks ) > 1:
+            try:
+                with ProcessPoolExecutor( max_workers=workers ) as pool:
+                    results = list( pool.map( generate_misconfs, tasks, chunksize=max( 1, len( tasks ) // (workers * 4) ) ) )
+            except (OSError, BrokenProcessPool) as e:
+                self.logger.warning(f">>>>[MisconfCorpus] process pool unavailable, generating in process: {e}")
+        if results is None:
+            results = [generate_misconfs( task ) for task in tasks]
+
+        with self.conn:
+            for option, (key, misconfs) in zip( stale, results ):
+                signature = option_signature( option )
+                self.conn.execute( "DELETE FROM misconfs WHERE mode = ? AND key = ?", (self.misconf_mode, key) )
+                self.conn.executemany( "INSERT INTO misconfs (mode, key, idx, misconf) VALUES (?, ?, ?, ?)",
+                                       [(self.misconf_mode, key, idx, json.dumps( misconf, default=str ))
+                                        for idx, misconf in enumerate( misconfs )] )
+                self.conn.execute( "INSERT OR REPLACE INTO options (mode, key, signature, count) VALUES (?, ?, ?, ?)",
+                                   (self.misconf_mode, key, signature, len( misconfs )) )
+                self.counts[key] = len( misconfs )
+                self.signatures[key] = signature
+        return len( stale )
+
+    def count(self, key):
+        return self.counts.get( key, 0 )
+
+    def draw(self, key):
+        """
+        Return a random misconf of option `key`, or None if the option has none.
+        """
+        if not self.deterministic:
+            option = self.options.get( key )
+            misconfs = MisconfEngine.generate( self.misconf_mode, option ) if option is not None else None
+            return random.choice( misconfs ) if misconfs else None
+        count = self.count( key )
+        if count == 0:
+            return None
+        row = self.conn.execute( "SELECT misconf FROM misconfs WHERE mode = ? AND key = ? AND idx = ?",
+                                 (self.misconf_mode, key, random.randrange( count )) ).fetchone()
+        return json.loads( row[0] ) if row else None
+
+    def close(self):
+        self.conn.close()
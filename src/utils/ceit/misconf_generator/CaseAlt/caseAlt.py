@@ -1,3 +1,5 @@
+from utils.ceit.option_registry import constraint_spec, split_part, num_constraint, path_constraint
+
 class CaseAlt():
 
     def __init__(self, option):
@@ -32,18 +34,19 @@ class CaseAlt():
                      "PERMISSION" : self.permission_misconf}
 
         self.option_value = option["value"]
-        self.option_num = option["constraint"].count("|")+1
-        constraints_list = option["constraint"].split("|")
+        spec = constraint_spec( option )
+        self.option_num = spec.count
+        constraints_list = spec.parts
         if self.option_num == 1:
             self.option_values.append(option["value"])
-            type, constraint = self.extract_constraints(constraints_list[0])
+            type, constraint = constraints_list[0].type, constraints_list[0].args
             self.option_constraints.append(constraint)
             self.option_types.append(type)
         else:
             for i in range(self.option_num):
                 id = str(i+1)
                 self.option_values.append(option["value"+id])
-                type, constraint = self.extract_constraints(constraints_list[i])
+                type, constraint = constraints_list[i].type, constraints_list[i].args
                 self.option_constraints.append(constraint)
                 self.option_types.append(type)
         self.misconfs = []
@@ -86,13 +89,7 @@ class CaseAlt():
 
 
     def extract_constraints(self, constraint):
-            if "[" not in constraint:
-                option_type = constraint
-                option_constraint = ""
-            else:
-                option_type = constraint.split( "[" )[0]
-                option_constraint = "[" + constraint.split( "[" )[1]
-            return option_type, option_constraint
+        return split_part( constraint )
 
     def str_misconf(self, value, constraint):
         return []
@@ -133,39 +130,10 @@ class CaseAlt():
         return []
 
     def path_handle_constraints(self, constraint):
-
-        constraint = constraint.strip( "[]" )
-        constraint = constraint.split( ',' )
-        absolute_or_relative = constraint[0] #A,R,B
-        create_or_not = constraint[1] #Y,N
-        file_or_dir = constraint[2] #F,D
-        return absolute_or_relative, create_or_not, file_or_dir
+        return path_constraint( constraint )
 
     def num_handle_constraints(self, constraint):
-        constraint = constraint.strip( "[]" )
-        default_types = {"UINT":[0, 4294967295],
-                         "ULONG" : [0, 4294967295],
-                         "INT" : [-2147483648,2147483647],
-                         "LONG" : [-2147483648, 2147483647],
-                         "LONGLONG" : [-9223372036854775808, 9223372036854775807],
-                         "ULONGLONG": [0, 18446744073709551615],
-                         "FLOAT":["",""],
-                         "DOUBLE":["",""]}
-
-        constraint = constraint.split( ',' )
-        type = constraint[0]
-        if type in default_types:
-            type_range = default_types[type]
-            if type in ["UINT", "ULONG", "INT", "LONG", "LONGLONG", "ULONGLONG"]:
-                float_flag = False
-            else:
-                float_flag = True
-        type_min = type_range[0]
-        type_max = type_range[1]
-        min_number = constraint[1]
-        max_number = constraint[2]
-        unit = constraint[3]
-        return float_flag, type_min, type_max, min_number, max_number, unit
+        return num_constraint( constraint )
 
     def get_misconfs(self):
         return self.misconfs
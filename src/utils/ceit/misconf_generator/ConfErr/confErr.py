@@ -1,3 +1,5 @@
+from utils.ceit.option_registry import constraint_spec
+
 class ConfErr():
 # ConfErr突变 和afl的变异思路类似
     def __init__(self, option):
@@ -29,7 +31,8 @@ class ConfErr():
 
         self.option_values = []
         self.option_value = option["value"]
-        self.option_num = option["constraint"].count( "|" ) + 1
+        spec = constraint_spec( option )
+        self.option_num = spec.count
         if self.option_num == 1:
             self.option_values.append( option["value"] )
         else:
@@ -1,8 +1,13 @@
 import hashlib
 import time
 
+from utils.ceit.option_registry import constraint_spec
+
 
 class Fuzzing( object ):
+    # every instance makes new random strings, so its misconfs must not be cached
+    deterministic = False
+
     def __init__(self, option):
         """
         :param option: {u'key': u'Listen', u'value': u'80', u'constraint': u'PORT'}
@@ -18,7 +23,8 @@ class Fuzzing( object ):
         """
         self.option_values = []
         self.option_value = option["value"] # 配置项对应到默认值
-        self.option_num = option["constraint"].count("|")+1 # 配置项对应到的约束关系
+        spec = constraint_spec( option )
+        self.option_num = spec.count # 配置项对应到的约束关系
         if self.option_num == 1: 
             self.option_values.append(option["value"]) #如果只有一个约束关系则可以添加默认值到option_values中
         else:
@@ -0,0 +1,128 @@
+# value ranges of the number types in NUM[type,min,max,unit] constraints
+NUM_TYPE_RANGES = {"UINT": [0, 4294967295],
+                   "ULONG": [0, 4294967295],
+                   "INT": [-2147483648, 2147483647],
+                   "LONG": [-2147483648, 2147483647],
+                   "LONGLONG": [-9223372036854775808, 9223372036854775807],
+                   "ULONGLONG": [0, 18446744073709551615],
+                   "FLOAT": ["", ""],
+                   "DOUBLE": ["", ""]}
+FLOAT_NUM_TYPES = {"FLOAT", "DOUBLE"}
+
+# constraint string -> ConstraintSpec, shared by every generator in the process
+_specs = {}
+# bracketed arguments -> parsed NUM / PATH arguments
+_num_args = {}
+_path_args = {}
+
+
+class ConstraintPart( object ):
+    """
+    One `|`-separated part of a constraint, e.g. `NUM[INT,,,]`: its type (`NUM`)
+    and its bracketed arguments (`[INT,,,]`, empty if there are none).
+    """
+    __slots__ = ("type", "args")
+
+    def __init__(self, type, args):
+        self.type = type
+        self.args = args
+
+    def num(self):
+        return num_constraint( self.args )
+
+    def path(self):
+        return path_constraint( self.args )
+
+
+class ConstraintSpec( object ):
+    """
+    A parsed `OptionsForCEIT` constraint string such as `INT[,]|INT[,]|ENUM`.
+    """
+    __slots__ = ("raw", "parts")
+
+    def __init__(self, raw, parts):
+        self.raw = raw
+        self.parts = parts
+
+    @property
+    def count(self):
+        return len( self.parts )
+
+    def __repr__(self):
+        return "ConstraintSpec(%r)" % self.raw
+
+
+def split_part(part):
+    if "[" not in part:
+        return part, ""
+    return part.split( "[" )[0], "[" + part.split( "[" )[1]
+
+
+def parse_constraint(constraint):
+    spec = _specs.get( constraint )
+    if spec is None:
+        spec = ConstraintSpec( constraint, tuple( ConstraintPart( *split_part( part ) ) for part in constraint.split( "|" ) ) )
+        _specs[constraint] = spec
+    return spec
+
+
+def constraint_spec(option):
+    return parse_constraint( option["constraint"] )
+
+
+def num_constraint(args):
+    """
+    Returns (float_flag, type_min, type_max, min_number, max_number, unit) of `[type,min,max,unit]`.
+    """
+    parsed = _num_args.get( args )
+    if parsed is None:
+        fields = args.strip( "[]" ).split( ',' )
+        if fields[0] not in NUM_TYPE_RANGES:
+            raise ValueError( "unknown number type in constraint %s" % args )
+        type_min, type_max = NUM_TYPE_RANGES[fields[0]]
+        parsed = (fields[0] in FLOAT_NUM_TYPES, type_min, type_max, fields[1], fields[2], fields[3])
+        _num_args[args] = parsed
+    return parsed
+
+
+def path_constraint(args):
+    """
+    Returns (absolute_or_relative, create_or_not, file_or_dir) of `[A|R|B,Y|N,F|D]`.
+    """
+    parsed = _path_args.get( args )
+    if parsed is None:
+        fields = args.strip( "[]" ).split( ',' )
+        parsed = (fields[0], fields[1], fields[2])
+        _path_args[args] = parsed
+    return parsed
+
+
+class OptionRegistry( object ):
+    """
+    CEIT options by parameter name, each with its constraint parsed once.
+    """
+
+    def __init__(self, options):
+        self.options = {option["key"]: option for option in options}
+        self.specs = {key: constraint_spec( option ) for key, option in self.options.items()}
+
+    def __contains__(self, key):
+        return key in self.options
+
+    def __len__(self):
+        return len( self.options )
+
+    def get(self, key):
+        return self.options.get( key )
+
+    def spec(self, key):
+        return self.specs.get( key )
+
+    def values(self):
+        return self.options.values()
+
+    @staticmethod
+    def from_conf():
+        # imported here so the generators can use this module without ConfAnalyzer
+        from utils.ceit.OptionsForCEIT import OptionsForCEIT
+        return OptionRegistry( OptionsForCEIT().run().values() )
@@ -1,12 +1,13 @@
 import os, shutil, stat
-import subprocess
 from utils.getCovNum import getCovNum
 from utils.Logger import getLogger
+from utils.ProcessRunner import ProcessRunner
 
 class getCov(object):
     def __init__(self) -> None:
         self.getCovNum = getCovNum()
         self.logger = getLogger()
+        self.runner = ProcessRunner()
 
     def get_cov_unit_hcommon(self) -> list:
         # return list of cov [branch, path, line]
@@ -68,12 +69,12 @@ class getCov(object):
         # return list of cov [branch, path, line]
         # unit_path = ["/home/hadoop/ecfuzz/data/app/ctest-hbase/hbase-server/target/jacoco.exec"]
         # classfiles = ["/home/hadoop/ecfuzz/data/app/ctest-hbase/hbase-server/target/hbase-server-2.2.2.jar"]
-        cmd = f"java -jar /home/hadoop/jacoco-0.8.7/lib/jacococli.jar report"
+        cmd = ["java", "-jar", "/home/hadoop/jacoco-0.8.7/lib/jacococli.jar", "report"]
         flag = False
         for unit in unit_path:
             if os.path.exists(unit):
                 # if exec exists
-                cmd = cmd + f" {unit}"
+                cmd.append(unit)
                 flag = True
         
         if flag == False:
@@ -82,21 +83,18 @@ class getCov(object):
             return [0,0,0]
 
         for classfile in classfiles:
-            cmd = cmd + f" --classfiles {classfile}"
+            cmd += ["--classfiles", classfile]
         # outdir = "/home/hadoop/jacoco-0.8.7/cov-unit-hdfs"
-        cmd = cmd + f" --html {outdir}"
+        cmd += ["--html", outdir]
         if os.path.exists(outdir):
             self.deleteDir(outdir)
         # run and get cov info
-        with open(os.devnull, 'w') as f:
-            try:
-                process = subprocess.Popen(cmd, shell=True, stderr=f, stdout=f)
-                self.logger.info(f'>>>>[getCov] get cov process is running')
-                # print("process running")
-                process.communicate()
-            except Exception as e:
-                # print(e)
-                self.logger.info(f'>>>>[getCov] get cov process has exception : {e}')
+        try:
+            self.logger.info(f'>>>>[getCov] get cov process is running')
+            self.runner.run(cmd)
+        except Exception as e:
+            # print(e)
+            self.logger.info(f'>>>>[getCov] get cov process has exception : {e}')
         # get ans
         index_path = os.path.join(outdir, "index.html")
         ans = self.getCovNum.getHtml(index_path)
@@ -27,6 +27,17 @@ class testConfItem(unittest.TestCase):
         print(confItem == confItem2)
         print(confItem == 3)
 
+    def test__hash__(self):
+        confItem = ConfItem("lisy", "帅哥", "确实")
+        assert hash(confItem) == hash(ConfItem("lisy", "帅哥", "确实"))
+        assert len({confItem, ConfItem("lisy", "帅哥", "确实"), ConfItem("lijq", "帅哥", "确实")}) == 2
+
+    def testSlots(self):
+        confItem = ConfItem("lisy", "帅哥", "确实")
+        assert not hasattr(confItem, "__dict__")
+        copy = confItem.copy()
+        assert copy == confItem and copy is not confItem
+
 
 
 if __name__ == '__main__':
@@ -1,7 +1,7 @@
 import unittest
 
 from dataModel.ConfItem import ConfItem
-from dataModel.Seed import Seed
+from dataModel.Seed import ConfItemList, Seed
 
 
 class testSeed(unittest.TestCase):
@@ -30,5 +30,40 @@ class testSeed(unittest.TestCase):
         seed = Seed()
         seed.addConfItem(ConfItem("lisy", "帅哥", "确实"))
 
+    def testFindConfItem(self):
+        seed = Seed([ConfItem("a", "INT", "1"), ConfItem("b", "INT", "2")])
+        index, confItem = seed.findConfItem("b")
+        assert index == 1 and confItem == ConfItem("b", "INT", "2")
+        assert confItem is not seed.confItemList[1]
+        assert seed.findConfItem("c") == (-1, None)
+        seed.confItemList.append(ConfItem("c", "INT", "3"))
+        assert seed.findConfItem("c")[0] == 2
+        seed.confItemList.remove(ConfItem("a", "INT", "1"))
+        assert seed.findConfItem("c")[0] == 1
+        assert seed.findConfItem("a") == (-1, None)
+        seed[0] = ConfItem("d", "INT", "4")
+        assert seed.findConfItem("d")[0] == 0
+
+    def testIndexedContains(self):
+        seed = Seed()
+        seed.confItemList = [ConfItem("a", "INT", "1")]
+        seed.addConfItem(ConfItem("a", "INT", "2"))
+        seed.addConfItem(ConfItem("a", "INT", "2"))
+        assert len(seed.confItemList) == 2
+        assert ConfItem("a", "INT", "2") in seed
+        assert ConfItem("a", "INT", "3") not in seed
+
+    def testRemoveKeepsIndex(self):
+        confItems = ConfItemList([ConfItem("a", "INT", "1"), ConfItem("b", "INT", "2"),
+                                  ConfItem("a", "INT", "3"), ConfItem("c", "INT", "4")])
+        assert confItems.indexOf("c") == 3
+        confItems.remove(ConfItem("a", "INT", "1"))
+        assert confItems._index == {"a": [1], "b": [0], "c": [2]}
+        confItems.remove(ConfItem("b", "INT", "2"))
+        assert confItems._index == {"a": [0], "c": [1]}
+        assert ConfItem("a", "INT", "3") in confItems and confItems.indexOf("c") == 1
+        with self.assertRaises(ValueError):
+            confItems.remove(ConfItem("b", "INT", "2"))
+
 if __name__ == '__main__':
     unittest.main()
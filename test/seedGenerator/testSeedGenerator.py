@@ -49,5 +49,50 @@ class testSeedGenerator(unittest.TestCase):
         assert sg.seedPool.__len__() == 1
 
 
+class testSeedGeneratorExclusion(unittest.TestCase):
+    # runs without a PUT: the analyzer state is set up by hand and restored afterwards
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        print("start to test class `SeedGenerator` exclusion tracking")
+
+    def setUp(self) -> None:
+        self.saved = {name: getattr(ConfAnalyzer, name) for name in
+                      ('confItemsBasic', 'confItemsMutable', 'confItemRelations', 'confItemTypeMap',
+                       'confItemValueMap', 'excludeConf', 'excludeVersion')}
+        self.fuzzerConf = getattr(Configuration, 'fuzzerConf', None)
+        Configuration.fuzzerConf = {'seed_pool_selection_ratio': "1.0", 'seed_gen_seq_ratio': "0",
+                                    'mutator': "testcaseGenerator.StackedMutator"}
+        names = [f"dfs.item{i}" for i in range(8)]
+        ConfAnalyzer.confItemsBasic = []
+        ConfAnalyzer.confItemsMutable = list(names)
+        ConfAnalyzer.confItemRelations = {}
+        ConfAnalyzer.confItemTypeMap = {name: "INT" for name in names}
+        ConfAnalyzer.confItemValueMap = {name: "1" for name in names}
+        ConfAnalyzer.excludeConf = set()
+
+    def tearDown(self) -> None:
+        for name, value in self.saved.items():
+            setattr(ConfAnalyzer, name, value)
+        Configuration.fuzzerConf = self.fuzzerConf
+
+    def testUpdateConfMutable(self):
+        sg = SeedGenerator()
+        excluded = sg.confItemMutable[0]
+        size = sg.confItemMutableSize
+
+        ConfAnalyzer.excludeConfItem(excluded)
+        sg.updateConfMutable()
+        assert excluded not in sg.confItemMutable
+        assert excluded not in sg.confItemSet
+        assert sg.confItemMutableSize == size - 1
+
+        # generated seeds share their unmutated items
+        sg.seedPoolSelectionRatio = 1.0
+        seed = sg.generateSeed()
+        for confItem in seed.confItemList:
+            assert confItem is sg.baseConfItem(confItem.name)
+
+
 if __name__ == '__main__':
     unittest.main()
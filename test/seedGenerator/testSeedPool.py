@@ -0,0 +1,84 @@
+import random
+import sys
+import unittest
+
+sys.path.append("../../src")
+
+from dataModel.ConfItem import ConfItem
+from dataModel.Seed import Seed
+from seedGenerator.SeedPool import FenwickTree, SeedPool
+
+
+def makeSeed(i: int) -> Seed:
+    return Seed([ConfItem("conf.a", "INT", str(i)), ConfItem("conf.b", "BOOL", "true")])
+
+
+class testSeedPool(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        print("start to test class `SeedPool`")
+
+    def testFenwickTree(self):
+        weights = [1.0, 0.0, 2.0, 3.0]
+        tree = FenwickTree.build(weights, 5)
+        assert tree.total() == 6.0
+        assert tree.prefixSum(3) == 3.0
+        assert tree.find(0.5) == 0
+        assert tree.find(1.5) == 2
+        assert tree.find(3.0) == 3
+        tree.add(1, 4.0)
+        assert tree.find(1.5) == 1
+
+    def testDeduplication(self):
+        pool = SeedPool()
+        assert pool.add(makeSeed(1))
+        # same (name, value) set in another order
+        assert not pool.add(Seed([ConfItem("conf.b", "BOOL", "true"), ConfItem("conf.a", "INT", "1")]))
+        assert len(pool) == 1
+        assert pool.duplicateCount == 1
+
+    def testWeightedSelection(self):
+        random.seed(0)
+        pool = SeedPool(minEnergy=0.01)
+        seeds = [makeSeed(i) for i in range(40)]
+        for seed in seeds:
+            pool.add(seed)
+        for seed in seeds[1:]:
+            pool.reward(seed, 0.0)
+            pool.reward(seed, 0.0)
+        pool.reward(seeds[0], 50.0)
+        expected = pool.energyOf(seeds[0]) / pool.tree.total()
+        picks = [pool.select() for _ in range(2000)]
+        assert abs(sum(1 for seed in picks if seed is seeds[0]) / 2000 - expected) < 0.05
+
+    def testBoundedCapacity(self):
+        pool = SeedPool(capacity=8)
+        seeds = [makeSeed(i) for i in range(20)]
+        for seed in seeds[:8]:
+            pool.add(seed)
+        pool.reward(seeds[3], 10.0)
+        for seed in seeds[8:]:
+            pool.add(seed)
+        assert len(pool) == 8
+        assert pool.evictedCount == 12
+        # the productive seed survives eviction
+        assert seeds[3] in pool
+        assert len(pool.seeds) == 8
+        for _ in range(100):
+            assert pool.select() in pool
+
+    def testRemoveAndReuse(self):
+        pool = SeedPool()
+        for i in range(3):
+            pool.add(makeSeed(i))
+        assert pool.remove(makeSeed(1))
+        assert makeSeed(1) not in pool
+        assert not pool.reward(makeSeed(1), 1.0)
+        pool.add(makeSeed(5))
+        assert len(pool) == 3
+        assert abs(pool.tree.total() - 3.0) < 1e-9
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+sys.path.append("../../src")
+
+from utils.Configuration import Configuration
+from testValidator.ceit.system_tester.async_runner import AsyncTestRunner
+from testValidator.ceit.system_tester.testcase import TestCase
+
+
+class RecordingListener(object):
+    def __init__(self):
+        self.events = []
+
+    def push_observer_event(self, id):
+        self.events.append(id)
+
+
+class TestAsyncTestRunner(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        print("start to test class `AsyncTestRunner`")
+        Configuration.putConf = {'test_path': '', 'test_mode': 'Default'}
+
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+        self.listener = RecordingListener()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.directory)
+
+    def makeTestCases(self, scripts, independent, timeout=10, log_files=None):
+        testCases = []
+        for i, script in enumerate(scripts):
+            id = str(i + 1)
+            testCase = TestCase(id=id, script_dict={"script": script, "independent": independent},
+                                oracle_dict={"oracle": "ok", "timeout": timeout, "running": False},
+                                interval=0, log_file=log_files[i] if log_files else "", end=str(len(scripts)))
+            testCase.set_directory(self.directory)
+            testCase.bind(self.listener)
+            testCases.append(testCase)
+        return testCases
+
+    def testResultsAndOrder(self):
+        testCases = self.makeTestCases(["sleep 0.3; echo ok", "echo bad", "echo ok"], independent=True)
+        failed = AsyncTestRunner(testCases, parallelism=3).run()
+        assert failed == ["2"]
+        # observer events keep the script order even though script 1 finishes last
+        assert self.listener.events == ["1", "2", "3"]
+
+    def testIndependentScriptsRunConcurrently(self):
+        testCases = self.makeTestCases(["sleep 0.5; echo ok"] * 4, independent=True)
+        start = time.time()
+        failed = AsyncTestRunner(testCases, parallelism=4).run()
+        assert failed == []
+        assert time.time() - start < 1.5
+
+    def testDependentScriptsRunSerially(self):
+        testCases = self.makeTestCases(["sleep 0.3; echo ok"] * 3, independent=False)
+        start = time.time()
+        AsyncTestRunner(testCases, parallelism=4).run()
+        assert time.time() - start >= 0.9
+        assert len(AsyncTestRunner(testCases, parallelism=4).batches()) == 3
+
+    def testScriptsSharingLogRunSerially(self):
+        logFile = os.path.join(self.directory, "server.log")
+        open(logFile, "w").close()
+        otherLog = os.path.join(self.directory, "other.log")
+        scripts = [f"sleep 0.2; echo script{i} >> {logFile}; echo ok" for i in range(1, 4)] + ["echo ok"]
+        testCases = self.makeTestCases(scripts, independent=True, log_files=[logFile] * 3 + [otherLog])
+        runner = AsyncTestRunner(testCases, parallelism=4)
+        assert [[t.id for t in batch] for batch in runner.batches()] == [["1"], ["2"], ["3", "4"]]
+        assert runner.run() == []
+        for testCase in testCases[:3]:
+            with open(testCase.log_path()) as f:
+                assert f.read() == f"script{testCase.id}\n"
+
+    def testTimeout(self):
+        testCases = self.makeTestCases(["(echo ok; sleep 2)"], independent=False, timeout=0.2)
+        start = time.time()
+        failed = AsyncTestRunner(testCases).run()
+        assert time.time() - start < 2
+        assert failed == []
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.append("../../src")
+
+from testValidator.ceit.data_recorder.data_recorder import DataRecorder
+from testValidator.ceit.data_recorder.data_structure import RedisDataValue
+from testValidator.ceit.data_recorder.result_exporter import ResultExporter
+
+
+class TestDataRecorder(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        print("start to test class `DataRecorder`")
+
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+        self.recorder = DataRecorder(backend="sqlite", batch_size=3, path=os.path.join(self.directory, "results.db"))
+
+    def tearDown(self) -> None:
+        self.recorder.backend.close()
+        shutil.rmtree(self.directory)
+
+    def makeValue(self, name):
+        value = RedisDataValue("mode", name, "misconf", 2)
+        value.set_testcase_results_fail("1")
+        return value()
+
+    def testBatchedWrites(self):
+        self.recorder.insert("hbase:a", "m1", self.makeValue("m1"))
+        self.recorder.insert("hbase:a", "m2", self.makeValue("m2"))
+        # still buffered, but visible to readers
+        assert self.recorder.backend.get_keys("hbase:a") == []
+        assert sorted(self.recorder.get_keys("hbase:a")) == ["m1", "m2"]
+        self.recorder.insert("hbase:b", "m3", self.makeValue("m3"))
+        assert self.recorder.pending == {}
+        assert sorted(self.recorder.backend.get_names("hbase:")) == ["hbase:a", "hbase:b"]
+
+    def testRoundTrip(self):
+        self.recorder.insert("hbase:a", "m1", self.makeValue("m1"))
+        for _ in range(2):
+            value = RedisDataValue()(self.recorder.get_value_from_key("hbase:a", "m1"))
+            assert value.mutation_name == "m1"
+            assert value.overall_results.results["testcase_results"] == "Fail"
+            self.recorder.sync()
+
+    def testLegacyValue(self):
+        legacy = str(self.makeValue("m1"))
+        value = RedisDataValue()(legacy)
+        assert value.detailed_results.testcase_results.results["1"] == "Fail"
+
+    def testClean(self):
+        self.recorder.set_prefix("hbase")
+        self.recorder.insert("hbase:a", "m1", self.makeValue("m1"))
+        self.recorder.sync()
+        self.recorder.insert("hbase:b", "m2", self.makeValue("m2"))
+        self.recorder.clean()
+        assert self.recorder.get_names() == []
+        assert self.recorder.pending_count == 0
+
+    def testDumpOverallResults(self):
+        self.recorder.insert("hbase:a", "m1", self.makeValue("m1"))
+        filePath = os.path.join(self.directory, "overall.csv")
+        self.recorder.dump_overall_results(filePath)
+        with open(filePath) as fp:
+            lines = fp.read().splitlines()
+        assert len(lines) == 2
+        assert lines[1].startswith("hbase:a, m1, Fail")
+
+    def testStreamingExport(self):
+        for i in range(10):
+            self.recorder.insert("hbase:opt%d" % (i % 4), "m%d" % i, self.makeValue("m%d" % i))
+        filePath = os.path.join(self.directory, "overall.csv")
+        count = ResultExporter(self.recorder, chunk_size=3).export(filePath)
+        assert count == 10
+        with open(filePath) as fp:
+            lines = fp.read().splitlines()
+        assert lines[0] == ', '.join(ResultExporter.header)
+        assert len(lines) == 11
+        assert sorted(line.split(', ')[1] for line in lines[1:]) == sorted("m%d" % i for i in range(10))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,7 @@
 import copy
+import os
 import random
+import tempfile
 import sys
 import unittest
 
@@ -9,6 +11,7 @@ from utils.Configuration import Configuration
 sys.path.append("../../src")
 
 from dataModel.ConfItem import ConfItem
+from dataModel.TestResult import TestResult
 from dataModel.Testcase import Testcase
 from testValidator.VirtualSystemTester import VirtualSystemTester
 from testValidator.DichotomyTrimmer import DichotomyTrimmer
@@ -91,5 +94,50 @@ class testDichotomyTrimmer(unittest.TestCase):
         print(testcase)
 
 
+class FakeSystemTester(object):
+    """
+    Fails while any of `vulnerable` keeps its value, like VirtualSystemTester, and records the tested values.
+    """
+
+    def __init__(self, vulnerable) -> None:
+        self.vulnerable = vulnerable
+        self.tested = []
+
+    def runTest(self, testcase: Testcase) -> TestResult:
+        values = {confItem.name: confItem.value for confItem in testcase.confItemList}
+        self.tested.append(values)
+        failed = any(values[name] == value for name, value in self.vulnerable.items())
+        return TestResult(status=1 if failed else 0)
+
+
+class testTrimmerSharedItems(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        print("start to test class `DichotomyTrimmer` with shared items")
+
+    def setUp(self) -> None:
+        self.fuzzerConf = getattr(Configuration, 'fuzzerConf', None)
+        Configuration.fuzzerConf = {'project': "zookeeper"}
+        self.cwd = os.getcwd()
+        os.chdir(tempfile.mkdtemp())
+
+    def tearDown(self) -> None:
+        os.chdir(self.cwd)
+        Configuration.fuzzerConf = self.fuzzerConf
+
+    def testItemsAreNotChanged(self) -> None:
+        random.seed(7)
+        # the trimmers get items shared with the seeds, as SeedGenerator hands them out
+        confItems = [ConfItem(f"ci{i}", "str", "notok") for i in range(30)]
+        systemTester = FakeSystemTester({"ci3": "notok"})
+        trimmer = DichotomyTrimmer(systemTester, {f"ci{i}": "ok" for i in range(30)})
+        testcase = trimmer.trimTestcase(Testcase(confItems))
+        assert all(confItem.value == "notok" for confItem in confItems)
+        assert any(values["ci3"] == "ok" for values in systemTester.tested)
+        assert [confItem.name for confItem in testcase.confItemList] == ["ci3"]
+        assert testcase.confItemList[0] is confItems[3]
+
+
 if __name__ == "__main__":
     unittest.main()
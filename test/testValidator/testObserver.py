@@ -0,0 +1,53 @@
+import sys
+import unittest
+
+sys.path.append("../../src")
+
+from testValidator.ceit.system_tester import observer
+from testValidator.ceit.system_tester.observer import EventListener, HangObserver, TerminationObserver
+
+
+class FakeTestCase(object):
+    def __init__(self, id, running):
+        self.id = id
+        self.script = f"no-such-script-{id}.sh"
+        self.oracle_dict = {"running": running}
+
+
+class FakeObserver(object):
+    def __init__(self, observers):
+        self.observers = observers
+
+    def get_event(self, event):
+        for o in self.observers:
+            o.get_event(event)
+
+
+class TestObserver(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        print("start to test class `Observer`")
+
+    def testEventsReachObservers(self):
+        observer.TESTCASES.clear()
+        for id, running in (("1", False), ("2", True), ("3", False)):
+            observer.TESTCASES[id] = FakeTestCase(id, running)
+        hang = HangObserver()
+        termination = TerminationObserver()
+        for o in (hang, termination):
+            o.daemon = True
+            o.start()
+        listener = EventListener()
+        listener.daemon = True
+        listener.bind_observer(FakeObserver([hang, termination]))
+        listener.start()
+        for id in ("1", "2", "3"):
+            listener.push_observer_event(id)
+        # stop blocks until the last testcase has been observed
+        assert hang.stop() == {"1": False, "2": False, "3": False}
+        # script 2 should still be running, it is not
+        assert termination.stop() == {"1": False, "2": True, "3": False}
+        listener.unbind()
+        listener.join(timeout=5)
+        assert not listener.is_alive()
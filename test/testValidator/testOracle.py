@@ -0,0 +1,66 @@
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+sys.path.append("../../src")
+
+from testValidator.ceit.system_tester import suite_loader
+from testValidator.ceit.system_tester.oracle import Oracle
+
+
+class TestOracle(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        print("start to test class `Oracle` and `load_suite`")
+
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+        self.scriptsPath = os.path.join(self.directory, "scripts.json")
+        self.oraclesPath = os.path.join(self.directory, "oracles.json")
+        self.writeSuite("ok")
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.directory)
+
+    def writeSuite(self, oracle):
+        with open(self.scriptsPath, 'w') as fp:
+            json.dump({"1": {"script": "echo ok"}}, fp)
+        with open(self.oraclesPath, 'w') as fp:
+            json.dump({"1": {"oracle": oracle, "timeout": 1, "running": False}}, fp)
+
+    def testLiteral(self):
+        assert Oracle("a.b")("xx a.b yy")
+        assert not Oracle("a.b")("xx acb yy")
+        assert Oracle("ERROR", check_for_absence=True)("all good")
+        assert not Oracle("ERROR", check_for_absence=True)("an ERROR here")
+
+    def testAlternationAndRegex(self):
+        oracle = Oracle(["passed", "a+b"])
+        assert oracle("tests passed")
+        assert oracle("a+b")
+        assert not oracle("aab")
+        assert Oracle(["a+b"], regex=True)("aab")
+        assert Oracle.from_dict({"oracle": "\\d+ tests", "regex": True})("12 tests")
+
+    def testLoadSuiteCache(self):
+        scripts, oracles = suite_loader.load_suite(self.scriptsPath, self.oraclesPath, self.directory)
+        assert oracles["1"]["oracle"] == "ok"
+        assert os.path.exists(suite_loader.cache_path(self.scriptsPath, self.oraclesPath, self.directory))
+        # cached in memory while the files are unchanged
+        assert suite_loader.load_suite(self.scriptsPath, self.oraclesPath, self.directory)[1] is oracles
+        # served from the pickle after a restart
+        suite_loader._loaded.clear()
+        assert suite_loader.load_suite(self.scriptsPath, self.oraclesPath, self.directory)[1] == oracles
+        # rebuilt once a file changes
+        time.sleep(0.01)
+        self.writeSuite("passed")
+        assert suite_loader.load_suite(self.scriptsPath, self.oraclesPath, self.directory)[1]["1"]["oracle"] == "passed"
+
+
+if __name__ == "__main__":
+    unittest.main()
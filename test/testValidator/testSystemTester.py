@@ -1,14 +1,17 @@
 import os.path
 import sys
+import tempfile
 import time
 import unittest
 
 sys.path.append("../../src")
 
 from testValidator.SystemTester import SystemTester
+from dataModel.ConfItem import ConfItem
 from dataModel.Testcase import Testcase
 from dataModel.TestResult import TestResult
 from utils.Configuration import Configuration
+from utils.FuzzContext import AnalyzerState, FuzzContext, MonitorFlags, StatsCounters
 from utils.ShowStats import ShowStats
 from testValidator.MonitorThread import MonitorThread
 from queue import Queue
@@ -36,5 +39,40 @@ class TestST(unittest.TestCase):
         print(f"cpu exception is : {MonitorThread.CpuException}, memory exception is : {MonitorThread.MemoryException}, log file size exception is : {MonitorThread.FileSizeException}")
         return res
 
+
+class TestSTFailure(unittest.TestCase):
+    # runs without a system under test, on an isolated context
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        print("start to test class `SystemTester` failure handling")
+
+    def test_failingSystemTestIsClassified(self):
+        workDir = tempfile.mkdtemp()
+        script = "echo 'API request Exception [info_excetion] java.io.IOException: boom' >&2; exit 1"
+        putConf = {'systest_java': 'sh', 'systest_shell': f'-c "{script}"', 'systest_shell_dir': workDir}
+        context = FuzzContext({'project': 'hbase'}, putConf, AnalyzerState(), StatsCounters.like(ShowStats),
+                              MonitorFlags(), workDir)
+        testcase = Testcase()
+        testcase.filePath = os.path.join(workDir, "tc.xml")
+        res = SystemTester(context).runSystemTestUtils(testcase, workDir, Queue())
+        assert res.status == 1
+        assert "java.io.IOException" in res.description
+        assert res.sysFailType == 2
+        assert res.exception == "IOException" and res.newException
+
+    def test_recordException(self):
+        # results of remote workers are recorded on the coordinator's tester
+        analyzer = AnalyzerState()
+        analyzer.confItemValueMap = {'dfs.replication': "3"}
+        context = FuzzContext({'project': 'hbase'}, {}, analyzer, StatsCounters.like(ShowStats), MonitorFlags())
+        sysTester = SystemTester(context)
+        testcase = Testcase([ConfItem("dfs.replication", "INT", "0")])
+        assert sysTester.recordException("IOException", testcase)
+        assert not sysTester.recordException("IOException", testcase)
+        assert sysTester.exceptionMap == {"IOException": 2}
+        assert sysTester.exceptionMapReason == {"IOException": [{"dfs.replication": "0"}] * 2}
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,33 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.append("../../src")
+
+from testValidator.UnitTestUtils import UnitTestUtils
+
+
+class TestUnitTestUtils(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        print("start to test class `UnitTestUtils`")
+
+    def testProjectComesFromContext(self):
+        workDir = tempfile.mkdtemp()
+        defaultConf = os.path.join(workDir, "zookeeper-default.tsv")
+        with open(defaultConf, "w") as f:
+            f.write("maxClientCnxns\t60\tdescription\n")
+        injectPath = os.path.join(workDir, "ctest.cfg")
+        putConf = {'default_conf_path': defaultConf, 'injecting_location': [injectPath]}
+        utils = UnitTestUtils(putConf, {'project': "zookeeper"})
+        assert utils.project == "zookeeper"
+        assert utils.default_conf == {'maxClientCnxns': "60"}
+        utils.inject_config({'maxClientCnxns': "50"})
+        with open(injectPath) as f:
+            assert f.read() == "maxClientCnxns=50\n"
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.append("../../src")
+
+from dataModel.ConfItem import ConfItem
+from dataModel.Seed import Seed
+from dataModel.TestResult import TestResult
+from testcaseGenerator.CeitMutator import CeitMutator
+from utils.Configuration import Configuration
+from utils.Logger import getItemLogger, getLogger
+from utils.ResultsDb import ResultsDb, ResultsQuery
+
+
+class FakeCorpus(object):
+
+    def draw(self, key):
+        return {"name": "num_sametype", "value": "-1"}
+
+
+class TestCeitMutator(unittest.TestCase):
+    # the option registry and the misconf corpus need a PUT, they are replaced by fakes
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        print("start to test class `CeitMutator`")
+
+    def setUp(self) -> None:
+        self.fuzzerConf = getattr(Configuration, 'fuzzerConf', None)
+        Configuration.fuzzerConf = {'misconf_mode': "ConfDiagDetector"}
+        self.mutator = CeitMutator.__new__(CeitMutator)
+        self.mutator.logger = getLogger()
+        self.mutator.itemLogger = getItemLogger('mutator')
+        self.mutator.optionRegistry = {"Listen": {"key": "Listen", "value": "80", "constraint": "PORT"}}
+        self.mutator.misconfCorpus = FakeCorpus()
+
+    def tearDown(self) -> None:
+        Configuration.fuzzerConf = self.fuzzerConf
+
+    def testMutatedItemIsRecorded(self):
+        testcase = self.mutator.mutate(Seed([ConfItem("Listen", "PORT", "80")]))
+        assert testcase.confItemList[0].value == "-1" and testcase.confItemList[0].isMutated
+        testcase.fileName = "ceit-1"
+        path = os.path.join(tempfile.mkdtemp(), "results.db")
+        db = ResultsDb(path)
+        result = TestResult(status=1, sysFailType=2, description="API request Exception IOException")
+        result.exception = "IOException"
+        result.newException = True
+        db.record(testcase, None, result)
+        db.close()
+        query = ResultsQuery(path)
+        assert query.param("Listen")[0][0] == "-1"
+        assert query.params("IOException") == [("Listen", 1)]
+        query.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import sys
+import unittest
+
+sys.path.append("../../src/")
+from dataModel.ConfItem import ConfItem
+from dataModel.Seed import Seed
+from dataModel.Testcase import Testcase
+from utils.FuzzContext import AnalyzerState, FuzzContext, MonitorFlags
+
+from testcaseGenerator.TestcaseGenerator import TestcaseGenerator
+
+
+class FakeStats(object):
+    fuzzerStartTime: float = 0.0
+    currentJob: str = ''
+    generatedTestcases: int = 0
+    duplicateTestcases: int = 0
+
+
+class RepeatingMutator(object):
+    """
+    Mutates `dfs.replication` to the next of `values`, keeping the other items of the seed.
+    """
+
+    def __init__(self, values) -> None:
+        self.values = list(values)
+
+    def mutate(self, seed: Seed) -> Testcase:
+        mutated = ConfItem("dfs.replication", "INT", self.values.pop(0))
+        mutated.isMutated = True
+        return Testcase([mutated] + [conf for conf in seed.confItemList if conf.name != "dfs.replication"])
+
+    def feedback(self, testcase, utResult, sysResult) -> None:
+        pass
+
+
+class TestTestcaseGenerator(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        print("start to test class `TestcaseGenerator`")
+
+    def setUp(self) -> None:
+        self.analyzer = AnalyzerState()
+        self.analyzer.confMutationInfo = {"dfs.replication": [0, 0], "dfs.blocksize": [0, 0]}
+        self.context = FuzzContext({}, {}, self.analyzer, FakeStats, MonitorFlags())
+
+    def testRejectedDuplicatesAreNotCounted(self):
+        generator = TestcaseGenerator(RepeatingMutator(["1", "1", "1", "2"]), 5, self.context)
+        seed = Seed([ConfItem("dfs.replication", "INT", "3"), ConfItem("dfs.blocksize", "DATA", "64m")])
+        assert generator.mutate(seed).confItemList[0].value == "1"
+        assert generator.mutate(seed).confItemList[0].value == "2"
+        # four testcases were generated, two of them were kept
+        assert self.analyzer.confMutationInfo["dfs.replication"] == [2, 0]
+
+    def testSeedItemsAreNotCounted(self):
+        generator = TestcaseGenerator(RepeatingMutator(["1"]), 5, self.context)
+        # a pooled seed keeps the flags of the mutation that produced it
+        pooled = ConfItem("dfs.blocksize", "DATA", "128m")
+        pooled.isMutated = True
+        generator.mutate(Seed([ConfItem("dfs.replication", "INT", "3"), pooled]))
+        assert self.analyzer.confMutationInfo["dfs.replication"] == [1, 0]
+        assert self.analyzer.confMutationInfo["dfs.blocksize"] == [0, 0]
+
+
+if __name__ == '__main__':
+    unittest.main()
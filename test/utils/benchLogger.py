@@ -0,0 +1,88 @@
+"""
+Microbenchmark: logging overhead of one fuzz iteration (per-item mutator and
+surefire records plus a few INFO lines), written synchronously at INFO as
+before vs. through the queue handler with per-item records on sampled DEBUG
+streams.
+
+    cd test/utils && python benchLogger.py [iterations]
+"""
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import tempfile
+import time
+
+sys.path.append("../../src")
+
+from utils.Logger import LOG_DATEFMT, LOG_FORMAT, SampleFilter, StructuredFormatter
+
+ITEMS = 300
+OUTCOMES = 100
+
+
+class Item(object):
+    def __init__(self, i: int) -> None:
+        self.name = f"dfs.namenode.item{i}"
+        self.value = str(i * 7)
+        self.type = "INT"
+
+
+def synchronousLogger(path: str) -> logging.Logger:
+    logger = logging.Logger("bench.sync", logging.INFO)
+    handler = logging.FileHandler(path, mode='w')
+    handler.setFormatter(logging.Formatter(LOG_FORMAT, LOG_DATEFMT))
+    logger.addHandler(handler)
+    return logger
+
+
+def queuedLoggers(path: str):
+    records = queue.SimpleQueue()
+    handler = logging.FileHandler(path, mode='w')
+    handler.setFormatter(StructuredFormatter())
+    listener = logging.handlers.QueueListener(records, handler)
+    listener.start()
+    logger = logging.Logger("bench.queued", logging.INFO)
+    logger.addHandler(logging.handlers.QueueHandler(records))
+    itemLogger = logging.Logger("bench.queued.items", logging.INFO)
+    itemLogger.addHandler(logging.handlers.QueueHandler(records))
+    itemLogger.addFilter(SampleFilter(100))
+    return logger, itemLogger, listener
+
+
+def main(iterations: int = 200) -> None:
+    items = [Item(i) for i in range(ITEMS)]
+    outcomes = [{'name': f"test{i}", 'classname': "TestX", 'time': "0.01"} for i in range(OUTCOMES)]
+    workDir = tempfile.mkdtemp()
+
+    logger = synchronousLogger(os.path.join(workDir, "sync.log"))
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for item in items:
+            logger.info(f"<<<<[StackedMutator] for itemA conf name is : {item.name}; conf value is : {item.value}; conf type is : {item.type}")
+        for outcome in outcomes:
+            logger.info(">>>>[UnitTestUtils] unit test outcome: {}".format(outcome))
+        for _ in range(5):
+            logger.info(">>>>[fuzzer] iteration done")
+    synchronous = time.perf_counter() - start
+
+    logger, itemLogger, listener = queuedLoggers(os.path.join(workDir, "queued.log"))
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for item in items:
+            itemLogger.debug("<<<<[StackedMutator] for itemA conf name is : %s; conf value is : %s; conf type is : %s", item.name, item.value, item.type)
+        for outcome in outcomes:
+            itemLogger.debug(">>>>[UnitTestUtils] unit test outcome", extra={'fields': outcome})
+        for _ in range(5):
+            logger.info(">>>>[fuzzer] iteration done")
+    queued = time.perf_counter() - start
+    listener.stop()
+
+    print(f"synchronous INFO : {synchronous / iterations * 1e6:10.1f} us/iteration")
+    print(f"queued, sampled  : {queued / iterations * 1e6:10.1f} us/iteration")
+    print(f"speedup          : {synchronous / queued:10.1f}x")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
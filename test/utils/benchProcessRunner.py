@@ -0,0 +1,45 @@
+"""
+Microbenchmark: per-launch overhead of the old tester pattern (`os.chdir` plus a
+`cd dir && ...` shell string with `preexec_fn=os.setsid`) vs. an argv list
+launched by `ProcessRunner` with an explicit cwd and a new session.
+
+    cd test/utils && python benchProcessRunner.py [launches]
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.append("../../src")
+
+from utils.ProcessRunner import ProcessRunner
+
+
+def main(launches: int = 200) -> None:
+    workDir = tempfile.mkdtemp()
+    before = os.getcwd()
+
+    start = time.perf_counter()
+    for _ in range(launches):
+        os.chdir(workDir)
+        process = subprocess.Popen(f"cd {workDir} && true", shell=True, stdout=subprocess.DEVNULL,
+                                   stderr=subprocess.DEVNULL, preexec_fn=os.setsid)
+        process.wait()
+        os.chdir(before)
+    shell = time.perf_counter() - start
+
+    runner = ProcessRunner()
+    start = time.perf_counter()
+    for _ in range(launches):
+        runner.run(["true"], cwd=workDir)
+    argv = time.perf_counter() - start
+
+    print(f"shell + chdir  : {shell / launches * 1000:8.2f} ms/launch")
+    print(f"argv + cwd     : {argv / launches * 1000:8.2f} ms/launch "
+          f"(Popen alone {runner.averageLaunchTime() * 1000:.2f} ms)")
+    print(f"speedup        : {shell / argv:8.2f}x")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,54 @@
+"""
+Microbenchmark: new values for a stacked mutation over hundreds of parameters,
+generated one call per type (`NewValue.gen*`) vs. by the shared `ValueEngine`.
+
+    cd test/utils && python benchValueEngine.py [params] [rounds]
+"""
+import random
+import sys
+import time
+
+sys.path.append("../../src")
+
+from utils.NewValue import NewValue
+from utils.ValueEngine import ValueEngine
+
+SAMPLE_VALUES = [("INT", "1024"), ("FLOAT", "0.75f"), ("BOOL", "true"), ("TIME", "30s"), ("DATA", "64MB"),
+                 ("PORT", "8080"), ("IPPORT", "0.0.0.0:9866"), ("INTLIST", "1,2,3"), ("STRLIST", "a,bb,ccc"),
+                 ("FILEPATH", "/tmp/x"), ("TIME", "1000ms"), ("INT", "3"), ("DIRPATH", "/data"), ("PM", "022")]
+
+
+def perTypeCalls(newValue: NewValue):
+    return {
+        "INT": lambda v: str(newValue.genInt(v)), "FLOAT": lambda v: str(newValue.genFloat(v)),
+        "BOOL": newValue.genBool, "TIME": newValue.genTime, "DATA": newValue.genDataSize,
+        "PORT": newValue.genPort, "IPPORT": newValue.genIpPortAddr, "INTLIST": newValue.genIntList,
+        "STRLIST": newValue.genStringList, "FILEPATH": newValue.genFilePath, "DIRPATH": newValue.genDirPath,
+        "PM": newValue.genPermissionMask,
+    }
+
+
+def main(params: int = 500, rounds: int = 200) -> None:
+    random.seed(0)
+    items = [random.choice(SAMPLE_VALUES) for _ in range(params)]
+
+    calls = perTypeCalls(NewValue())
+    start = time.perf_counter()
+    for _ in range(rounds):
+        [calls[confType](value) for confType, value in items]
+    perType = time.perf_counter() - start
+
+    engine = ValueEngine()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        engine.genValues(items)
+    batched = time.perf_counter() - start
+
+    total = params * rounds
+    print(f"per-type calls : {total / perType:12.0f} values/s")
+    print(f"value engine   : {total / batched:12.0f} values/s")
+    print(f"speedup        : {perType / batched:12.2f}x")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:3]])
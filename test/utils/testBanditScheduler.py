@@ -0,0 +1,70 @@
+import pickle
+import random
+import sys
+import unittest
+
+sys.path.append("../../src")
+
+from dataModel.TestResult import TestResult
+from utils.BanditScheduler import BanditScheduler, ThompsonSampler
+
+
+class TestBanditScheduler(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        print("start to test class `BanditScheduler`")
+
+    def testSamplerLearnsBestArm(self):
+        random.seed(7)
+        sampler = ThompsonSampler()
+        rates = {"a": 0.1, "b": 0.6, "c": 0.2}
+        arms = list(rates)
+        for _ in range(2000):
+            arm = arms[sampler.select(arms)]
+            sampler.update(arm, 1.0 if random.random() < rates[arm] else 0.0)
+        assert sampler.best(1)[0][0] == "b"
+        assert sampler.posteriors["b"][2] > 1000
+
+    def testDiscount(self):
+        sampler = ThompsonSampler(discount=0.5)
+        for _ in range(50):
+            sampler.update("a", 1.0)
+        alpha, beta, pulls = sampler.posteriors["a"]
+        assert alpha < 3.0 and pulls == 50
+        assert sampler.mean("unknown") == 0.5
+
+    def testReward(self):
+        assert BanditScheduler.reward(None, None) == 0.0
+        unit = TestResult(status=1)
+        unit.failed_tests_count = 10
+        assert BanditScheduler.reward(unit, None) == BanditScheduler.unitFailureReward
+        assert BanditScheduler.reward(unit, TestResult(status=1, sysFailType=2)) == 1.0
+        sysResult = TestResult(status=1, sysFailType=1)
+        assert BanditScheduler.reward(None, sysResult) == BanditScheduler.sysFailTypeRewards[1]
+        sysResult.newException = True
+        assert BanditScheduler.reward(None, sysResult) == BanditScheduler.newExceptionReward
+
+    def testUpdateAndPersist(self):
+        scheduler = BanditScheduler()
+        assert scheduler.selectOperator() in (BanditScheduler.SINGLE, BanditScheduler.STACKED)
+        assert scheduler.selectParameter(["x", "y"]) in (0, 1)
+        scheduler.update(BanditScheduler.STACKED, ["x", "y"], None, TestResult(status=1, sysFailType=3))
+        restored = pickle.loads(pickle.dumps(scheduler))
+        assert restored.parameterBandit.mean("x") > restored.parameterBandit.mean("z")
+        assert restored.operatorBandit.posteriors[BanditScheduler.STACKED][2] == 1
+
+    def testSelectParametersSamplesEachArmOnce(self):
+        random.seed(7)
+        scheduler = BanditScheduler()
+        for _ in range(30):
+            scheduler.parameterBandit.update("good", 1.0)
+            scheduler.parameterBandit.update("bad", 0.0)
+        sampled = []
+        sample = scheduler.parameterBandit.sample
+        scheduler.parameterBandit.sample = lambda arm: sampled.append(arm) or sample(arm)
+        names = ["bad", "x", "good", "y"]
+        indices = scheduler.selectParameters(names, 3)
+        assert sorted(sampled) == sorted(names)
+        assert len(set(indices)) == 3 and indices[0] == 2
+        assert sorted(scheduler.selectParameters(names, 10)) == [0, 1, 2, 3]
@@ -0,0 +1,50 @@
+import pickle
+import sys
+import unittest
+
+sys.path.append("../../src")
+
+from utils.BloomFilter import BloomFilter, ScalableBloomFilter
+
+
+class TestBloomFilter(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        print("start to test class `BloomFilter`")
+
+    def testAddAndContains(self):
+        bloom = BloomFilter(1000, 0.01)
+        assert bloom.add(b"a")
+        assert not bloom.add(b"a")
+        assert b"a" in bloom
+        assert b"b" not in bloom
+
+    def testFalsePositiveRate(self):
+        bloom = BloomFilter(5000, 0.01)
+        for i in range(5000):
+            bloom.add(str(i).encode())
+        falsePositives = sum(1 for i in range(5000, 25000) if str(i).encode() in bloom)
+        assert falsePositives / 20000 < 0.02
+
+    def testScalable(self):
+        bloom = ScalableBloomFilter(initialCapacity=100, errorRate=0.001)
+        added = sum(1 for i in range(2000) if bloom.add(str(i).encode()))
+        # a few adds may be rejected as false positives
+        assert added >= 1990
+        assert len(bloom.filters) > 1
+        assert all(str(i).encode() in bloom for i in range(2000))
+        assert not bloom.add(b"10")
+        falsePositives = sum(1 for i in range(2000, 22000) if str(i).encode() in bloom)
+        assert falsePositives / 20000 < 0.005
+
+    def testPickle(self):
+        bloom = ScalableBloomFilter(initialCapacity=100)
+        bloom.add(b"fingerprint")
+        restored = pickle.loads(pickle.dumps(bloom))
+        assert b"fingerprint" in restored
+        assert len(restored) == 1
+
+
+if __name__ == "__main__":
+    unittest.main()
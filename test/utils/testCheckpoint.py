@@ -0,0 +1,62 @@
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+sys.path.append("../../src")
+
+from dataModel.ConfItem import ConfItem
+from dataModel.Seed import Seed
+from seedGenerator.SeedPool import SeedPool
+from utils.Checkpoint import Checkpoint
+
+
+class TestCheckpoint(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        print("start to test class `Checkpoint`")
+
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "campaign", "checkpoint.ckpt")
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.directory)
+
+    def makeState(self, iteration):
+        pool = SeedPool()
+        pool.add(Seed([ConfItem("conf.a", "INT", str(iteration))]))
+        return {'iteration': iteration, 'seedPool': pool, 'exceptionMap': {"java.io.IOException": iteration}}
+
+    def testBackgroundWrite(self):
+        checkpoint = Checkpoint(self.path, interval=0.05)
+        assert not checkpoint.maybeSave(lambda: self.makeState(0))
+        time.sleep(0.06)
+        assert checkpoint.maybeSave(lambda: self.makeState(1))
+        checkpoint.close()
+        state = Checkpoint.load(self.path)
+        assert state['iteration'] == 1
+        assert len(state['seedPool']) == 1
+        assert state['exceptionMap'] == {"java.io.IOException": 1}
+        assert os.listdir(os.path.dirname(self.path)) == ["checkpoint.ckpt"]
+
+    def testLatestSnapshotWins(self):
+        checkpoint = Checkpoint(self.path, interval=0)
+        for i in range(20):
+            checkpoint.submit(self.makeState(i))
+        checkpoint.saveNow(self.makeState(100))
+        checkpoint.close()
+        assert Checkpoint.load(self.path)['iteration'] == 100
+
+    def testDisabled(self):
+        checkpoint = Checkpoint(self.path, interval=0)
+        assert not checkpoint.maybeSave(lambda: self.makeState(0))
+        checkpoint.close()
+        assert not os.path.exists(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
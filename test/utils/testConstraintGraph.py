@@ -0,0 +1,70 @@
+import csv
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.append("../../src")
+
+from utils.ConstraintGraph import ConstraintGraph, DependencyType
+from utils.UnitConstant import DATA_DIR
+
+CSV = """Dependency Taxonomy,Configuration Parameter A,Configuration Parameter B,Class,Function
+Control Dependency,a,b,C,f
+Default Value Dependency,b,c,C,f
+Overwrite,d,e,C,f
+"""
+
+
+class TestConstraintGraph(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        print("start to test class `ConstraintGraph`")
+
+    def setUp(self) -> None:
+        self.dir = tempfile.TemporaryDirectory()
+        self.csvPath = os.path.join(self.dir.name, "intra.csv")
+        with open(self.csvPath, "w") as f:
+            f.write(CSV)
+
+    def tearDown(self) -> None:
+        self.dir.cleanup()
+
+    def testRelations(self):
+        graph = ConstraintGraph.fromCsv(self.csvPath)
+        assert graph.relations("a") == [["b", DependencyType.CONTROL]]
+        assert graph.relations("b") == [["a", "Control Dependency"], ["c", "Default Value Dependency"]]
+        assert graph.relations("x") == []
+        assert f"{graph.relations('d')[0][1]}" == "Overwrite"
+
+    def testClosuresAndComponents(self):
+        graph = ConstraintGraph.fromCsv(self.csvPath)
+        assert graph.reachable("a") == {"b", "c"}
+        assert graph.reachable("c") == frozenset()
+        assert set(graph.component("c")) == {"a", "b", "c"}
+        assert graph.related("a", "c")
+        assert not graph.related("a", "d")
+
+    def testCache(self):
+        graph = ConstraintGraph.load(self.csvPath, self.dir.name)
+        cached = ConstraintGraph.load(self.csvPath, self.dir.name)
+        assert cached.relationMap == graph.relationMap
+        assert len([f for f in os.listdir(self.dir.name) if f.endswith(".pkl")]) == 1
+        with open(self.csvPath, "a") as f:
+            f.write("Behavior Dependency,a,e,C,f\n")
+        assert ConstraintGraph.load(self.csvPath, self.dir.name).related("a", "d")
+
+    def testUnknownDependencyType(self):
+        with open(self.csvPath, "a") as f:
+            f.write("Timing Dependency,a,f,C,f\n")
+        graph = ConstraintGraph.fromCsv(self.csvPath)
+        assert graph.relations("f") == []
+        assert graph.reachable("a") == {"b", "c"}
+
+    def testShippedConstraints(self):
+        csvPath = os.path.join(DATA_DIR, "cDep_result", "intra.csv")
+        with open(csvPath, encoding="utf-8-sig") as f:
+            rows = sum(1 for _ in csv.reader(f)) - 1
+        graph = ConstraintGraph.fromCsv(csvPath)
+        assert sum(len(relations) for relations in graph.relationMap.values()) == 2 * rows
@@ -0,0 +1,139 @@
+import sys
+import threading
+import unittest
+from queue import Queue
+from urllib.error import HTTPError
+
+sys.path.append("../../src")
+
+from dataModel.ConfItem import ConfItem
+from dataModel.TestResult import TestResult
+from dataModel.Testcase import Testcase
+from utils.Coordinator import Coordinator, CoordinatorServer
+from utils.Worker import Worker, WorkerClient
+
+
+class FakeCampaign(object):
+    """
+    Stands in for the fuzzer: numbered testcases, commits recorded, odd ones kept as seeds.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.committed = []
+
+    def nextTestcase(self):
+        self.count += 1
+        testcase = Testcase([ConfItem("dfs.replication", "INT", str(self.count))])
+        return testcase, testcase
+
+    def commit(self, seed, testcase, utResult, sysResult, trimmedTestcase):
+        value = int(testcase.confItemList[0].value)
+        self.committed.append((value, sysResult.status))
+        return testcase if value % 2 else None
+
+
+class FakeValidator(object):
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.values = []
+
+    def runTest(self, testcase, stopSoon):
+        value = int(testcase.confItemList[0].value)
+        with self.lock:
+            self.values.append(value)
+        return None, TestResult(status=value % 2, sysFailType=2), testcase
+
+
+class TestCoordinator(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        print("start to test class `Coordinator`")
+
+    def setUp(self) -> None:
+        self.campaign = FakeCampaign()
+        self.coordinator = Coordinator(self.campaign.nextTestcase, self.campaign.commit, leaseTimeout=60)
+        self.server = CoordinatorServer(self.coordinator, "127.0.0.1", 0).start()
+        host, port = self.server.address
+        self.client = WorkerClient(f"{host}:{port}")
+
+    def tearDown(self) -> None:
+        self.server.close()
+
+    def testWorkersShareCampaign(self):
+        validator = FakeValidator()
+        workers = [Worker(self.client, validator, workerId=f"w{i}") for i in range(3)]
+        threads = [threading.Thread(target=worker.run, args=(Queue(), 4)) for worker in workers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # every testcase ran exactly once and every result was committed
+        assert sorted(validator.values) == list(range(1, 13))
+        assert sorted(value for value, _ in self.campaign.committed) == list(range(1, 13))
+        assert all(status == value % 2 for value, status in self.campaign.committed)
+        status = self.client.status()
+        assert status['completed'] == 12
+        assert status['leased'] == 0
+        assert status['corpus'] == 6
+
+    def testIncrementalCorpus(self):
+        worker = Worker(self.client, FakeValidator(), workerId="w")
+        for _ in range(3):
+            worker.runOnce(Queue())
+        # testcase 1 was fetched along with job 3, testcase 3 is new since
+        assert worker.corpusOffset == 1
+        assert worker.syncCorpus() == 1
+        assert worker.corpusOffset == 2
+        assert worker.syncCorpus() == 0
+        worker.runOnce(Queue())
+        worker.runOnce(Queue())
+        assert worker.syncCorpus() == 1
+        assert [seed.confItemList[0].value for seed in worker.corpus] == ["1", "3", "5"]
+
+    def testLeavingWorkerRequeuesJob(self):
+        job = self.client.work("gone")
+        assert self.client.leave("gone") == 1
+        # the job goes to the next worker and the late result is rejected
+        retry = self.client.work("other")
+        assert retry['job'] == job['job']
+        assert retry['testcase'] == job['testcase']
+        assert not self.client.result("gone", job['job'], None, TestResult())
+        assert self.client.result("other", job['job'], None, TestResult())
+
+    def testExpiredLease(self):
+        self.coordinator.leaseTimeout = -1
+        job = self.client.work("slow")
+        retry = self.client.work("fast")
+        assert retry['job'] == job['job']
+        assert self.coordinator.stats['expired'] == 1
+
+    def testStop(self):
+        self.coordinator.stop()
+        assert self.client.work("late") == {'stop': True}
+        worker = Worker(self.client, FakeValidator(), workerId="w")
+        worker.run(Queue())
+        assert worker.jobsDone == 0
+
+    def testToken(self):
+        server = CoordinatorServer(self.coordinator, "127.0.0.1", 0, token="s3cret").start()
+        host, port = server.address
+        try:
+            with self.assertRaises(HTTPError) as raised:
+                WorkerClient(f"{host}:{port}").work("intruder")
+            assert raised.exception.code == 401
+            with self.assertRaises(HTTPError):
+                WorkerClient(f"{host}:{port}", token="guess").status()
+            assert self.coordinator.stats['assigned'] == 0
+            assert 'job' in WorkerClient(f"{host}:{port}", token="s3cret").work("w")
+        finally:
+            server.close()
+
+    def testLoopbackByDefault(self):
+        server = CoordinatorServer(self.coordinator, port=0)
+        try:
+            assert server.address[0] == "127.0.0.1"
+        finally:
+            server.httpd.server_close()
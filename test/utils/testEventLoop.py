@@ -0,0 +1,78 @@
+import sys
+import threading
+import time
+import unittest
+from queue import Queue
+
+sys.path.append("../../src")
+
+from utils.EventLoop import EventLoop
+
+
+class TestEventLoop(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        print("start to test class `EventLoop`")
+
+    def setUp(self) -> None:
+        self.eventLoop = EventLoop(name='test-loop')
+
+    def tearDown(self) -> None:
+        self.eventLoop.close()
+
+    def testRunAndOffload(self):
+        loopThread = []
+
+        def blocking():
+            time.sleep(0.05)
+            return threading.current_thread()
+
+        async def work():
+            loopThread.append(threading.current_thread())
+            return await EventLoop.offload(blocking)
+
+        worker = self.eventLoop.run(work(), timeout=5)
+        assert loopThread == [self.eventLoop.thread]
+        # the blocking call ran in the executor, not on the loop thread
+        assert worker is not self.eventLoop.thread
+        assert worker is not threading.current_thread()
+
+    def testPeriodicStops(self):
+        ticks = []
+        stop = Queue()
+        future = self.eventLoop.every(0.02, lambda: ticks.append(time.time()), stop)
+        time.sleep(0.2)
+        stop.put(1)
+        future.result(timeout=1)
+        assert len(ticks) >= 3
+        count = len(ticks)
+        time.sleep(0.1)
+        assert len(ticks) == count
+
+    def testPeriodicCoroutineTick(self):
+        ticks = []
+        stop = Queue()
+
+        async def tick():
+            ticks.append(await EventLoop.offload(len, ticks))
+            if len(ticks) == 3:
+                stop.put(1)
+
+        self.eventLoop.run(EventLoop.periodic(0.01, tick, Queue(), stop), timeout=5)
+        assert ticks == [0, 1, 2]
+
+    def testRunFromLoopThreadFails(self):
+        async def nested():
+            try:
+                self.eventLoop.run(EventLoop.periodic(1, print, Queue()))
+            except RuntimeError:
+                return True
+            return False
+
+        assert self.eventLoop.run(nested(), timeout=5)
+
+    def testShared(self):
+        shared = EventLoop.shared()
+        assert EventLoop.shared() is shared
+        assert shared.thread.daemon
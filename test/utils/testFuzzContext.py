@@ -0,0 +1,62 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.append("../../src")
+
+from utils.FuzzContext import AnalyzerState, FuzzContext, MonitorFlags, StatsCounters
+
+
+class FakeStats(object):
+    fuzzerStartTime: float = 100.0
+    totalRunUnitTestsCount: int = 7
+    currentJob: str = 'unit testing'
+
+
+class TestFuzzContext(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        print("start to test class `FuzzContext`")
+
+    def setUp(self) -> None:
+        self.workDir = tempfile.mkdtemp()
+        analyzer = AnalyzerState()
+        analyzer.confItemsMutable = ["a", "b"]
+        analyzer.confUnitMap = {"a": ["TestA#test"]}
+        analyzer.confMutationInfo = {"a": [3, 0]}
+        self.base = FuzzContext({"project": "hbase"}, {"testing_dir": "/ctest/hbase"}, analyzer, FakeStats,
+                                MonitorFlags(), self.workDir)
+
+    def testForkIsolatesState(self):
+        worker = self.base.fork("worker-1")
+        worker.analyzer.excludeConfItem("a")
+        worker.analyzer.confItemsMutable.remove("a")
+        worker.analyzer.confMutationInfo["a"][1] += 1
+        worker.stats.totalRunUnitTestsCount += 5
+        worker.monitor.CpuException = True
+        assert self.base.analyzer.excludeConf == set()
+        assert self.base.analyzer.confItemsMutable == ["a", "b"]
+        assert self.base.analyzer.confMutationInfo["a"] == [3, 0]
+        assert FakeStats.totalRunUnitTestsCount == 7
+        assert not self.base.monitor.CpuException
+        # read-only maps are shared
+        assert worker.analyzer.confUnitMap["a"] is self.base.analyzer.confUnitMap["a"]
+
+    def testForkOverridesAndWorkDir(self):
+        worker = self.base.fork("worker-2", putConf={"testing_dir": "/ctest/hbase-2"})
+        assert worker.testingDir == "/ctest/hbase-2"
+        assert self.base.testingDir == "/ctest/hbase"
+        assert worker.fuzzerConf == {"project": "hbase"}
+        assert worker.workDir == os.path.join(self.workDir, "worker-2")
+        assert os.path.isdir(worker.workDir)
+        assert worker.name == "worker-2"
+
+    def testStatsCounters(self):
+        counters = StatsCounters.like(FakeStats)
+        assert counters.totalRunUnitTestsCount == 0
+        assert counters.currentJob == ''
+        assert counters.fuzzerStartTime == 100.0
+        counters.totalRunUnitTestsCount += 2
+        assert FakeStats.totalRunUnitTestsCount == 7
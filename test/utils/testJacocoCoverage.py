@@ -0,0 +1,151 @@
+import pickle
+import socket
+import struct
+import sys
+import threading
+import unittest
+
+sys.path.append("../../src")
+
+from utils.JacocoCoverage import (JacocoClient, CoverageMap, CoverageTracker, JacocoProtocolError,
+                                  BLOCK_HEADER, BLOCK_SESSIONINFO, BLOCK_EXECUTIONDATA, BLOCK_CMDOK,
+                                  BLOCK_CMDDUMP, MAGIC_NUMBER, FORMAT_VERSION)
+
+
+def utf(s: str) -> bytes:
+    data = s.encode("utf-8")
+    return struct.pack(">H", len(data)) + data
+
+
+def varInt(value: int) -> bytes:
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def booleanArray(probes) -> bytes:
+    packed = bytearray((len(probes) + 7) // 8)
+    for i, probe in enumerate(probes):
+        if probe:
+            packed[i >> 3] |= 1 << (i & 7)
+    return varInt(len(probes)) + bytes(packed)
+
+
+class FakeAgent(object):
+    """
+    Answers dump commands like a JaCoCo agent with output=tcpserver.
+    """
+
+    def __init__(self, dumps) -> None:
+        self.dumps = list(dumps)
+        self.commands = []
+        self.server = socket.socket()
+        self.server.bind(("127.0.0.1", 0))
+        self.server.listen(1)
+        self.port = self.server.getsockname()[1]
+        self.thread = threading.Thread(target=self.serve, daemon=True)
+        self.thread.start()
+
+    def serve(self) -> None:
+        for executionData in self.dumps:
+            conn, _ = self.server.accept()
+            with conn:
+                request = b""
+                while len(request) < 8:
+                    request += conn.recv(8 - len(request))
+                self.commands.append(request)
+                reply = struct.pack(">BHH", BLOCK_HEADER, MAGIC_NUMBER, FORMAT_VERSION)
+                reply += bytes([BLOCK_SESSIONINFO]) + utf("session") + struct.pack(">qq", 1, 2)
+                for classId, name, probes in executionData:
+                    reply += bytes([BLOCK_EXECUTIONDATA]) + struct.pack(">q", classId) + utf(name) + booleanArray(probes)
+                reply += bytes([BLOCK_CMDOK])
+                # split the reply to exercise partial reads
+                conn.sendall(reply[:7])
+                conn.sendall(reply[7:])
+        self.server.close()
+
+
+class TestJacocoCoverage(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        print("start to test class `JacocoCoverage`")
+
+    def testDump(self):
+        probes = [True, False, True] + [False] * 7 + [True]
+        agent = FakeAgent([[(42, "org/apache/A", probes), (-7, "org/apache/B", [False])]])
+        data = JacocoClient("127.0.0.1", agent.port).dump(reset=True)
+        assert data == [(42, "org/apache/A", 11, 0b10000000101), (-7, "org/apache/B", 1, 0)]
+        assert agent.commands[0] == struct.pack(">BHHB??", BLOCK_HEADER, MAGIC_NUMBER, FORMAT_VERSION,
+                                                BLOCK_CMDDUMP, True, True)
+
+    def testCoverageMap(self):
+        coverageMap = CoverageMap()
+        assert coverageMap.merge([(1, "A", 4, 0b0011)]) == 2
+        assert coverageMap.merge([(1, "A", 4, 0b0110), (2, "B", 1, 0b1)]) == 2
+        assert coverageMap.merge([(1, "A", 4, 0b0111)]) == 0
+        assert len(coverageMap) == 4
+
+    def testTracker(self):
+        agent = FakeAgent([[(1, "A", [True])], [(1, "A", [True]), (2, "B", [True, True])]])
+        tracker = CoverageTracker(JacocoClient("127.0.0.1", agent.port), maxOverhead=0.05)
+        assert tracker.collect(100.0) == 1
+        assert tracker.collect(100.0) == 2
+        assert tracker.overhead() < 0.05
+        restored = pickle.loads(pickle.dumps(tracker))
+        assert len(restored.coverageMap) == 3
+
+    def testOverheadBudget(self):
+        tracker = CoverageTracker(JacocoClient("127.0.0.1", 1), maxOverhead=0.1)
+        tracker.collectTime, tracker.testTime = 3.0, 10.0
+        assert tracker.sampleInterval() == 3
+        assert tracker.collect(0.0) == -1 and tracker.collect(0.0) == -1
+        assert tracker.collectCount == 0
+
+    def testSkippedRunIsReset(self):
+        agent = FakeAgent([[], [(1, "A", [True, True])]])
+        tracker = CoverageTracker(JacocoClient("127.0.0.1", agent.port), maxOverhead=0.1)
+        tracker.collectTime, tracker.testTime = 1.5, 10.0
+        assert tracker.collect(0.0) == -1
+        assert agent.commands[0][-3:] == struct.pack(">B??", BLOCK_CMDDUMP, False, True)
+        assert tracker.collect(0.0) == 2 and not tracker.aggregated
+        assert agent.commands[1][-3:] == struct.pack(">B??", BLOCK_CMDDUMP, True, True)
+
+    def testFailedResetIsNotReportedAsDelta(self):
+        agent = FakeAgent([[(1, "A", [True, True])]])
+        tracker = CoverageTracker(JacocoClient("127.0.0.1", 1), maxOverhead=0.1)
+        tracker.collectTime, tracker.testTime = 1.5, 10.0
+        assert tracker.collect(0.0) == -1
+        assert tracker.aggregated and tracker.failedCount == 1
+        tracker.client = JacocoClient("127.0.0.1", agent.port)
+        # the dump holds probes of the skipped run too, it is merged but not reported
+        assert tracker.collect(0.0) == -1
+        assert len(tracker.coverageMap) == 2 and not tracker.aggregated
+
+    def testUnreachableAgent(self):
+        server = socket.socket()
+        server.bind(("127.0.0.1", 0))
+        port = server.getsockname()[1]
+        server.close()
+        tracker = CoverageTracker(JacocoClient("127.0.0.1", port, timeout=1.0))
+        assert tracker.collect(10.0) == -1
+        assert tracker.failedCount == 1
+
+    def testBadHeader(self):
+        server = socket.socket()
+        server.bind(("127.0.0.1", 0))
+        server.listen(1)
+
+        def serve():
+            conn, _ = server.accept()
+            with conn:
+                conn.recv(8)
+                conn.sendall(struct.pack(">BHH", BLOCK_HEADER, 0x1234, FORMAT_VERSION))
+            server.close()
+
+        threading.Thread(target=serve, daemon=True).start()
+        with self.assertRaises(JacocoProtocolError):
+            JacocoClient("127.0.0.1", server.getsockname()[1]).dump()
@@ -0,0 +1,76 @@
+import json
+import logging
+import sys
+import time
+import unittest
+
+sys.path.append("../../src")
+
+from utils.Logger import Logger, SampleFilter, StructuredFormatter, getItemLogger, getLogger
+
+
+class ListHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.records = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+class TestLogger(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        print("start to test class `Logger`")
+
+    def tearDown(self) -> None:
+        Logger.configure({})
+
+    def testSampleFilter(self):
+        logger = logging.Logger("test.sample", logging.DEBUG)
+        handler = ListHandler()
+        logger.addHandler(handler)
+        logger.addFilter(SampleFilter(3))
+        for i in range(7):
+            logger.debug("item %d", i)
+        assert [record.getMessage() for record in handler.records] == ["item 0", "item 3", "item 6"]
+        assert handler.records[0].fields == {'sample': 3}
+
+    def testFormatter(self):
+        record = logging.LogRecord("x", logging.INFO, "/src/utils/X.py", 12, "outcome %s", ("ok",), None,
+                                   func="parse")
+        record.fields = {'name': 'testA', 'time': '0.5'}
+        text = StructuredFormatter().format(record)
+        assert text.endswith("]\noutcome ok name=testA time=0.5")
+        entry = json.loads(StructuredFormatter(asJson=True).format(record))
+        assert entry['msg'] == "outcome ok"
+        assert entry['where'] == "/src/utils/X.py:12"
+        assert entry['name'] == "testA"
+
+    def testItemStreamLevels(self):
+        itemLogger = getItemLogger("teststream")
+        handler = ListHandler()
+        itemLogger.addHandler(handler)
+        try:
+            itemLogger.debug("dropped %s", "a")
+            assert handler.records == []
+            Logger.configure({'log_level': 'DEBUG', 'log_sample_every': '2'})
+            for i in range(4):
+                itemLogger.debug("kept %d", i)
+            assert [record.getMessage() for record in handler.records] == ["kept 0", "kept 2"]
+            # the main logger does not open DEBUG for every library
+            assert getLogger().level == logging.INFO
+        finally:
+            itemLogger.removeHandler(handler)
+
+    def testWrittenInBackground(self):
+        marker = f"background writer marker {time.time()}"
+        getLogger().info(marker)
+        deadline = time.time() + 5
+        found = False
+        while not found and time.time() < deadline:
+            with open(Logger.fileHandler.baseFilename) as f:
+                found = marker in f.read()
+            time.sleep(0.05)
+        assert found
@@ -0,0 +1,60 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.append("../../src")
+
+from utils.ceit.misconf_corpus import MisconfCorpus
+
+
+class TestMisconfCorpus(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        print("start to test class `MisconfCorpus`")
+
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "corpus.db")
+        self.options = [{"key": "port%d" % i, "value": str(8000 + i), "constraint": "PORT"} for i in range(6)]
+        self.options.append({"key": "dir", "value": "/tmp", "constraint": "PATH[,N,D]"})
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.directory)
+
+    def testBuildAndDraw(self):
+        corpus = MisconfCorpus(self.path, "ConfTest")
+        assert corpus.build(self.options, workers=2) == len(self.options)
+        for option in self.options:
+            assert corpus.count(option["key"]) > 0
+            assert "value" in corpus.draw(option["key"])
+        assert corpus.draw("missing") is None
+        corpus.close()
+
+    def testReuseAndInvalidate(self):
+        corpus = MisconfCorpus(self.path, "ConfErr")
+        corpus.build(self.options, workers=1)
+        corpus.close()
+
+        corpus = MisconfCorpus(self.path, "ConfErr")
+        assert corpus.build(self.options, workers=1) == 0
+        self.options[0]["value"] = "9999"
+        assert corpus.build(self.options, workers=1) == 1
+        # other modes are stored separately
+        assert MisconfCorpus(self.path, "ConfTest").count("port0") == 0
+        corpus.close()
+
+    def testRandomGeneratorsAreNotCached(self):
+        corpus = MisconfCorpus(self.path, "Fuzzing")
+        assert corpus.build(self.options, workers=1) == 0
+        values = {corpus.draw("port0")["value"] for _ in range(5)}
+        assert len(values) > 1
+        assert corpus.draw("missing") is None
+        assert corpus.conn.execute("SELECT COUNT(*) FROM misconfs").fetchone()[0] == 0
+        corpus.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+
+sys.path.append("../../src")
+
+from utils.MongoWriter import MongoWriter
+
+
+class FakeCollection(object):
+
+    def __init__(self, failures: int = 0, block: threading.Event = None) -> None:
+        self.docs = []
+        self.batches = []
+        self.failures = failures
+        self.block = block
+
+    def insert_many(self, docs, ordered=True):
+        if self.block is not None:
+            self.block.wait()
+        if self.failures > 0:
+            self.failures -= 1
+            raise ConnectionError("mongo is down")
+        self.batches.append(len(docs))
+        self.docs.extend(docs)
+
+    def insert_one(self, doc):
+        self.docs.append(doc)
+
+    def delete_many(self, query):
+        self.docs.clear()
+
+
+class FakeDatabase(dict):
+    # like a pymongo database, a collection exists as soon as it is used
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__()
+        self.kwargs = kwargs
+
+    def __missing__(self, name: str) -> FakeCollection:
+        self[name] = FakeCollection(**self.kwargs)
+        return self[name]
+
+
+class FakeMongoDb(object):
+
+    def __init__(self, **kwargs) -> None:
+        self.data_base = FakeDatabase(**kwargs)
+
+    def collection(self, name: str) -> FakeCollection:
+        return self.data_base[name]
+
+
+def readSpill(spillDir: str) -> list:
+    entries = []
+    for name in sorted(os.listdir(spillDir)):
+        with open(os.path.join(spillDir, name)) as f:
+            entries.extend(json.loads(line) for line in f)
+    return entries
+
+
+class TestMongoWriter(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        print("start to test class `MongoWriter`")
+
+    def setUp(self) -> None:
+        self.spillDir = os.path.join(tempfile.mkdtemp(), "mongo_spill")
+
+    def testInsertsAreBatched(self):
+        mongoDb = FakeMongoDb()
+        seeds = mongoDb.collection("expSeed")
+        writer = MongoWriter(mongoDb, self.spillDir, batchSize=10, flushInterval=60)
+        for i in range(25):
+            writer.insert("expSeed", {'dfs.replication': i})
+        writer.close()
+        assert [doc['dfs.replication'] for doc in seeds.docs] == list(range(25))
+        assert sum(seeds.batches) == 25 and max(seeds.batches) <= 10 and len(seeds.batches) < 25
+        assert not os.path.exists(self.spillDir)
+
+    def testReplaceKeepsLatestDocument(self):
+        mongoDb = FakeMongoDb()
+        coverage = mongoDb.collection("unit-coverage")
+        writer = MongoWriter(mongoDb, self.spillDir, flushInterval=60)
+        writer.replace("unit-coverage", {'time': 1})
+        writer.replace("unit-coverage", {'time': 2})
+        writer.close()
+        assert coverage.docs == [{'time': 2}]
+
+    def testRetryThenSucceed(self):
+        mongoDb = FakeMongoDb(failures=2)
+        writer = MongoWriter(mongoDb, self.spillDir, flushInterval=60, retries=3, retryDelay=0.01)
+        writer.insert("result", {'system_testcase_num': 3})
+        writer.close()
+        assert mongoDb.data_base["result"].docs == [{'system_testcase_num': 3}]
+        assert writer.stats['retried'] == 2 and writer.stats['spilled'] == 0
+
+    def testSpillWhenRetriesFail(self):
+        mongoDb = FakeMongoDb(failures=100)
+        writer = MongoWriter(mongoDb, self.spillDir, flushInterval=60, retries=1, retryDelay=0.01)
+        writer.insert("expSeed", {'a': 1})
+        writer.replace("sys-coverage", {'b': 2})
+        writer.close()
+        assert readSpill(self.spillDir) == [{'op': 'insert', 'collection': 'expSeed', 'doc': {'a': 1}},
+                                            {'op': 'replace', 'collection': 'sys-coverage', 'doc': {'b': 2}}]
+        healthy = FakeMongoDb()
+        assert MongoWriter.replay(self.spillDir, healthy) == 2
+        assert healthy.data_base["expSeed"].docs == [{'a': 1}]
+        assert healthy.data_base["sys-coverage"].docs == [{'b': 2}]
+        assert os.listdir(self.spillDir) == []
+
+    def testSpillWithoutMongo(self):
+        writer = MongoWriter(None, self.spillDir)
+        writer.insert("exception-map", {'java.io.IOException': 2})
+        writer.close()
+        assert readSpill(self.spillDir) == [{'op': 'insert', 'collection': 'exception-map',
+                                             'doc': {'java.io.IOException': 2}}]
+
+    def testBufferIsBounded(self):
+        block = threading.Event()
+        mongoDb = FakeMongoDb(block=block)
+        seeds = mongoDb.collection("expSeed")
+        writer = MongoWriter(mongoDb, self.spillDir, batchSize=1, flushInterval=60, maxBuffered=5)
+        # the writer is stuck on the first document, the rest fill the buffer and then spill
+        for i in range(20):
+            writer.insert("expSeed", {'i': i})
+        assert len(writer.buffer) <= 5
+        block.set()
+        writer.close()
+        spilled = [entry['doc']['i'] for entry in readSpill(self.spillDir)]
+        assert spilled and sorted(spilled + [doc['i'] for doc in seeds.docs]) == list(range(20))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+import sys
+import unittest
+
+sys.path.append("../../src")
+
+from utils.ceit.option_registry import OptionRegistry, parse_constraint, num_constraint, path_constraint
+
+
+class TestOptionRegistry(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        print("start to test class `OptionRegistry`")
+
+    def testParseConstraint(self):
+        spec = parse_constraint("NUM[INT,,,]|PATH[,N,D]|ENUM")
+        assert spec.count == 3
+        assert [(part.type, part.args) for part in spec.parts] == [("NUM", "[INT,,,]"), ("PATH", "[,N,D]"), ("ENUM", "")]
+        assert parse_constraint("NUM[INT,,,]|PATH[,N,D]|ENUM") is spec
+        assert spec.parts[0].num() == (False, -2147483648, 2147483647, "", "", "")
+        assert spec.parts[1].path() == ("", "N", "D")
+
+    def testNumConstraint(self):
+        assert num_constraint("[FLOAT,0,,]") == (True, "", "", "0", "", "")
+        assert num_constraint("[FLOAT,0,,]") is num_constraint("[FLOAT,0,,]")
+        assert path_constraint("[A,Y,F]") == ("A", "Y", "F")
+        with self.assertRaises(ValueError):
+            num_constraint("[BYTE,,,]")
+
+    def testRegistry(self):
+        options = [{"key": "port", "value": "80", "constraint": "PORT"},
+                   {"key": "dir", "value": "/tmp", "constraint": "PATH[,N,D]"}]
+        registry = OptionRegistry(options)
+        assert len(registry) == 2 and "port" in registry and "missing" not in registry
+        assert registry.get("dir") is options[1]
+        assert registry.spec("dir").parts[0].type == "PATH"
+        assert registry.get("missing") is None
@@ -0,0 +1,105 @@
+import sys
+import threading
+import time
+import unittest
+
+sys.path.append("../../src")
+
+from utils.Pipeline import Pipeline
+
+
+class TestPipeline(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        print("start to test class `Pipeline`")
+
+    def testResultsInSubmitOrder(self):
+        # odd payloads skip the second stage and so overtake the even ones
+        def first(n):
+            return n % 2 == 1, n
+
+        def second(n):
+            time.sleep(0.01)
+            return True, n * 10
+
+        pipeline = Pipeline([("first", first), ("second", second)], depth=4)
+        for n in range(10):
+            pipeline.submit(n)
+        results = [pipeline.take() for _ in range(10)]
+        pipeline.close()
+        assert results == [n if n % 2 else n * 10 for n in range(10)]
+        assert pipeline.inFlight() == 0
+
+    def testStagesOverlap(self):
+        def stage(n):
+            time.sleep(0.05)
+            return False, n
+
+        pipeline = Pipeline([("a", stage), ("b", stage)], depth=2)
+        start = time.time()
+        for n in range(6):
+            pipeline.submit(n)
+        results = [pipeline.take() for _ in range(6)]
+        elapsed = time.time() - start
+        pipeline.close()
+        assert results == list(range(6))
+        # sequentially this takes 0.6s, pipelined about 0.35s
+        assert elapsed < 0.5
+        occupancy = pipeline.occupancy()
+        assert set(occupancy) == {"a", "b"}
+        assert all(0.3 < ratio <= 1.0 for ratio in occupancy.values())
+
+    def testBackpressure(self):
+        release = threading.Event()
+
+        def stage(n):
+            release.wait()
+            return True, n
+
+        pipeline = Pipeline([("slow", stage)], depth=1)
+        pipeline.submit(0)
+        pipeline.submit(1)
+        blocked = threading.Thread(target=pipeline.submit, args=(2,))
+        blocked.start()
+        blocked.join(0.1)
+        # one payload in the stage, one in its queue, the third submit waits
+        assert blocked.is_alive()
+        release.set()
+        blocked.join(1)
+        assert not blocked.is_alive()
+        assert [pipeline.take() for _ in range(3)] == [0, 1, 2]
+        pipeline.close()
+
+    def testStageErrorRaisedOnTake(self):
+        def first(n):
+            if n == 1:
+                raise ValueError("bad testcase")
+            return False, n
+
+        calls = []
+
+        def second(n):
+            calls.append(n)
+            return True, n
+
+        pipeline = Pipeline([("first", first), ("second", second)])
+        for n in range(3):
+            pipeline.submit(n)
+        assert pipeline.take() == 0
+        with self.assertRaises(ValueError):
+            pipeline.take()
+        assert pipeline.take() == 2
+        pipeline.close()
+        assert calls == [0, 2]
+
+    def testRecordBusy(self):
+        pipeline = Pipeline([("a", lambda n: (True, n))])
+        pipeline.recordBusy("mutate", 0.0)
+        pipeline.submit(0)
+        pipeline.take()
+        pipeline.close()
+        assert pipeline.describeOccupancy().startswith("a ")
+        assert "mutate 0%" in pipeline.describeOccupancy()
+        with self.assertRaises(IndexError):
+            pipeline.take()
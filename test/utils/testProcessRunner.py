@@ -0,0 +1,93 @@
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+sys.path.append("../../src")
+
+from utils.ProcessRunner import ProcessRunner
+
+
+class TestProcessRunner(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        print("start to test class `ProcessRunner`")
+
+    def setUp(self) -> None:
+        self.runner = ProcessRunner(killGrace=1.0)
+
+    def testCwdWithoutChdir(self):
+        before = os.getcwd()
+        workDir = os.path.realpath(tempfile.mkdtemp())
+        result = self.runner.run(["pwd"], cwd=workDir, capture=True)
+        assert result.returncode == 0
+        assert result.stdout.strip() == workDir
+        assert os.getcwd() == before
+
+    def testEnvIsMerged(self):
+        runner = ProcessRunner(env={"FUZZ_A": "a"})
+        result = runner.run([sys.executable, "-c", "import os;print(os.environ['FUZZ_A'], os.environ['FUZZ_B'], "
+                                                   "'PATH' in os.environ)"], env={"FUZZ_B": "b"}, capture=True)
+        assert result.stdout.split() == ["a", "b", "True"]
+
+    def testTimeoutKillsGroup(self):
+        marker = os.path.join(tempfile.mkdtemp(), "child-alive")
+        # the shell forks a child that would write the marker once the timeout has passed
+        script = f"(sleep 2; touch {marker}) & sleep 30"
+        start = time.time()
+        result = self.runner.run(["sh", "-c", script], timeout=0.5)
+        assert result.timedOut
+        assert result.returncode != 0
+        assert time.time() - start < 10
+        time.sleep(2.5)
+        assert not os.path.exists(marker)
+
+    def testLineHookStops(self):
+        seen = []
+
+        def onLine(line):
+            seen.append(line.strip())
+            return line.startswith("FAIL")
+
+        code = "import time\nfor i in range(3): print('ok', i, flush=True)\nprint('FAIL', flush=True)\ntime.sleep(30)"
+        result = self.runner.run([sys.executable, "-c", code], timeout=20, onLine=onLine, capture=True)
+        assert result.stopped
+        assert not result.timedOut
+        assert seen == ["ok 0", "ok 1", "ok 2", "FAIL"]
+        assert result.stdout.endswith("FAIL\n")
+        assert result.duration < 15
+
+    def testStreamTimeout(self):
+        code = "import time\nprint('start', flush=True)\ntime.sleep(30)"
+        result = self.runner.run([sys.executable, "-c", code], timeout=0.5, onLine=lambda line: False)
+        assert result.timedOut
+        assert not result.stopped
+
+    def testStderrCaptured(self):
+        code = "import sys\nprint('out')\nprint('err', file=sys.stderr)\nsys.exit(3)"
+        result = self.runner.run([sys.executable, "-c", code], capture=True)
+        assert result.returncode == 3
+        assert result.stdout == "out\n"
+        assert result.stderr == "err\n"
+
+    def testLaunchStats(self):
+        for _ in range(3):
+            self.runner.run(["true"])
+        assert self.runner.launches == 3
+        assert self.runner.averageLaunchTime() > 0
+
+    def testProcessExists(self):
+        keyword = "process-runner-probe-%d" % os.getpid()
+        assert not ProcessRunner.processExists(keyword)
+        process = self.runner.start([sys.executable, "-c", "import time;time.sleep(30)", keyword])
+        try:
+            # the child may not have exec'd yet
+            deadline = time.time() + 5
+            while not ProcessRunner.processExists(keyword) and time.time() < deadline:
+                time.sleep(0.05)
+            assert ProcessRunner.processExists(keyword)
+        finally:
+            self.runner.kill(process)
+        assert not ProcessRunner.processExists(keyword)
@@ -0,0 +1,108 @@
+import io
+import os
+import sys
+import tempfile
+import time
+import unittest
+from contextlib import redirect_stdout
+
+sys.path.append("../../src")
+
+from dataModel.ConfItem import ConfItem
+from dataModel.TestResult import TestResult
+from dataModel.Testcase import Testcase
+from utils.ResultsDb import ResultsDb, ResultsQuery, main, parseSince
+
+
+class TestResultsDb(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        print("start to test class `ResultsDb`")
+
+    def setUp(self) -> None:
+        self.path = os.path.join(tempfile.mkdtemp(), "results.db")
+        self.db = ResultsDb(self.path, flushInterval=3600, flushRows=3)
+        self.count = 0
+
+    def tearDown(self) -> None:
+        self.db.close()
+
+    def makeTestcase(self, **mutated) -> Testcase:
+        self.count += 1
+        items = [ConfItem("dfs.blocksize", "DATA", "64m")]
+        for name, value in mutated.items():
+            item = ConfItem(name.replace('_', '.'), "INT", value)
+            item.isMutated = True
+            items.append(item)
+        testcase = Testcase(items)
+        testcase.fileName = f"tc-{self.count}"
+        return testcase
+
+    def systemResult(self, exception: str = '', new: bool = False, duration: float = 1.0) -> TestResult:
+        result = TestResult(status=1 if exception else 0, sysFailType=2 if exception else 0,
+                            description=f"API request Exception {exception}")
+        result.exception = exception
+        result.newException = new
+        result.duration = duration
+        return result
+
+    def testBatchedWrites(self):
+        query = ResultsQuery(self.path)
+        self.db.record(self.makeTestcase(dfs_replication="0"), TestResult(status=0))
+        self.db.record(self.makeTestcase(dfs_replication="1"), TestResult(status=1))
+        assert query.summary()['testcases'] == 0
+        self.db.record(self.makeTestcase(dfs_replication="2"), TestResult(status=0), self.systemResult())
+        summary = query.summary()
+        assert summary['testcases'] == 3 and summary['unit_failed'] == 1 and summary['system_tested'] == 1
+        query.close()
+
+    def testParamsOfNewExceptions(self):
+        now = time.time()
+        self.db.record(self.makeTestcase(dfs_replication="0"), None,
+                       self.systemResult("java.io.IOException", new=True, duration=5.0), when=now - 7200)
+        self.db.record(self.makeTestcase(dfs_replication="0", dfs_heartbeat_interval="-1"), None,
+                       self.systemResult("java.io.IOException"), when=now - 60)
+        self.db.record(self.makeTestcase(dfs_heartbeat_interval="-1"), None,
+                       self.systemResult("java.lang.IllegalArgumentException", new=True), when=now - 30)
+        self.db.record(self.makeTestcase(dfs_namenode_handler_count="3"), None, self.systemResult(), when=now)
+        self.db.flush()
+        query = ResultsQuery(self.path)
+        recent = query.newExceptions(parseSince("1h"))
+        assert [(sig, name, params) for _, sig, name, params in recent] == \
+               [("java.lang.IllegalArgumentException", "tc-3", "dfs.heartbeat.interval=-1")]
+        assert query.params(since=parseSince("1h")) == [("dfs.heartbeat.interval", 2), ("dfs.replication", 1)]
+        assert query.params("java.io.IOException") == [("dfs.replication", 2), ("dfs.heartbeat.interval", 1)]
+        assert [row[:2] for row in query.exceptions()] == [("java.io.IOException", 2),
+                                                           ("java.lang.IllegalArgumentException", 1)]
+        assert query.param("dfs.replication") == [("0", 2, 0, 2)]
+        assert query.slowest("system", 1)[0][0] == "tc-1"
+        query.close()
+
+    def testResumeAndReset(self):
+        self.db.record(self.makeTestcase(dfs_replication="0"))
+        self.db.close()
+        self.db = ResultsDb(self.path, flushRows=1)
+        assert self.db.record(self.makeTestcase(dfs_replication="1")) == 2
+        self.db.reset()
+        assert self.db.record(self.makeTestcase(dfs_replication="2")) == 1
+        query = ResultsQuery(self.path)
+        assert query.sql("SELECT name FROM testcases") == [("tc-3",)]
+        query.close()
+
+    def testCommandLine(self):
+        self.db.record(self.makeTestcase(dfs_replication="0"), None, self.systemResult("java.io.IOException", new=True))
+        self.db.flush()
+        out = io.StringIO()
+        with redirect_stdout(out):
+            main([self.path, "params", "--new", "--since", "10m"])
+        assert out.getvalue() == "dfs.replication\t1\n"
+
+    def testParseSince(self):
+        assert abs(parseSince("2h") - (time.time() - 7200)) < 5
+        assert parseSince("1700000000") == 1700000000.0
+        assert parseSince(None) is None
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.append("../../src")
+
+from dataModel.ConfItem import ConfItem
+from dataModel.Testcase import Testcase
+from utils.Configuration import Configuration
+from utils.TestcaseStore import TestcaseStore
+
+
+class TestTestcaseStore(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        print("start to test class `TestcaseStore`")
+        Configuration.fuzzerConf = {'project': 'hadoop-hdfs'}
+
+    def setUp(self) -> None:
+        self.storeDir = tempfile.mkdtemp()
+        self.store = TestcaseStore(self.storeDir)
+
+    def tearDown(self) -> None:
+        self.store.close()
+
+    def makeTestcase(self, value: str, fileName: str) -> Testcase:
+        testcase = Testcase([ConfItem("dfs.replication", "INT", value), ConfItem("dfs.blocksize", "DATA", "64m")])
+        testcase.fileName = fileName
+        return testcase
+
+    def testMaterializeMatchesWriteToFile(self):
+        testcase = self.makeTestcase("3", "tc-1")
+        ref = self.store.put(testcase, "sys_testcase_fail1_dir")
+        outDir = tempfile.mkdtemp()
+        path = self.store.materialize("tc-1", outDir)
+        assert path == os.path.join(outDir, "tc-1.xml")
+        expected = testcase.writeToFile(fileDir=tempfile.mkdtemp())
+        with open(path, 'rb') as a, open(expected, 'rb') as b:
+            assert a.read() == b.read()
+        assert ref.fileName == "tc-1.xml"
+
+    def testDeduplicatesContent(self):
+        self.store.put(self.makeTestcase("3", "tc-1"), "unit_testcase_dir")
+        self.store.put(self.makeTestcase("3", "tc-1"), "sys_testcase_fail2_dir")
+        self.store.put(self.makeTestcase("3", "tc-2"), "unit_testcase_dir")
+        self.store.put(self.makeTestcase("4", "tc-3"), "unit_testcase_dir")
+        assert len(self.store) == 4
+        assert len(self.store.blobs) == 2
+        assert self.store.dedupHits == 2
+        assert [ref.name for ref in self.store.find("unit_testcase_dir")] == ["tc-1", "tc-2", "tc-3"]
+        assert [ref.name for ref in self.store.find("sys_testcase_fail2_dir")] == ["tc-1"]
+
+    def testReopenAndTornIndex(self):
+        self.store.put(self.makeTestcase("3", "tc-1"), "unit_testcase_dir")
+        self.store.put(self.makeTestcase("5", "tc-2"), "unit_testcase_dir")
+        self.store.close()
+        with open(os.path.join(self.storeDir, TestcaseStore.indexName), 'a') as f:
+            f.write("R\tunit_testcase_dir\ttc-")
+        self.store = TestcaseStore(self.storeDir)
+        assert [ref.name for ref in self.store.find()] == ["tc-1", "tc-2"]
+        assert b"<value>5</value>" in self.store.get(self.store.byName["tc-2"].digest)
+        # appending after a reopen keeps the offsets right
+        self.store.put(self.makeTestcase("7", "tc-3"), "unit_testcase_dir")
+        assert b"<value>7</value>" in self.store.get(self.store.byName["tc-3"].digest)
+
+    def testReset(self):
+        self.store.put(self.makeTestcase("3", "tc-1"), "unit_testcase_dir")
+        self.store.reset()
+        assert len(self.store) == 0
+        self.store.put(self.makeTestcase("4", "tc-2"), "unit_testcase_dir")
+        assert self.store.blobs[self.store.byName["tc-2"].digest][0] == 0
+        assert b"<value>4</value>" in self.store.get(self.store.byName["tc-2"].digest)
+
+    def testPropertiesProject(self):
+        Configuration.fuzzerConf = {'project': 'alluxio'}
+        try:
+            ref = self.store.put(self.makeTestcase("3", "tc-1"), "unit_testcase_dir")
+        finally:
+            Configuration.fuzzerConf = {'project': 'hadoop-hdfs'}
+        assert ref.extension == ".properties"
+        assert self.store.get(ref.digest) == b"dfs.replication=3\ndfs.blocksize=64m\n"
@@ -0,0 +1,69 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.append("../../src")
+
+from utils import CSVReader
+from utils.TimeSeries import TimeSeriesReader, TimeSeriesWriter, binaryPath
+
+
+class TestTimeSeries(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        print("start to test class `TimeSeries`")
+
+    def setUp(self) -> None:
+        self.csvPath = os.path.join(tempfile.mkdtemp(), "plot_data")
+        self.columns = ["time", "loop_counts", "average unit test time"]
+
+    def testBuffersUntilThreshold(self):
+        writer = TimeSeriesWriter(self.csvPath, self.columns, truncate=True, flushInterval=3600, flushRows=3)
+        reader = TimeSeriesReader(binaryPath(self.csvPath))
+        writer.append([1, 0, 0.5])
+        writer.append([2, 1, 0.75])
+        assert reader.rowCount() == 0
+        writer.append([3, 1, 1.0])
+        assert reader.rowCount() == 3
+        writer.append([4, 2, 1.25])
+        writer.flush()
+        assert reader.rowCount() == 4
+
+    def testRowsSince(self):
+        writer = TimeSeriesWriter(self.csvPath, self.columns, truncate=True, flushRows=1)
+        reader = TimeSeriesReader(binaryPath(self.csvPath))
+        assert reader.columns == self.columns
+        for i in range(5):
+            writer.append([i, i // 2, i / 4])
+        rows, offset = reader.rowsSince(0)
+        assert offset == 5
+        assert rows[4] == (4.0, 2.0, 1.0)
+        assert reader.rowsSince(offset) == ([], 5)
+        writer.append([5, 2, 1.25])
+        rows, offset = reader.rowsSince(offset)
+        assert rows == [(5.0, 2.0, 1.25)]
+        assert offset == 6
+
+    def testCsvStillReadable(self):
+        writer = TimeSeriesWriter(self.csvPath, self.columns, truncate=True, flushRows=2)
+        writer.append([1, 0, 0.5])
+        writer.append([2, 1, 0.75])
+        header, data = CSVReader.readCSVFile(self.csvPath)
+        assert [name.strip() for name in header] == self.columns
+        assert data == [[1.0, 0.0, 0.5], [2.0, 1.0, 0.75]]
+
+    def testResumeFromCsvOnly(self):
+        with open(self.csvPath, 'w') as f:
+            f.write(", ".join(self.columns) + "\n1, 0, 0.5\n2, 1, 0.75\n")
+        writer = TimeSeriesWriter(self.csvPath, self.columns, flushRows=1)
+        writer.append([3, 1, 1.0])
+        rows, offset = TimeSeriesReader(binaryPath(self.csvPath)).rowsSince(1)
+        assert rows == [(2.0, 1.0, 0.75), (3.0, 1.0, 1.0)]
+        assert offset == 3
+
+    def testWrongWidth(self):
+        writer = TimeSeriesWriter(self.csvPath, self.columns, truncate=True)
+        with self.assertRaises(ValueError):
+            writer.append([1, 2])
@@ -0,0 +1,59 @@
+import sys
+import unittest
+
+sys.path.append("../../src")
+
+from utils.ValueEngine import ValueEngine, RandomBuffer, intDomain, timeDomain, dataSizeDomain, PORTS, IPVALUES
+
+
+class TestValueEngine(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        print("start to test class `ValueEngine`")
+
+    def testValuesComeFromDomain(self):
+        engine = ValueEngine(seed=1)
+        domain = {str(v) for v in intDomain("8")}
+        for _ in range(200):
+            assert engine.genValue("INT", "8") in domain
+            assert engine.genValue("PORT", "8080") in PORTS
+            assert engine.genValue("IP", "127.0.0.1") in IPVALUES
+            assert engine.genValue("TIME", "30s") in timeDomain("30s")
+            assert engine.genValue("DATA", "64MB") in dataSizeDomain("64MB")
+        assert engine.genValue("BOOL", "true") == "False"
+        assert engine.genValue("CLASSNAME", "a.b.C") == "a.b.C"
+        assert engine.genValue("UNKNOWN", "x") == "x"
+
+    def testTablesAreCached(self):
+        engine = ValueEngine(seed=1)
+        engine.genValue("INT", "8")
+        table = engine.tables[("INT", "8")]
+        engine.genValue("INT", "8")
+        assert engine.tables[("INT", "8")] is table
+        ValueEngine.maxTables, old = 2, ValueEngine.maxTables
+        try:
+            for value in ["1", "2", "3"]:
+                engine.genValue("INT", value)
+            assert len(engine.tables) <= 2
+        finally:
+            ValueEngine.maxTables = old
+
+    def testUnknownUnit(self):
+        engine = ValueEngine(seed=1)
+        values = {engine.genValue("TIME", "abc") for _ in range(200)}
+        assert "10ms" in values
+        assert all(len(v) <= 5 for v in values if v != "10ms")
+
+    def testBatch(self):
+        engine = ValueEngine(seed=1)
+        values = engine.genValues([("BOOL", "false"), ("INTLIST", "1,2,3"), ("STRLIST", "a,b")])
+        assert values[0] == "True"
+        assert len(values[1].split(",")) == 3
+
+    def testRandomBuffer(self):
+        buffer = RandomBuffer(size=16, seed=3)
+        indexes = [buffer.index(5) for _ in range(100)]
+        assert all(0 <= i < 5 for i in indexes)
+        assert len(set(indexes)) > 1
+        assert all(32 <= ord(c) < 122 for c in buffer.string(40))